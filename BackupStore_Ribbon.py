@@ -0,0 +1,260 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+import os
+import gzip
+import json
+import hashlib
+from datetime import datetime
+import Parameters_Ribbon
+import Standard_Functions_RIbbon as StandardFunctions
+
+# The index with the backups. The restore dialog reads only this file
+INDEX_FILE = "BackupIndex.json"
+# The version of the index
+INDEX_VERSION = 1
+# The format of the time in the names of the backups
+TIME_FORMAT = "%Y%m%d_%H%M%S"
+
+
+class BackupStore:
+    """
+    Compressed backups of the ribbon structure with an index.
+    A backup is only written when the content differs from the last backup.
+    After each backup, the retention policy is applied: the last backups are kept,
+    together with the last backup of each of the last days and the last backup of each of the last weeks.
+    """
+
+    def __init__(self, BackupFolder: str = None):
+        if BackupFolder is None:
+            BackupFolder = Parameters_Ribbon.BACKUP_LOCATION
+        self.BackupFolder = BackupFolder
+        self.IndexFile = os.path.join(BackupFolder, INDEX_FILE)
+        # The backups, oldest first: {"File": name, "Hash": sha1 of the content, "Time": TIME_FORMAT}
+        self.List_Backups = None
+        return
+
+    def backups(self) -> list:
+        """
+        Returns the backups, oldest first. The index is read once.
+        When there is no index, it is created from the files in the backup folder.
+        """
+        if self.List_Backups is None:
+            self.List_Backups = self.readIndex()
+            if self.List_Backups is None:
+                self.List_Backups = self.scanFolder()
+                self.writeIndex()
+        return self.List_Backups
+
+    def readIndex(self) -> list:
+        try:
+            with open(self.IndexFile, "r") as IndexFile:
+                Data = json.load(IndexFile)
+            if Data.get("version") != INDEX_VERSION:
+                return None
+            # Skip backups that are removed by hand
+            return [
+                Backup
+                for Backup in Data["Backups"]
+                if os.path.isfile(self.path(Backup))
+            ]
+        except Exception:
+            return None
+
+    def writeIndex(self):
+        if os.path.exists(self.BackupFolder) is False:
+            os.makedirs(self.BackupFolder)
+        TempFile = self.IndexFile + ".tmp"
+        with open(TempFile, "w") as IndexFile:
+            json.dump(
+                {"version": INDEX_VERSION, "Backups": self.List_Backups},
+                IndexFile,
+                indent=1,
+            )
+        os.replace(TempFile, self.IndexFile)
+        return
+
+    def scanFolder(self) -> list:
+        """
+        Creates the list of backups from the files in the backup folder.
+        Backups from older versions (uncompressed json files) are included.
+        """
+        List_Backups = []
+        if os.path.isdir(self.BackupFolder) is False:
+            return List_Backups
+
+        for Name in os.listdir(self.BackupFolder):
+            if Name.startswith("RibbonStructure_") is False:
+                continue
+            if Name.endswith(".json") is False and Name.endswith(".json.gz") is False:
+                continue
+            try:
+                Backup = {"File": Name, "Hash": "", "Time": ""}
+                Backup["Hash"] = hashlib.sha1(self.read(Backup)).hexdigest()
+                Backup["Time"] = self.timeOf(Backup).strftime(TIME_FORMAT)
+                List_Backups.append(Backup)
+            except Exception as e:
+                if Parameters_Ribbon.DEBUG_MODE is True:
+                    StandardFunctions.Print(f"{Name}: {e}", "Warning")
+        List_Backups.sort(key=lambda Backup: Backup["Time"])
+        return List_Backups
+
+    def path(self, Backup: dict) -> str:
+        return os.path.join(self.BackupFolder, Backup["File"])
+
+    def timeOf(self, Backup: dict) -> datetime:
+        """
+        Returns the time of a backup. From the index, or from the name of the file.
+        """
+        if Backup.get("Time", "") != "":
+            return datetime.strptime(Backup["Time"], TIME_FORMAT)
+        try:
+            Suffix = Backup["File"].replace("RibbonStructure_", "").split(".")[0]
+            return datetime.strptime(Suffix, TIME_FORMAT)
+        except Exception:
+            return datetime.fromtimestamp(os.path.getmtime(self.path(Backup)))
+
+    def read(self, Backup: dict) -> bytes:
+        """
+        Returns the content of a backup.
+        """
+        if Backup["File"].endswith(".gz"):
+            with gzip.open(self.path(Backup), "rb") as BackupFile:
+                return BackupFile.read()
+        with open(self.path(Backup), "rb") as BackupFile:
+            return BackupFile.read()
+
+    def createBackup(self, JsonFile: str) -> str:
+        """
+        Creates a compressed backup of a file, unless the content is equal to the last backup.
+
+        Args:
+            JsonFile (str): The file to backup.
+
+        Returns:
+            str: The name of the backup, or None when no backup was needed.
+        """
+        with open(JsonFile, "rb") as SourceFile:
+            Content = SourceFile.read()
+        Hash = hashlib.sha1(Content).hexdigest()
+
+        List_Backups = self.backups()
+        if len(List_Backups) > 0 and List_Backups[-1]["Hash"] == Hash:
+            return None
+
+        Time = datetime.now().strftime(TIME_FORMAT)
+        Backup = {"File": f"RibbonStructure_{Time}.json.gz", "Hash": Hash, "Time": Time}
+        # Two backups in the same second replace each other
+        List_Backups[:] = [
+            Item for Item in List_Backups if Item["File"] != Backup["File"]
+        ]
+
+        if os.path.exists(self.BackupFolder) is False:
+            os.makedirs(self.BackupFolder)
+        TempFile = self.path(Backup) + ".tmp"
+        with gzip.open(TempFile, "wb") as BackupFile:
+            BackupFile.write(Content)
+        os.replace(TempFile, self.path(Backup))
+
+        List_Backups.append(Backup)
+        self.applyRetention()
+        self.writeIndex()
+        return Backup["File"]
+
+    def applyRetention(
+        self,
+        Count: int = None,
+        Days: int = None,
+        Weeks: int = None,
+        Now: datetime = None,
+    ):
+        """
+        Removes the backups that are not kept by the retention policy.
+
+        Args:
+            Count (int, optional): The number of last backups to keep. Defaults to BACKUP_COUNT.
+            Days (int, optional): The number of days for which the last backup of the day is kept.
+                Defaults to BACKUP_DAYS.
+            Weeks (int, optional): The number of weeks for which the last backup of the week is kept.
+                Defaults to BACKUP_WEEKS.
+            Now (datetime, optional): The current time. Defaults to now.
+        """
+        if Count is None:
+            Count = Parameters_Ribbon.BACKUP_COUNT
+        if Days is None:
+            Days = Parameters_Ribbon.BACKUP_DAYS
+        if Weeks is None:
+            Weeks = Parameters_Ribbon.BACKUP_WEEKS
+        if Now is None:
+            Now = datetime.now()
+
+        List_Backups = self.backups()
+        Set_Keep = set()
+        # The last backups
+        if Count > 0:
+            for Backup in List_Backups[-Count:]:
+                Set_Keep.add(Backup["File"])
+
+        # The last backup of each day and of each week. The list is sorted oldest first,
+        # so the last backup of a day or week overwrites the earlier ones
+        Dict_Days = {}
+        Dict_Weeks = {}
+        for Backup in List_Backups:
+            Time = self.timeOf(Backup)
+            Age = (Now.date() - Time.date()).days
+            if Age < Days:
+                Dict_Days[Time.date()] = Backup["File"]
+            if Age < Weeks * 7:
+                Dict_Weeks[Time.isocalendar()[0:2]] = Backup["File"]
+        Set_Keep.update(Dict_Days.values())
+        Set_Keep.update(Dict_Weeks.values())
+
+        List_Kept = []
+        for Backup in List_Backups:
+            if Backup["File"] in Set_Keep:
+                List_Kept.append(Backup)
+                continue
+            try:
+                os.remove(self.path(Backup))
+            except Exception as e:
+                if Parameters_Ribbon.DEBUG_MODE is True:
+                    StandardFunctions.Print(f"{Backup['File']}: {e}", "Warning")
+                List_Kept.append(Backup)
+        List_Backups[:] = List_Kept
+        return
+
+    def restoreBackup(self, FileName: str, JsonFile: str) -> str:
+        """
+        Writes the content of a backup to a file.
+
+        Args:
+            FileName (str): The name of the backup.
+            JsonFile (str): The file to restore.
+
+        Returns:
+            str: The restored file.
+        """
+        Content = self.read({"File": FileName})
+        TempFile = JsonFile + ".tmp"
+        with open(TempFile, "wb") as RestoredFile:
+            RestoredFile.write(Content)
+        os.replace(TempFile, JsonFile)
+        return JsonFile
@@ -0,0 +1,152 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+import json
+import hashlib
+
+# Sections that are lists without a meaningful order. They are sorted before hashing.
+# The quick access commands are not in this list: the toolbar is built in their order
+List_UnorderedSections = [
+    "ignoredToolbars",
+    "iconOnlyToolbars",
+    "ignoredWorkbenches",
+]
+
+
+def ReturnStructureHash(Value) -> str:
+    """
+    Returns a hash of the structure of a value from the ribbon structure.
+    Equal structures have equal hashes, regardless of the order of the keys in dicts.
+    """
+    Text = json.dumps(
+        Value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha1(Text.encode("utf-8")).hexdigest()
+
+
+class ChangeTracker:
+    """
+    Tracks which top-level sections of the ribbon structure are changed since the last save.
+    Each section has a hash for each of its keys (dict sections) or one hash (other sections).
+    An update rehashes only the given section, or only the given keys of it,
+    e.g. only the edited workbench in the workbenches section.
+    """
+
+    def __init__(self):
+        # The hashes of the saved sections: {Section: {Key: Hash}}
+        self.Dict_Saved = {}
+        # The hashes of the current sections: {Section: {Key: Hash}}
+        self.Dict_Current = {}
+        # The sections where the current hashes differ from the saved hashes
+        self.Set_Changed = set()
+        return
+
+    def ReturnHashes(
+        self, Section: str, Value, Keys: list = None, Hashes: dict = None
+    ) -> dict:
+        """
+        Returns the hashes of a section.
+
+        Args:
+            Section (str): The name of the section.
+            Value: The value of the section.
+            Keys (list, optional): The keys of a dict section to rehash. Defaults to None (all keys).
+            Hashes (dict, optional): The previous hashes. Used with Keys. Defaults to None.
+
+        Returns:
+            dict: {Key: Hash}. Sections that are not a dict have one key: "".
+        """
+        if isinstance(Value, dict) is False:
+            if Section in List_UnorderedSections and isinstance(Value, list):
+                Value = sorted(Value, key=str)
+            return {"": ReturnStructureHash(Value)}
+
+        if Keys is None or Hashes is None:
+            return {Key: ReturnStructureHash(Item) for Key, Item in Value.items()}
+
+        Hashes = dict(Hashes)
+        for Key in Keys:
+            if Key in Value:
+                Hashes[Key] = ReturnStructureHash(Value[Key])
+            else:
+                Hashes.pop(Key, None)
+        # Keys that are removed or added in another way
+        if len(Hashes) != len(Value):
+            for Key in list(Hashes):
+                if Key not in Value:
+                    Hashes.pop(Key)
+            for Key in Value:
+                if Key not in Hashes:
+                    Hashes[Key] = ReturnStructureHash(Value[Key])
+        return Hashes
+
+    def setSaved(self, Dict_Sections: dict, Sections: list = None):
+        """
+        Sets the hashes of saved sections, e.g. after reading or writing the Json file.
+
+        Args:
+            Dict_Sections (dict): The sections.
+            Sections (list, optional): The sections that are saved. Defaults to None (all sections).
+        """
+        if Sections is None:
+            self.Dict_Saved = {}
+            self.Dict_Current = {}
+            self.Set_Changed = set()
+            Sections = list(Dict_Sections)
+
+        for Section in Sections:
+            if Section in Dict_Sections:
+                Hashes = self.ReturnHashes(Section, Dict_Sections[Section])
+                self.Dict_Saved[Section] = Hashes
+                self.Dict_Current[Section] = Hashes
+            else:
+                self.Dict_Saved.pop(Section, None)
+                self.Dict_Current.pop(Section, None)
+            self.Set_Changed.discard(Section)
+        return
+
+    def update(self, Section: str, Value, Keys: list = None):
+        """
+        Rehashes a section after an edit.
+
+        Args:
+            Section (str): The name of the section.
+            Value: The current value of the section.
+            Keys (list, optional): The edited keys of a dict section. Defaults to None (all keys).
+        """
+        Hashes = self.ReturnHashes(Section, Value, Keys, self.Dict_Current.get(Section))
+        self.Dict_Current[Section] = Hashes
+        if Hashes != self.Dict_Saved.get(Section):
+            self.Set_Changed.add(Section)
+        else:
+            self.Set_Changed.discard(Section)
+        return
+
+    def isChanged(self, Section: str = None) -> bool:
+        """
+        Returns True when a section, or any section, is changed since the last save.
+        """
+        if Section is None:
+            return len(self.Set_Changed) > 0
+        return Section in self.Set_Changed
+
+    def changedSections(self) -> list:
+        return sorted(self.Set_Changed)
@@ -0,0 +1,632 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+import re
+import unicodedata
+from PySide.QtWidgets import QListWidgetItem
+from PySide.QtCore import Qt, QAbstractListModel, QSortFilterProxyModel, QModelIndex
+
+
+def ReturnRowText(CommandItem) -> str:
+    """
+    Returns the text of a command in the command lists: the translated menu text without "&".
+    Dropdown buttons are shown with their name.
+    """
+    MenuNameTranslated = CommandItem.MenuTextTranslated
+    if CommandItem.CommandName.endswith("_ddb"):
+        MenuNameTranslated = CommandItem.CommandName.replace("_ddb", "")
+    return MenuNameTranslated.replace("&", "")
+
+
+class CommandListModel(QAbstractListModel):
+    """
+    A list model over the command records of the data file. Each command is listed once.
+    The text is prepared when the commands are set. Icons are resolved when a view first shows them.
+    Whether a command has an icon is decided from its record, so filtering does not load any icon.
+    """
+
+    def __init__(self, IconProvider=None, StoredIconProvider=None, parent=None):
+        """
+        Args:
+            IconProvider (optional): Function(CommandName) that returns the icon of a command or None.
+            StoredIconProvider (optional): Function(CommandName) that returns True when the icon of
+                a command is stored. Used for commands without an icon name in their record.
+            parent (optional): The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.IconProvider = IconProvider
+        self.StoredIconProvider = StoredIconProvider
+        # [CommandName, Text, MenuText] per row. Text is the translated menu text, MenuText the english one
+        self.List_Rows = []
+        # The row per command name
+        self.Dict_Rows = {}
+        # The workbenches of each command
+        self.Dict_WorkBenches = {}
+        # Cache for the icons. None means that the command has no icon
+        self.Dict_Icons = {}
+        # The commands with an icon name in one of their records, or with a stored icon
+        self.Set_HasIcon = set()
+        return
+
+    def setCommands(self, List_Commands: list):
+        """
+        Replaces all commands in one model reset.
+
+        Args:
+            List_Commands (list): The command records, see Records_Ribbon.CommandRecord:
+                [CommandName, IconName, MenuText, WorkBenchName, MenuTextTranslated]
+        """
+        self.beginResetModel()
+        self.List_Rows = []
+        self.Dict_Rows = {}
+        self.Dict_WorkBenches = {}
+        self.Dict_Icons = {}
+        self.Set_HasIcon = set()
+        for CommandItem in List_Commands:
+            self.addRecord(CommandItem)
+        if self.StoredIconProvider is not None:
+            for CommandName in self.Dict_Rows:
+                self.updateHasIcon(CommandName)
+        self.endResetModel()
+        return
+
+    def addCommand(self, CommandItem) -> int:
+        """
+        Adds one command at the end of the model, e.g. a new dropdown button. Views are updated for the new row only.
+
+        Args:
+            CommandItem (CommandRecord): The command record.
+
+        Returns:
+            int: The row of the command, or -1 when the command has no text.
+        """
+        CommandName = CommandItem.CommandName
+        if CommandName not in self.Dict_Rows and ReturnRowText(CommandItem) != "":
+            row = len(self.List_Rows)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.addRecord(CommandItem)
+            self.updateHasIcon(CommandName)
+            self.endInsertRows()
+        else:
+            self.addRecord(CommandItem)
+        return self.row(CommandName)
+
+    def addRecord(self, CommandItem):
+        """
+        Adds a command record without notifying the views. A command is listed once:
+        for a command that is already in the model, only its workbench is added.
+        """
+        CommandName = CommandItem.CommandName
+        self.Dict_WorkBenches.setdefault(CommandName, set()).add(
+            CommandItem.WorkBenchName
+        )
+        if CommandItem.IconName is not None and CommandItem.IconName != "":
+            self.Set_HasIcon.add(CommandName)
+        # Set based duplicate check
+        if CommandName in self.Dict_Rows:
+            return
+
+        Text = ReturnRowText(CommandItem)
+        if Text == "":
+            return
+
+        self.Dict_Rows[CommandName] = len(self.List_Rows)
+        self.List_Rows.append(
+            [CommandName, Text, CommandItem.MenuText.replace("&", "")]
+        )
+        return
+
+    def updateHasIcon(self, CommandName: str):
+        """
+        Marks a command without an icon name as having an icon, when its icon is stored.
+        """
+        if CommandName in self.Set_HasIcon or self.StoredIconProvider is None:
+            return
+        if self.StoredIconProvider(CommandName) is True:
+            self.Set_HasIcon.add(CommandName)
+        return
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.List_Rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.isValid() is False:
+            return None
+        CommandName, Text, MenuText = self.List_Rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return Text
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self.icon(index.row())
+        if role == Qt.ItemDataRole.ToolTipRole or role == Qt.ItemDataRole.UserRole:
+            return CommandName
+        return None
+
+    def commandName(self, row: int) -> str:
+        return self.List_Rows[row][0]
+
+    def text(self, row: int) -> str:
+        return self.List_Rows[row][1]
+
+    def menuText(self, row: int) -> str:
+        return self.List_Rows[row][2]
+
+    def row(self, CommandName: str) -> int:
+        """
+        Returns the row of a command, or -1 when the command is not in the model.
+        """
+        return self.Dict_Rows.get(CommandName, -1)
+
+    def icon(self, row: int):
+        """
+        Returns the icon of a row. The icon is resolved the first time and cached.
+
+        Returns:
+            QIcon: The icon or None.
+        """
+        CommandName = self.List_Rows[row][0]
+        if CommandName not in self.Dict_Icons:
+            Icon = None
+            if self.IconProvider is not None:
+                Icon = self.IconProvider(CommandName)
+            if Icon is not None and Icon.isNull():
+                Icon = None
+            self.Dict_Icons[CommandName] = Icon
+        return self.Dict_Icons[CommandName]
+
+    def hasIcon(self, row: int) -> bool:
+        """
+        Returns True when the command has an icon name or a stored icon. The icon itself is not loaded.
+        """
+        return self.List_Rows[row][0] in self.Set_HasIcon
+
+
+class CommandFilterProxyModel(QSortFilterProxyModel):
+    """
+    A view on the CommandListModel for one list of the dialog.
+    Commands can be included or excluded by name, e.g. for the available and selected lists.
+    Commands without an icon are hidden.
+    The commands are sorted by their text, or kept in a set order, e.g. for the quick access commands.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # The commands to show. None shows all commands
+        self.Set_Included = None
+        # The commands to hide
+        self.Set_Excluded = set()
+        # The order of the commands. None sorts the commands by their text
+        self.List_Order = None
+        self.Dict_Order = {}
+        return
+
+    def setSourceModel(self, Model):
+        super().setSourceModel(Model)
+        # Sort on the text, or on the set order. The sorting is kept when the filter changes
+        self.sort(0)
+        return
+
+    def setIncluded(self, Commands):
+        self.Set_Included = None if Commands is None else set(Commands)
+        self.invalidateFilter()
+        return
+
+    def setExcluded(self, Commands):
+        self.Set_Excluded = set(Commands)
+        self.invalidateFilter()
+        return
+
+    def setOrder(self, Commands):
+        """
+        Shows only the given commands, in the given order.
+        """
+        self.List_Order = []
+        for CommandName in Commands:
+            if CommandName not in self.List_Order:
+                self.List_Order.append(CommandName)
+        self.Set_Included = set(self.List_Order)
+        self.updateOrder()
+        return
+
+    def updateOrder(self):
+        self.Dict_Order = {
+            CommandName: i for i, CommandName in enumerate(self.List_Order)
+        }
+        self.invalidate()
+        return
+
+    def addCommands(self, Commands):
+        """
+        Shows the commands again, or adds them at the end when the list has a set order.
+        """
+        Commands = list(Commands)
+        self.Set_Excluded.difference_update(Commands)
+        if self.List_Order is not None:
+            for CommandName in Commands:
+                if CommandName not in self.Dict_Order:
+                    self.Dict_Order[CommandName] = len(self.List_Order)
+                    self.List_Order.append(CommandName)
+        if self.Set_Included is not None:
+            self.Set_Included.update(Commands)
+        self.invalidate()
+        return
+
+    def removeCommands(self, Commands):
+        """
+        Hides the commands, or removes them when the list has a set order.
+        """
+        Commands = set(Commands)
+        if self.List_Order is not None:
+            self.List_Order = [
+                CommandName
+                for CommandName in self.List_Order
+                if CommandName not in Commands
+            ]
+            self.Set_Included.difference_update(Commands)
+            self.updateOrder()
+            return
+        self.Set_Excluded.update(Commands)
+        self.invalidateFilter()
+        return
+
+    def moveCommand(self, CommandName: str, Up: bool = True) -> bool:
+        """
+        Moves a command one place up or down in the set order.
+
+        Returns:
+            bool: True when the command is moved.
+        """
+        if self.List_Order is None or CommandName not in self.Dict_Order:
+            return False
+        i = self.Dict_Order[CommandName]
+        Target = i - 1 if Up is True else i + 1
+        if Target < 0 or Target >= len(self.List_Order):
+            return False
+        self.List_Order[i], self.List_Order[Target] = (
+            self.List_Order[Target],
+            self.List_Order[i],
+        )
+        self.updateOrder()
+        return True
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        Model: CommandListModel = self.sourceModel()
+        CommandName = Model.commandName(source_row)
+        if CommandName in self.Set_Excluded:
+            return False
+        if self.Set_Included is not None and CommandName not in self.Set_Included:
+            return False
+        return Model.hasIcon(source_row)
+
+    def lessThan(self, source_left, source_right):
+        if self.List_Order is None:
+            return super().lessThan(source_left, source_right)
+        Model: CommandListModel = self.sourceModel()
+        return self.Dict_Order.get(
+            Model.commandName(source_left.row()), 0
+        ) < self.Dict_Order.get(Model.commandName(source_right.row()), 0)
+
+    def commandName(self, row: int) -> str:
+        """
+        Returns the command name of a row of this proxy.
+        """
+        Model: CommandListModel = self.sourceModel()
+        return Model.commandName(self.mapToSource(self.index(row, 0)).row())
+
+    def commandNames(self) -> list:
+        """
+        Returns the command names of the accepted rows, in the order of the list.
+        """
+        return [self.commandName(i) for i in range(self.rowCount())]
+
+    def row(self, CommandName: str) -> int:
+        """
+        Returns the row of a command in this proxy, or -1 when it is not shown.
+        """
+        Model: CommandListModel = self.sourceModel()
+        SourceRow = Model.row(CommandName)
+        if SourceRow < 0:
+            return -1
+        return self.mapFromSource(Model.index(SourceRow, 0)).row()
+
+
+def NormalizeText(Text: str) -> str:
+    """
+    Returns the text in lower case, without accents and without "&".
+    """
+    Text = unicodedata.normalize("NFKD", Text.replace("&", "").lower())
+    return "".join(
+        Character for Character in Text if unicodedata.combining(Character) == 0
+    )
+
+
+def ReturnTokens(Text: str) -> list:
+    """
+    Splits a text in words. Command names are split on "_" and on capitals, e.g. "Std_ViewFit" -> std, view, fit.
+    """
+    Text = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", Text)
+    return [
+        Token for Token in re.split(r"[^0-9a-z]+", NormalizeText(Text)) if Token != ""
+    ]
+
+
+class CommandSearchIndex:
+    """
+    Search index over the rows of a CommandListModel.
+    A row matches when its translated text, english text or command name starts with the search text,
+    or when every word of the search text is the start of a word in the row.
+    With fuzzy search, rows that contain the characters of the search text in the same order match as well.
+    They are ranked by how close the characters are together.
+    """
+
+    # The length of the prefixes in the index
+    PrefixLength = 2
+
+    def __init__(self, Model: CommandListModel):
+        self.Model = Model
+        # The normalized texts and words per row
+        self.List_Texts = []
+        self.List_Tokens = []
+        # The rows per prefix of a word or text
+        self.Dict_Prefixes = {}
+
+        for row in range(Model.rowCount()):
+            self.addRow(row)
+        return
+
+    def addRow(self, row: int):
+        """
+        Adds a row of the model to the index, e.g. after a command is added to the model.
+        """
+        if row < len(self.List_Texts):
+            return
+        Model = self.Model
+        Texts = [
+            NormalizeText(Model.text(row)),
+            NormalizeText(Model.menuText(row)),
+            NormalizeText(Model.commandName(row)),
+        ]
+        Tokens = set()
+        for Text in (Model.text(row), Model.menuText(row), Model.commandName(row)):
+            Tokens.update(ReturnTokens(Text))
+        self.List_Texts.append(Texts)
+        self.List_Tokens.append(Tokens)
+
+        for Word in Tokens.union(Texts):
+            for i in range(1, self.PrefixLength + 1):
+                if len(Word) >= i:
+                    self.Dict_Prefixes.setdefault(Word[:i], set()).add(row)
+        return
+
+    def candidates(self, Query: str) -> set:
+        """
+        Returns the rows that can match the search text, based on the prefix of its first word.
+        """
+        Tokens = ReturnTokens(Query)
+        if len(Tokens) == 0:
+            return set(range(len(self.List_Texts)))
+        return self.Dict_Prefixes.get(Tokens[0][: self.PrefixLength], set())
+
+    def matches(self, row: int, Query: str, QueryTokens: list) -> bool:
+        for Text in self.List_Texts[row]:
+            if Text.startswith(Query):
+                return True
+        if len(QueryTokens) == 0:
+            return False
+        for QueryToken in QueryTokens:
+            if (
+                any(Token.startswith(QueryToken) for Token in self.List_Tokens[row])
+                is False
+            ):
+                return False
+        return True
+
+    def fuzzyScore(self, row: int, Query: str) -> int:
+        """
+        Returns a score for a fuzzy match, or -1 if there is no match. A lower score is a better match.
+        The score is the number of characters between the first and the last matched character.
+        """
+        Query = Query.replace(" ", "")
+        BestScore = -1
+        for Text in self.List_Texts[row]:
+            Position = -1
+            Start = -1
+            for Character in Query:
+                Position = Text.find(Character, Position + 1)
+                if Position < 0:
+                    break
+                if Start < 0:
+                    Start = Position
+            if Position < 0:
+                continue
+            Score = Position - Start - len(Query) + 1
+            if BestScore < 0 or Score < BestScore:
+                BestScore = Score
+        return BestScore
+
+    def search(self, Query: str, List_Rows: list = None, Fuzzy: bool = False) -> list:
+        """
+        Searches the rows.
+
+        Args:
+            Query (str): The search text.
+            List_Rows (list, optional): The rows to search in, e.g. the result for the previous search text.
+                Defaults to None (all possible rows).
+            Fuzzy (bool, optional): Add fuzzy matches, ranked after the normal matches. Defaults to False.
+
+        Returns:
+            list: The matching rows. Normal matches in model order, followed by the ranked fuzzy matches.
+        """
+        Query = NormalizeText(Query).strip()
+        if Query == "":
+            if List_Rows is not None:
+                return list(List_Rows)
+            return list(range(len(self.List_Texts)))
+
+        QueryTokens = ReturnTokens(Query)
+        if List_Rows is None:
+            if Fuzzy is True:
+                List_Rows = range(len(self.List_Texts))
+            else:
+                List_Rows = sorted(self.candidates(Query))
+
+        Result = []
+        List_Fuzzy = []
+        for row in List_Rows:
+            if self.matches(row, Query, QueryTokens) is True:
+                Result.append(row)
+            elif Fuzzy is True:
+                Score = self.fuzzyScore(row, Query)
+                if Score >= 0:
+                    List_Fuzzy.append((Score, row))
+
+        List_Fuzzy.sort()
+        Result.extend(row for Score, row in List_Fuzzy)
+        return Result
+
+
+def ReturnListWidgetItem(Model: CommandListModel, row: int) -> QListWidgetItem:
+    """
+    Returns a list widget item for a row of the model, for the lists that are not views on the model.
+
+    Args:
+        Model (CommandListModel): The model with the commands.
+        row (int): The row of the command.
+
+    Returns:
+        QListWidgetItem: The item.
+    """
+    CommandName = Model.commandName(row)
+    ListWidgetItem = QListWidgetItem()
+    ListWidgetItem.setText(Model.text(row))
+    Icon = Model.icon(row)
+    if Icon is not None:
+        ListWidgetItem.setIcon(Icon)
+    ListWidgetItem.setToolTip(
+        CommandName
+    )  # Use the tooltip to store the actual command.
+    ListWidgetItem.setData(Qt.ItemDataRole.UserRole, CommandName)
+    return ListWidgetItem
+
+
+class CommandTableRows:
+    """
+    The command records of the panel in the command table on the Ribbon design tab.
+    The rows follow the rows of the table, without the first row ("All").
+    This is not a Qt model: the table is a QTableWidget with check boxes for the size of each command,
+    which are kept as they are.
+    Changes are written directly to the dict of the panel in the ribbon structure:
+    an edit updates only the entry of its command and a move swaps two places in the order.
+    """
+
+    def __init__(self):
+        # The dict of the panel: Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar]
+        self.Dict_Panel = None
+        # [OrderName, CommandName] per row. OrderName is the name in the order list. CommandName is "" for separators
+        self.List_Rows = []
+        return
+
+    def setPanel(self, Dict_Panel: dict, List_Rows: list, Dict_Commands: dict = None):
+        """
+        Sets the panel and its rows. The order of the panel is set once for all rows.
+
+        Args:
+            Dict_Panel (dict): The dict of the panel in the ribbon structure.
+            List_Rows (list): The rows: [OrderName, CommandName]
+            Dict_Commands (dict, optional): The entries for the commands of the panel. Defaults to None.
+        """
+        self.Dict_Panel = Dict_Panel
+        self.List_Rows = List_Rows
+        if isinstance(Dict_Panel.get("commands"), dict) is False:
+            Dict_Panel["commands"] = {}
+        if Dict_Commands is not None:
+            Dict_Panel["commands"].update(Dict_Commands)
+        Dict_Panel["order"] = [OrderName for OrderName, CommandName in List_Rows]
+        return
+
+    def rowCount(self) -> int:
+        return len(self.List_Rows)
+
+    def orderName(self, row: int) -> str:
+        return self.List_Rows[row][0]
+
+    def commandName(self, row: int) -> str:
+        return self.List_Rows[row][1]
+
+    def isValid(self, row: int) -> bool:
+        return self.Dict_Panel is not None and 0 <= row < len(self.List_Rows)
+
+    def updateCommand(self, row: int, Text: str, Size: str):
+        """
+        Updates the entry of the command in a row. Separators have no entry.
+
+        Args:
+            row (int): The row.
+            Text (str): The text of the command.
+            Size (str): The size of the command: "small", "medium", "large" or "none".
+        """
+        if self.isValid(row) is False:
+            return
+        CommandName = self.List_Rows[row][1]
+        if CommandName == "":
+            return
+
+        Entry = self.Dict_Panel["commands"].get(CommandName)
+        if isinstance(Entry, dict) is False:
+            Entry = {"icon": ""}
+            self.Dict_Panel["commands"][CommandName] = Entry
+        Entry["size"] = Size
+        Entry["text"] = Text
+        return
+
+    def insertRow(self, row: int, OrderName: str, CommandName: str = ""):
+        if self.Dict_Panel is None:
+            return
+        row = max(0, min(row, len(self.List_Rows)))
+        self.List_Rows.insert(row, [OrderName, CommandName])
+        self.Dict_Panel["order"].insert(row, OrderName)
+        return
+
+    def removeRow(self, row: int):
+        if self.isValid(row) is False:
+            return
+        self.List_Rows.pop(row)
+        self.Dict_Panel["order"].pop(row)
+        return
+
+    def moveRow(self, row: int, Up: bool = True) -> bool:
+        """
+        Moves a row one place up or down. The order of the panel is updated in place.
+
+        Returns:
+            bool: True when the row is moved.
+        """
+        Target = row - 1 if Up is True else row + 1
+        if self.isValid(row) is False or self.isValid(Target) is False:
+            return False
+        Order: list = self.Dict_Panel["order"]
+        self.List_Rows[row], self.List_Rows[Target] = (
+            self.List_Rows[Target],
+            self.List_Rows[row],
+        )
+        Order[row], Order[Target] = Order[Target], Order[row]
+        return True
@@ -89,7 +89,6 @@ class CustomControls:
         # Define the controls
         btn = QToolButton()
         CommandButton = QToolButton()
-        ArrowButton = QToolButton()
         Layout = QVBoxLayout()
         Label_Text = QTextEdit()
 
@@ -117,8 +116,13 @@ class CustomControls:
         CommandButton.setIconSize(IconSize.expandedTo(CommandButton.size()))
         # Set the content margins to zero
         CommandButton.setContentsMargins(0, 0, 0, 0)
+        # Check if the button has a dropdown menu. Only then the arrow button is created
+        HasMenu = Menu is not None and len(Menu.actions()) > 1
+        ArrowButton = None
+        if HasMenu is True:
+            ArrowButton = QToolButton()
         # Add a actions if there is only one
-        if len(Menu.actions()) == 0:
+        if Menu is None or len(Menu.actions()) == 0:
             CommandButton.addAction(Action)
         CommandButton.setDefaultAction(Action)
 
@@ -185,7 +189,7 @@ class CustomControls:
                 # Set the proper alignment
                 Label_Text.setAlignment(TextAlignment)
                 # Lower the height when there is a menu
-                if Menu is not None and len(Menu.actions()) > 1:
+                if HasMenu is True:
                     Label_Text.setFixedHeight(SingleHeight)
                 else:
                     Label_Text.setFixedHeight(SingleHeight + Space)
@@ -217,7 +221,7 @@ class CustomControls:
                 # get the text width
                 TextWidth = FontMetrics.horizontalAdvance(line1, -1)
                 # Set the correct height. Avoid a too big difference in icon sizes by only decreasing the height when there is a menu.
-                if Menu is not None and len(Menu.actions()) > 1:
+                if HasMenu is True:
                     Label_Text.setFixedHeight(SingleHeight)
                 else:
                     Label_Text.setFixedHeight((SingleHeight * MaxNumberOfLines) - Space)
@@ -242,7 +246,7 @@ class CustomControls:
             Layout.addWidget(Label_Text)
             CommandButtonHeight = CommandButtonHeight - Label_Text.height()
 
-        if Menu is not None and len(Menu.actions()) > 1:
+        if HasMenu is True:
             # Define a menu
             ArrowButton.setMenu(Menu)
             ArrowButton.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
@@ -570,7 +574,8 @@ class CustomControls:
                 }"""
         )
         CommandButton.setStyleSheet(StyleSheet_Addition_Command + StyleSheet)
-        ArrowButton.setStyleSheet(StyleSheet_Addition_Arrow + StyleSheet)
+        if HasMenu is True:
+            ArrowButton.setStyleSheet(StyleSheet_Addition_Arrow + StyleSheet)
         Label_Text.setStyleSheet(StyleSheet_Addition_Label + StyleSheet)
         btn.setStyleSheet(StyleSheet_Addition_Button + StyleSheet)
 
@@ -581,7 +586,8 @@ class CustomControls:
         if TextWidth > 0 and TextWidth > CommandButtonHeight + Space:
             width = TextWidth + Space
         Label_Text.setFixedWidth(width)
-        ArrowButton.setFixedWidth(width)
+        if HasMenu is True:
+            ArrowButton.setFixedWidth(width)
         CommandButton.setFixedSize(QSize(width, CommandButtonHeight))
         btn.setFixedSize(QSize(width, ButtonSize.height()))
 
@@ -607,7 +613,6 @@ class CustomControls:
         # Define the controls
         btn = QToolButton()
         CommandButton = QToolButton()
-        ArrowButton = QToolButton()
         Layout = QHBoxLayout()
         Label_Text = QTextEdit()
         # Set the default stylesheet
@@ -630,8 +635,13 @@ class CustomControls:
         CommandButton.setIconSize(IconSize)
         # Set the content margins to zero
         CommandButton.setContentsMargins(0, 0, 0, 0)
+        # Check if the button has a dropdown menu. Only then the arrow button is created
+        HasMenu = Menu is not None and len(Menu.actions()) > 1
+        ArrowButton = None
+        if HasMenu is True:
+            ArrowButton = QToolButton()
         # Add a actions if there is only one
-        if len(Menu.actions()) == 0:
+        if Menu is None or len(Menu.actions()) == 0:
             CommandButton.addAction(Action)
         CommandButton.setDefaultAction(Action)
 
@@ -771,7 +781,7 @@ class CustomControls:
             # Add the label with alignment
             Layout.addWidget(Label_Text)
 
-        if Menu is not None and len(Menu.actions()) > 1:
+        if HasMenu is True:
             # Define a menu
             ArrowButton.setMenu(Menu)
             ArrowButton.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
@@ -925,9 +935,6 @@ class CustomControls:
                 Label_Text.mousePressEvent = lambda mouseClick: mouseClickevent(
                     mouseClick
                 )
-                ArrowButton.mousePressEvent = lambda mouseClick: mouseClickevent(
-                    mouseClick
-                )
 
                 # Change the background color for commandbutton and label on hovering (CSS)
                 def enterEventCustom(event):
@@ -1105,7 +1112,8 @@ class CustomControls:
             + ";}"
         )
         CommandButton.setStyleSheet(StyleSheet_Addition_Command + StyleSheet)
-        ArrowButton.setStyleSheet(StyleSheet_Addition_Arrow + StyleSheet)
+        if HasMenu is True:
+            ArrowButton.setStyleSheet(StyleSheet_Addition_Arrow + StyleSheet)
         Label_Text.setStyleSheet(StyleSheet_Addition_Label + StyleSheet)
         btn.setStyleSheet(StyleSheet_Addition_button + StyleSheet)
 
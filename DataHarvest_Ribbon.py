@@ -0,0 +1,298 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+import FreeCAD as App
+import FreeCADGui as Gui
+import os
+import json
+import hashlib
+import inspect
+import Standard_Functions_RIbbon as StandardFunctions
+import Parameters_Ribbon
+import Records_Ribbon
+
+
+def ReturnWorkbenchFile(WorkBenchName: str) -> str:
+    """
+    Returns the file in which the class of a workbench is defined.
+
+    Args:
+        WorkBenchName (str): The name of the workbench.
+
+    Returns:
+        str: The file, or None when no file is found.
+    """
+    try:
+        return inspect.getfile(Gui.getWorkbench(WorkBenchName).__class__)
+    except Exception:
+        return None
+
+
+def ReturnToolbarItemsHash(WorkBenchName: str) -> str:
+    """
+    Returns a hash of the toolbar items of a workbench.
+    Used as fingerprint for workbenches that are not defined in a file.
+
+    Args:
+        WorkBenchName (str): The name of the workbench.
+
+    Returns:
+        str: The hash, or an empty string when the toolbar items cannot be read.
+    """
+    try:
+        ToolbarItems = Gui.getWorkbench(WorkBenchName).getToolbarItems()
+        Text = json.dumps(ToolbarItems, sort_keys=True)
+        return hashlib.sha1(Text.encode("utf-8")).hexdigest()
+    except Exception:
+        return ""
+
+
+def ReturnWorkbenchFingerprint(WorkBenchName: str) -> str:
+    """
+    Returns a fingerprint of a workbench, without activating it.
+    The fingerprint consists of the version from the package.xml of the addon
+    (or the FreeCAD version for built-in workbenches) and the modification time of the workbench file.
+    For workbenches without a file, a hash of the toolbar items is used instead of the modification time.
+
+    Args:
+        WorkBenchName (str): The name of the workbench.
+
+    Returns:
+        str: The fingerprint.
+    """
+    Version = ".".join(App.Version()[0:3])
+    Modified = 0
+    WorkBenchFile = ReturnWorkbenchFile(WorkBenchName)
+    if WorkBenchFile is None:
+        StandardFunctions.Print(
+            f"No file found for workbench {WorkBenchName}. Its toolbar items are used to detect updates.",
+            "Log",
+        )
+        return f"{Version}|{ReturnToolbarItemsHash(WorkBenchName)}"
+
+    try:
+        Modified = int(os.path.getmtime(WorkBenchFile))
+
+        # Addons have a package.xml in the folder of the workbench or in one of its parent folders
+        Folder = os.path.dirname(os.path.abspath(WorkBenchFile))
+        for i in range(3):
+            PackageXML = os.path.join(Folder, "package.xml")
+            if os.path.exists(PackageXML) is True:
+                Version = StandardFunctions.ReturnXML_Value(PackageXML, "version")
+                break
+            Folder = os.path.dirname(Folder)
+    except Exception as e:
+        StandardFunctions.Print(f"Fingerprint of workbench {WorkBenchName}: {e}", "Log")
+    return f"{Version}|{Modified}"
+
+
+def ReturnChangedWorkbenches(
+    Dict_Fingerprints: dict, List_KnownWorkbenches: list
+) -> tuple:
+    """
+    Compares the installed workbenches with the stored fingerprints.
+
+    Args:
+        Dict_Fingerprints (dict): The stored fingerprint per workbench.
+        List_KnownWorkbenches (list): The names of the workbenches in the data file.
+
+    Returns:
+        tuple: (new workbenches, changed workbenches, removed workbenches)
+    """
+    List_Installed = [
+        str(WorkBenchName)
+        for WorkBenchName in Gui.listWorkbenches()
+        if WorkBenchName != "NoneWorkbench"
+    ]
+
+    List_New = []
+    List_Changed = []
+    for WorkBenchName in List_Installed:
+        if WorkBenchName not in List_KnownWorkbenches:
+            List_New.append(WorkBenchName)
+        # Workbenches without a stored fingerprint (older data files) are assumed unchanged
+        elif WorkBenchName in Dict_Fingerprints:
+            if Dict_Fingerprints[WorkBenchName] != ReturnWorkbenchFingerprint(
+                WorkBenchName
+            ):
+                List_Changed.append(WorkBenchName)
+
+    List_Removed = [
+        WorkBenchName
+        for WorkBenchName in List_KnownWorkbenches
+        if WorkBenchName not in List_Installed
+    ]
+    return List_New, List_Changed, List_Removed
+
+
+class DataHarvester:
+    """
+    Collects the workbench, toolbar and command data for the data file.
+    Each workbench is activated only once. The command info is stored per command,
+    so that CommandInfoCorrections is called only once for each command.
+    """
+
+    def __init__(self):
+        # Cache for CommandInfoCorrections
+        self.Dict_CommandInfo = {}
+        # Set to True when the harvest is cancelled
+        self.Cancelled = False
+        return
+
+    def CommandInfo(self, CommandName: str) -> dict:
+        """
+        Returns the (corrected) command info. The result is stored for the next call.
+
+        Args:
+            CommandName (str): The name of the command.
+
+        Returns:
+            dict: The command info.
+        """
+        CommandInfo = self.Dict_CommandInfo.get(CommandName)
+        if CommandInfo is None:
+            CommandInfo = StandardFunctions.CommandInfoCorrections(CommandName)
+            self.Dict_CommandInfo[CommandName] = CommandInfo
+        return CommandInfo
+
+    def CommandRecord(
+        self, CommandName: str, WorkBenchName: str, EmptyIconName=""
+    ) -> Records_Ribbon.CommandRecord:
+        """
+        Returns the entry for List_Commands.
+
+        Args:
+            CommandName (str): The name of the command.
+            WorkBenchName (str): The name of the workbench.
+            EmptyIconName (optional): The icon name when the command has no pixmap. Defaults to "".
+
+        Returns:
+            CommandRecord: [CommandName, IconName, MenuName, WorkBenchName, MenuNameTranslated]
+        """
+        CommandInfo = self.CommandInfo(CommandName)
+        IconName = EmptyIconName
+        if CommandInfo["pixmap"] != "":
+            IconName = CommandInfo["pixmap"]
+        MenuName = CommandInfo["menuText"].replace("&", "")
+        MenuNameTranslated = CommandInfo["ActionText"].replace("&", "")
+        return Records_Ribbon.ReturnCommandRecord(
+            [CommandName, IconName, MenuName, WorkBenchName, MenuNameTranslated]
+        )
+
+    def HarvestWorkbench(self, WorkBenchName: str) -> dict:
+        """
+        Activates a workbench and collects its data.
+
+        Args:
+            WorkBenchName (str): The name of the workbench.
+
+        Returns:
+            dict: {"Workbench": List_Workbenches entry,
+                   "Toolbars": StringList_Toolbars entries,
+                   "Commands": List_Commands entries,
+                   "Fingerprint": fingerprint of the workbench}
+        """
+        # Get the fingerprint before activating. Used to detect changed workbenches later
+        Fingerprint = ReturnWorkbenchFingerprint(WorkBenchName)
+
+        Gui.activateWorkbench(WorkBenchName)
+        WorkBench = Gui.getWorkbench(WorkBenchName)
+
+        # Get the toolbar items and update them with corrections
+        ToolbarItems: dict = WorkBench.getToolbarItems()
+        ToolbarItems: dict = StandardFunctions.CorrectGetToolbarItems(ToolbarItems)
+
+        # Get the workbench info
+        IconName = str(WorkBench.Icon)
+        WorkbenchTitle = WorkBench.MenuText
+        WorkbenchTitleTranslated = StandardFunctions.TranslationsMapping(
+            WorkBenchName, WorkbenchTitle
+        )
+
+        # Get the toolbars
+        Toolbars = []
+        for Toolbar in WorkBench.listToolbars():
+            ToolBarTtranslated = StandardFunctions.TranslationsMapping(
+                WorkBenchName, Toolbar
+            )
+            Toolbars.append(
+                Records_Ribbon.ReturnToolbarRecord(
+                    [Toolbar, WorkbenchTitle, WorkBenchName, ToolBarTtranslated]
+                )
+            )
+
+        # Get the commands
+        Commands = []
+        for key, value in list(ToolbarItems.items()):
+            for CommandName in value:
+                if Gui.Command.get(CommandName) is not None:
+                    Commands.append(self.CommandRecord(CommandName, WorkBenchName))
+
+        return {
+            "Workbench": Records_Ribbon.ReturnWorkbenchRecord(
+                [
+                    str(WorkBenchName),
+                    IconName,
+                    WorkbenchTitle,
+                    ToolbarItems,
+                    WorkbenchTitleTranslated,
+                ]
+            ),
+            "Toolbars": Toolbars,
+            "Commands": Commands,
+            "Fingerprint": Fingerprint,
+        }
+
+    def Harvest(self, WorkBenchNames: list, ProgressCallback=None) -> list:
+        """
+        Collects the data of several workbenches.
+
+        Args:
+            WorkBenchNames (list): The names of the workbenches.
+            ProgressCallback (optional): Function(Index, Total, WorkBenchName) that is called before each
+                workbench. When it returns False, the harvest is cancelled. Defaults to None.
+
+        Returns:
+            list: The records from HarvestWorkbench, or None when cancelled.
+        """
+        Records = []
+        for i in range(len(WorkBenchNames)):
+            WorkBenchName = WorkBenchNames[i]
+            if (
+                WorkBenchName is None
+                or str(WorkBenchName) == ""
+                or str(WorkBenchName) == "NoneWorkbench"
+            ):
+                continue
+
+            if ProgressCallback is not None:
+                if ProgressCallback(i, len(WorkBenchNames), WorkBenchName) is False:
+                    self.Cancelled = True
+                    return None
+
+            try:
+                Records.append(self.HarvestWorkbench(WorkBenchName))
+            except Exception as e:
+                if Parameters_Ribbon.DEBUG_MODE is True:
+                    StandardFunctions.Print(f"{WorkBenchName}: {e}", "Warning")
+                continue
+
+        return Records
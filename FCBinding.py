@@ -94,6 +94,13 @@ import LoadLicenseForm_Ribbon
 import Standard_Functions_RIbbon as StandardFunctions
 from Standard_Functions_RIbbon import CommandInfoCorrections
 import Serialize_Ribbon
+import Scroll_Ribbon
+import WidgetPool_Ribbon
+import LayeredConfig_Ribbon
+import SharedData_Ribbon
+import TranslationCache_Ribbon
+import RibbonStructure_Ribbon
+import Records_Ribbon
 import StyleMapping
 import platform
 import math
@@ -140,9 +147,18 @@ class ModernMenu(RibbonBar):
     # Define a placeholder for the repro adress
     ReproAdress: str = ""
     # Placeholders for building the ribbonbar
-    ribbonStructure = {}
+    ribbonStructure = RibbonStructure_Ribbon.RibbonStructure()
     wbNameMapping = {}
     isWbLoaded = {}
+    # List of the loaded categories. The last item is the most recently used
+    List_LoadedCategories = []
+    # The ordered toolbars per category, with the toolbars of the workbench they are made from.
+    # Used to rebuild a category after it is unloaded
+    Dict_CategoryPlans = {}
+    # The custom buttons per category with their pool key. Returned to the pool when the category is unloaded
+    Dict_PooledButtons = {}
+    # Pool with buttons from unloaded categories
+    ButtonPool = WidgetPool_Ribbon.WidgetPool(Parameters_Ribbon.MAX_POOLED_BUTTONS)
     MainWindowLoaded = False
     LeaveEventEnabled = True
 
@@ -173,8 +189,9 @@ class ModernMenu(RibbonBar):
     # Declare the right padding for dropdown menus
     PaddingRight = 10
 
-    # Create the list for the commands
+    # Create the list for the commands and the index with the first record per command name
     List_Commands = []
+    Dict_CommandRecords = {}
 
     # Create the lists for the deserialized icons
     List_CommandIcons = []
@@ -200,10 +217,11 @@ class ModernMenu(RibbonBar):
         # connect the signals
         self.connectSignals()
 
-        # read ribbon structure from JSON file
-        with open(Parameters_Ribbon.RIBBON_STRUCTURE_JSON, "r") as file:
-            self.ribbonStructure.update(json.load(file))
-        file.close()
+        # read ribbon structure from JSON file. Wait until saved changes are written
+        # With a base layout, this is the base layout merged with the user changes
+        self.ribbonStructure.update(LayeredConfig_Ribbon.ReadStructure())
+        # The toolbar plans are made from the ribbon structure. Make them again after it is read
+        self.Dict_CategoryPlans = {}
 
         DataFile2 = os.path.join(os.path.dirname(__file__), "RibbonDataFile2.dat")
         if os.path.exists(DataFile2) is True:
@@ -213,10 +231,16 @@ class ModernMenu(RibbonBar):
                 Data.update(json.load(file))
             file.close()
             try:
-                # Load the list of commands
-                self.List_Commands = Data["List_Commands"]
+                # Load the list of commands. Older entries are upgraded here
+                self.List_Commands = Records_Ribbon.LoadRecords(Data)["List_Commands"]
             except Exception:
                 pass
+        else:
+            # Without a local data file, use the list of commands from the shared data store
+            SharedStore = SharedData_Ribbon.ReturnSharedStore()
+            if SharedStore is not None:
+                self.List_Commands = SharedStore.data().get("List_Commands", [])
+        self.Dict_CommandRecords = Records_Ribbon.ReturnIndex(self.List_Commands, "CommandName")
 
         # if FreeCAD is version 0.21 create a custom toolbar "Individual Views"
         if int(App.Version()[0]) == 0 and int(App.Version()[1]) <= 21:
@@ -303,6 +327,8 @@ class ModernMenu(RibbonBar):
         # Set the preferred toolbars
         PreferredToolbar = Parameters_Ribbon.Settings.GetIntSetting("Preferred_view")
         ListIgnoredToolbars: list = self.ribbonStructure["ignoredToolbars"]
+        # Keep a copy of the list as read, to write the structure only when the list is changed
+        List_ReadIgnoredToolbars = list(ListIgnoredToolbars)
         # check if the toolbar is already ignored
         View_Inlist = False
         ViewsRibbon_Inlist = False
@@ -344,11 +370,10 @@ class ModernMenu(RibbonBar):
             if ViewsRibbon_Inlist is False:
                 ListIgnoredToolbars.append("Views - Ribbon")
         self.ribbonStructure["ignoredToolbars"] = ListIgnoredToolbars
-        # write the change to the json file
-        # Writing to sample.json
-        with open(Parameters_Ribbon.RIBBON_STRUCTURE_JSON, "w") as outfile:
-            json.dump(self.ribbonStructure, outfile, indent=4)
-        outfile.close()
+        # write the change to the json file on a worker thread. Without a change, nothing is written,
+        # so the merged layers are not created again and the list is not copied into the user layer
+        if ListIgnoredToolbars != List_ReadIgnoredToolbars:
+            LayeredConfig_Ribbon.WriteStructure(self.ribbonStructure)
 
         # Get the address of the repository address
         PackageXML = os.path.join(os.path.dirname(__file__), "package.xml")
@@ -508,6 +533,7 @@ class ModernMenu(RibbonBar):
         self.tabBar().tabBarClicked.connect(self.onTabBarClicked)
 
         # override the default scroll behavior with a custom function
+        self.TabBarStepAccumulator = Scroll_Ribbon.StepAccumulator()
         self.tabBar().wheelEvent = lambda event_tabBar: self.wheelEvent_TabBar(event_tabBar)
         self.wheelEvent = lambda event_CC: self.wheelEvent_CC(event_CC)
         self.tabBar().setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -627,31 +653,22 @@ class ModernMenu(RibbonBar):
     # used to scroll a ribbon horizontally, when it's wider than the screen
     def wheelEvent_CC(self, event):
         if self.currentCategory().underMouse():
-            x = 0
-            # Get the scroll value (1 or -1)
-            delta = event.angleDelta().y()
-            x += delta and delta // abs(delta)
-
             NoClicks = Parameters_Ribbon.Settings.GetIntSetting("Ribbon_Scroll")
             if NoClicks == 0 or NoClicks is None:
                 NoClicks = 1
 
-            # go back or forward based on x.
-            if x == 1:
-                for i in range(NoClicks):
-                    self.currentCategory().scrollPrevious()
-            if x == -1:
-                for i in range(NoClicks):
-                    self.currentCategory().scrollNext()
+            # Scroll to the new position in one step, instead of scrolling NoClicks times
+            ScrollController = self.ReturnScrollController(self.currentCategory())
+            ScrollController.wheelEvent(event, StepsPerNotch=NoClicks)
         return
 
     # used to scroll the tabbar horizontally, when it's wider than the screen
     def wheelEvent_TabBar(self, event):
         if self.tabBar().underMouse():
-            x = 0
-            # Get the scroll value (1 or -1)
-            delta = event.angleDelta().y()
-            x += delta and delta // abs(delta)
+            # Get the number of steps. Small deltas from touchpads are accumulated until they form a step
+            Steps = self.TabBarStepAccumulator.wheelEvent(event)
+            if Steps == 0:
+                return
 
             ScrollButtons_Tab = self.tabBar().children()
             ScrollLeftButton_Tab: QToolButton = ScrollButtons_Tab[0]
@@ -661,15 +678,46 @@ class ModernMenu(RibbonBar):
             if NoClicks == 0 or NoClicks is None:
                 NoClicks = 1
 
-            # go back or forward based on x.
-            if x == 1:
-                for i in range(NoClicks):
-                    ScrollLeftButton_Tab.click()
-            if x == -1:
-                for i in range(NoClicks):
-                    ScrollRightButton_Tab.click()
+            # The tabbar can only scroll by its scroll buttons.
+            # Disable the updates while clicking, so that the tabbar is repainted only once.
+            self.tabBar().setUpdatesEnabled(False)
+            try:
+                ScrollButton = ScrollLeftButton_Tab
+                if Steps < 0:
+                    ScrollButton = ScrollRightButton_Tab
+                for i in range(abs(Steps) * NoClicks):
+                    ScrollButton.click()
+            finally:
+                self.tabBar().setUpdatesEnabled(True)
         return
 
+    def ReturnScrollController(self, category):
+        """_summary_ Returns the scroll controller of a category. Creates one if it does not exist yet.
+
+        Args:
+            category (RibbonCategory): The category to scroll.
+
+        Returns:
+            ScrollController: The scroll controller for the category
+        """
+        ScrollController = getattr(category, "ScrollController", None)
+        if ScrollController is None:
+            Duration = 120
+            if Parameters_Ribbon.RIBBON_INSTANTSCROLL is True:
+                Duration = 0
+            ScrollController = Scroll_Ribbon.ScrollController(
+                category._categoryScrollArea.horizontalScrollBar(),
+                StepSize=50,
+                Duration=Duration,
+                SnapEnabled=Parameters_Ribbon.RIBBON_SNAPTOPANELS,
+            )
+            # Snap to the left side of each panel
+            ScrollController.SnapPositions = lambda: [Panel.x() for Panel in category.panels().values()]
+            # Update the previous/next buttons once, when the target is reached
+            ScrollController.onFinished = category.autoSetScrollButtonsVisible
+            category.ScrollController = ScrollController
+        return ScrollController
+
     def connectSignals(self):
         self.tabBar().currentChanged.connect(self.onUserChangedWorkbench)
         mw.workbenchActivated.connect(self.onWbActivated)
@@ -737,10 +785,9 @@ class ModernMenu(RibbonBar):
                         # Find the command its workbench and activate it
                         QuickAction = Gui.Command.get(commandName).getAction()
                         if len(QuickAction) == 0:
-                            for CommandItem in self.List_Commands:
-                                if CommandItem[0] == commandName:
-                                    Gui.activateWorkbench(CommandItem[3])
-                                    break
+                            CommandItem = self.Dict_CommandRecords.get(commandName)
+                            if CommandItem is not None:
+                                Gui.activateWorkbench(CommandItem.WorkBenchName)
                     except Exception:
                         pass
                     QuickAction = Gui.Command.get(commandName).getAction()
@@ -877,7 +924,7 @@ class ModernMenu(RibbonBar):
                     name = workbench.MenuText.replace("&", "")
                     if (
                         name != ""
-                        and name not in self.ribbonStructure["ignoredWorkbenches"]
+                        and self.ribbonStructure.isIgnoredWorkbench(name) is False
                         and name != "<none>"
                         and name is not None
                     ):
@@ -1340,82 +1387,32 @@ class ModernMenu(RibbonBar):
         # check if the panel is already loaded. If so exit this function
         tabName = workbenchTitle
         if tabName in self.isWbLoaded and (self.isWbLoaded[tabName] or tabName == ""):
+            # Mark the category as most recently used
+            self.UpdateLoadedCategories(tabName)
             return
 
-        # Get the list of toolbars from the active workbench
-        ListToolbars: list = workbench.listToolbars()
-        # Get custom toolbars that are created in the toolbar environment and add them to the list of toolbars
-        CustomToolbars = self.List_ReturnCustomToolbars()
-        for CustomToolbar in CustomToolbars:
-            if CustomToolbar[1] == workbenchName:
-                ListToolbars.append(CustomToolbar[0])
-        # Get the global custom toolbars that are created in the toolbar environment and add them to the list of toolbars
-        CustomToolbars_Global = self.List_ReturnCustomToolbars_Global()
-        for CustomToolbar in CustomToolbars_Global:
-            ListToolbars.append(CustomToolbar[0])
-
-        # Get the custom panels and add them to the list of toolbars
-        try:
-            if workbenchName in self.ribbonStructure["customToolbars"]:
-                for CustomPanel in self.ribbonStructure["customToolbars"][workbenchName]:
-                    ListToolbars.append(CustomPanel)
-
-                    # remove the original toolbars from the list
-                    Commands = self.ribbonStructure["customToolbars"][workbenchName][CustomPanel]["commands"]
-                    for Command in Commands:
-                        try:
-                            OriginalToolbar = self.ribbonStructure["customToolbars"][workbenchName][CustomPanel][
-                                "commands"
-                            ][Command]
-                            ListToolbars.remove(OriginalToolbar)
-                        except Exception:
-                            continue
-        except Exception as e:
-            if Parameters_Ribbon.DEBUG_MODE is True:
-                StandardFunctions.Print(f"{e}, 1", "Warning")
-            pass
-
-        # Add the new panels to the toolbar list
-        try:
-            for WorkBenchItem in self.ribbonStructure["newPanels"]:
-                if WorkBenchItem == workbenchName or WorkBenchItem == "Global":
-                    for Panel in self.ribbonStructure["newPanels"][WorkBenchItem]:
-                        ListToolbars.append(Panel)
-        except Exception:
-            pass
-
-        try:
-            # Get the order of toolbars
-            ToolbarOrder: list = self.ribbonStructure["workbenches"][workbenchName]["toolbars"]["order"]
-
-            # Sort the list of toolbars according the toolbar order
-            def SortToolbars(toolbar):
-                if toolbar == "":
-                    return -1
-
-                position = None
-                try:
-                    position = ToolbarOrder.index(toolbar) + 1
-                except ValueError:
-                    position = 999999
-                    if toolbar.endswith("_custom") or toolbar.endswith("_newPanel"):
-                        if Parameters_Ribbon.DEFAULT_PANEL_POSITION_CUSTOM == "Right":
-                            position = 999999
-                        else:
-                            position = 0
-                return position
-
-            ListToolbars.sort(key=SortToolbars)
-        except Exception:
-            pass
+        # Get the ordered list of toolbars. Use the cached plan when this category is rebuilt after it was unloaded.
+        # When the workbench has other toolbars since the plan was made (e.g. after a reload), make the plan again
+        WorkbenchToolbars = tuple(workbench.listToolbars())
+        Plan = self.Dict_CategoryPlans.get(tabName)
+        if Plan is not None and Plan[0] == WorkbenchToolbars:
+            ListToolbars = list(Plan[1])
+        else:
+            ListToolbars = self.List_ReturnToolbarPlan(workbench, workbenchName)
+            self.Dict_CategoryPlans[tabName] = (WorkbenchToolbars, list(ListToolbars))
 
         # If the toolbar must be ignored, skip it
         for toolbar in ListToolbars:
-            if toolbar in self.ribbonStructure["ignoredToolbars"]:
+            if self.ribbonStructure.isIgnoredToolbar(toolbar):
                 continue
             if toolbar == "":
                 continue
 
+            # Get the settings of this toolbar. (None if the toolbar is not in the ribbon structure)
+            ToolbarRecord = self.ribbonStructure.toolbar(workbenchName, toolbar)
+            # Check if this is an icon only toolbar
+            IconOnly = self.ribbonStructure.isIconOnlyToolbar(toolbar)
+
             # Create the panel, use the toolbar name as title
             title = StandardFunctions.TranslationsMapping(workbenchName, toolbar)
             panel: RibbonPanel = self.currentCategory().addPanel(
@@ -1449,48 +1446,25 @@ class ModernMenu(RibbonBar):
             allButtons.extend(NewPanelList)
 
             # add separators to the command list.
-            if workbenchName in self.ribbonStructure["workbenches"]:
-                if toolbar != "" and toolbar in self.ribbonStructure["workbenches"][workbenchName]["toolbars"]:
-                    if "order" in self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar]:
-                        for j in range(
-                            len(self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar]["order"])
-                        ):
-                            if (
-                                "separator"
-                                in self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar]["order"][
-                                    j
-                                ].lower()
-                            ):
-                                separator = QToolButton()
-                                separator.setText(
-                                    self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar]["order"][j]
-                                )
-                                allButtons.insert(j, separator)
+            if ToolbarRecord is not None and ToolbarRecord.hasOrder():
+                for j, SeparatorName in ToolbarRecord.separators():
+                    separator = QToolButton()
+                    separator.setText(SeparatorName)
+                    allButtons.insert(j, separator)
 
-            if workbenchName in self.ribbonStructure["workbenches"]:
                 # order buttons like defined in ribbonStructure
-                if (
-                    toolbar in self.ribbonStructure["workbenches"][workbenchName]["toolbars"]
-                    and "order" in self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar]
-                ):
-                    OrderList: list = self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar]["order"]
+                Dict_Positions = ToolbarRecord.positions()
 
-                    # XXX check that positionsList consists of strings only
-                    def sortButtons(button: QToolButton):
-                        Text = button.text()
+                # XXX check that positionsList consists of strings only
+                def sortButtons(button: QToolButton):
+                    Text = button.text()
 
-                        if Text == "":
-                            return -1
+                    if Text == "":
+                        return -1
 
-                        position = None
-                        try:
-                            position = OrderList.index(Text)
-                        except ValueError:
-                            position = 999999
+                    return Dict_Positions.get(Text, ToolbarRecord.NotInOrder)
 
-                        return position
-
-                    allButtons.sort(key=sortButtons)
+                allButtons.sort(key=sortButtons)
 
             # add buttons to panel
             shadowList = (
@@ -1525,9 +1499,7 @@ class ModernMenu(RibbonBar):
                 buttonSize = "small"
                 try:
                     action = button.defaultAction()
-                    buttonSize = self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar]["commands"][
-                        action.data()
-                    ]["size"]
+                    buttonSize = ToolbarRecord.commands()[action.data()]["size"]
                     if buttonSize == "small":
                         NoSmallButtons_spacer += 1
                     if buttonSize == "medium":
@@ -1622,33 +1594,21 @@ class ModernMenu(RibbonBar):
 
                             # try to get alternative text from ribbonStructure
                             try:
-                                textJSON = self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar][
-                                    "commands"
-                                ][action.data()]["text"]
+                                if ToolbarRecord is None:
+                                    raise KeyError(toolbar)
+                                textJSON = ToolbarRecord.commands()[action.data()]["text"]
+                                StoredText = textJSON
 
                                 # There is a bug in freecad with the comp-sketch menu hase the wrong text
-                                if (
-                                    action.data() == "PartDesign_CompSketches"
-                                    and self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar][
-                                        "commands"
-                                    ][action.data()]["text"]
-                                    == "Create datum"
-                                ):
+                                if action.data() == "PartDesign_CompSketches" and StoredText == "Create datum":
                                     textJSON = "Create sketch"
 
                                 # Check if the original menutext is different
                                 # if so use the alternative, otherwise use original
-                                for CommandName in Gui.listCommands():
-                                    Command = Gui.Command.get(CommandName)
-                                    MenuName = CommandInfoCorrections(CommandName)["menuText"].replace("&", "")
-                                    if CommandName == action.data():
-                                        if (
-                                            MenuName
-                                            != self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar][
-                                                "commands"
-                                            ][action.data()]["text"]
-                                        ):
-                                            text = textJSON
+                                if action.data() is not None and Gui.Command.get(action.data()) is not None:
+                                    MenuName = CommandInfoCorrections(action.data())["menuText"].replace("&", "")
+                                    if MenuName != StoredText:
+                                        text = textJSON
 
                                 # the text would be overwritten again when the state of the action changes
                                 # (e.g. when getting enabled / disabled), therefore the action itself
@@ -1669,9 +1629,7 @@ class ModernMenu(RibbonBar):
                                 CommandName = button.text()
 
                             try:
-                                pixmap = self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar][
-                                    "commands"
-                                ][CommandName]["icon"]
+                                pixmap = ToolbarRecord.commands()[CommandName]["icon"]
                             except Exception:
                                 pass
                             actionIcon = self.ReturnCommandIcon(action.data(), pixmap)
@@ -1680,57 +1638,37 @@ class ModernMenu(RibbonBar):
 
                             # try to get alternative icon from ribbonStructure
                             try:
-                                icon_Json = self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar][
-                                    "commands"
-                                ][CommandName]["icon"]
+                                icon_Json = ToolbarRecord.commands()[CommandName]["icon"]
                                 if icon_Json != "":
                                     action.setIcon(Gui.getIcon(icon_Json))
-                            except KeyError:
+                            except (KeyError, AttributeError):
                                 pass
 
                             # If the icon is still none, try to retrieve it from the data file
                             if action.icon() is None or (action.icon() is not None and action.icon().isNull()):
                                 StandardFunctions.Print(f"An icon retrieved from data file for '{CommandName}'")
-                                DataFile = os.path.join(os.path.dirname(__file__), "RibbonDataFile.dat")
-
-                                if os.path.exists(DataFile) is True:
-                                    Data = {}
-                                    # read ribbon structure from JSON file
-                                    with open(DataFile, "r") as file:
-                                        Data.update(json.load(file))
-                                    file.close()
-                                    try:
-                                        # Load the lists for the deserialized icons
-                                        for IconItem in Data["Command_Icons"]:
-                                            # This works only for FreeCAD Commands
-                                            CommandName_Icon = action.data()
-                                            if CommandName_Icon == IconItem[0]:
-                                                Icon: QIcon = Serialize_Ribbon.deserializeIcon(IconItem[1])
-                                                action.setIcon(Icon)
-                                    except Exception as e:
-                                        if Parameters_Ribbon.DEBUG_MODE is True:
-                                            StandardFunctions.Print(
-                                                f"Trying the get an icon for {CommandName}\n{e}",
-                                                "Warning",
-                                            )
-                                        pass
+                                try:
+                                    # Only the icon of this command is read from the local or shared icon store
+                                    # This works only for FreeCAD Commands
+                                    Icon: QIcon = SharedData_Ribbon.ReturnStoredIcon(action.data())
+                                    if Icon is not None:
+                                        action.setIcon(Icon)
+                                except Exception as e:
+                                    if Parameters_Ribbon.DEBUG_MODE is True:
+                                        StandardFunctions.Print(
+                                            f"Trying the get an icon for {CommandName}\n{e}",
+                                            "Warning",
+                                        )
+                                    pass
 
                             # get button size from ribbonStructure
                             try:
-                                buttonSize = self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar][
-                                    "commands"
-                                ][CommandName]["size"]
+                                buttonSize = ToolbarRecord.commands()[CommandName]["size"]
                                 if buttonSize == "":
                                     buttonSize = "small"
-                            except KeyError:
+                            except (KeyError, AttributeError):
                                 pass
 
-                            # Check if this is an icon only toolbar
-                            IconOnly = False
-                            for iconToolbar in self.ribbonStructure["iconOnlyToolbars"]:
-                                if iconToolbar == toolbar:
-                                    IconOnly = True
-
                             btn = RibbonToolButton()
                             # Make sure that no strange "&" symbols are remainging
                             action.setText(action.text().replace("&", ""))
@@ -1748,23 +1686,27 @@ class ModernMenu(RibbonBar):
                                     Parameters_Ribbon.ICON_SIZE_SMALL,
                                     Parameters_Ribbon.ICON_SIZE_SMALL,
                                 )
-                                Menu = QMenu(self)
-                                if button.menu() is not None:
-                                    Menu = button.menu()
-                                btn = CustomControls.CustomToolButton(
-                                    Text=action.text(),
-                                    Action=action,
-                                    Icon=action.icon(),
-                                    IconSize=IconSize,
-                                    ButtonSize=ButtonSize,
-                                    FontSize=11,
-                                    showText=showText,
-                                    setWordWrap=False,
-                                    ElideMode=False,
-                                    MaxNumberOfLines=2,
-                                    Menu=Menu,
-                                    MenuButtonSpace=16,
-                                )
+                                # Only pass a menu when the command has one. (no empty menus for plain buttons)
+                                Menu = button.menu()
+                                # Reuse a button from an unloaded category if possible
+                                PoolKey = self.ReturnButtonPoolKey("small", CommandName, action, showText, Menu)
+                                btn = self.ReturnPooledButton(PoolKey, action, Menu)
+                                if btn is None:
+                                    btn = CustomControls.CustomToolButton(
+                                        Text=action.text(),
+                                        Action=action,
+                                        Icon=action.icon(),
+                                        IconSize=IconSize,
+                                        ButtonSize=ButtonSize,
+                                        FontSize=11,
+                                        showText=showText,
+                                        setWordWrap=False,
+                                        ElideMode=False,
+                                        MaxNumberOfLines=2,
+                                        Menu=Menu,
+                                        MenuButtonSpace=16,
+                                    )
+                                self.Dict_PooledButtons.setdefault(tabName, []).append([PoolKey, btn])
                                 # add the button as large button
                                 panel.addSmallWidget(
                                     btn,
@@ -1786,22 +1728,26 @@ class ModernMenu(RibbonBar):
                                     Parameters_Ribbon.ICON_SIZE_MEDIUM,
                                     Parameters_Ribbon.ICON_SIZE_MEDIUM,
                                 )
-                                Menu = QMenu(self)
-                                if button.menu() is not None:
-                                    Menu = button.menu()
-                                btn = CustomControls.CustomToolButton(
-                                    Text=action.text(),
-                                    Action=action,
-                                    Icon=action.icon(),
-                                    IconSize=IconSize,
-                                    ButtonSize=ButtonSize,
-                                    FontSize=11,
-                                    showText=showText,
-                                    setWordWrap=Parameters_Ribbon.WRAPTEXT_MEDIUM,
-                                    MaxNumberOfLines=2,
-                                    Menu=Menu,
-                                    MenuButtonSpace=16,
-                                )
+                                # Only pass a menu when the command has one. (no empty menus for plain buttons)
+                                Menu = button.menu()
+                                # Reuse a button from an unloaded category if possible
+                                PoolKey = self.ReturnButtonPoolKey("medium", CommandName, action, showText, Menu)
+                                btn = self.ReturnPooledButton(PoolKey, action, Menu)
+                                if btn is None:
+                                    btn = CustomControls.CustomToolButton(
+                                        Text=action.text(),
+                                        Action=action,
+                                        Icon=action.icon(),
+                                        IconSize=IconSize,
+                                        ButtonSize=ButtonSize,
+                                        FontSize=11,
+                                        showText=showText,
+                                        setWordWrap=Parameters_Ribbon.WRAPTEXT_MEDIUM,
+                                        MaxNumberOfLines=2,
+                                        Menu=Menu,
+                                        MenuButtonSpace=16,
+                                    )
+                                self.Dict_PooledButtons.setdefault(tabName, []).append([PoolKey, btn])
                                 # add the button as large button
                                 panel.addMediumWidget(
                                     btn,
@@ -1822,22 +1768,26 @@ class ModernMenu(RibbonBar):
                                     Parameters_Ribbon.ICON_SIZE_LARGE,
                                     Parameters_Ribbon.ICON_SIZE_LARGE,
                                 )
-                                Menu = QMenu(self)
-                                if button.menu() is not None:
-                                    Menu = button.menu()
-                                btn: QToolButton = CustomControls.LargeCustomToolButton(
-                                    Text=action.text(),
-                                    Action=action,
-                                    Icon=action.icon(),
-                                    IconSize=IconSize,
-                                    ButtonSize=ButtonSize,
-                                    FontSize=11,
-                                    showText=showText,
-                                    setWordWrap=Parameters_Ribbon.WRAPTEXT_LARGE,
-                                    MaxNumberOfLines=2,
-                                    Menu=Menu,
-                                    MenuButtonSpace=16,
-                                )
+                                # Only pass a menu when the command has one. (no empty menus for plain buttons)
+                                Menu = button.menu()
+                                # Reuse a button from an unloaded category if possible
+                                PoolKey = self.ReturnButtonPoolKey("large", CommandName, action, showText, Menu)
+                                btn = self.ReturnPooledButton(PoolKey, action, Menu)
+                                if btn is None:
+                                    btn = CustomControls.LargeCustomToolButton(
+                                        Text=action.text(),
+                                        Action=action,
+                                        Icon=action.icon(),
+                                        IconSize=IconSize,
+                                        ButtonSize=ButtonSize,
+                                        FontSize=11,
+                                        showText=showText,
+                                        setWordWrap=Parameters_Ribbon.WRAPTEXT_LARGE,
+                                        MaxNumberOfLines=2,
+                                        Menu=Menu,
+                                        MenuButtonSpace=16,
+                                    )
+                                self.Dict_PooledButtons.setdefault(tabName, []).append([PoolKey, btn])
                                 # add the button as large button
                                 panel.addLargeWidget(
                                     btn,
@@ -1906,44 +1856,22 @@ class ModernMenu(RibbonBar):
             self.RibbonHeight = self.ReturnRibbonHeight(self.RibbonOffset) + 6
 
             # Setup the panelOptionButton
-            actionList = []
-            for i in range(len(ButtonList)):
-                button = ButtonList[i]
-                if len(button.actions()) == 1:
-                    actionList.append(button.actions()[0])
-                if len(button.actions()) > 1:
-                    actionList.append(button.actions())
+            # Only the button is set up here. The menu is filled from ButtonList when it is opened for the first time,
+            # because most overflow menus are never opened.
             OptionButton = panel.panelOptionButton()
-            if len(actionList) > 0:
-                for i in range(len(actionList)):
-                    action = actionList[i]
-                    if isinstance(action, QAction):
-                        OptionButton.addAction(action)
-                    if isinstance(action, list):
-                        # if it is a submenu, it is a list with two items
-                        # The first, is the default action with text
-                        # The second is the action with all the subactions, but without text or icon
-
-                        # Get the first action
-                        action_0 = action[0]
-                        # Get the second action
-                        action_1 = action[1]
-                        # Set the text and icon for the second action with those from the first action
-                        action_1.setText(action_0.text())
-                        action_1.setIcon(action_0.icon())
-                        # Add the second action
-                        OptionButton.addAction(action_1)
-                if len(actionList) == 0:
-                    panel.panelOptionButton().hide()
+            if len(ButtonList) > 0:
+                OptionMenu = QMenu(OptionButton)
+                OptionMenu.aboutToShow.connect(
+                    lambda OptionMenu=OptionMenu, ButtonList=ButtonList: self.PopulateOverflowMenu(
+                        OptionMenu, ButtonList
+                    )
+                )
+                OptionButton.setMenu(OptionMenu)
 
                 # Set the behavior of the option button
                 OptionButton.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
                 # Remove the image to avoid double arrows
                 OptionButton.setStyleSheet("RibbonPanelOptionButton::menu-indicator {image: none;}")
-                Menu = OptionButton.menu()
-                if Menu is not None:
-                    hexColor = StyleMapping.ReturnStyleItem("Background_Color")
-                    Menu.setStyleSheet("background-color: " + hexColor)
                 # Set the icon
                 OptionButton_Icon = StyleMapping.ReturnStyleItem("OptionButton")
                 if OptionButton_Icon is not None:
@@ -1952,8 +1880,12 @@ class ModernMenu(RibbonBar):
                     OptionButton.setArrowType(Qt.ArrowType.DownArrow)
                     OptionButton.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
                     OptionButton.setText("more...")
+                OptionButton.show()
+            else:
+                OptionButton.hide()
 
         self.isWbLoaded[tabName] = True
+        self.UpdateLoadedCategories(tabName)
 
         # Set the previous/next buttons
         category = self.currentCategory()
@@ -1991,11 +1923,290 @@ class ModernMenu(RibbonBar):
         self.currentCategory().setMinimumHeight(self.RibbonHeight)
         self.currentCategory().setMaximumHeight(self.RibbonHeight)
         self.setRibbonHeight(self.RibbonHeight)
+
+        # Unload the least recently used categories when there are too many
+        self.UnloadCategories()
+
+        # Store the translations of the panel titles, if there are new ones
+        TranslationCache_Ribbon.SaveTranslationCache()
+        return
+
+    def List_ReturnToolbarPlan(self, workbench, workbenchName: str) -> list:
+        """_summary_ Returns the ordered list of toolbars (panels) for a workbench
+
+        Args:
+            workbench (Workbench): The workbench.
+            workbenchName (str): The name of the workbench.
+
+        Returns:
+            list: The ordered list of toolbars
+        """
+        # Get the list of toolbars from the active workbench
+        ListToolbars: list = workbench.listToolbars()
+        # Get custom toolbars that are created in the toolbar environment and add them to the list of toolbars
+        CustomToolbars = self.List_ReturnCustomToolbars()
+        for CustomToolbar in CustomToolbars:
+            if CustomToolbar[1] == workbenchName:
+                ListToolbars.append(CustomToolbar[0])
+        # Get the global custom toolbars that are created in the toolbar environment and add them to the list of toolbars
+        CustomToolbars_Global = self.List_ReturnCustomToolbars_Global()
+        for CustomToolbar in CustomToolbars_Global:
+            ListToolbars.append(CustomToolbar[0])
+
+        # Get the custom panels and add them to the list of toolbars
+        try:
+            if workbenchName in self.ribbonStructure["customToolbars"]:
+                for CustomPanel in self.ribbonStructure["customToolbars"][workbenchName]:
+                    ListToolbars.append(CustomPanel)
+
+                    # remove the original toolbars from the list
+                    Commands = self.ribbonStructure["customToolbars"][workbenchName][CustomPanel]["commands"]
+                    for Command in Commands:
+                        try:
+                            OriginalToolbar = self.ribbonStructure["customToolbars"][workbenchName][CustomPanel][
+                                "commands"
+                            ][Command]
+                            ListToolbars.remove(OriginalToolbar)
+                        except Exception:
+                            continue
+        except Exception as e:
+            if Parameters_Ribbon.DEBUG_MODE is True:
+                StandardFunctions.Print(f"{e}, 1", "Warning")
+            pass
+
+        # Add the new panels to the toolbar list
+        try:
+            for WorkBenchItem in self.ribbonStructure["newPanels"]:
+                if WorkBenchItem == workbenchName or WorkBenchItem == "Global":
+                    for Panel in self.ribbonStructure["newPanels"][WorkBenchItem]:
+                        ListToolbars.append(Panel)
+        except Exception:
+            pass
+
+        try:
+            # Get the order of toolbars. The position of each toolbar is looked up once
+            ToolbarOrder: list = self.ribbonStructure["workbenches"][workbenchName]["toolbars"]["order"]
+            Dict_ToolbarPositions = {}
+            for j in range(len(ToolbarOrder)):
+                Dict_ToolbarPositions.setdefault(ToolbarOrder[j], j)
+
+            # Sort the list of toolbars according the toolbar order
+            def SortToolbars(toolbar):
+                if toolbar == "":
+                    return -1
+
+                position = None
+                if toolbar in Dict_ToolbarPositions:
+                    position = Dict_ToolbarPositions[toolbar] + 1
+                else:
+                    position = 999999
+                    if toolbar.endswith("_custom") or toolbar.endswith("_newPanel"):
+                        if Parameters_Ribbon.DEFAULT_PANEL_POSITION_CUSTOM == "Right":
+                            position = 999999
+                        else:
+                            position = 0
+                return position
+
+            ListToolbars.sort(key=SortToolbars)
+        except Exception:
+            pass
+
+        return ListToolbars
+
+    def PopulateOverflowMenu(self, Menu: QMenu, ButtonList: list):
+        """_summary_ Fills the menu of a panelOptionButton with the actions of the buttons that did not fit in the panel.
+        Runs only once, the first time the menu is opened.
+
+        Args:
+            Menu (QMenu): The menu of the panelOptionButton
+            ButtonList (list): The toolbuttons beyond the maximum number of columns
+        """
+        # If the menu is already filled, exit this function
+        if len(Menu.actions()) > 0:
+            return
+
+        for button in ButtonList:
+            try:
+                if len(button.actions()) == 1:
+                    Menu.addAction(button.actions()[0])
+                if len(button.actions()) > 1:
+                    # if it is a submenu, it is a list with two items
+                    # The first, is the default action with text
+                    # The second is the action with all the subactions, but without text or icon
+
+                    # Get the first action
+                    action_0 = button.actions()[0]
+                    # Get the second action
+                    action_1 = button.actions()[1]
+                    # Set the text and icon for the second action with those from the first action
+                    action_1.setText(action_0.text())
+                    action_1.setIcon(action_0.icon())
+                    # Add the second action
+                    Menu.addAction(action_1)
+            except Exception as e:
+                if Parameters_Ribbon.DEBUG_MODE is True:
+                    StandardFunctions.Print(f"{e}, PopulateOverflowMenu", "Warning")
+                continue
+
+        hexColor = StyleMapping.ReturnStyleItem("Background_Color")
+        Menu.setStyleSheet("background-color: " + hexColor)
+        return
+
+    def ReturnButtonPoolKey(self, SizeClass: str, CommandName: str, action: QAction, showText: bool, Menu: QMenu):
+        """_summary_ Returns the key for a custom button in the button pool.
+        The layout of the custom buttons depends on the text, so only buttons with the same text can be reused.
+
+        Args:
+            SizeClass (str): "small", "medium" or "large"
+            CommandName (str): The name of the command
+            action (QAction): The action of the button
+            showText (bool): True if the text is shown
+            Menu (QMenu): The dropdown menu of the button or None
+
+        Returns:
+            tuple: The key
+        """
+        HasMenu = Menu is not None and len(Menu.actions()) > 1
+        return (SizeClass, CommandName, action.text(), showText, HasMenu)
+
+    def ReturnPooledButton(self, PoolKey: tuple, action: QAction, Menu: QMenu):
+        """_summary_ Takes a custom button from the button pool and binds it to the action and menu
+
+        Args:
+            PoolKey (tuple): The key from ReturnButtonPoolKey
+            action (QAction): The action of the button
+            Menu (QMenu): The dropdown menu of the button or None
+
+        Returns:
+            QToolButton: The custom button, or None if there is no button in the pool
+        """
+        btn = self.ButtonPool.take(PoolKey)
+        if btn is None:
+            return None
+
+        # Rebind the command button and the arrow button
+        for ChildButton in btn.findChildren(QToolButton):
+            if ChildButton.defaultAction() is not None:
+                ChildButton.setDefaultAction(action)
+            if ChildButton.menu() is not None and Menu is not None:
+                ChildButton.setMenu(Menu)
+        btn.show()
+        return btn
+
+    def UpdateLoadedCategories(self, tabName: str):
+        """_summary_ Moves a category to the end of the list with loaded categories (most recently used)
+
+        Args:
+            tabName (str): The title of the category
+        """
+        if tabName in self.List_LoadedCategories:
+            self.List_LoadedCategories.remove(tabName)
+        self.List_LoadedCategories.append(tabName)
+        return
+
+    def UnloadCategories(self):
+        """_summary_ Unloads the least recently used categories, when there are more loaded categories than
+        MAX_LOADED_CATEGORIES or when their icons use more than CATEGORY_MEMORY_BUDGET (MB).
+        The current category is never unloaded.
+        """
+        MaxCategories = Parameters_Ribbon.MAX_LOADED_CATEGORIES
+        MemoryBudget = Parameters_Ribbon.CATEGORY_MEMORY_BUDGET * 1024 * 1024
+        if MaxCategories <= 0 and MemoryBudget <= 0:
+            return
+
+        currentTab = self.tabBar().tabText(self.tabBar().currentIndex())
+        Statistics = {}
+        if MemoryBudget > 0:
+            Statistics = self.ReturnCategoryStatistics()
+
+        # Go through the categories, starting with the least recently used
+        for tabName in list(self.List_LoadedCategories):
+            if tabName == currentTab:
+                continue
+
+            TooMany = MaxCategories > 0 and len(self.List_LoadedCategories) > MaxCategories
+            TooLarge = False
+            if MemoryBudget > 0:
+                Memory = 0
+                for LoadedCategory in self.List_LoadedCategories:
+                    if LoadedCategory in Statistics:
+                        Memory = Memory + Statistics[LoadedCategory]["PixmapMemory"]
+                TooLarge = Memory > MemoryBudget
+            if TooMany is False and TooLarge is False:
+                break
+
+            self.UnloadCategory(tabName)
+        return
+
+    def UnloadCategory(self, tabName: str):
+        """_summary_ Deletes all panels of a category. The category is rebuild the next time it is activated.
+
+        Args:
+            tabName (str): The title of the category
+        """
+        try:
+            if Parameters_Ribbon.DEBUG_MODE is True:
+                Statistics = self.ReturnCategoryStatistics(tabName)[tabName]
+                PoolStatistics = self.ButtonPool.statistics()
+                StandardFunctions.Print(
+                    f"Unloading {tabName}: {Statistics['Widgets']} widgets, "
+                    f"{round(Statistics['PixmapMemory'] / 1024)} kB pixmaps. "
+                    f"Button pool: {PoolStatistics['Size']}/{PoolStatistics['MaxSize']} buttons, "
+                    f"hit rate {round(PoolStatistics['HitRate'] * 100)}%",
+                    "Log",
+                )
+            # Return the buttons to the pool, before the panels are deleted
+            for PoolKey, btn in self.Dict_PooledButtons.pop(tabName, []):
+                self.ButtonPool.release(PoolKey, btn)
+            category = self.categories()[tabName]
+            category.clearPanels()
+        except Exception as e:
+            if Parameters_Ribbon.DEBUG_MODE is True:
+                StandardFunctions.Print(f"{e}, UnloadCategory", "Warning")
+
+        self.isWbLoaded[tabName] = False
+        if tabName in self.List_LoadedCategories:
+            self.List_LoadedCategories.remove(tabName)
         return
 
+    def ReturnCategoryStatistics(self, tabName: str = None) -> dict:
+        """_summary_ Returns the number of widgets and the estimated memory of the icons per category.
+        Used for debugging.
+
+        Args:
+            tabName (str, optional): The title of the category. Defaults to None (all categories).
+
+        Returns:
+            dict: {tabName: {"Loaded": bool, "Widgets": int, "PixmapMemory": int (bytes)}}
+        """
+        Statistics = {}
+        for Name, category in self.categories().items():
+            if tabName is not None and Name != tabName:
+                continue
+
+            # Estimate the pixmap memory. Icons are rendered at the icon size, with 4 bytes per pixel
+            PixelRatio = category.devicePixelRatioF()
+            PixmapMemory = 0
+            for Button in category.findChildren(QToolButton):
+                if Button.icon().isNull() is False:
+                    Size = Button.iconSize()
+                    PixmapMemory = PixmapMemory + int(Size.width() * Size.height() * 4 * PixelRatio * PixelRatio)
+
+            Statistics[Name] = {
+                "Loaded": self.isWbLoaded.get(Name, False),
+                "Widgets": len(category.findChildren(QWidget)),
+                "PixmapMemory": PixmapMemory,
+            }
+        return Statistics
+
     def on_ScrollButton_Category_clicked(self, event, ScrollButton: RibbonCategoryLayoutButton):
-        for i in range(Parameters_Ribbon.RIBBON_CLICKSPEED):
-            ScrollButton.click()
+        category = self.currentCategory()
+        Steps = Parameters_Ribbon.RIBBON_CLICKSPEED
+        if ScrollButton is category._previousButton:
+            Steps = -Steps
+
+        # Scroll to the new position in one step, instead of clicking the button RIBBON_CLICKSPEED times
+        self.ReturnScrollController(category).scrollSteps(Steps)
         return
 
     def updateCurrentTab(self):
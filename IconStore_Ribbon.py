@@ -0,0 +1,579 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+
+# Binary store for the icons of workbenches and commands.
+#
+# Layout of the file:
+#   header      : magic (8 bytes), version (uint32), length of the index (uint32)
+#   index       : json with per workbench/command the key of its icon,
+#                 per icon a list of pixmaps [width, height, mode, state, blob]
+#                 and a list of blobs [offset, length]
+#   blobs       : raw PNG data. Equal pixmaps are stored only once.
+#
+# The file is read with mmap, so only the pixmaps of requested icons are read from disk.
+import os
+import json
+import mmap
+import struct
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, Future
+from PySide.QtGui import QIcon, QPixmap, QImage
+from PySide.QtCore import QByteArray
+import Serialize_Ribbon
+
+# The default locations of the icon store and the data file with the lists
+STORE_FILE = os.path.join(os.path.dirname(__file__), "RibbonIcons.dat")
+DATA_FILE = os.path.join(os.path.dirname(__file__), "RibbonDataFile.dat")
+
+MAGIC = b"RIBICONS"
+VERSION = 2
+HEADER = struct.Struct("<8sII")
+
+# The kinds of icons in the store
+WORKBENCHES = "Workbenches"
+COMMANDS = "Commands"
+
+Dict_Modes = {
+    "normal": QIcon.Mode.Normal,
+    "disabled": QIcon.Mode.Disabled,
+    "active": QIcon.Mode.Active,
+    "selected": QIcon.Mode.Selected,
+}
+Dict_States = {
+    "off": QIcon.State.Off,
+    "on": QIcon.State.On,
+}
+
+
+def ReturnDistinctImages(Icon: QIcon) -> list:
+    """
+    Renders an icon and returns only the renders that Qt cannot derive itself.
+    The normal "off" render is always returned. Other renders are compared with the render
+    of an icon that contains only the returned images.
+
+    Args:
+        Icon (QIcon): The icon.
+
+    Returns:
+        list: [Width, Height, Mode, State, QImage] per distinct render.
+    """
+    List_Images = []
+    for Size in Icon.availableSizes():
+        # The icon with the renders so far. Qt derives the missing modes and states from it
+        Derived = QIcon()
+        for Mode, QtMode in Dict_Modes.items():
+            for State, QtState in Dict_States.items():
+                Pixmap = Icon.pixmap(Size, QtMode, QtState)
+                Image = Pixmap.toImage()
+                if Mode != "normal" or State != "off":
+                    if Image == Derived.pixmap(Size, QtMode, QtState).toImage():
+                        continue
+                Derived.addPixmap(Pixmap, QtMode, QtState)
+                List_Images.append([Size.width(), Size.height(), Mode, State, Image])
+    return List_Images
+
+
+def EncodeImage(Image: QImage) -> tuple:
+    """
+    Encodes an image to PNG and hashes the data. Runs on a worker thread.
+
+    Args:
+        Image (QImage): The image.
+
+    Returns:
+        tuple: (PNG data, hash)
+    """
+    Data = Serialize_Ribbon.imageToBytes(Image)
+    return Data, hashlib.sha1(Data).hexdigest()
+
+
+class IconStore:
+    """
+    Reads icons from an icon store. Icons are decoded when they are requested.
+    """
+
+    def __init__(self, FileName: str = STORE_FILE):
+        self.FileName = FileName
+        self.File = None
+        self.Map = None
+        self.Index = {WORKBENCHES: {}, COMMANDS: {}}
+        self.Dict_StoredIcons = {}
+        self.List_Blobs = []
+        self.BlobOffset = 0
+        # Cache for decoded icons
+        self.Dict_Icons = {}
+
+        self.File = open(FileName, "rb")
+        try:
+            self.Map = mmap.mmap(self.File.fileno(), 0, access=mmap.ACCESS_READ)
+            Magic, Version, IndexLength = HEADER.unpack_from(self.Map, 0)
+            if Magic != MAGIC or Version > VERSION:
+                raise ValueError(f"{FileName} is not a valid icon store")
+
+            Index = json.loads(
+                self.Map[HEADER.size : HEADER.size + IndexLength].decode("utf-8")
+            )
+            self.Index[WORKBENCHES] = Index[WORKBENCHES]
+            self.Index[COMMANDS] = Index[COMMANDS]
+            self.Dict_StoredIcons = Index.get("Icons", {})
+            self.List_Blobs = Index["Blobs"]
+            self.BlobOffset = HEADER.size + IndexLength
+        except Exception:
+            self.close()
+            raise
+        return
+
+    def names(self, Kind: str = COMMANDS) -> list:
+        """
+        Returns the names of all icons of a kind.
+
+        Args:
+            Kind (str, optional): WORKBENCHES or COMMANDS. Defaults to COMMANDS.
+
+        Returns:
+            list: The names.
+        """
+        return list(self.Index[Kind].keys())
+
+    def hasIcon(self, Name: str, Kind: str = COMMANDS) -> bool:
+        return Name in self.Index[Kind]
+
+    def blob(self, BlobIndex: int) -> bytes:
+        """
+        Returns the PNG data of a blob.
+
+        Args:
+            BlobIndex (int): The index of the blob.
+
+        Returns:
+            bytes: The PNG data.
+        """
+        Offset, Length = self.List_Blobs[BlobIndex][0], self.List_Blobs[BlobIndex][1]
+        Start = self.BlobOffset + Offset
+        return self.Map[Start : Start + Length]
+
+    def icon(self, Name: str, Kind: str = COMMANDS) -> QIcon:
+        """
+        Returns an icon from the store.
+
+        Args:
+            Name (str): The name of the workbench or command.
+            Kind (str, optional): WORKBENCHES or COMMANDS. Defaults to COMMANDS.
+
+        Returns:
+            QIcon: The icon, or None when the icon is not in the store.
+        """
+        Key = (Kind, Name)
+        if Key in self.Dict_Icons:
+            return self.Dict_Icons[Key]
+
+        List_Pixmaps = self.Index[Kind].get(Name)
+        if List_Pixmaps is None:
+            return None
+        # Icons can be shared. The index refers to the stored icon then (since version 2)
+        if isinstance(List_Pixmaps, str):
+            List_Pixmaps = self.Dict_StoredIcons[List_Pixmaps]
+
+        # Only the distinct renders are stored. QIcon derives the other modes and states
+        Icon = QIcon()
+        for Width, Height, Mode, State, BlobIndex in List_Pixmaps:
+            Pixmap = QPixmap()
+            Pixmap.loadFromData(self.blob(BlobIndex), "PNG")
+            Icon.addPixmap(Pixmap, Dict_Modes[Mode], Dict_States[State])
+        self.Dict_Icons[Key] = Icon
+        return Icon
+
+    def close(self):
+        if self.Map is not None:
+            self.Map.close()
+            self.Map = None
+        if self.File is not None:
+            self.File.close()
+            self.File = None
+        self.Dict_Icons.clear()
+        return
+
+
+class IconStoreWriter:
+    """
+    Creates an icon store. Only distinct renders are stored:
+    - Equal pixmaps are stored only once (by content hash).
+    - Modes and states that Qt derives itself (e.g. disabled) are not stored.
+    - Icons with the same pixmap name or the same content are shared by all commands.
+    """
+
+    def __init__(self, Workers: int = None):
+        self.Index = {WORKBENCHES: {}, COMMANDS: {}}
+        # The pixmaps per icon key
+        self.Dict_Icons = {}
+        self.List_Blobs = []
+        self.Dict_Hashes = {}
+        # Icon key per pixmap name and per content
+        self.Dict_PixmapNames = {}
+        self.Dict_Signatures = {}
+        # The names of all added icons (stored or pending)
+        self.Set_Names = set()
+
+        # PNG encoding and hashing is done by a pool of workers. Rendering stays on the GUI thread.
+        # The icons wait in List_Pending until they are encoded. They are stored in the order they were added,
+        # so the file is the same for any number of workers. Workers = 0 encodes on the calling thread.
+        if Workers is None:
+            Workers = min(8, os.cpu_count() or 1)
+        self.Executor = None
+        if Workers > 0:
+            self.Executor = ThreadPoolExecutor(max_workers=Workers)
+        self.List_Pending = []
+        return
+
+    def addBlob(self, Data: bytes, Hash: str = None) -> int:
+        """
+        Adds PNG data to the store. If the same data is already stored, that blob is used.
+
+        Args:
+            Data (bytes): The PNG data.
+            Hash (str, optional): The hash of the data, when already calculated. Defaults to None.
+
+        Returns:
+            int: The index of the blob.
+        """
+        if Hash is None:
+            Hash = hashlib.sha1(Data).hexdigest()
+        BlobIndex = self.Dict_Hashes.get(Hash)
+        if BlobIndex is None:
+            BlobIndex = len(self.List_Blobs)
+            self.List_Blobs.append(Data)
+            self.Dict_Hashes[Hash] = BlobIndex
+        return BlobIndex
+
+    def addPixmapList(self, List_Names: list, List_Pixmaps: list, PixmapName: str = ""):
+        """
+        Adds the pixmaps of an icon. If an icon with the same content is already stored, that icon is shared.
+
+        Args:
+            List_Names (list): [Kind, Name] per workbench or command that uses the icon.
+            List_Pixmaps (list): [Width, Height, Mode, State, BlobIndex] per pixmap.
+            PixmapName (str, optional): The pixmap name of the icon. Defaults to "".
+        """
+        Signature = json.dumps(List_Pixmaps)
+        IconKey = self.Dict_Signatures.get(Signature)
+        if IconKey is None:
+            IconKey = str(len(self.Dict_Icons))
+            self.Dict_Icons[IconKey] = List_Pixmaps
+            self.Dict_Signatures[Signature] = IconKey
+
+        for Kind, Name in List_Names:
+            self.Index[Kind][Name] = IconKey
+        if PixmapName != "":
+            self.Dict_PixmapNames[PixmapName] = IconKey
+        return
+
+    def addSharedIcon(self, Name: str, Kind: str, PixmapName: str) -> bool:
+        """
+        Shares an icon that is already stored or pending, based on its pixmap name.
+
+        Returns:
+            bool: True if the icon is shared. False if the icon must be rendered.
+        """
+        # Commands can be listed more than once. Store their icon only once
+        if (Kind, Name) in self.Set_Names:
+            return True
+        if (
+            PixmapName is None
+            or PixmapName == ""
+            or PixmapName not in self.Dict_PixmapNames
+        ):
+            return False
+
+        self.Set_Names.add((Kind, Name))
+        Shared = self.Dict_PixmapNames[PixmapName]
+        # The icon is not encoded yet. Add the name to the pending icon
+        if isinstance(Shared, dict):
+            Shared["Names"].append([Kind, Name])
+        else:
+            self.Index[Kind][Name] = Shared
+        return True
+
+    def addIcon(
+        self, Name: str, Icon: QIcon, Kind: str = COMMANDS, PixmapName: str = ""
+    ):
+        """
+        Adds the distinct pixmaps of an icon to the store.
+        The icon is rendered directly. Encoding is done by the workers.
+
+        Args:
+            Name (str): The name of the workbench or command.
+            Icon (QIcon): The icon.
+            Kind (str, optional): WORKBENCHES or COMMANDS. Defaults to COMMANDS.
+            PixmapName (str, optional): The pixmap name. Icons with the same name are stored once. Defaults to "".
+        """
+        if self.addSharedIcon(Name, Kind, PixmapName) is True:
+            return
+
+        Pending = {"Names": [[Kind, Name]], "PixmapName": PixmapName, "Pixmaps": []}
+        for Width, Height, Mode, State, Image in ReturnDistinctImages(Icon):
+            if self.Executor is not None:
+                Result = self.Executor.submit(EncodeImage, Image)
+            else:
+                Result = EncodeImage(Image)
+            Pending["Pixmaps"].append([Width, Height, Mode, State, Result])
+
+        self.Set_Names.add((Kind, Name))
+        if PixmapName is not None and PixmapName != "":
+            self.Dict_PixmapNames[PixmapName] = Pending
+        else:
+            Pending["PixmapName"] = ""
+        self.List_Pending.append(Pending)
+        return
+
+    def collect(self, Wait: bool = False) -> int:
+        """
+        Stores the encoded icons. Icons are stored in the order they were added.
+
+        Args:
+            Wait (bool, optional): Wait for all pending icons. Defaults to False.
+
+        Returns:
+            int: The number of icons that are still pending.
+        """
+        while len(self.List_Pending) > 0:
+            Pending = self.List_Pending[0]
+            if Wait is False:
+                for Pixmap in Pending["Pixmaps"]:
+                    if isinstance(Pixmap[4], Future) and Pixmap[4].done() is False:
+                        return len(self.List_Pending)
+
+            List_Pixmaps = []
+            for Width, Height, Mode, State, Result in Pending["Pixmaps"]:
+                if isinstance(Result, Future):
+                    Result = Result.result()
+                Data, Hash = Result
+                List_Pixmaps.append(
+                    [Width, Height, Mode, State, self.addBlob(Data, Hash)]
+                )
+            self.addPixmapList(Pending["Names"], List_Pixmaps, Pending["PixmapName"])
+            self.List_Pending.pop(0)
+        return 0
+
+    def addSerializedIcon(self, Name: str, iconPixmaps: dict, Kind: str = COMMANDS):
+        """
+        Adds an icon that is serialized with Serialize_Ribbon.serializeIcon.
+        Renders that are equal to the normal render (or to the "off" state) are skipped.
+
+        Args:
+            Name (str): The name of the workbench or command.
+            iconPixmaps (dict): The serialized icon.
+            Kind (str, optional): WORKBENCHES or COMMANDS. Defaults to COMMANDS.
+        """
+        if self.addSharedIcon(Name, Kind, "") is True:
+            return
+        # Keep the order of the blobs
+        self.collect(Wait=True)
+
+        List_Pixmaps = []
+        for strW, wPixmaps in iconPixmaps.items():
+            for strH, hPixmaps in wPixmaps.items():
+                for Mode, modePixmaps in hPixmaps.items():
+                    for State, statePixmap in modePixmaps.items():
+                        # Active and selected are derived from normal, "on" is derived from "off".
+                        # Disabled is generated by Qt and must be stored when it exists in the data.
+                        if Mode in (
+                            "active",
+                            "selected",
+                        ) and statePixmap == hPixmaps.get("normal", {}).get(State):
+                            continue
+                        if State == "on" and statePixmap == modePixmaps.get("off"):
+                            continue
+                        Data = bytes(
+                            QByteArray.fromBase64(
+                                bytearray(statePixmap.encode("utf-8"))
+                            ).data()
+                        )
+                        List_Pixmaps.append(
+                            [int(strW), int(strH), Mode, State, self.addBlob(Data)]
+                        )
+        self.Set_Names.add((Kind, Name))
+        self.addPixmapList([[Kind, Name]], List_Pixmaps)
+        return
+
+    def copyIcon(self, Store: IconStore, Name: str, Kind: str = COMMANDS) -> bool:
+        """
+        Copies an icon from another store, without decoding it.
+
+        Args:
+            Store (IconStore): The store to copy from.
+            Name (str): The name of the workbench or command.
+            Kind (str, optional): WORKBENCHES or COMMANDS. Defaults to COMMANDS.
+
+        Returns:
+            bool: True if the icon is copied.
+        """
+        if (Kind, Name) in self.Set_Names:
+            return True
+        List_Pixmaps = Store.Index[Kind].get(Name)
+        if List_Pixmaps is None:
+            return False
+        if isinstance(List_Pixmaps, str):
+            List_Pixmaps = Store.Dict_StoredIcons[List_Pixmaps]
+        # Keep the order of the blobs
+        self.collect(Wait=True)
+
+        List_Copied = []
+        for Width, Height, Mode, State, BlobIndex in List_Pixmaps:
+            List_Copied.append(
+                [Width, Height, Mode, State, self.addBlob(Store.blob(BlobIndex))]
+            )
+        self.Set_Names.add((Kind, Name))
+        self.addPixmapList([[Kind, Name]], List_Copied)
+        return True
+
+    def write(self, FileName: str = STORE_FILE):
+        """
+        Writes the store to a file. The file is replaced only when writing succeeded.
+
+        Args:
+            FileName (str, optional): The file name. Defaults to STORE_FILE.
+        """
+        # Wait for the workers
+        self.collect(Wait=True)
+        if self.Executor is not None:
+            self.Executor.shutdown()
+            self.Executor = None
+
+        List_BlobIndex = []
+        Offset = 0
+        for Data in self.List_Blobs:
+            List_BlobIndex.append([Offset, len(Data)])
+            Offset = Offset + len(Data)
+
+        Index = {
+            WORKBENCHES: self.Index[WORKBENCHES],
+            COMMANDS: self.Index[COMMANDS],
+            "Icons": self.Dict_Icons,
+            "Blobs": List_BlobIndex,
+        }
+        IndexData = json.dumps(Index, separators=(",", ":"), sort_keys=True).encode(
+            "utf-8"
+        )
+
+        TempFile = FileName + ".tmp"
+        with open(TempFile, "wb") as outfile:
+            outfile.write(HEADER.pack(MAGIC, VERSION, len(IndexData)))
+            outfile.write(IndexData)
+            for Data in self.List_Blobs:
+                outfile.write(Data)
+
+        # Close the shared store first. An open (mapped) file cannot be replaced on all systems
+        CloseIconStore()
+        os.replace(TempFile, FileName)
+        return
+
+
+# The shared store and the modification time of its file
+_Store = None
+_StoreTime = None
+# The store files for which the migration failed. The migration is tried once per session
+_Set_NotMigrated = set()
+
+
+def ReturnIconStore(FileName: str = STORE_FILE):
+    """
+    Returns the shared icon store. The store is opened again when the file is changed.
+    When there is no store yet, icons from an older data file are migrated first.
+    This is tried once per session.
+
+    Returns:
+        IconStore: The store, or None when there is no store.
+    """
+    global _Store, _StoreTime
+
+    if os.path.exists(FileName) is False:
+        CloseIconStore()
+        if FileName in _Set_NotMigrated:
+            return None
+        try:
+            Migrated = MigrateDataFile(DATA_FILE, FileName)
+        except Exception:
+            Migrated = False
+        if Migrated is False:
+            _Set_NotMigrated.add(FileName)
+            return None
+
+    FileTime = os.path.getmtime(FileName)
+    if _Store is None or _StoreTime != FileTime or _Store.FileName != FileName:
+        CloseIconStore()
+        try:
+            _Store = IconStore(FileName)
+            _StoreTime = FileTime
+        except Exception:
+            _Store = None
+    return _Store
+
+
+def CloseIconStore():
+    global _Store, _StoreTime
+
+    if _Store is not None:
+        _Store.close()
+    _Store = None
+    _StoreTime = None
+    return
+
+
+def MigrateDataFile(DataFile: str = DATA_FILE, StoreFile: str = STORE_FILE) -> bool:
+    """
+    Moves the base64 icons from an older data file to an icon store.
+    The data file is written again without the icons.
+
+    Args:
+        DataFile (str, optional): The data file. Defaults to DATA_FILE.
+        StoreFile (str, optional): The icon store. Defaults to STORE_FILE.
+
+    Returns:
+        bool: True if the icons are migrated.
+    """
+    if os.path.exists(DataFile) is False:
+        return False
+
+    Data = {}
+    with open(DataFile, "r") as file:
+        Data.update(json.load(file))
+    file.close()
+
+    if "WorkBench_Icons" not in Data and "Command_Icons" not in Data:
+        return False
+
+    Writer = IconStoreWriter()
+    for IconItem in Data.get("WorkBench_Icons", []):
+        Writer.addSerializedIcon(IconItem[0], IconItem[1], WORKBENCHES)
+    for IconItem in Data.get("Command_Icons", []):
+        Writer.addSerializedIcon(IconItem[0], IconItem[1], COMMANDS)
+    Writer.write(StoreFile)
+
+    # Write the data file again with only the lists
+    Data.pop("WorkBench_Icons", None)
+    Data.pop("Command_Icons", None)
+    TempFile = DataFile + ".tmp"
+    with open(TempFile, "w") as outfile:
+        json.dump(Data, outfile, indent=4)
+    outfile.close()
+    os.replace(TempFile, DataFile)
+    return True
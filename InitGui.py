@@ -49,7 +49,15 @@ source_default = os.path.join(
 fileExists = os.path.isfile(file)
 # if not, copy and rename
 if fileExists is False:
-    shutil.copy(source, file)
+    # With a base layout, start with an empty list of user changes
+    if (
+        Parameters_Ribbon.RIBBON_STRUCTURE_BASE != ""
+        and file == Parameters_Ribbon.RIBBON_STRUCTURE_JSON
+    ):
+        with open(file, "w") as outfile:
+            outfile.write("{}")
+    else:
+        shutil.copy(source, file)
 
 # check if file exits
 fileExists = os.path.isfile(file_default)
@@ -0,0 +1,191 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+import os
+import stat
+import json
+import atexit
+import tempfile
+import threading
+import Parameters_Ribbon
+import Standard_Functions_RIbbon as StandardFunctions
+
+
+def WriteFileAtomic(FileName: str, Data: bytes):
+    """
+    Writes a file in one step. The data is written to a temporary file in the same folder,
+    synced to disk and then renamed over the file. When the write fails, the old file is untouched.
+
+    Args:
+        FileName (str): The file to write.
+        Data (bytes): The content.
+    """
+    Folder = os.path.dirname(os.path.abspath(FileName))
+    Handle, TempFile = tempfile.mkstemp(
+        prefix=os.path.basename(FileName) + ".", suffix=".tmp", dir=Folder
+    )
+    try:
+        with os.fdopen(Handle, "wb") as TempOutput:
+            TempOutput.write(Data)
+            TempOutput.flush()
+            os.fsync(TempOutput.fileno())
+        # Keep the permissions of the existing file
+        if os.path.exists(FileName):
+            os.chmod(TempFile, stat.S_IMODE(os.stat(FileName).st_mode))
+        os.replace(TempFile, FileName)
+    except Exception:
+        try:
+            os.remove(TempFile)
+        except Exception:
+            pass
+        raise
+
+    # Sync the folder, so that the rename is on disk as well
+    if os.name == "posix":
+        try:
+            FolderHandle = os.open(Folder, os.O_RDONLY)
+            try:
+                os.fsync(FolderHandle)
+            finally:
+                os.close(FolderHandle)
+        except Exception:
+            pass
+    return
+
+
+class JsonWriter:
+    """
+    Writes json files on a worker thread.
+    The data is serialized on the calling thread, so later changes to the data do not affect the save.
+    Saves of the same file that follow each other quickly are combined: only the last one is written.
+    """
+
+    # Time in seconds to wait for more saves before writing
+    CoalesceDelay = 0.25
+
+    def __init__(self):
+        self.Condition = threading.Condition()
+        # The text to write per file
+        self.Dict_Pending = {}
+        # The worker thread. None when there is nothing to write
+        self.Thread = None
+        # Set by flush, to write without waiting for more saves
+        self.Flushing = False
+        return
+
+    def save(self, FileName: str, Data, indent=4):
+        """
+        Serializes the data and schedules the write.
+
+        Args:
+            FileName (str): The json file.
+            Data: The data to write.
+            indent (int, optional): The indent of the json file. Defaults to 4.
+        """
+        Text = json.dumps(Data, indent=indent)
+        with self.Condition:
+            self.Dict_Pending[FileName] = Text
+            if self.Thread is None:
+                self.Thread = threading.Thread(
+                    target=self.run, name="Ribbon json writer", daemon=True
+                )
+                self.Thread.start()
+            self.Condition.notify_all()
+        return
+
+    def run(self):
+        while True:
+            with self.Condition:
+                # Wait for more saves, unless a flush is requested
+                self.Condition.wait_for(
+                    lambda: self.Flushing is True, self.CoalesceDelay
+                )
+                if len(self.Dict_Pending) == 0:
+                    self.Thread = None
+                    self.Condition.notify_all()
+                    return
+                Dict_Write = self.Dict_Pending
+                self.Dict_Pending = {}
+
+            for FileName, Text in Dict_Write.items():
+                try:
+                    WriteFileAtomic(FileName, Text.encode("utf-8"))
+                except Exception as e:
+                    StandardFunctions.Print(f"Failed to write {FileName}: {e}", "Error")
+
+    def flush(self, Timeout: float = 10):
+        """
+        Writes all scheduled saves and waits until they are written.
+
+        Args:
+            Timeout (float, optional): The maximum time to wait in seconds. Defaults to 10.
+
+        Returns:
+            bool: True when everything is written.
+        """
+        with self.Condition:
+            if self.Thread is None or self.Thread is threading.current_thread():
+                return len(self.Dict_Pending) == 0
+            self.Flushing = True
+            self.Condition.notify_all()
+            Result = self.Condition.wait_for(lambda: self.Thread is None, Timeout)
+            self.Flushing = False
+        if Result is False and Parameters_Ribbon.DEBUG_MODE is True:
+            StandardFunctions.Print("Json files are still being written", "Warning")
+        return Result
+
+
+# The writer that is shared by the ribbon and the design dialog
+_JsonWriter = None
+
+
+def ReturnJsonWriter() -> JsonWriter:
+    """
+    Returns the shared json writer. The writer is flushed when FreeCAD closes.
+    """
+    global _JsonWriter
+    if _JsonWriter is None:
+        _JsonWriter = JsonWriter()
+        atexit.register(FlushJson)
+        try:
+            from PySide.QtWidgets import QApplication
+
+            QApplication.instance().aboutToQuit.connect(FlushJson)
+        except Exception:
+            pass
+    return _JsonWriter
+
+
+def SaveJson(FileName: str, Data, indent=4):
+    """
+    Saves data to a json file on the worker thread. See JsonWriter.save.
+    """
+    ReturnJsonWriter().save(FileName, Data, indent)
+    return
+
+
+def FlushJson(Timeout: float = 10) -> bool:
+    """
+    Waits until all saved json files are written. Call this before reading or copying a saved file.
+    """
+    if _JsonWriter is None:
+        return True
+    return _JsonWriter.flush(Timeout)
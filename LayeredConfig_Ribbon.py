@@ -0,0 +1,239 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+import os
+import json
+import copy
+import hashlib
+import Parameters_Ribbon
+import Standard_Functions_RIbbon as StandardFunctions
+import JsonStore_Ribbon
+
+# A ribbon structure can consist of two layers:
+# - a base layout, shared by all users. This file is only read and can be on a network share.
+# - an overlay per user with only the differences from the base layout (Parameters_Ribbon.RIBBON_STRUCTURE_JSON).
+# Dicts in the overlay are merged key by key into the base layout. Other values (lists, strings, numbers)
+# replace the value of the base layout. A key with the value None (null) removes the key from the base layout.
+# The merged structure is cached next to the overlay, together with the hashes of both files.
+
+CACHE_FILE = "RibbonStructure_Merged.json"
+
+
+def IsLayered() -> bool:
+    """
+    Returns True when a base layout is set.
+    """
+    return Parameters_Ribbon.RIBBON_STRUCTURE_BASE != ""
+
+
+def ReturnTextHash(Text: str) -> str:
+    """
+    Returns the hash of a text as it is written by JsonStore_Ribbon.
+    """
+    return hashlib.sha1(Text.encode("utf-8")).hexdigest()
+
+
+def ReturnFileHash(FileName: str) -> str:
+    """
+    Returns the hash of a file. Returns an empty string when the file cannot be read.
+    """
+    try:
+        with open(FileName, "rb") as file:
+            return hashlib.sha1(file.read()).hexdigest()
+    except Exception:
+        return ""
+
+
+def ReadJsonFile(FileName: str) -> dict:
+    """
+    Reads a json file. Returns an empty dict when the file does not exist or cannot be read.
+    """
+    try:
+        with open(FileName, "r") as file:
+            return json.load(file)
+    except Exception as e:
+        if Parameters_Ribbon.DEBUG_MODE is True and os.path.exists(FileName):
+            StandardFunctions.Print(f"{FileName}: {e}", "Warning")
+        return {}
+
+
+def MergeLayers(Base: dict, Overlay: dict) -> dict:
+    """
+    Merges the overlay into the base layout. Neither of the two is changed.
+    The keys of the base layout keep their order, new keys from the overlay are added after them.
+
+    Args:
+        Base (dict): The base layout.
+        Overlay (dict): The differences.
+
+    Returns:
+        dict: The merged structure.
+    """
+    Merged = {}
+    for Key, Value in Base.items():
+        if Key not in Overlay:
+            Merged[Key] = copy.deepcopy(Value)
+    for Key, Value in Overlay.items():
+        if Value is None:
+            continue
+        if isinstance(Value, dict) and isinstance(Base.get(Key), dict):
+            Merged[Key] = MergeLayers(Base[Key], Value)
+        else:
+            Merged[Key] = copy.deepcopy(Value)
+
+    # Restore the order of the base layout
+    Result = {}
+    for Key in Base:
+        if Key in Merged:
+            Result[Key] = Merged.pop(Key)
+    Result.update(Merged)
+    return Result
+
+
+def ReturnOverlay(Base: dict, Merged: dict) -> dict:
+    """
+    Returns the differences between the base layout and a complete structure.
+    MergeLayers(Base, ReturnOverlay(Base, Merged)) is equal to Merged.
+
+    Args:
+        Base (dict): The base layout.
+        Merged (dict): The complete structure.
+
+    Returns:
+        dict: The differences.
+    """
+    Overlay = {}
+    for Key, Value in Merged.items():
+        if Key not in Base:
+            Overlay[Key] = copy.deepcopy(Value)
+        elif isinstance(Value, dict) and isinstance(Base[Key], dict):
+            Difference = ReturnOverlay(Base[Key], Value)
+            if len(Difference) > 0:
+                Overlay[Key] = Difference
+        elif Value != Base[Key]:
+            Overlay[Key] = copy.deepcopy(Value)
+    for Key in Base:
+        if Key not in Merged:
+            Overlay[Key] = None
+    return Overlay
+
+
+def ReturnCacheFile() -> str:
+    return os.path.join(
+        os.path.dirname(os.path.abspath(Parameters_Ribbon.RIBBON_STRUCTURE_JSON)),
+        CACHE_FILE,
+    )
+
+
+def WriteCache(BaseHash: str, OverlayHash: str, Merged: dict):
+    """
+    Stores the merged structure with the hashes of the base layout and the overlay it was made from.
+    """
+    Cache = {"base": BaseHash, "overlay": OverlayHash, "structure": Merged}
+    JsonStore_Ribbon.SaveJson(ReturnCacheFile(), Cache, indent=None)
+    return
+
+
+def ReadStructure() -> dict:
+    """
+    Returns the ribbon structure. With a base layout, this is the base layout merged with the overlay.
+    The merged structure is taken from the cache, when both files are unchanged.
+
+    Returns:
+        dict: The ribbon structure.
+    """
+    # Wait until saved changes are written
+    JsonStore_Ribbon.FlushJson()
+    if IsLayered() is False:
+        return ReadJsonFile(Parameters_Ribbon.RIBBON_STRUCTURE_JSON)
+
+    BaseHash = ReturnFileHash(Parameters_Ribbon.RIBBON_STRUCTURE_BASE)
+    OverlayHash = ReturnFileHash(Parameters_Ribbon.RIBBON_STRUCTURE_JSON)
+
+    # Use the cache if it is made from the same files
+    Cache = ReadJsonFile(ReturnCacheFile())
+    if (
+        Cache.get("base") == BaseHash
+        and Cache.get("overlay") == OverlayHash
+        and "structure" in Cache
+    ):
+        return Cache["structure"]
+
+    # The base layout can be unavailable, for example when the network share is offline.
+    # Use the overlay alone in that case and do not cache the result
+    Base = ReadJsonFile(Parameters_Ribbon.RIBBON_STRUCTURE_BASE)
+    Overlay = ReadJsonFile(Parameters_Ribbon.RIBBON_STRUCTURE_JSON)
+    Merged = MergeLayers(Base, Overlay)
+    if BaseHash != "":
+        WriteCache(BaseHash, OverlayHash, Merged)
+    else:
+        StandardFunctions.Print(
+            f"Base layout {Parameters_Ribbon.RIBBON_STRUCTURE_BASE} is not available. Using the user layout only",
+            "Warning",
+        )
+    return Merged
+
+
+def WriteStructure(Data: dict):
+    """
+    Saves the ribbon structure on the worker thread of JsonStore_Ribbon.
+    With a base layout, only the differences from the base layout are written to the overlay.
+
+    Args:
+        Data (dict): The complete ribbon structure.
+    """
+    if IsLayered() is False:
+        JsonStore_Ribbon.SaveJson(
+            Parameters_Ribbon.RIBBON_STRUCTURE_JSON, Data, indent=4
+        )
+        return
+
+    BaseHash = ReturnFileHash(Parameters_Ribbon.RIBBON_STRUCTURE_BASE)
+    if BaseHash == "":
+        # Without the base layout, the differences cannot be determined. Keep the overlay as it is
+        StandardFunctions.Print(
+            f"Base layout {Parameters_Ribbon.RIBBON_STRUCTURE_BASE} is not available. Changes are not saved",
+            "Warning",
+        )
+        return
+    Base = ReadJsonFile(Parameters_Ribbon.RIBBON_STRUCTURE_BASE)
+    Overlay = ReturnOverlay(Base, Data)
+    JsonStore_Ribbon.SaveJson(
+        Parameters_Ribbon.RIBBON_STRUCTURE_JSON, Overlay, indent=4
+    )
+
+    # The overlay is written as json.dumps(indent=4), so its hash is known already.
+    # Update the cache, so that the next start does not merge again
+    WriteCache(
+        BaseHash,
+        ReturnTextHash(json.dumps(Overlay, indent=4)),
+        MergeLayers(Base, Overlay),
+    )
+    return
+
+
+def ResetOverlay():
+    """
+    Removes all differences from the overlay, so that the base layout is used as it is.
+    """
+    JsonStore_Ribbon.SaveJson(Parameters_Ribbon.RIBBON_STRUCTURE_JSON, {}, indent=4)
+    JsonStore_Ribbon.FlushJson()
+    return
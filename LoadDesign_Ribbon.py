@@ -27,6 +27,7 @@ from PySide.QtWidgets import (
     QListWidgetItem,
     QTableWidgetItem,
     QListWidget,
+    QListView,
     QTableWidget,
     QToolBar,
     QToolButton,
@@ -37,16 +38,27 @@ from PySide.QtWidgets import (
     QLineEdit,
     QSizePolicy,
     QRadioButton,
+    QProgressDialog,
 )
-from PySide.QtCore import Qt, SIGNAL, Signal, QObject, QThread, QSize
+from PySide.QtCore import Qt, SIGNAL, Signal, QObject, QThread, QSize, QTimer
 import sys
 import json
-from datetime import datetime
 import shutil
 import Standard_Functions_RIbbon as StandardFunctions
 from Standard_Functions_RIbbon import CommandInfoCorrections
 import Parameters_Ribbon
 import Serialize_Ribbon
+import DataHarvest_Ribbon
+import IconStore_Ribbon
+import CommandModel_Ribbon
+import ChangeTracker_Ribbon
+import BackupStore_Ribbon
+import JsonStore_Ribbon
+import RibbonStructure_Ribbon
+import Records_Ribbon
+import LayeredConfig_Ribbon
+import SharedData_Ribbon
+import TranslationCache_Ribbon
 import webbrowser
 import time
 import math
@@ -85,6 +97,15 @@ class LoadDialog(Design_ui.Ui_Form):
     StringList_Toolbars = []
     List_WorkBenchToolBarItems = []
     List_Commands = []
+    # Define the indexes over the lists on class level. See CreateCommandIndex
+    Dict_CommandRecords = {}
+    Dict_WorkbenchCommandRecords = {}
+    Dict_MenuTextRecords = {}
+    Dict_WorkbenchRecords = {}
+    Dict_ToolbarRecords = {}
+    Dict_WorkbenchToolbarRecords = {}
+    Dict_WorkbenchToolbars = {}
+    Dict_WorkbenchCommands = {}
 
     # Create lists for the several list in the json file.
     List_IgnoredToolbars = []
@@ -102,9 +123,9 @@ class LoadDialog(Design_ui.Ui_Form):
 
     List_IgnoredToolbars_internal = []
 
-    # Create the lists for the deserialized icons
-    List_CommandIcons = []
-    List_WorkBenchIcons = []
+    # Cache for the icons from the icon store. Icons are decoded when they are first requested
+    Dict_CommandIcons = {}
+    Dict_WorkBenchIcons = {}
 
     # Create a tomporary list for newly added dropdown buttons
     newDDBList = []
@@ -163,12 +184,19 @@ class LoadDialog(Design_ui.Ui_Form):
         Style = mw.style()
         self.form.setStyle(Style)
 
+        # The indexed ribbon structure over the sections of the dialog
+        self.RibbonStructure = RibbonStructure_Ribbon.RibbonStructure()
+
         # load the RibbonStructure.json
-        self.ReadJson()
+        JsonData = self.ReadJson()
+        # Store the hashes of the sections as saved. Used to detect changes
+        self.ChangeTracker = ChangeTracker_Ribbon.ChangeTracker()
+        self.ChangeTracker.setSaved(JsonData)
 
         # Check if there is a datafile. if not, ask the user to create one.
+        # With a valid shared data store, the local data file contains only the differences
         DataFile = os.path.join(os.path.dirname(__file__), "RibbonDataFile.dat")
-        if os.path.exists(DataFile) is False:
+        if os.path.exists(DataFile) is False and SharedData_Ribbon.ReturnSharedStore(self.DataFileVersion) is None:
             Question = translate(
                 "FreeCAD Ribbon",
                 "The first time, a data file must be generated!\n" "This can take a while! Do you want to proceed?",
@@ -179,11 +207,16 @@ class LoadDialog(Design_ui.Ui_Form):
 
         # region - Load data------------------------------------------------------------------
         #
-        Data = {}
-        # read ribbon structure from JSON file
-        with open(DataFile, "r") as file:
-            Data.update(json.load(file))
-        file.close()
+        # Move the icons of an older data file to the icon store
+        if os.path.exists(IconStore_Ribbon.STORE_FILE) is False:
+            try:
+                IconStore_Ribbon.MigrateDataFile(DataFile, IconStore_Ribbon.STORE_FILE)
+            except Exception as e:
+                if Parameters_Ribbon.DEBUG_MODE is True:
+                    StandardFunctions.Print(f"{e.with_traceback(e.__traceback__)}", "Warning")
+
+        # read the data file, merged with the shared data if available
+        Data = SharedData_Ribbon.ReadData(DataFile, self.DataFileVersion)
 
         DataUpdateNeeded = False
         try:
@@ -228,66 +261,44 @@ class LoadDialog(Design_ui.Ui_Form):
         except Exception:
             pass
 
-        # Load the standard lists for Workbenches, toolbars and commands
+        # Load the standard lists for Workbenches, toolbars and commands.
+        # These are records. Entries of an older data file are already upgraded by SharedData_Ribbon.ReadData
         self.List_Workbenches = Data["List_Workbenches"]
         self.StringList_Toolbars = Data["StringList_Toolbars"]
         self.List_Commands = Data["List_Commands"]
-
-        # test if List_Commands is correct
-        i = 5
-        if len(self.List_Commands) > 0:
-            for item in self.List_Commands:
-                if len(item) < 5:
-                    i = len(item)
-                    break
-        if i < 5:
-            Question = translate(
-                "FreeCAD Ribbon",
-                "It seems that the data file is not up-to-date.\n"
-                "Do you want to update the data?\n"
-                "This can take a while!",
-            )
-            Answer = StandardFunctions.Mbox(Question, "FreeCAD Ribbon", 1, "Question")
-            if Answer == "yes":
-                self.on_ReloadWB_clicked()
-
-        # Load the lists for the deserialized icons
-        try:
-            for IconItem in Data["WorkBench_Icons"]:
-                Icon: QIcon = Serialize_Ribbon.deserializeIcon(IconItem[1])
-                item = [IconItem[0], Icon]
-                self.List_WorkBenchIcons.append(item)
-            # Load the lists for the deserialized icons
-            for IconItem in Data["Command_Icons"]:
-                Icon: QIcon = Serialize_Ribbon.deserializeIcon(IconItem[1])
-                item = [IconItem[0], Icon]
-                self.List_CommandIcons.append(item)
-        except Exception as e:
-            StandardFunctions.Print(f"{e.with_traceback(e.__traceback__)}", "Warning")
-            pass
-
-        # check if the list with workbenches is up-to-date
-        missingWB = []
-        for WorkBenchName in Gui.listWorkbenches():
-            for j in range(len(self.List_Workbenches)):
-                if WorkBenchName == self.List_Workbenches[j][0] or WorkBenchName == "NoneWorkbench":
-                    break
-                if j == len(self.List_Workbenches) - 1:
-                    missingWB.append(WorkBenchName)
-        if len(missingWB) > 0:
+        self.CreateCommandIndex()
+
+        # Clear the icon caches. The icons are read from the icon store when they are needed
+        self.Dict_CommandIcons = {}
+        self.Dict_WorkBenchIcons = {}
+        # The rows of the command table on the Ribbon design tab. Set when a panel is selected
+        self.CommandTableRows = CommandModel_Ribbon.CommandTableRows()
+
+        # check if the list with workbenches is up-to-date.
+        # New and changed workbenches are scanned again, uninstalled workbenches are removed.
+        missingWB, changedWB, removedWB = DataHarvest_Ribbon.ReturnChangedWorkbenches(
+            Data.get("Workbench_Fingerprints", {}),
+            [WorkBench[0] for WorkBench in self.List_Workbenches],
+        )
+        if len(missingWB) > 0 or len(changedWB) > 0:
             ListWB = "  "
-            for WB in missingWB:
+            for WB in missingWB + changedWB:
                 ListWB = ListWB + WB + "\n" + "  "
             Question = translate(
                 "FreeCAD Ribbon",
-                "The following workbenches were installed after the last data update: \n"
+                "The following workbenches were installed or updated after the last data update: \n"
                 "{}\n\n"
-                "Do you want to update the data?\n"
-                "This can take a while!",
+                "Do you want to update the data?",
             ).format(ListWB)
             Answer = StandardFunctions.Mbox(Question, "FreeCAD Ribbon", 1, "Question")
+            # After a refresh, the dialog is already initialized again with the new data
             if Answer == "yes":
-                self.on_ReloadWB_clicked()
+                if self.RefreshData(missingWB + changedWB, removedWB) is True:
+                    return
+        elif len(removedWB) > 0:
+            # Removing the data of uninstalled workbenches does not need a scan
+            if self.RefreshData([], removedWB) is True:
+                return
 
         # Add dropdownbuttons to the list of commands
         try:
@@ -295,17 +306,19 @@ class LoadDialog(Design_ui.Ui_Form):
                 if isinstance(Commands, list):
                     CommandName = Commands[0][0]
                     IconName = ""
-                    for CommandItem in self.List_Commands:
-                        if CommandItem[0] == CommandName:
-                            IconName = StandardFunctions.CommandInfoCorrections(CommandItem[1])["pixmap"]
+                    CommandItem = self.Dict_CommandRecords.get(CommandName)
+                    if CommandItem is not None:
+                        IconName = StandardFunctions.CommandInfoCorrections(CommandItem.IconName)["pixmap"]
                     self.List_Commands.append(
-                        [
-                            DropDownCommand,
-                            IconName,
-                            DropDownCommand.split("_")[0],
-                            "General",
-                            DropDownCommand.split("_")[0],
-                        ]
+                        Records_Ribbon.ReturnCommandRecord(
+                            [
+                                DropDownCommand,
+                                IconName,
+                                DropDownCommand.split("_")[0],
+                                "General",
+                                DropDownCommand.split("_")[0],
+                            ]
+                        )
                     )
                 else:
                     del self.Dict_DropDownButtons["dropdownButtons"]
@@ -331,13 +344,15 @@ class LoadDialog(Design_ui.Ui_Form):
                         MenuName = CommandInfoCorrections(NewPanelCommand[0])["menuText"].replace("&", "")
                         MenuNameTranslated = CommandInfoCorrections(NewPanelCommand[0])["ActionText"].replace("&", "")
                         self.List_Commands.append(
-                            [
-                                NewPanelCommand[0],
-                                IconName,
-                                MenuName,
-                                NewPanelWorkBench,
-                                MenuNameTranslated,
-                            ]
+                            Records_Ribbon.ReturnCommandRecord(
+                                [
+                                    NewPanelCommand[0],
+                                    IconName,
+                                    MenuName,
+                                    NewPanelWorkBench,
+                                    MenuNameTranslated,
+                                ]
+                            )
                         )
         except Exception:
             pass
@@ -753,218 +768,230 @@ class LoadDialog(Design_ui.Ui_Form):
         return
 
     def on_ReloadWB_clicked(self):
+        self.RefreshData()
+        return
+
+    def RefreshData(self, List_UpdateWorkbenches: list = None, List_RemoveWorkbenches: list = None):
+        """_summary_
+        Collects the data of the workbenches and writes the data file and the icon store.
+        When a list of workbenches is given, only these workbenches are scanned again.
+        The data of all other workbenches is kept.
+
+        Args:
+            List_UpdateWorkbenches (list, optional): The workbenches to scan. Defaults to None (all workbenches).
+            List_RemoveWorkbenches (list, optional): The workbenches to remove from the data. Defaults to None.
+
+        Returns:
+            bool: True when the data is refreshed and the dialog is initialized again. False when cancelled.
+        """
+        if List_RemoveWorkbenches is None:
+            List_RemoveWorkbenches = []
+
         # minimize the dialog
         self.form.hide()
 
-        # clear the lists first
-        self.List_Workbenches.clear()
-        self.StringList_Toolbars.clear()
-        self.List_Commands.clear()
-
         # get the system language
         FreeCAD_preferences = App.ParamGet("User parameter:BaseApp/Preferences/General")
         FCLanguage = FreeCAD_preferences.GetString("Language")
 
-        # --- Workbenches ----------------------------------------------------------------------------------------------
-        #
-        # Create a list of all workbenches with their icon
-        self.List_Workbenches.clear()
-        List_Workbenches = Gui.listWorkbenches().copy()
-        for WorkBenchName in List_Workbenches:
-            if str(WorkBenchName) != "" or WorkBenchName is not None:
-                if str(WorkBenchName) != "NoneWorkbench":
-                    Gui.activateWorkbench(WorkBenchName)
-                    WorkBench = Gui.getWorkbench(WorkBenchName)
-                    # Get the toolbar items
-                    ToolbarItems: dict = WorkBench.getToolbarItems()
-                    # Update the toolbar items with corrections
-                    ToolbarItems: dict = StandardFunctions.CorrectGetToolbarItems(ToolbarItems)
-
-                    IconName = ""
-                    IconName = str(Gui.getWorkbench(WorkBenchName).Icon)
-                    WorkbenchTitle = Gui.getWorkbench(WorkBenchName).MenuText
-                    WorkbenchTitleTranslated = StandardFunctions.TranslationsMapping(WorkBenchName, WorkbenchTitle)
-                    self.List_Workbenches.append(
-                        [
-                            str(WorkBenchName),
-                            IconName,
-                            WorkbenchTitle,
-                            ToolbarItems,
-                            WorkbenchTitleTranslated,
-                        ]
-                    )
-
-        # --- Toolbars ----------------------------------------------------------------------------------------------
-        #
         # Store the current active workbench
         ActiveWB = Gui.activeWorkbench().name()
-        # Go through the list of workbenches
-        i = 0
-        for WorkBench in self.List_Workbenches:
-            wbToolbars = []
-            if WorkBench[0] != "General" and WorkBench[0] != "" and WorkBench[0] is not None:
-                Gui.activateWorkbench(WorkBench[0])
-                wbToolbars = Gui.getWorkbench(WorkBench[0]).listToolbars()
-                # Go through the toolbars
-                for Toolbar in wbToolbars:
-                    ToolBarTtranslated = StandardFunctions.TranslationsMapping(WorkBench[0], Toolbar)
-                    self.StringList_Toolbars.append([Toolbar, WorkBench[2], WorkBench[0], ToolBarTtranslated])
-
-        # Add the custom toolbars
-        CustomToolbars = self.List_ReturnCustomToolbars()
-        for Customtoolbar in CustomToolbars:
-            self.StringList_Toolbars.append(Customtoolbar)
-        CustomToolbars = self.List_ReturnCustomToolbars_Global()
-        for Customtoolbar in CustomToolbars:
-            self.StringList_Toolbars.append(Customtoolbar)
 
-        # --- Commands ----------------------------------------------------------------------------------------------
-        #
-        # Create a list of all commands with their icon
-        self.List_Commands.clear()
-        # Create a list of command names
-        CommandNames = []
-        for i in range(len(self.List_Workbenches)):
-            Gui.activateWorkbench(self.List_Workbenches[i][0])
-            WorkBench = Gui.getWorkbench(self.List_Workbenches[i][0])
-            # Get the toolbar items
-            ToolbarItems: dict = WorkBench.getToolbarItems()
-            # Update the toolbar items with corrections
-            ToolbarItems: dict = StandardFunctions.CorrectGetToolbarItems(ToolbarItems)
+        # For an incremental update, start with the current data
+        IsIncremental = List_UpdateWorkbenches is not None
+        Data = {}
+        DataFile = os.path.join(os.path.dirname(__file__), "RibbonDataFile.dat")
+        if IsIncremental is True and os.path.exists(DataFile) is True:
+            with open(DataFile, "r") as file:
+                Data.update(json.load(file))
+            file.close()
+            Data = Records_Ribbon.LoadRecords(Data)
 
-            for key, value in list(ToolbarItems.items()):
-                for j in range(len(value)):
-                    Item = [value[j], self.List_Workbenches[i][0]]
-                    CommandNames.append(Item)
-
-        # Go through the list
-        for CommandName in CommandNames:
-            # get the command with this name
-            command = Gui.Command.get(CommandName[0])
-            WorkBenchName = CommandName[1]
-            if command is not None:
-                # get the icon for this command
-                if CommandInfoCorrections(CommandName[0])["pixmap"] != "":
-                    IconName = CommandInfoCorrections(CommandName[0])["pixmap"]
-                else:
-                    IconName = ""
-                MenuName = CommandInfoCorrections(CommandName[0])["menuText"].replace("&", "")
-                MenuNameTranslated = CommandInfoCorrections(CommandName[0])["ActionText"].replace("&", "")
-                self.List_Commands.append(
-                    [
-                        CommandName[0],
-                        IconName,
-                        MenuName,
-                        WorkBenchName,
-                        MenuNameTranslated,
-                    ]
-                )
-        # add also custom commands
+        # --- Workbenches, toolbars and commands -----------------------------------------------------------------------
+        #
+        # Activate each workbench only once and collect all its data in one go.
+        # Show the progress, so the user can cancel the reload.
+        List_WorkbenchNames = Gui.listWorkbenches().copy()
+        if IsIncremental is True:
+            List_WorkbenchNames = List_UpdateWorkbenches
+        # With a valid shared data store, only the workbenches that differ from it are stored locally
+        SharedStore = SharedData_Ribbon.ReturnSharedStore(self.DataFileVersion)
+        if IsIncremental is False and SharedStore is not None:
+            List_WorkbenchNames = SharedStore.changedWorkbenches()
+        Progress = QProgressDialog(
+            translate("FreeCAD Ribbon", "Loading workbenches..."),
+            translate("FreeCAD Ribbon", "Cancel"),
+            0,
+            len(List_WorkbenchNames),
+        )
+        Progress.setWindowTitle(translate("FreeCAD Ribbon", "Reload workbenches"))
+        Progress.setWindowModality(Qt.WindowModality.WindowModal)
+        Progress.setMinimumDuration(0)
+
+        def UpdateProgress(Index, Total, WorkBenchName):
+            Progress.setValue(Index)
+            Progress.setLabelText(translate("FreeCAD Ribbon", "Loading workbench") + f" {WorkBenchName}...")
+            Gui.updateGui()
+            return not Progress.wasCanceled()
+
+        Harvester = DataHarvest_Ribbon.DataHarvester()
+        Records = Harvester.Harvest(List_WorkbenchNames, UpdateProgress)
+        Progress.setValue(len(List_WorkbenchNames))
+
+        # If the reload is cancelled, keep the current data
+        if Records is None:
+            Progress.close()
+            Gui.activateWorkbench(ActiveWB)
+            self.form.show()
+            return False
+
+        # The workbenches of which the current data is replaced or removed
+        List_ReplacedWorkbenches = [Record["Workbench"][0] for Record in Records] + List_RemoveWorkbenches
+
+        # Keep the data of the other workbenches
+        List_Workbenches = []
+        StringList_Toolbars = []
+        List_Commands = []
+        Dict_Fingerprints = {}
+        if IsIncremental is True:
+            for WorkBench in Data.get("List_Workbenches", []):
+                if WorkBench[0] not in List_ReplacedWorkbenches:
+                    List_Workbenches.append(WorkBench)
+            for Toolbar in Data.get("StringList_Toolbars", []):
+                if Toolbar.WorkBenchName not in List_ReplacedWorkbenches:
+                    StringList_Toolbars.append(Toolbar)
+            for Command in Data.get("List_Commands", []):
+                if Command.WorkBenchName not in List_ReplacedWorkbenches:
+                    List_Commands.append(Command)
+            for WorkBenchName, Fingerprint in Data.get("Workbench_Fingerprints", {}).items():
+                if WorkBenchName not in List_ReplacedWorkbenches:
+                    Dict_Fingerprints[WorkBenchName] = Fingerprint
+
+        for Record in Records:
+            List_Workbenches.append(Record["Workbench"])
+            if Record["Workbench"][0] != "General":
+                StringList_Toolbars.extend(Record["Toolbars"])
+            List_Commands.extend(Record["Commands"])
+            Dict_Fingerprints[Record["Workbench"][0]] = Record["Fingerprint"]
+
+        # Add the custom toolbars. With an incremental update, these are already in the list
+        if IsIncremental is False:
+            CustomToolbars = self.List_ReturnCustomToolbars()
+            for Customtoolbar in CustomToolbars:
+                StringList_Toolbars.append(Records_Ribbon.ReturnToolbarRecord(Customtoolbar))
+            CustomToolbars = self.List_ReturnCustomToolbars_Global()
+            for Customtoolbar in CustomToolbars:
+                StringList_Toolbars.append(Records_Ribbon.ReturnToolbarRecord(Customtoolbar))
+
+        # add also custom commands. With an incremental update, only for the scanned workbenches
         Toolbars = self.List_ReturnCustomToolbars()
         for Toolbar in Toolbars:
             WorkbenchTitle = Toolbar[1]
-            for WorkBench in self.List_Workbenches:
+            for WorkBench in List_Workbenches:
                 if WorkbenchTitle == WorkBench[2]:
                     WorkBenchName = WorkBench[0]
+                    if IsIncremental is True and WorkBenchName not in List_ReplacedWorkbenches:
+                        continue
                     for CustomCommand in Toolbar[2]:
-                        command = Gui.Command.get(CustomCommand)
-                        if CommandInfoCorrections(CustomCommand)["pixmap"] != "":
-                            IconName = CommandInfoCorrections(CustomCommand)["pixmap"]
-                        else:
-                            IconName = ""
-                        MenuName = CommandInfoCorrections(CustomCommand)["menuText"].replace("&", "")
-                        MenuNameTranslated = CommandInfoCorrections(CustomCommand)["ActionText"].replace("&", "")
-                        self.List_Commands.append(
-                            [
-                                CustomCommand,
-                                IconName,
-                                MenuName,
-                                WorkBenchName,
-                                MenuNameTranslated,
-                            ]
-                        )
-        Toolbars = self.List_ReturnCustomToolbars_Global()
-        for Toolbar in Toolbars:
-            for CustomCommand in Toolbar[2]:
-                command = Gui.Command.get(CustomCommand)
-                if CommandInfoCorrections(CustomCommand)["pixmap"] != "":
-                    IconName = CommandInfoCorrections(CustomCommand)["pixmap"]
-                else:
-                    IconName = None
-                MenuName = CommandInfoCorrections(CustomCommand)["menuText"].replace("&", "")
-                MenuNameTranslated = CommandInfoCorrections(CustomCommand)["ActionText"].replace("&", "")
-                self.List_Commands.append([CustomCommand, IconName, MenuName, Toolbar[1], MenuNameTranslated])
-        # Add general commands
-        if int(App.Version()[0]) > 0:
-            command = Gui.Command.get("Std_Measure")
-            if CommandInfoCorrections("Std_Measure")["pixmap"] != "":
-                IconName = CommandInfoCorrections("Std_Measure")["pixmap"]
-            else:
-                IconName = ""
-            MenuName = CommandInfoCorrections("Std_Measure")["menuText"].replace("&", "")
-            MenuNameTranslated = CommandInfoCorrections("Std_Measure")["ActionText"].replace("&", "")
-            self.List_Commands.append(["Std_Measure", IconName, MenuName, "General", MenuNameTranslated])
+                        List_Commands.append(Harvester.CommandRecord(CustomCommand, WorkBenchName))
+        if IsIncremental is False:
+            Toolbars = self.List_ReturnCustomToolbars_Global()
+            for Toolbar in Toolbars:
+                for CustomCommand in Toolbar[2]:
+                    List_Commands.append(Harvester.CommandRecord(CustomCommand, Toolbar[1], None))
+            # Add general commands
+            if int(App.Version()[0]) > 0:
+                List_Commands.append(Harvester.CommandRecord("Std_Measure", "General"))
 
         # re-activate the workbench that was stored.
         Gui.activateWorkbench(ActiveWB)
 
-        # --- Serialize Icons ------------------------------------------------------------------------------------------
+        # Replace the lists
+        self.List_Workbenches = List_Workbenches
+        self.StringList_Toolbars = StringList_Toolbars
+        self.List_Commands = List_Commands
+
+        # --- Store Icons ----------------------------------------------------------------------------------------------
         #
-        WorkbenchIcon = []
+        # The icons are rendered here. Encoding is done in parallel by the workers of the IconWriter.
+        # The data is already collected, so the icons cannot be cancelled anymore.
+        StartTime = time.time()
+        IconWriter = IconStore_Ribbon.IconStoreWriter()
+        # With an incremental update, the icons of the other workbenches are copied from the current store
+        Store = None
+        if IsIncremental is True:
+            Store = IconStore_Ribbon.ReturnIconStore()
+        Progress.setCancelButton(None)
+        Progress.setLabelText(translate("FreeCAD Ribbon", "Storing icons..."))
+        Progress.setRange(0, len(self.List_Workbenches) + len(self.List_Commands))
+        Progress.setValue(0)
         for WorkBenchItem in self.List_Workbenches:
             WorkBenchName = WorkBenchItem[0]
+            if Store is not None and WorkBenchName not in List_ReplacedWorkbenches:
+                if IconWriter.copyIcon(Store, WorkBenchName, IconStore_Ribbon.WORKBENCHES) is True:
+                    Progress.setValue(Progress.value() + 1)
+                    continue
             Icon = Gui.getIcon(WorkBenchItem[1])
             if Icon is not None and Icon.isNull() is False:
                 try:
-                    SerializedIcon = Serialize_Ribbon.serializeIcon(Icon)
-
-                    WorkbenchIcon.append([WorkBenchName, SerializedIcon])
-                    # add the icons also to the deserialized list
-                    self.List_WorkBenchIcons.append([WorkBenchName, Icon])
+                    IconWriter.addIcon(WorkBenchName, Icon, IconStore_Ribbon.WORKBENCHES)
                 except Exception as e:
                     if Parameters_Ribbon.DEBUG_MODE is True:
                         StandardFunctions.Print(f"{e.with_traceback(e.__traceback__)}", "Warning")
+            Progress.setValue(Progress.value() + 1)
 
-        CommandIcons = []
         for CommandItem in self.List_Commands:
-            CommandName = CommandItem[0]
-            Icon = StandardFunctions.returnQiCons_Commands(CommandName, CommandItem[1])
+            CommandName = CommandItem.CommandName
+            if Store is not None and CommandItem.WorkBenchName not in List_ReplacedWorkbenches:
+                if IconWriter.copyIcon(Store, CommandName, IconStore_Ribbon.COMMANDS) is True:
+                    Progress.setValue(Progress.value() + 1)
+                    continue
+            Icon = StandardFunctions.returnQiCons_Commands(CommandName, CommandItem.IconName)
             if Icon is not None and Icon.isNull() is False:
                 try:
-                    SerializedIcon = Serialize_Ribbon.serializeIcon(Icon)
-
-                    CommandIcons.append([CommandName, SerializedIcon])
-                    # add the icons also to the deserialized list
-                    self.List_CommandIcons.append([CommandName, Icon])
+                    IconWriter.addIcon(CommandName, Icon, IconStore_Ribbon.COMMANDS, CommandItem.IconName)
                 except Exception as e:
                     if Parameters_Ribbon.DEBUG_MODE is True:
                         StandardFunctions.Print(f"{e.with_traceback(e.__traceback__)}", "Warning")
 
-        # Write the lists to a data file
-        #
-        # clear the data file. If not exists, create it
-        DataFile = os.path.join(os.path.dirname(__file__), "RibbonDataFile.dat")
-        open(DataFile, "w").close()
+            # Store the icons that are encoded and keep the dialog responsive
+            IconWriter.collect()
+            Progress.setValue(Progress.value() + 1)
+            Gui.updateGui()
+        IconWriter.write(IconStore_Ribbon.STORE_FILE)
+        Progress.close()
+        if Parameters_Ribbon.DEBUG_MODE is True:
+            StandardFunctions.Print(
+                f"Icon store: {len(IconWriter.Dict_Icons)} icons, {len(IconWriter.List_Blobs)} pixmaps, "
+                f"{round(os.path.getsize(IconStore_Ribbon.STORE_FILE) / 1024)} kB, "
+                f"{round(time.time() - StartTime, 2)} s",
+                "Log",
+            )
 
-        # Open de data file, load it as json and then close it again
+        # Write the lists to a data file. The icons are stored in the icon store
         Data = {}
         # Update the data
         Data["dataVersion"] = self.DataFileVersion
+        Data["recordVersion"] = Records_Ribbon.RECORD_VERSION
         Data["Language"] = FCLanguage
         Data["List_Workbenches"] = self.List_Workbenches
         Data["StringList_Toolbars"] = self.StringList_Toolbars
         Data["List_Commands"] = self.List_Commands
-        Data["WorkBench_Icons"] = WorkbenchIcon
-        Data["Command_Icons"] = CommandIcons
+        Data["Workbench_Fingerprints"] = Dict_Fingerprints
         # Write to the data file
-        DataFile = os.path.join(os.path.dirname(__file__), "RibbonDataFile.dat")
         with open(DataFile, "w") as outfile:
             json.dump(Data, outfile, indent=4)
         outfile.close()
 
-        # Write a second data file with the list of commands only
+        # Store the translations of the workbenches and toolbars
+        TranslationCache_Ribbon.SaveTranslationCache()
+
+        # Write a second data file with the list of commands only. Including the shared commands
         Data2 = {}
+        Data2["recordVersion"] = Records_Ribbon.RECORD_VERSION
         Data2["List_Commands"] = self.List_Commands
+        if SharedStore is not None:
+            Data2["List_Commands"] = SharedData_Ribbon.MergeData(SharedStore.data(), Data)["List_Commands"]
         # Write to the data file
         DataFile2 = os.path.join(os.path.dirname(__file__), "RibbonDataFile2.dat")
         with open(DataFile2, "w") as outfile:
@@ -979,7 +1006,102 @@ class LoadDialog(Design_ui.Ui_Form):
 
         # Show the dialog again
         self.form.show()
-        return
+        return True
+
+    def ReturnStoredCommandIcon(self, CommandName: str) -> QIcon:
+        """_summary_
+        Returns the icon of a command from the local or shared icon store.
+        The icon is decoded the first time it is requested and cached for the next time.
+
+        Args:
+            CommandName (str): The name of the command.
+
+        Returns:
+            QIcon: The icon, or None if the command has no stored icon.
+        """
+        if CommandName in self.Dict_CommandIcons:
+            return self.Dict_CommandIcons[CommandName]
+
+        Icon = None
+        try:
+            Icon = SharedData_Ribbon.ReturnStoredIcon(CommandName, IconStore_Ribbon.COMMANDS)
+        except Exception as e:
+            if Parameters_Ribbon.DEBUG_MODE is True:
+                StandardFunctions.Print(f"{e.with_traceback(e.__traceback__)}", "Warning")
+        self.Dict_CommandIcons[CommandName] = Icon
+        return Icon
+
+    def ReturnHasStoredCommandIcon(self, CommandName: str) -> bool:
+        """_summary_
+        Returns True when the icon of a command is in the local or shared icon store, without decoding it.
+
+        Args:
+            CommandName (str): The name of the command.
+
+        Returns:
+            bool: True when the icon is stored.
+        """
+        # If the command is a dropdown button, check the icon of the first command in the dropdown list
+        FirstCommand = self.ReturnDropDownFirstCommand(CommandName)
+        if FirstCommand is not None:
+            CommandName = FirstCommand
+        if self.Dict_CommandIcons.get(CommandName) is not None:
+            return True
+        try:
+            return SharedData_Ribbon.HasStoredIcon(CommandName, IconStore_Ribbon.COMMANDS)
+        except Exception as e:
+            if Parameters_Ribbon.DEBUG_MODE is True:
+                StandardFunctions.Print(f"{e.with_traceback(e.__traceback__)}", "Warning")
+        return False
+
+    def ReturnStoredWorkbenchIcon(self, WorkBenchName: str) -> QIcon:
+        """_summary_
+        Returns the icon of a workbench from the local or shared icon store.
+        The icon is decoded the first time it is requested and cached for the next time.
+
+        Args:
+            WorkBenchName (str): The name of the workbench.
+
+        Returns:
+            QIcon: The icon, or None if the workbench has no stored icon.
+        """
+        if WorkBenchName in self.Dict_WorkBenchIcons:
+            return self.Dict_WorkBenchIcons[WorkBenchName]
+
+        Icon = None
+        try:
+            Icon = SharedData_Ribbon.ReturnStoredIcon(WorkBenchName, IconStore_Ribbon.WORKBENCHES)
+        except Exception as e:
+            if Parameters_Ribbon.DEBUG_MODE is True:
+                StandardFunctions.Print(f"{e.with_traceback(e.__traceback__)}", "Warning")
+        self.Dict_WorkBenchIcons[WorkBenchName] = Icon
+        return Icon
+
+    def ReturnCommandIcon(self, CommandName: str) -> QIcon:
+        """_summary_
+        Returns the icon of a command as shown in the command lists.
+        Dropdown buttons get the icon of their first command.
+        The icon is read from the icon store. Only when it is not stored, it is looked up in FreeCAD.
+
+        Args:
+            CommandName (str): The name of the command.
+
+        Returns:
+            QIcon: The icon, or None if there is no icon.
+        """
+        # Define a commandname for the icon
+        CommandName_Icon = CommandName
+        # If the command is a dropdown button, get the icon from the first command in the dropdown list
+        FirstCommand = self.ReturnDropDownFirstCommand(CommandName)
+        if FirstCommand is not None:
+            CommandName_Icon = FirstCommand
+        # Get the icon from the icon store
+        Icon = self.ReturnStoredCommandIcon(CommandName_Icon)
+        # If the icon is not stored, get the icon from FreeCAD. If there isn't one, leave it None
+        if Icon is None or Icon.isNull():
+            IconName = StandardFunctions.CommandInfoCorrections(CommandName_Icon)["pixmap"]
+            Icon = StandardFunctions.returnQiCons_Commands(CommandName_Icon, IconName)
+        return Icon
 
     # region - Control functions----------------------------------------------------------------------
     # Add all toolbars of the selected workbench to the toolbar list(QComboBox)
@@ -1046,7 +1168,10 @@ class LoadDialog(Design_ui.Ui_Form):
             DefaultPath=Parameters_Ribbon.EXPORT_LOCATION,
             SaveAs=True,
         )
-        shutil.copy(Parameters_Ribbon.RIBBON_STRUCTURE_JSON, FileName)
+        # Export the complete structure. With a base layout, the ribbon structure file has only the user changes
+        with open(FileName, "w") as outfile:
+            json.dump(LayeredConfig_Ribbon.ReadStructure(), outfile, indent=4)
+        outfile.close()
 
         return
 
@@ -1212,7 +1337,7 @@ class LoadDialog(Design_ui.Ui_Form):
         )
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        if self.CheckChanges(["quickAccessCommands"]) is True:
             self.form.UpdateJson.setEnabled(True)
 
         return
@@ -1224,7 +1349,7 @@ class LoadDialog(Design_ui.Ui_Form):
         )
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        if self.CheckChanges(["quickAccessCommands"]) is True:
             self.form.UpdateJson.setEnabled(True)
 
         return
@@ -1233,7 +1358,7 @@ class LoadDialog(Design_ui.Ui_Form):
         self.MoveItem(ListWidget=self.form.CommandsSelected_QC, Up=True)
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        if self.CheckChanges(["quickAccessCommands"]) is True:
             self.form.UpdateJson.setEnabled(True)
 
         return
@@ -1242,7 +1367,7 @@ class LoadDialog(Design_ui.Ui_Form):
         self.MoveItem(ListWidget=self.form.CommandsSelected_QC, Up=False)
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        if self.CheckChanges(["quickAccessCommands"]) is True:
             self.form.UpdateJson.setEnabled(True)
 
         return
@@ -1256,10 +1381,7 @@ class LoadDialog(Design_ui.Ui_Form):
         for Toolbar in self.StringList_Toolbars:
             WorkbenchTitle = Toolbar[1]
             # Get the translated toolbar name
-            if len(Toolbar) == 4:
-                ToolbarTransLated = Toolbar[3]
-            else:
-                ToolbarTransLated = Toolbar[0]
+            ToolbarTransLated = Toolbar.ToolbarTranslated
 
             if self.form.ListCategory_EP.currentData(Qt.ItemDataRole.UserRole) is not None:
                 if (
@@ -1286,10 +1408,7 @@ class LoadDialog(Design_ui.Ui_Form):
         for Toolbar in self.StringList_Toolbars:
             if Toolbar[0].lower().startswith(self.form.SearchBar_EP.text().lower()):
                 # Get the translated toolbar name
-                if len(Toolbar) == 4:
-                    ToolbarTransLated = Toolbar[3]
-                else:
-                    ToolbarTransLated = Toolbar[0]
+                ToolbarTransLated = Toolbar.ToolbarTranslated
 
                 ListWidgetItem = QListWidgetItem()
                 ListWidgetItem.setText(ToolbarTransLated.replace("&", ""))
@@ -1312,7 +1431,7 @@ class LoadDialog(Design_ui.Ui_Form):
         )
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        if self.CheckChanges(["ignoredToolbars"]) is True:
             self.form.UpdateJson.setEnabled(True)
 
         return
@@ -1324,7 +1443,7 @@ class LoadDialog(Design_ui.Ui_Form):
         )
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        if self.CheckChanges(["ignoredToolbars"]) is True:
             self.form.UpdateJson.setEnabled(True)
 
         return
@@ -1339,7 +1458,7 @@ class LoadDialog(Design_ui.Ui_Form):
         )
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        if self.CheckChanges(["ignoredWorkbenches"]) is True:
             self.form.UpdateJson.setEnabled(True)
 
         return
@@ -1351,7 +1470,7 @@ class LoadDialog(Design_ui.Ui_Form):
         )
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        if self.CheckChanges(["ignoredWorkbenches"]) is True:
             self.form.UpdateJson.setEnabled(True)
 
         return
@@ -1406,12 +1525,9 @@ class LoadDialog(Design_ui.Ui_Form):
             if IsIgnored is False and Toolbar != "":
                 ToolbarTransLated = Toolbar
                 # Get the translated toolbar name
-                for ToolBarItem in self.StringList_Toolbars:
-                    if ToolBarItem[0] == Toolbar:
-                        if len(ToolBarItem) == 4:
-                            ToolbarTransLated = ToolBarItem[3]
-                        else:
-                            ToolbarTransLated = ToolBarItem[0]
+                ToolBarItem = self.Dict_ToolbarRecords.get(Toolbar)
+                if ToolBarItem is not None:
+                    ToolbarTransLated = ToolBarItem.ToolbarTranslated
                 # If it is a custom toolbar, remove the suffix
                 ToolbarTransLated = ToolbarTransLated.replace("_custom", "").replace("_newPanel", "")
 
@@ -1469,43 +1585,40 @@ class LoadDialog(Design_ui.Ui_Form):
                 if key == toolbar:
                     for j in range(len(value)):
                         CommandName = value[j]
-                        for ToolbarCommand in self.List_Commands:
-                            if ToolbarCommand[0] == CommandName:
-                                # Get the command
-                                MenuName = ToolbarCommand[4].replace("&", "")
-
-                                # get the icon for this command if there isn't one, leave it None
-                                Icon = QIcon()
-                                for item in self.List_CommandIcons:
-                                    if item[0] == ToolbarCommand[0]:
-                                        Icon = item[1]
-                                if Icon is None:
-                                    Command = Gui.Command.get(CommandName)
-                                    if Command is not None:
-                                        Icon = Gui.getIcon(CommandInfoCorrections(CommandName)["pixmap"])
-                                        action = Command.getAction()
-                                        try:
-                                            if len(action) > 1:
-                                                Icon = action[0].icon()
-                                        except Exception:
-                                            pass
-
-                                # Define a new ListWidgetItem.
-                                ListWidgetItem = QListWidgetItem()
-                                ListWidgetItem.setText(StandardFunctions.TranslationsMapping(WorkbenchName, MenuName))
-                                if Icon is not None:
-                                    ListWidgetItem.setIcon(Icon)
-                                ListWidgetItem.setData(
-                                    Qt.ItemDataRole.UserRole, [key, CommandName]
-                                )  # add here the toolbar name as hidden data
-
-                                IsInList = False
-                                for k in range(self.form.PanelSelected_CP.count()):
-                                    if self.form.PanelSelected_CP.item(k).text() == ListWidgetItem.text():
-                                        IsInList = True
-
-                                if IsInList is False:
-                                    self.form.PanelSelected_CP.addItem(ListWidgetItem)
+                        ToolbarCommand = self.Dict_CommandRecords.get(CommandName)
+                        if ToolbarCommand is not None:
+                            # Get the command
+                            MenuName = ToolbarCommand.MenuTextTranslated.replace("&", "")
+
+                            # get the icon for this command if there isn't one, leave it None
+                            Icon = self.ReturnStoredCommandIcon(ToolbarCommand.CommandName)
+                            if Icon is None:
+                                Command = Gui.Command.get(CommandName)
+                                if Command is not None:
+                                    Icon = Gui.getIcon(CommandInfoCorrections(CommandName)["pixmap"])
+                                    action = Command.getAction()
+                                    try:
+                                        if len(action) > 1:
+                                            Icon = action[0].icon()
+                                    except Exception:
+                                        pass
+
+                            # Define a new ListWidgetItem.
+                            ListWidgetItem = QListWidgetItem()
+                            ListWidgetItem.setText(StandardFunctions.TranslationsMapping(WorkbenchName, MenuName))
+                            if Icon is not None:
+                                ListWidgetItem.setIcon(Icon)
+                            ListWidgetItem.setData(
+                                Qt.ItemDataRole.UserRole, [key, CommandName]
+                            )  # add here the toolbar name as hidden data
+
+                            IsInList = False
+                            for k in range(self.form.PanelSelected_CP.count()):
+                                if self.form.PanelSelected_CP.item(k).text() == ListWidgetItem.text():
+                                    IsInList = True
+
+                            if IsInList is False:
+                                self.form.PanelSelected_CP.addItem(ListWidgetItem)
 
         # Enable the apply button
         if self.CheckChanges() is True:
@@ -1548,29 +1661,29 @@ class LoadDialog(Design_ui.Ui_Form):
             ListWidgetItem = self.form.PanelSelected_CP.item(i)
             # if the translated menuname from the ListWidgetItem is equel to the MenuName from the command
             # Add the commandName to the list commandslist for this custom panel
-            for CommandItem in self.List_Commands:
-                if CommandItem[0] == ListWidgetItem.data(Qt.ItemDataRole.UserRole)[1]:
-                    MenuName = CommandItem[2].replace("&", "")
+            CommandItem = self.Dict_CommandRecords.get(ListWidgetItem.data(Qt.ItemDataRole.UserRole)[1])
+            if CommandItem is not None:
+                MenuName = CommandItem.MenuText.replace("&", "")
 
-                    # Get the original toolbar
-                    OriginalToolbar = ListWidgetItem.data(Qt.ItemDataRole.UserRole)[0]
+                # Get the original toolbar
+                OriginalToolbar = ListWidgetItem.data(Qt.ItemDataRole.UserRole)[0]
 
-                    # Create or modify the dict that will be entered
-                    StandardFunctions.add_keys_nested_dict(
-                        self.Dict_CustomToolbars,
-                        [
-                            "customToolbars",
-                            WorkBenchName,
-                            CustomPanelTitle + Suffix,
-                            "commands",
-                            MenuName,
-                        ],
-                    )
+                # Create or modify the dict that will be entered
+                StandardFunctions.add_keys_nested_dict(
+                    self.Dict_CustomToolbars,
+                    [
+                        "customToolbars",
+                        WorkBenchName,
+                        CustomPanelTitle + Suffix,
+                        "commands",
+                        MenuName,
+                    ],
+                )
 
-                    # Update the dict
-                    self.Dict_CustomToolbars["customToolbars"][WorkBenchName][CustomPanelTitle + Suffix]["commands"][
-                        MenuName
-                    ] = OriginalToolbar
+                # Update the dict
+                self.Dict_CustomToolbars["customToolbars"][WorkBenchName][CustomPanelTitle + Suffix]["commands"][
+                    MenuName
+                ] = OriginalToolbar
 
         # Check if the custom panel is selected in the Json file
         IsInList = False
@@ -1635,24 +1748,21 @@ class LoadDialog(Design_ui.Ui_Form):
                                 "commands"
                             ].items()
                         ):
-                            for CommandItem in self.List_Commands:
+                            for CommandItem in self.Dict_MenuTextRecords.get(key, []):
                                 # Check if the items is already there
                                 # if not, continue
-                                if not CommandItem[0] in ShadowList:
-                                    MenuName_Command = CommandItem[2]
-                                    if MenuName_Command == key and CommandItem[3] == WorkBenchName:
-                                        MenuName = CommandItem[4].replace("&", "").replace("_custom", "")
+                                if CommandItem.CommandName not in ShadowList:
+                                    if CommandItem.WorkBenchName == WorkBenchName:
+                                        MenuName = CommandItem.MenuTextTranslated.replace("&", "")
+                                        MenuName = MenuName.replace("_custom", "")
 
                                         # Define a new ListWidgetItem.
                                         ListWidgetItem = QListWidgetItem()
                                         ListWidgetItem.setText(MenuName)
                                         ListWidgetItem.setData(Qt.ItemDataRole.UserRole, CommandItem)
-                                        Icon = QIcon()
-                                        for item in self.List_CommandIcons:
-                                            if item[0] == CommandItem[0]:
-                                                Icon = item[1]
+                                        Icon = self.ReturnStoredCommandIcon(CommandItem.CommandName)
                                         if Icon is None:
-                                            Icon = Gui.getIcon(CommandItem[1])
+                                            Icon = Gui.getIcon(CommandItem.IconName)
                                         if Icon is not None:
                                             ListWidgetItem.setIcon(Icon)
 
@@ -1660,7 +1770,7 @@ class LoadDialog(Design_ui.Ui_Form):
                                             self.form.PanelSelected_CP.addItem(ListWidgetItem)
 
                                         # Add the command to the shadow list
-                                        ShadowList.append(CommandItem[0])
+                                        ShadowList.append(CommandItem.CommandName)
 
             self.form.PanelName_CP.setText(CustomPanelTitle.split("_")[0])
 
@@ -1772,16 +1882,16 @@ class LoadDialog(Design_ui.Ui_Form):
         ListCommands = []
         for i in range(self.form.NewPanel_NP.count()):
             ListWidgetItem = self.form.NewPanel_NP.item(i)
-            for CommandItem in self.List_Commands:
-                if CommandItem[0] == ListWidgetItem.data(Qt.ItemDataRole.UserRole):
-                    ListItem = [CommandItem[0], CommandItem[3]]
-                    # if the commanditem is not yet in the list, add it.
-                    IsInList = False
-                    for Item in ListCommands:
-                        if Item[0] == ListItem[0]:
-                            IsInList = True
-                    if IsInList is False:
-                        ListCommands.append([CommandItem[0], CommandItem[3]])
+            CommandItem = self.Dict_CommandRecords.get(ListWidgetItem.data(Qt.ItemDataRole.UserRole))
+            if CommandItem is not None:
+                ListItem = [CommandItem.CommandName, CommandItem.WorkBenchName]
+                # if the commanditem is not yet in the list, add it.
+                IsInList = False
+                for Item in ListCommands:
+                    if Item[0] == ListItem[0]:
+                        IsInList = True
+                if IsInList is False:
+                    ListCommands.append([CommandItem.CommandName, CommandItem.WorkBenchName])
 
         if len(ListCommands) > 0:
             # Create or modify the dict that will be entered
@@ -1933,16 +2043,12 @@ class LoadDialog(Design_ui.Ui_Form):
                                     ListWidgetItem = QListWidgetItem()
                                     ListWidgetItem.setText(MenuName)
                                     ListWidgetItem.setData(Qt.ItemDataRole.UserRole, CommandName)
-                                    Icon = QIcon()
-                                    for item in self.List_CommandIcons:
-                                        if item[0] == Commands[0][0]:
-                                            Icon = item[1]
+                                    Icon = self.ReturnStoredCommandIcon(Commands[0][0])
                                     if Icon is None:
-                                        for CommandItem in self.List_Commands:
-                                            if Commands[0][0] == CommandItem[0]:
-                                                IconName = StandardFunctions.CommandInfoCorrections(CommandItem[0])[
-                                                    "pixmap"
-                                                ]
+                                        if Commands[0][0] in self.Dict_CommandRecords:
+                                            IconName = StandardFunctions.CommandInfoCorrections(Commands[0][0])[
+                                                "pixmap"
+                                            ]
                                         Icon = StandardFunctions.returnQiCons_Commands(CommandName, IconName)
                                     if Icon is not None:
                                         ListWidgetItem.setIcon(Icon)
@@ -1951,34 +2057,29 @@ class LoadDialog(Design_ui.Ui_Form):
                                         self.form.NewPanel_NP.addItem(ListWidgetItem)
                             else:
                                 # if not a drop down button check if the commandname is in the list of commands
-                                for CommandItem in self.List_Commands:
-                                    if CommandItem[0] == CommandName and CommandItem[3] == WorkBenchNameCMD:
-                                        MenuName = CommandItem[4].replace("&", "")
-
-                                        # Check if the items is already there
-                                        # if not, continue
-                                        if CommandName not in ShadowList:
-                                            # Define a new ListWidgetItem.
-                                            ListWidgetItem = QListWidgetItem()
-                                            ListWidgetItem.setText(MenuName)
-                                            ListWidgetItem.setData(Qt.ItemDataRole.UserRole, CommandName)
-                                            Icon = None
-                                            for item in self.List_CommandIcons:
-                                                if item[0] == CommandName:
-                                                    Icon = item[1]
-                                            if Icon is None:
-                                                IconName = StandardFunctions.CommandInfoCorrections(CommandName)[
-                                                    "pixmap"
-                                                ]
-                                                Icon = StandardFunctions.returnQiCons_Commands(CommandName, IconName)
-                                            if Icon is not None:
-                                                ListWidgetItem.setIcon(Icon)
-
-                                            if ListWidgetItem.text() != "":
-                                                self.form.NewPanel_NP.addItem(ListWidgetItem)
+                                CommandItem = self.Dict_WorkbenchCommandRecords.get((CommandName, WorkBenchNameCMD))
+                                if CommandItem is not None:
+                                    MenuName = CommandItem.MenuTextTranslated.replace("&", "")
 
-                                        # Add the command to the shadow list
-                                        ShadowList.append(f"{CommandName}")
+                                    # Check if the items is already there
+                                    # if not, continue
+                                    if CommandName not in ShadowList:
+                                        # Define a new ListWidgetItem.
+                                        ListWidgetItem = QListWidgetItem()
+                                        ListWidgetItem.setText(MenuName)
+                                        ListWidgetItem.setData(Qt.ItemDataRole.UserRole, CommandName)
+                                        Icon = self.ReturnStoredCommandIcon(CommandName)
+                                        if Icon is None:
+                                            IconName = StandardFunctions.CommandInfoCorrections(CommandName)["pixmap"]
+                                            Icon = StandardFunctions.returnQiCons_Commands(CommandName, IconName)
+                                        if Icon is not None:
+                                            ListWidgetItem.setIcon(Icon)
+
+                                        if ListWidgetItem.text() != "":
+                                            self.form.NewPanel_NP.addItem(ListWidgetItem)
+
+                                    # Add the command to the shadow list
+                                    ShadowList.append(f"{CommandName}")
 
             # Enable the apply button
             if self.CheckChanges() is True:
@@ -2069,16 +2170,16 @@ class LoadDialog(Design_ui.Ui_Form):
         for i in range(self.form.NewControl_DDB.count()):
             ListWidgetItem = self.form.NewControl_DDB.item(i)
 
-            for CommandItem in self.List_Commands:
-                if CommandItem[0] == ListWidgetItem.data(Qt.ItemDataRole.UserRole):
-                    CommandName = CommandItem[0]
-                    WorkBenchName = CommandItem[3]
-                    IsInlist = False
-                    for item in DropDownButton:
-                        if item[0] == CommandName:
-                            IsInlist = True
-                    if IsInlist is False:
-                        DropDownButton.append([CommandName, WorkBenchName])
+            CommandItem = self.Dict_CommandRecords.get(ListWidgetItem.data(Qt.ItemDataRole.UserRole))
+            if CommandItem is not None:
+                CommandName = CommandItem.CommandName
+                WorkBenchName = CommandItem.WorkBenchName
+                IsInlist = False
+                for item in DropDownButton:
+                    if item[0] == CommandName:
+                        IsInlist = True
+                if IsInlist is False:
+                    DropDownButton.append([CommandName, WorkBenchName])
 
             # Create or modify the dict that will be entered
             Suffix = "_ddb"
@@ -2093,31 +2194,30 @@ class LoadDialog(Design_ui.Ui_Form):
         # Update the dict
         self.Dict_DropDownButtons["dropdownButtons"][DropDownName + Suffix] = DropDownButton
 
-        # Add the dropdown button to the command list widgets
+        # The dropdown button gets the icon of its first command
         FirstCommand = DropDownButton[0][0]
-        Icon = None
         IconName = ""
-        for item in self.List_CommandIcons:
-            if item[0] == FirstCommand:
-                Icon = item[1]
-        if Icon is None:
-            IconName = ""
-            for CommandItem in self.List_Commands:
-                if CommandItem[0] == FirstCommand:
-                    IconName = StandardFunctions.CommandInfoCorrections(CommandItem[0])["pixmap"]
-            Icon = StandardFunctions.returnQiCons_Commands(FirstCommand, IconName)
-        ListWidgetItem = QListWidgetItem()
-        ListWidgetItem.setText(DropDownName)
-        ListWidgetItem.setData(Qt.ItemDataRole.UserRole, DropDownName + Suffix)
-        if Icon is not None:
-            ListWidgetItem.setIcon(Icon)
-        # Add the ListWidgetItem to the several listWidgets
-        self.form.CommandsAvailable_QC.addItem(ListWidgetItem)
-        self.form.CommandsAvailable_NP.addItem(ListWidgetItem.clone())
-        self.form.CommandsAvailable_DDB.addItem(ListWidgetItem.clone())
+        if FirstCommand in self.Dict_CommandRecords:
+            IconName = StandardFunctions.CommandInfoCorrections(FirstCommand)["pixmap"]
 
         # Add the command to the list of commands
-        self.List_Commands.append([DropDownName + Suffix, IconName, DropDownName, "General", DropDownName])
+        CommandItem = Records_Ribbon.ReturnCommandRecord(
+            [DropDownName + Suffix, IconName, DropDownName, "General", DropDownName]
+        )
+        self.List_Commands.append(CommandItem)
+        self.Dict_CommandRecords.setdefault(CommandItem.CommandName, CommandItem)
+        self.Dict_WorkbenchCommandRecords.setdefault((CommandItem.CommandName, CommandItem.WorkBenchName), CommandItem)
+        self.Dict_MenuTextRecords.setdefault(CommandItem.MenuText, []).append(CommandItem)
+
+        # Add a new dropdown button to the command model and show it in the command lists
+        if self.CommandModel.row(CommandItem.CommandName) < 0:
+            row = self.CommandModel.addCommand(CommandItem)
+            if row >= 0:
+                self.CommandSearchIndex.addRow(row)
+                self.Dict_SearchResults = {}
+                self.CommandProxy_QC_Available.addCommands([CommandItem.CommandName])
+                self.CommandProxy_NP.addCommands([CommandItem.CommandName])
+                self.CommandProxy_DDB.addCommands([CommandItem.CommandName])
 
         # Add the drop down buttoon to the combobox
         self.form.CommandList_DDB.addItem(DropDownName)
@@ -2148,16 +2248,15 @@ class LoadDialog(Design_ui.Ui_Form):
                 # If the DropDownButton is equal to the text in the combobox, go through its commands
                 if DropDownButton == DropDownControl:
                     for CommandName in Commands:
-                        for i in range(self.form.CommandsAvailable_DDB.count()):
-                            ListWidgetItem = self.form.CommandsAvailable_DDB.item(i)
-
-                            # If the command is equal to one in the commandsavaialble listwidget,
-                            # Move it to the listwidget for the dropdown button.
-                            if ListWidgetItem.data(Qt.ItemDataRole.UserRole) == CommandName[0]:
-                                self.form.NewControl_DDB.addItem(ListWidgetItem.clone())
-                                self.form.CommandsAvailable_DDB.removeItemWidget(ListWidgetItem)
-                                # load the text as well
-                                self.form.ControlName_DDB.setText(DropDownControl.split("_")[0])
+                        # If the command is in the list with available commands,
+                        # add it to the listwidget for the dropdown button.
+                        if self.CommandProxy_DDB.row(CommandName[0]) >= 0:
+                            row = self.CommandModel.row(CommandName[0])
+                            self.form.NewControl_DDB.addItem(
+                                CommandModel_Ribbon.ReturnListWidgetItem(self.CommandModel, row)
+                            )
+                            # load the text as well
+                            self.form.ControlName_DDB.setText(DropDownControl.split("_")[0])
 
         return
 
@@ -2319,10 +2418,9 @@ class LoadDialog(Design_ui.Ui_Form):
 
             # Get the translated toolbar name
             ToolbarTransLated = Toolbar
-            for ToolBarItem in self.StringList_Toolbars:
-                if ToolBarItem[0] == Toolbar and ToolBarItem[2] == WorkBenchName:
-                    if len(ToolBarItem) == 4:
-                        ToolbarTransLated = ToolBarItem[3]
+            ToolBarItem = self.Dict_WorkbenchToolbarRecords.get((Toolbar, WorkBenchName))
+            if ToolBarItem is not None:
+                ToolbarTransLated = ToolBarItem.ToolbarTranslated
 
             # If the are not to be ignored, add them to the listwidget
             if IsIgnored is False:
@@ -2343,380 +2441,272 @@ class LoadDialog(Design_ui.Ui_Form):
 
     def on_PanelList_RD__TextChanged(self):
         if "workbenches" in self.Dict_RibbonCommandPanel:
-            # Clear the table
-            self.form.CommandTable_RD.setRowCount(0)
-
-            # Create the row in the table
-            # add a row to the table widget
-            FirstItem = QTableWidgetItem()
-            FirstItem.setText("All")
-            self.form.CommandTable_RD.insertRow(self.form.CommandTable_RD.rowCount())
-
-            # Get the last rownumber and set this row with the CommandTable_RDItem
-            RowNumber = 0
-            # update the data
-            FirstItem.setData(Qt.ItemDataRole.UserRole, "All")
-
-            # Add the first cell with the table widget
-            self.form.CommandTable_RD.setItem(RowNumber, 0, FirstItem)
-
-            # Create the second cell and set the checkstate according the checkstate as defined earlier
-            Icon_small = QTableWidgetItem()
-            Icon_small.setText("")
-            Icon_small.setCheckState(Qt.CheckState.Unchecked)
-            self.form.CommandTable_RD.setItem(RowNumber, 1, Icon_small)
-
-            # Create the third cell and set the checkstate according the checkstate as defined earlier
-            Icon_medium = QTableWidgetItem()
-            Icon_medium.setText("")
-            Icon_medium.setCheckState(Qt.CheckState.Unchecked)
-            self.form.CommandTable_RD.setItem(RowNumber, 2, Icon_medium)
-
-            # Create the fourth cell and set the checkstate according the checkstate as defined earlier
-            Icon_large = QTableWidgetItem()
-            Icon_large.setText("")
-            Icon_large.setCheckState(Qt.CheckState.Unchecked)
-            self.form.CommandTable_RD.setItem(RowNumber, 3, Icon_large)
-
-            # Create the last cell and set the checkstaat according the checkstate as defined earlier
-            Enabled_item = QTableWidgetItem()
-            Enabled_item.setText("")
-            Enabled_item.setCheckState(Qt.CheckState.Checked)
-            self.form.CommandTable_RD.setItem(RowNumber, 4, Enabled_item)
-
-            # # Add the first cell with the table widget
-            # self.form.CommandTable_RD.setItem(RowNumber, 0, CommandTable_RDItem)
+            # Fill the table in one batch. Changes are written to the ribbon structure by the table rows
+            self.form.CommandTable_RD.setUpdatesEnabled(False)
+            self.form.CommandTable_RD.blockSignals(True)
+            try:
+                self.LoadCommandTable()
+            finally:
+                self.form.CommandTable_RD.blockSignals(False)
+                self.form.CommandTable_RD.setUpdatesEnabled(True)
+        return
 
-            ShadowList = []  # Create a shadow list. To check if items are already existing.
+    def LoadCommandTable(self):
+        """_summary_
+        Fills the command table with the commands of the selected panel
+        and sets the rows of the command table.
+        """
+        # Clear the table
+        self.form.CommandTable_RD.setRowCount(0)
+        self.CommandTableRows = CommandModel_Ribbon.CommandTableRows()
+
+        # Create the first row. This row is used to set all commands at once
+        FirstItem = QTableWidgetItem()
+        FirstItem.setText("All")
+        FirstItem.setData(Qt.ItemDataRole.UserRole, "All")
+        self.AddCommandTableRow(
+            0,
+            FirstItem,
+            [
+                Qt.CheckState.Unchecked,
+                Qt.CheckState.Unchecked,
+                Qt.CheckState.Unchecked,
+                Qt.CheckState.Checked,
+            ],
+        )
 
-            # Get the correct workbench name
-            WorkBenchName = self.form.WorkbenchList_RD.currentData(Qt.ItemDataRole.UserRole)[0]
+        ShadowList = set()  # Create a shadow list. To check if items are already existing.
+        List_Rows = []  # The rows for the command table: [OrderName, CommandName]
+        Dict_Commands = {}  # The entries of the commands for the ribbon structure
 
-            # Get the toolbar name
-            Toolbar = self.form.PanelList_RD.currentData(Qt.ItemDataRole.UserRole)
-            # Copy the workbench Toolbars
-            ToolbarItems = self.returnToolbarCommands(WorkBenchName)
-            # Get the custom toolbars from each installed workbench
-            CustomCommands = self.Dict_ReturnCustomToolbars(WorkBenchName)
-            ToolbarItems.update(CustomCommands)
-            # Get the custom toolbars from global
-            CustomCommands = self.Dict_ReturnCustomToolbars_Global()
-            ToolbarItems.update(CustomCommands)
-            # Get the commands from the custom commands
-            CustomPanelCommands = self.Dict_AddCustomPanel(
-                DictPanels=self.Dict_CustomToolbars,
-                WorkBenchName=WorkBenchName,
-                PanelDict="customToolbars",
-            )
-            ToolbarItems.update(CustomPanelCommands)
-            # Get the commands from the custom commands
-            NewPanelCommands = self.Dict_AddNewPanel(
-                DictPanels=self.Dict_NewPanels,
-                WorkBenchName=WorkBenchName,
-                PanelDict="newPanels",
-            )
-            ToolbarItems.update(NewPanelCommands)
-            NewPanelCommands = self.Dict_AddNewPanel(
-                DictPanels=self.Dict_NewPanels,
-                WorkBenchName="Global",
-                PanelDict="newPanels",
-            )
-            ToolbarItems.update(NewPanelCommands)
+        # Get the correct workbench name
+        WorkBenchName = self.form.WorkbenchList_RD.currentData(Qt.ItemDataRole.UserRole)[0]
 
-            # Get the commands in this toolbar
-            ToolbarCommands = []
-            for ToolbarItem in ToolbarItems:
-                if ToolbarItem == Toolbar:
-                    ToolbarCommands = ToolbarItems[ToolbarItem]
+        # Get the toolbar name
+        Toolbar = self.form.PanelList_RD.currentData(Qt.ItemDataRole.UserRole)
+        # Copy the workbench Toolbars
+        ToolbarItems = self.returnToolbarCommands(WorkBenchName)
+        # Get the custom toolbars from each installed workbench
+        CustomCommands = self.Dict_ReturnCustomToolbars(WorkBenchName)
+        ToolbarItems.update(CustomCommands)
+        # Get the custom toolbars from global
+        CustomCommands = self.Dict_ReturnCustomToolbars_Global()
+        ToolbarItems.update(CustomCommands)
+        # Get the commands from the custom commands
+        CustomPanelCommands = self.Dict_AddCustomPanel(
+            DictPanels=self.Dict_CustomToolbars,
+            WorkBenchName=WorkBenchName,
+            PanelDict="customToolbars",
+        )
+        ToolbarItems.update(CustomPanelCommands)
+        # Get the commands from the custom commands
+        NewPanelCommands = self.Dict_AddNewPanel(
+            DictPanels=self.Dict_NewPanels,
+            WorkBenchName=WorkBenchName,
+            PanelDict="newPanels",
+        )
+        ToolbarItems.update(NewPanelCommands)
+        NewPanelCommands = self.Dict_AddNewPanel(
+            DictPanels=self.Dict_NewPanels,
+            WorkBenchName="Global",
+            PanelDict="newPanels",
+        )
+        ToolbarItems.update(NewPanelCommands)
+
+        # Get the commands in this toolbar
+        ToolbarCommands = list(ToolbarItems.get(Toolbar, []))
+
+        # Get the stored settings of this toolbar
+        ToolbarRecord = self.ReturnRibbonStructure().toolbar(WorkBenchName, Toolbar)
+        Dict_Positions = {}
+        Dict_StoredCommands = {}
+        if ToolbarRecord is not None:
+            Dict_Positions = ToolbarRecord.positions()
+            Dict_StoredCommands = ToolbarRecord.commands()
 
             # add separators to the command list.
             index = 0
-            if WorkBenchName in self.Dict_RibbonCommandPanel["workbenches"]:
-                if Toolbar != "" and Toolbar in self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"]:
-                    if "order" in self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar]:
-                        for j in range(
-                            len(
-                                self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar]["order"]
-                            )
-                        ):
-                            if (
-                                "separator"
-                                in self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar][
-                                    "order"
-                                ][j].lower()
-                            ):
-                                ToolbarCommands.insert(
-                                    j + index,
-                                    self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar][
-                                        "order"
-                                    ][j],
-                                )
-                                index = index + 1
+            if Toolbar != "":
+                for j, SeparatorName in ToolbarRecord.separators():
+                    ToolbarCommands.insert(j + index, SeparatorName)
+                    index = index + 1
 
-            # Sort the Toolbarcommands according the sorted list
-            def SortCommands(item):
-                try:
-                    if "separator" not in item.lower():
-                        MenuName = CommandInfoCorrections(item)["menuText"].replace("&", "")
-                        if MenuName == "":
-                            for CommandItem in self.List_Commands:
-                                if CommandItem[0] == item:
-                                    MenuName = CommandItem[2]
-                                if MenuName == "":
-                                    continue
-                        item = MenuName
+        # Sort the Toolbarcommands according the sorted list
+        def SortCommands(item):
+            try:
+                if "separator" not in item.lower():
+                    MenuName = CommandInfoCorrections(item)["menuText"].replace("&", "")
+                    if MenuName == "" and self.ReturnCommandRecord(item) is not None:
+                        MenuName = self.ReturnCommandRecord(item)[2]
+                    item = MenuName
+                position = Dict_Positions.get(item, 999999)
+            except Exception:
+                position = 999999
 
-                    OrderList: list = self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar][
-                        "order"
-                    ]
-                    position = OrderList.index(item)
-                except Exception:
-                    position = 999999
-
-                return position
-
-            ToolbarCommands.sort(key=SortCommands)
-
-            # Go through the list of toolbar commands
-            for ToolbarCommand in ToolbarCommands:
-                if "separator" in ToolbarCommand:
-                    # Create the row in the table
-                    # add a row to the table widget
-                    self.form.CommandTable_RD.insertRow(self.form.CommandTable_RD.rowCount())
-
-                    # Define a table widget item
-                    Separator = QTableWidgetItem()
-                    Separator.setText("Separator")
-                    Separator.setData(Qt.ItemDataRole.UserRole, "separator")
-
-                    # Get the last rownumber and set this row with the CommandTable_RDItem
-                    RowNumber = self.form.CommandTable_RD.rowCount() - 1
-                    # update the data
-                    Separator.setData(
-                        Qt.ItemDataRole.UserRole,
-                        f"{RowNumber}_separator_{WorkBenchName}",
-                    )
+            return position
 
-                    # Add the first cell with the table widget
-                    self.form.CommandTable_RD.setItem(RowNumber, 0, Separator)
-
-                    # Create the second cell and set the checkstate according the checkstate as defined earlier
-                    Icon_small = QTableWidgetItem()
-                    Icon_small.setText("")
-                    self.form.CommandTable_RD.setItem(RowNumber, 1, Icon_small)
-
-                    # Create the third cell and set the checkstate according the checkstate as defined earlier
-                    Icon_medium = QTableWidgetItem()
-                    Icon_medium.setText("")
-                    self.form.CommandTable_RD.setItem(RowNumber, 2, Icon_medium)
-
-                    # Create the last cell and set the checkstate according the checkstate as defined earlier
-                    Icon_large = QTableWidgetItem()
-                    Icon_large.setText("")
-                    self.form.CommandTable_RD.setItem(RowNumber, 3, Icon_large)
-
-                    # Define the order based on the order in this table widget
-                    Order = []
-                    for j in range(self.form.CommandTable_RD.rowCount()):
-                        Order.append(
-                            QTableWidgetItem(self.form.CommandTable_RD.item(j, 0)).data(Qt.ItemDataRole.UserRole)
-                        )
+        ToolbarCommands.sort(key=SortCommands)
 
-                    # Add or update the dict for the Ribbon command panel
-                    StandardFunctions.add_keys_nested_dict(
-                        self.Dict_RibbonCommandPanel,
-                        ["workbenches", WorkBenchName, "toolbars", Toolbar, "order"],
-                    )
-                    self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar]["order"] = Order
-
-                if "separator" not in ToolbarCommand and "All" not in ToolbarCommand:
-                    # Get the command
-                    CommandName = ToolbarCommand
-
-                    # if not, continue
-                    if f"{CommandName}, {WorkBenchName}" not in ShadowList and CommandName is not None:
-                        MenuName = StandardFunctions.CommandInfoCorrections(CommandName)["menuText"]
-                        if CommandName.endswith("_ddb"):
-                            MenuName = CommandName
-                        if MenuName == "":
-                            for CommandItem in self.List_Commands:
-                                if CommandItem[0] == CommandName:
-                                    MenuName = CommandItem[2]
-                                if MenuName == "":
-                                    continue
+        # Go through the list of toolbar commands
+        for ToolbarCommand in ToolbarCommands:
+            if "separator" in ToolbarCommand:
+                # Get the last rownumber
+                RowNumber = self.form.CommandTable_RD.rowCount()
 
-                        IconName = StandardFunctions.CommandInfoCorrections(CommandName)["pixmap"]
-                        if CommandName.endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
-                            for (
-                                DropDownCommand,
-                                Commands,
-                            ) in self.Dict_DropDownButtons["dropdownButtons"].items():
-                                for CommandItem in self.List_Commands:
-                                    if Commands[0][0] == CommandItem[0]:
-                                        IconName = CommandItem[1]
-                                        break
-                        # get the icon for this command if there isn't one, leave it None
-                        Icon = StandardFunctions.returnQiCons_Commands(CommandName)
-                        if Icon is None:
-                            for item in self.List_CommandIcons:
-                                if item[0] == CommandName:
-                                    Icon = item[1]
-                                    break
-                                if CommandName.endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
-                                    for (
-                                        DropDownCommand,
-                                        Commands,
-                                    ) in self.Dict_DropDownButtons["dropdownButtons"].items():
-                                        if Commands[0][0] == item[0]:
-                                            Icon = item[1]
-                                            break
-
-                        # Set the default check states
-                        checked_small = Qt.CheckState.Checked
-                        checked_medium = Qt.CheckState.Unchecked
-                        checked_large = Qt.CheckState.Unchecked
-                        Enabled = Qt.CheckState.Checked
-                        # set the default size
-                        Size = "small"
-
-                        # Go through the toolbars in the Json Ribbon list
-                        MenuNameJson = ""
-                        for j in range(len(self.List_Workbenches)):
-                            if self.List_Workbenches[j][0] == WorkBenchName:
-                                try:
-                                    MenuNameJson = self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName][
-                                        "toolbars"
-                                    ][Toolbar]["commands"][CommandName]["text"]
-                                    Size = self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][
-                                        Toolbar
-                                    ]["commands"][CommandName]["size"]
-
-                                    if Size == "medium":
-                                        checked_small = Qt.CheckState.Unchecked
-                                        checked_medium = Qt.CheckState.Checked
-                                        checked_large = Qt.CheckState.Unchecked
-                                        Enabled = Qt.CheckState.Checked
-                                    if Size == "large":
-                                        checked_small = Qt.CheckState.Unchecked
-                                        checked_medium = Qt.CheckState.Unchecked
-                                        checked_large = Qt.CheckState.Checked
-                                        Enabled = Qt.CheckState.Checked
-                                    if Size == "none":
-                                        checked_small = Qt.CheckState.Unchecked
-                                        checked_medium = Qt.CheckState.Unchecked
-                                        checked_large = Qt.CheckState.Unchecked
-                                        Enabled = Qt.CheckState.Unchecked
-                                except Exception:
-                                    continue
+                # Define a table widget item
+                Separator = QTableWidgetItem()
+                Separator.setText("Separator")
+                Separator.setData(
+                    Qt.ItemDataRole.UserRole,
+                    f"{RowNumber}_separator_{WorkBenchName}",
+                )
+                self.AddCommandTableRow(RowNumber, Separator)
 
-                        MenuNameTabelWidgetItem = ""
-                        if MenuNameJson != CommandInfoCorrections(ToolbarCommand)["menuText"].replace("&", ""):
-                            MenuNameTabelWidgetItem = MenuNameJson
-                        elif MenuName.endswith("_ddb"):
-                            MenuNameTabelWidgetItem = MenuName.replace("_ddb", "")
-                        else:
-                            for CommandItem in self.List_Commands:
-                                if CommandItem[0] == CommandName:
-                                    MenuNameTabelWidgetItem = StandardFunctions.CommandInfoCorrections(CommandName)[
-                                        "ActionText"
-                                    ]
-                        if MenuNameTabelWidgetItem == "":
-                            MenuNameTabelWidgetItem = MenuName
-
-                        # Create the row in the table
-                        # add a row to the table widget
-                        self.form.CommandTable_RD.insertRow(self.form.CommandTable_RD.rowCount())
-
-                        # Fill the table widget ----------------------------------------------------------------------------------
-                        #
-                        # Define a table widget item
-                        textAddition = ""
-                        CommandWidgetItem = QTableWidgetItem()
-                        CommandWidgetItem.setText((MenuNameTabelWidgetItem + textAddition).replace("&", ""))
-                        CommandWidgetItem.setData(
-                            Qt.ItemDataRole.UserRole,
-                            MenuName.replace("&", ""),
-                        )
-                        CommandWidgetItem.setFlags(CommandWidgetItem.flags() | Qt.ItemFlag.ItemIsEditable)
-                        if Icon is not None:
-                            CommandWidgetItem.setIcon(Icon)
-                        if Icon is None:
-                            CommandWidgetItem.setFlags(CommandWidgetItem.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-                        # Get the last rownumber and set this row with the CommandTable_RDItem
-                        RowNumber = self.form.CommandTable_RD.rowCount() - 1
-
-                        # Add the first cell with the table widget
-                        self.form.CommandTable_RD.setItem(RowNumber, 0, CommandWidgetItem)
-
-                        # Create the second cell and set the checkstate according the checkstate as defined earlier
-                        Icon_small = QTableWidgetItem()
-                        Icon_small.setCheckState(checked_small)
-                        self.form.CommandTable_RD.setItem(RowNumber, 1, Icon_small)
-
-                        # Create the third cell and set the checkstate according the checkstate as defined earlier
-                        Icon_medium = QTableWidgetItem()
-                        Icon_medium.setCheckState(checked_medium)
-                        self.form.CommandTable_RD.setItem(RowNumber, 2, Icon_medium)
-
-                        # Create the fourth cell and set the checkstate according the checkstate as defined earlier
-                        Icon_large = QTableWidgetItem()
-                        Icon_large.setCheckState(checked_large)
-                        self.form.CommandTable_RD.setItem(RowNumber, 3, Icon_large)
-
-                        # Create the last cell and set the checkstaat according the checkstate as defined earlier
-                        Enabled_item = QTableWidgetItem()
-                        Enabled_item.setCheckState(Enabled)
-                        self.form.CommandTable_RD.setItem(RowNumber, 4, Enabled_item)
-
-                        # Double check the workbench name
-                        WorkBenchName = self.form.WorkbenchList_RD.currentData(Qt.ItemDataRole.UserRole)[0]
-
-                        # Define the order based on the order in this table widget
-                        Order = []
-                        for j in range(self.form.CommandTable_RD.rowCount()):
-                            Order.append(
-                                QTableWidgetItem(self.form.CommandTable_RD.item(j, 0)).data(Qt.ItemDataRole.UserRole)
-                            )
+                List_Rows.append([Separator.data(Qt.ItemDataRole.UserRole), ""])
 
-                        # Add or update the dict for the Ribbon command panel
-                        StandardFunctions.add_keys_nested_dict(
-                            self.Dict_RibbonCommandPanel,
-                            [
-                                "workbenches",
-                                WorkBenchName,
-                                "toolbars",
-                                Toolbar,
-                                "order",
-                            ],
-                        )
-                        StandardFunctions.add_keys_nested_dict(
-                            self.Dict_RibbonCommandPanel,
-                            [
-                                "workbenches",
-                                WorkBenchName,
-                                "toolbars",
-                                Toolbar,
-                                "commands",
-                                CommandName,
-                            ],
-                        )
-                        self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar]["order"] = Order
-                        self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar]["commands"][
-                            CommandName
-                        ] = {
-                            "size": Size,
-                            "text": MenuName,
-                            "icon": IconName,
-                        }
-
-                        # Set the IconOnly_Toolbars control
-                        if Toolbar in self.List_IconOnly_Toolbars:
-                            self.form.IconOnly_RD.setCheckState(Qt.CheckState.Checked)
-                        else:
-                            self.form.IconOnly_RD.setCheckState(Qt.CheckState.Unchecked)
+            if "separator" not in ToolbarCommand and "All" not in ToolbarCommand:
+                # Get the command
+                CommandName = ToolbarCommand
+
+                # if not, continue
+                if CommandName is None or CommandName in ShadowList:
+                    continue
+
+                CommandInfo = StandardFunctions.CommandInfoCorrections(CommandName)
+                CommandRecord = self.ReturnCommandRecord(CommandName)
+                MenuName = CommandInfo["menuText"]
+                if CommandName.endswith("_ddb"):
+                    MenuName = CommandName
+                if MenuName == "" and CommandRecord is not None:
+                    MenuName = CommandRecord[2]
+
+                # Dropdown buttons use the icon of their first command
+                IconName = CommandInfo["pixmap"]
+                FirstCommand = self.ReturnDropDownFirstCommand(CommandName)
+                if FirstCommand is not None and self.ReturnCommandRecord(FirstCommand) is not None:
+                    IconName = self.ReturnCommandRecord(FirstCommand)[1]
+                # get the icon for this command if there isn't one, leave it None
+                Icon = StandardFunctions.returnQiCons_Commands(CommandName)
+                if Icon is None:
+                    Icon = self.ReturnStoredCommandIcon(CommandName)
+                if Icon is None and FirstCommand is not None:
+                    Icon = self.ReturnStoredCommandIcon(FirstCommand)
+
+                # Set the default check states
+                checked_small = Qt.CheckState.Checked
+                checked_medium = Qt.CheckState.Unchecked
+                checked_large = Qt.CheckState.Unchecked
+                Enabled = Qt.CheckState.Checked
+                # set the default size
+                Size = "small"
+
+                # Get the stored text and size of the command
+                MenuNameJson = ""
+                try:
+                    MenuNameJson = Dict_StoredCommands[CommandName]["text"]
+                    Size = Dict_StoredCommands[CommandName]["size"]
+
+                    if Size == "medium":
+                        checked_small = Qt.CheckState.Unchecked
+                        checked_medium = Qt.CheckState.Checked
+                    if Size == "large":
+                        checked_small = Qt.CheckState.Unchecked
+                        checked_large = Qt.CheckState.Checked
+                    if Size == "none":
+                        checked_small = Qt.CheckState.Unchecked
+                        Enabled = Qt.CheckState.Unchecked
+                except Exception:
+                    pass
 
-                        # Add the command to the shadow list
-                        ShadowList.append(f"{CommandName}, {WorkBenchName}")
+                MenuNameTabelWidgetItem = ""
+                if MenuNameJson != CommandInfo["menuText"].replace("&", ""):
+                    MenuNameTabelWidgetItem = MenuNameJson
+                elif MenuName.endswith("_ddb"):
+                    MenuNameTabelWidgetItem = MenuName.replace("_ddb", "")
+                elif CommandRecord is not None:
+                    MenuNameTabelWidgetItem = CommandInfo["ActionText"]
+                if MenuNameTabelWidgetItem == "":
+                    MenuNameTabelWidgetItem = MenuName
+
+                # Fill the table widget ------------------------------------------------------------------------------
+                #
+                # Define a table widget item
+                CommandWidgetItem = QTableWidgetItem()
+                CommandWidgetItem.setText(MenuNameTabelWidgetItem.replace("&", ""))
+                CommandWidgetItem.setData(
+                    Qt.ItemDataRole.UserRole,
+                    MenuName.replace("&", ""),
+                )
+                CommandWidgetItem.setFlags(CommandWidgetItem.flags() | Qt.ItemFlag.ItemIsEditable)
+                if Icon is not None:
+                    CommandWidgetItem.setIcon(Icon)
+                if Icon is None:
+                    CommandWidgetItem.setFlags(CommandWidgetItem.flags() & ~Qt.ItemFlag.ItemIsEnabled)
+
+                # Add the row at the end of the table
+                self.AddCommandTableRow(
+                    self.form.CommandTable_RD.rowCount(),
+                    CommandWidgetItem,
+                    [checked_small, checked_medium, checked_large, Enabled],
+                )
+
+                # Add the row and the entry of the command for the ribbon structure
+                List_Rows.append([MenuName.replace("&", ""), CommandName])
+                Dict_Commands[CommandName] = {
+                    "size": Size,
+                    "text": MenuName,
+                    "icon": IconName,
+                }
+
+                # Add the command to the shadow list
+                ShadowList.add(CommandName)
+
+        # Set the rows of the table. This sets the order of the panel once for all rows.
+        if len(List_Rows) > 0:
+            StandardFunctions.add_keys_nested_dict(
+                self.Dict_RibbonCommandPanel,
+                ["workbenches", WorkBenchName, "toolbars", Toolbar],
+            )
+            self.CommandTableRows.setPanel(
+                self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar],
+                List_Rows,
+                Dict_Commands,
+            )
+
+        # Set the IconOnly_Toolbars control
+        if self.ReturnRibbonStructure().isIconOnlyToolbar(Toolbar):
+            self.form.IconOnly_RD.setCheckState(Qt.CheckState.Checked)
+        else:
+            self.form.IconOnly_RD.setCheckState(Qt.CheckState.Unchecked)
+        return
+
+    def AddCommandTableRow(self, RowNumber: int, CommandWidgetItem: QTableWidgetItem, List_CheckStates: list = None):
+        """_summary_
+        Inserts a row in the command table.
+
+        Args:
+            RowNumber (int): The number of the new row.
+            CommandWidgetItem (QTableWidgetItem): The item for the first column.
+            List_CheckStates (list, optional): The check states for small, medium, large and enabled.
+                Defaults to None, for a separator without check boxes.
+        """
+        self.form.CommandTable_RD.insertRow(RowNumber)
+        self.form.CommandTable_RD.setItem(RowNumber, 0, CommandWidgetItem)
+
+        # Separators have empty cells for the sizes
+        if List_CheckStates is None:
+            for Column in range(1, 4):
+                EmptyItem = QTableWidgetItem()
+                EmptyItem.setText("")
+                self.form.CommandTable_RD.setItem(RowNumber, Column, EmptyItem)
+            return
+
+        # Create the cells with the check boxes for the sizes and the enabled state
+        for Column in range(len(List_CheckStates)):
+            CheckItem = QTableWidgetItem()
+            CheckItem.setText("")
+            CheckItem.setCheckState(List_CheckStates[Column])
+            self.form.CommandTable_RD.setItem(RowNumber, Column + 1, CheckItem)
         return
 
     def on_AddSeparator_RD_clicked(self):
@@ -2726,56 +2716,37 @@ class LoadDialog(Design_ui.Ui_Form):
         # Get the toolbar name
         Toolbar = self.form.PanelList_RD.currentData(Qt.ItemDataRole.UserRole)
 
+        # Get the rownumber. The separator is added above the selected row or at the end.
+        # The first row ("All") stays on top.
+        RowNumber = self.form.CommandTable_RD.rowCount()
+        if len(self.form.CommandTable_RD.selectedItems()) > 0:
+            RowNumber = max(1, self.form.CommandTable_RD.currentRow())
+
         # Define a table widget item
         CommandTable_RDItem = QTableWidgetItem()
         CommandTable_RDItem.setText("Separator")
-        CommandTable_RDItem.setData(Qt.ItemDataRole.UserRole, "separator")
-
-        # Get the last rownumber and set this row with the CommandTable_RDItem
-        RowNumber = self.form.CommandTable_RD.rowCount()
-        if len(self.form.CommandTable_RD.selectedItems()) > 0:
-            RowNumber = self.form.CommandTable_RD.currentRow()
-        # # update the data
         CommandTable_RDItem.setData(Qt.ItemDataRole.UserRole, f"{RowNumber}_separator_{WorkBenchName}")
-        self.form.CommandTable_RD.insertRow(RowNumber)
-
-        # Add the first cell with the table widget
-        self.form.CommandTable_RD.setItem(RowNumber, 0, CommandTable_RDItem)
-
-        # Create the second cell and set the checkstate according the checkstate as defined earlier
-        Icon_small = QTableWidgetItem()
-        Icon_small.setText("")
-        self.form.CommandTable_RD.setItem(RowNumber, 1, Icon_small)
-
-        # Create the third cell and set the checkstate according the checkstate as defined earlier
-        Icon_medium = QTableWidgetItem()
-        Icon_medium.setText("")
-        self.form.CommandTable_RD.setItem(RowNumber, 2, Icon_medium)
-
-        # Create the last cell and set the checkstate according the checkstate as defined earlier
-        Icon_large = QTableWidgetItem()
-        Icon_large.setText("")
-        self.form.CommandTable_RD.setItem(RowNumber, 3, Icon_large)
+        self.form.CommandTable_RD.blockSignals(True)
+        self.AddCommandTableRow(RowNumber, CommandTable_RDItem)
+        self.form.CommandTable_RD.blockSignals(False)
 
         self.form.CommandTable_RD.selectRow(RowNumber)
 
-        # Double check the workbench name
-        WorkBenchName = self.form.WorkbenchList_RD.currentData(Qt.ItemDataRole.UserRole)[0]
-
-        # Define the order based on the order in this table widget
-        Order = []
-        for i in range(self.form.CommandTable_RD.rowCount()):
-            Order.append(QTableWidgetItem(self.form.CommandTable_RD.item(i, 0)).data(Qt.ItemDataRole.UserRole))
-
-        # Add or update the dict for the Ribbon command panel
-        StandardFunctions.add_keys_nested_dict(
-            self.Dict_RibbonCommandPanel,
-            ["workbenches", WorkBenchName, "toolbars", Toolbar, "order"],
-        )
-        self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar]["order"] = Order
+        # A panel without commands has no entry in the ribbon structure yet
+        if self.CommandTableRows.Dict_Panel is None:
+            StandardFunctions.add_keys_nested_dict(
+                self.Dict_RibbonCommandPanel,
+                ["workbenches", WorkBenchName, "toolbars", Toolbar],
+            )
+            self.CommandTableRows.setPanel(
+                self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar], []
+            )
+        # Add the separator to the order. The model has no row for the first row ("All")
+        self.CommandTableRows.insertRow(RowNumber - 1, CommandTable_RDItem.data(Qt.ItemDataRole.UserRole))
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        WorkBenchName = self.form.WorkbenchList_RD.currentData(Qt.ItemDataRole.UserRole)[0]
+        if self.CheckChanges(["workbenches"], WorkBenchName) is True:
             self.form.UpdateJson.setEnabled(True)
         return
 
@@ -2783,7 +2754,8 @@ class LoadDialog(Design_ui.Ui_Form):
         self.Remove_TableItem(self.form.CommandTable_RD, "separator")
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        WorkBenchName = self.form.WorkbenchList_RD.currentData(Qt.ItemDataRole.UserRole)[0]
+        if self.CheckChanges(["workbenches"], WorkBenchName) is True:
             self.form.UpdateJson.setEnabled(True)
 
         return
@@ -2800,7 +2772,7 @@ class LoadDialog(Design_ui.Ui_Form):
                 self.List_IconOnly_Toolbars.remove(toolbar)
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        if self.CheckChanges(["iconOnlyToolbars"]) is True:
             self.form.UpdateJson.setEnabled(True)
 
         return
@@ -2811,13 +2783,14 @@ class LoadDialog(Design_ui.Ui_Form):
             if text == "":
                 Item.setText(Item.data(Qt.ItemDataRole.UserRole))
 
-            # Update the data with the (text)changed
-            self.UpdateData()
+            # Update the data of the changed row
+            self.UpdateData(Item.row())
             # Update the order of the commands
             self.on_PanelOrder_RD_changed()
 
             # Enable the apply button
-            if self.CheckChanges() is True:
+            WorkBenchName = self.form.WorkbenchList_RD.currentData(Qt.ItemDataRole.UserRole)[0]
+            if self.CheckChanges(["workbenches"], WorkBenchName) is True:
                 self.form.UpdateJson.setEnabled(True)
 
         return
@@ -2874,13 +2847,17 @@ class LoadDialog(Design_ui.Ui_Form):
             if IsChecked is False:
                 self.form.CommandTable_RD.item(row, 4).setCheckState(Qt.CheckState.Unchecked)
 
-            # Update the data
-            self.UpdateData()
+            # Update the data. The first row changes all rows
+            if row == 0:
+                self.UpdateData()
+            else:
+                self.UpdateData(row)
             # Update the order of the commands
             self.on_PanelOrder_RD_changed()
 
             # Enable the apply button
-            if self.CheckChanges() is True:
+            WorkBenchName = self.form.WorkbenchList_RD.currentData(Qt.ItemDataRole.UserRole)[0]
+            if self.CheckChanges(["workbenches"], WorkBenchName) is True:
                 self.form.UpdateJson.setEnabled(True)
         except Exception as e:
             if Parameters_Ribbon.DEBUG_MODE is True:
@@ -2893,7 +2870,8 @@ class LoadDialog(Design_ui.Ui_Form):
         self.MoveItem_CommandTable(self.form.CommandTable_RD, True)
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        WorkBenchName = self.form.WorkbenchList_RD.currentData(Qt.ItemDataRole.UserRole)[0]
+        if self.CheckChanges(["workbenches"], WorkBenchName) is True:
             self.form.UpdateJson.setEnabled(True)
 
         return
@@ -2902,7 +2880,8 @@ class LoadDialog(Design_ui.Ui_Form):
         self.MoveItem_CommandTable(self.form.CommandTable_RD, False)
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        WorkBenchName = self.form.WorkbenchList_RD.currentData(Qt.ItemDataRole.UserRole)[0]
+        if self.CheckChanges(["workbenches"], WorkBenchName) is True:
             self.form.UpdateJson.setEnabled(True)
 
         return
@@ -2912,7 +2891,8 @@ class LoadDialog(Design_ui.Ui_Form):
         self.on_PanelOrder_RD_changed()
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        WorkBenchName = self.form.WorkbenchList_RD.currentData(Qt.ItemDataRole.UserRole)[0]
+        if self.CheckChanges(["workbenches"], WorkBenchName) is True:
             self.form.UpdateJson.setEnabled(True)
 
         return
@@ -2922,7 +2902,8 @@ class LoadDialog(Design_ui.Ui_Form):
         self.on_PanelOrder_RD_changed()
 
         # Enable the apply button
-        if self.CheckChanges() is True:
+        WorkBenchName = self.form.WorkbenchList_RD.currentData(Qt.ItemDataRole.UserRole)[0]
+        if self.CheckChanges(["workbenches"], WorkBenchName) is True:
             self.form.UpdateJson.setEnabled(True)
 
         return
@@ -2957,14 +2938,12 @@ class LoadDialog(Design_ui.Ui_Form):
         # get the path for the Json file
         JsonPath = os.path.dirname(__file__)
         JsonFile = os.path.join(JsonPath, "RibbonStructure.json")
+        # Make sure that no save is still being written over the restored file
+        JsonStore_Ribbon.FlushJson()
 
-        BackupFiles = []
-        # returns a list of names (with extension, without full path) of all files
-        # in backup path
-        for name in os.listdir(pathBackup):
-            if os.path.isfile(os.path.join(pathBackup, name)):
-                if name.lower().endswith("json"):
-                    BackupFiles.append(name)
+        # Get the names of the backups from the index, newest first
+        Store = BackupStore_Ribbon.BackupStore(pathBackup)
+        BackupFiles = [Backup["File"] for Backup in reversed(Store.backups())]
 
         if len(BackupFiles) > 0:
             SelectedFile = StandardFunctions.Mbox(
@@ -2975,8 +2954,7 @@ class LoadDialog(Design_ui.Ui_Form):
                 BackupFiles[0],
                 BackupFiles,
             )
-            BackupFile = os.path.join(pathBackup, SelectedFile)
-            result = shutil.copy(BackupFile, JsonFile)
+            result = Store.restoreBackup(SelectedFile, JsonFile)
             StandardFunctions.Print(
                 translate("FreeCAD Ribbon", "Ribbon bar set back to settings from: {}").format(result),
                 "Warning",
@@ -2998,6 +2976,8 @@ class LoadDialog(Design_ui.Ui_Form):
         # get the path for the Json file
         JsonPath = os.path.dirname(__file__)
         JsonFile = os.path.join(JsonPath, "RibbonStructure.json")
+        # Make sure that no save is still being written over the restored file
+        JsonStore_Ribbon.FlushJson()
 
         BackupFile = os.path.join(JsonPath, "RibbonStructure_default.json")
 
@@ -3013,7 +2993,12 @@ class LoadDialog(Design_ui.Ui_Form):
                 "Settings reset to default!\nYou must restart FreeCAD for changes to take effect.",
             )
 
-            result = shutil.copy(BackupFile, JsonFile)
+            # With a base layout, remove the user changes. Otherwise copy the default structure
+            if LayeredConfig_Ribbon.IsLayered() is True:
+                LayeredConfig_Ribbon.ResetOverlay()
+                result = Parameters_Ribbon.RIBBON_STRUCTURE_BASE
+            else:
+                result = shutil.copy(BackupFile, JsonFile)
             StandardFunctions.Print(
                 translate("FreeCAD Ribbon", "Ribbon bar reset from {}!").format(result),
                 "Warning",
@@ -3118,19 +3103,13 @@ class LoadDialog(Design_ui.Ui_Form):
                         IsSelected = False
 
                 # Get the translate worbench title
-                if len(workbench) == 5:
-                    WorkbenchTitle = workbench[4]
-                else:
-                    WorkbenchTitle = workbench[2]
+                WorkbenchTitle = workbench.WorkbenchTitleTranslated
 
                 # Define a new ListWidgetItem.
                 ListWidgetItem_IW = QListWidgetItem()
                 ListWidgetItem_IW.setText(WorkbenchTitle)
                 ListWidgetItem_IW.setData(Qt.ItemDataRole.UserRole, workbench)
-                Icon = QIcon()
-                for item in self.List_WorkBenchIcons:
-                    if item[0] == WorkbenchName:
-                        Icon = item[1]
+                Icon = self.ReturnStoredWorkbenchIcon(WorkbenchName)
                 if Icon is None:
                     Icon = Gui.getIcon(workbench[1])
 
@@ -3219,10 +3198,7 @@ class LoadDialog(Design_ui.Ui_Form):
 
             if Toolbar[0] != "":
                 # Get the translated toolbar name
-                if len(Toolbar) == 4:
-                    ToolbarTransLated = Toolbar[3]
-                else:
-                    ToolbarTransLated = Toolbar[0]
+                ToolbarTransLated = Toolbar.ToolbarTranslated
 
                 ListWidgetItem = QListWidgetItem()
                 ListWidgetItem.setText(ToolbarTransLated.replace("&", ""))
@@ -3249,89 +3225,42 @@ class LoadDialog(Design_ui.Ui_Form):
 
     def LoadCommands(self):
         """Fill the Quick Commands Available and Selected"""
-        self.form.CommandsAvailable_QC.clear()
-        self.form.CommandsSelected_QC.clear()
-        self.form.CommandsAvailable_DDB.clear()
-        self.form.CommandsAvailable_NP.clear()
         self.form.CommandList_DDB.clear()
 
-        ShadowList = []  # List to add the commands and prevent duplicates
-
-        for CommandItem in self.List_Commands:
-            if f"{CommandItem[0]}" not in ShadowList:
-                CommandName = CommandItem[0]
-                MenuNameTranslated = CommandItem[2]
-                if len(CommandItem) == 5:
-                    MenuNameTranslated = CommandItem[4]
-                if CommandName.endswith("_ddb"):
-                    MenuNameTranslated = CommandName.replace("_ddb", "")
-
-                if MenuNameTranslated != "":
-                    # Get an icon
-                    # Define a commandname for the icon
-                    CommandName_Icon = CommandName
-                    # If the command is a dropdown button, get the icon from the first command in the dropdown list
-                    if str(CommandName).endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
-                        for DropDownCommand, Commands in self.Dict_DropDownButtons["dropdownButtons"].items():
-                            if DropDownCommand == CommandName:
-                                CommandName_Icon = Commands[0][0]
-                    # Get the icon name
-                    IconName = StandardFunctions.CommandInfoCorrections(CommandName_Icon)["pixmap"]
-                    # get the icon for this command if there isn't one, leave it None
-                    Icon = StandardFunctions.returnQiCons_Commands(CommandName_Icon, IconName)
-                    # If the icon is still None, get the icon from the iconlist
-                    if Icon is None or (Icon is not None and Icon.isNull()):
-                        for item in self.List_CommandIcons:
-                            if item[0] == CommandName_Icon:
-                                Icon = item[1]
-                                break
-
-                    # Define a new ListWidgetItem.
-                    textAddition = ""
-                    ListWidgetItem = QListWidgetItem()
-                    ListWidgetItem.setText((MenuNameTranslated + textAddition).replace("&", ""))
-                    if Icon is not None:
-                        ListWidgetItem.setIcon(Icon)
-                    ListWidgetItem.setToolTip(CommandName)  # Use the tooltip to store the actual command.
-                    ListWidgetItem.setData(Qt.ItemDataRole.UserRole, CommandName)
-
-                    # Add the ListWidgetItem to the correct ListWidget
-                    #
-                    # Default a command is not selected
-                    IsSelected = False
-                    for QuickCommand in self.List_QuickAccessCommands:
-                        if CommandItem[0] == QuickCommand:
-                            IsSelected = True
-
-                    if Icon is not None:
-                        if IsSelected is False:
-                            IsInlist = False
-                            for i in range(self.form.CommandsAvailable_QC.count()):
-                                Command = self.form.CommandsAvailable_QC.item(i)
-                                if Command.data(Qt.ItemDataRole.UserRole) == CommandName:
-                                    IsInlist = True
-
-                            if IsInlist is False:
-                                self.form.CommandsAvailable_QC.addItem(ListWidgetItem)
-                        if IsSelected is True:
-                            IsInlist = False
-                            for i in range(self.form.CommandsSelected_QC.count()):
-                                Command = self.form.CommandsSelected_QC.item(i)
-                                if Command.data(Qt.ItemDataRole.UserRole) == CommandName:
-                                    IsInlist = True
-
-                            if IsInlist is False:
-                                self.form.CommandsSelected_QC.addItem(ListWidgetItem)
-
-                        # Add clones of the listWidgetItem to the other listwidgets
-                        self.form.CommandsAvailable_NP.addItem(ListWidgetItem.clone())
-                        self.form.CommandsAvailable_DDB.addItem(ListWidgetItem.clone())
-
-                    # If there are any dropdown buttons in the json file, add them to the dropdown list
-                    if str(CommandName).endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
-                        self.form.CommandList_DDB.addItem(CommandName.replace("_ddb", ""))
-
-            ShadowList.append(f"{CommandItem[0]}")
+        # Create one model with all commands. Each tab views it through its own filter
+        self.CommandModel = CommandModel_Ribbon.CommandListModel(self.ReturnCommandIcon, self.ReturnHasStoredCommandIcon)
+        self.CommandModel.setCommands(self.List_Commands)
+
+        # Create the search index for the search bars
+        self.CommandSearchIndex = CommandModel_Ribbon.CommandSearchIndex(self.CommandModel)
+        self.Dict_SearchResults = {}
+        self.Dict_SearchTimers = {}
+
+        # Quick access commands: the selected commands are not available
+        self.CommandProxy_QC_Available = CommandModel_Ribbon.CommandFilterProxyModel()
+        self.CommandProxy_QC_Available.setSourceModel(self.CommandModel)
+        self.CommandProxy_QC_Available.setExcluded(self.List_QuickAccessCommands)
+        self.CommandProxy_QC_Selected = CommandModel_Ribbon.CommandFilterProxyModel()
+        self.CommandProxy_QC_Selected.setSourceModel(self.CommandModel)
+        self.CommandProxy_QC_Selected.setOrder(self.List_QuickAccessCommands)
+        # New panels and dropdown buttons: all commands are available
+        self.CommandProxy_NP = CommandModel_Ribbon.CommandFilterProxyModel()
+        self.CommandProxy_NP.setSourceModel(self.CommandModel)
+        self.CommandProxy_DDB = CommandModel_Ribbon.CommandFilterProxyModel()
+        self.CommandProxy_DDB.setSourceModel(self.CommandModel)
+
+        # The command lists are views on the command model. Only the visible rows are drawn
+        self.form.CommandsAvailable_QC.setModel(self.CommandProxy_QC_Available)
+        self.form.CommandsSelected_QC.setModel(self.CommandProxy_QC_Selected)
+        self.form.CommandsAvailable_NP.setModel(self.CommandProxy_NP)
+        self.form.CommandsAvailable_DDB.setModel(self.CommandProxy_DDB)
+
+        # If there are any dropdown buttons in the json file, add them to the dropdown list
+        if "dropdownButtons" in self.Dict_DropDownButtons:
+            for row in range(self.CommandModel.rowCount()):
+                CommandName = self.CommandModel.commandName(row)
+                if str(CommandName).endswith("_ddb"):
+                    self.form.CommandList_DDB.addItem(CommandName.replace("_ddb", ""))
 
         # Add a "new" item to the dropdown list
         self.form.CommandList_DDB.addItem(translate("FreeCAD Ribbon", "New"), "new")
@@ -3348,10 +3277,7 @@ class LoadDialog(Design_ui.Ui_Form):
         for ToolBarItem in self.StringList_Toolbars:
             if ToolBarItem[0] not in ShadowList and ToolBarItem[0] != "":
                 # Get the translated toolbar name
-                if len(ToolBarItem) == 4:
-                    ToolbarTransLated = ToolBarItem[3]
-                else:
-                    ToolbarTransLated = ToolBarItem[0]
+                ToolbarTransLated = ToolBarItem.ToolbarTranslated
 
                 ListWidgetItem = QListWidgetItem()
                 ListWidgetItem.setText(ToolbarTransLated.replace("&", ""))
@@ -3366,9 +3292,9 @@ class LoadDialog(Design_ui.Ui_Form):
         try:
             for WorkBenchName in self.Dict_CustomToolbars["customToolbars"]:
                 WorkBenchTitle = ""
-                for WorkBenchItem in self.List_Workbenches:
-                    if WorkBenchItem[0] == WorkBenchName:
-                        WorkBenchTitle = WorkBenchItem[2]
+                WorkBenchItem = self.Dict_WorkbenchRecords.get(WorkBenchName)
+                if WorkBenchItem is not None:
+                    WorkBenchTitle = WorkBenchItem.WorkbenchTitle
                 for CustomPanelTitle in self.Dict_CustomToolbars["customToolbars"][WorkBenchName]:
                     if WorkBenchTitle != "":
                         self.form.CustomToolbarSelector_CP.addItem(
@@ -3383,9 +3309,9 @@ class LoadDialog(Design_ui.Ui_Form):
         try:
             for WorkBenchName in self.Dict_NewPanels["newPanels"]:
                 WorkBenchTitle = ""
-                for WorkBenchItem in self.List_Workbenches:
-                    if WorkBenchItem[0] == WorkBenchName:
-                        WorkBenchTitle = WorkBenchItem[2]
+                WorkBenchItem = self.Dict_WorkbenchRecords.get(WorkBenchName)
+                if WorkBenchItem is not None:
+                    WorkBenchTitle = WorkBenchItem.WorkbenchTitle
                 if WorkBenchName == "Global":
                     WorkBenchTitle = WorkBenchName
 
@@ -3409,106 +3335,67 @@ class LoadDialog(Design_ui.Ui_Form):
         return
 
     
-    def UpdateData(self):
-        for i1 in range(1, self.form.CommandTable_RD.rowCount()):
-            row = i1
+    def UpdateData(self, Row: int = None):
+        """_summary_
+        Writes the text and size of the commands in the command table to the ribbon structure.
+        Only the entry of the command in each row is updated. The order is kept up-to-date by the table rows.
 
-            WorkBenchName = self.form.WorkbenchList_RD.currentData(Qt.ItemDataRole.UserRole)[0]
+        Args:
+            Row (int, optional): The row to update. Defaults to None (all rows).
+        """
+        List_Rows = range(1, self.form.CommandTable_RD.rowCount())
+        if Row is not None:
+            List_Rows = [Row]
+
+        for row in List_Rows:
+            # The first row ("All") has no command. The model has no row for it
+            if row < 1:
+                continue
+            CommandName = ""
             try:
-                # get the name of the toolbar
-                Toolbar = self.form.PanelList_RD.currentData(Qt.ItemDataRole.UserRole)
-                # create a empty size string
-                Size = ""
-                # Define empty strings for the command name and icon name
-                CommandName = ""
-                IconName = ""
-                # Get the menu name from the text value. This can be changed.
-                MenuName = self.form.CommandTable_RD.item(row, 0).data(Qt.ItemDataRole.UserRole)
-                MenuNameEntered = self.form.CommandTable_RD.item(row, 0).text()
+                CommandName = self.CommandTableRows.commandName(row - 1)
+                # Separators have no entry
+                if CommandName == "":
+                    continue
 
-                # Go through the list with all available commands.
-                # If the commandText is in this list, get the command name.
-                if MenuName.endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
-                    for DropDownCommand, Commands in self.Dict_DropDownButtons["dropdownButtons"].items():
-                        if DropDownCommand == MenuName:
-                            CommandName = MenuName
-                            for CommandItem in self.List_Commands:
-                                if CommandItem[0] == Commands[0][0]:
-                                    IconName = CommandItem[1]
-                else:
-                    for i3 in range(len(self.List_Commands)):
-                        if MenuName == self.List_Commands[i3][2]:
-                            if len(self.List_Commands[i3][0].split(", ")) <= 1:
-                                if WorkBenchName == self.List_Commands[i3][3] or self.List_Commands[i3][3] == "Global":
-                                    CommandName = self.List_Commands[i3][0]
-                                    IconName = self.List_Commands[i3][1]
-                            if len(self.List_Commands[i3][0].split(", ")) > 1:
-                                CommandName = self.List_Commands[i3][0]
-
-                # Go through the cells in the row. If checkstate is checked, uncheck the other cells in the row
-                for i6 in range(1, self.form.CommandTable_RD.columnCount()):
-                    CheckState = self.form.CommandTable_RD.item(row, i6).checkState()
+                # Get the size from the checked cell in the row
+                Size = ""
+                for Column in range(1, self.form.CommandTable_RD.columnCount()):
+                    CheckState = self.form.CommandTable_RD.item(row, Column).checkState()
                     if CheckState == Qt.CheckState.Checked:
-                        if i6 == 1:
+                        if Column == 1:
                             Size = "small"
-                        if i6 == 2:
+                        if Column == 2:
                             Size = "medium"
-                        if i6 == 3:
+                        if Column == 3:
                             Size = "large"
-                    if i6 == 4 and CheckState == Qt.CheckState.Unchecked:
+                    if Column == 4 and CheckState == Qt.CheckState.Unchecked:
                         Size = "none"
 
-                Order = []
-                for i7 in range(1, self.form.CommandTable_RD.rowCount()):
-                    Order.append(QTableWidgetItem(self.form.CommandTable_RD.item(i7, 0)).data(Qt.ItemDataRole.UserRole))
-
-                StandardFunctions.add_keys_nested_dict(
-                    self.Dict_RibbonCommandPanel,
-                    [
-                        "workbenches",
-                        WorkBenchName,
-                        "toolbars",
-                        Toolbar,
-                        "order",
-                    ],
-                )
-                StandardFunctions.add_keys_nested_dict(
-                    self.Dict_RibbonCommandPanel,
-                    [
-                        "workbenches",
-                        WorkBenchName,
-                        "toolbars",
-                        Toolbar,
-                        "commands",
-                        CommandName,
-                    ],
-                )
+                # Get the menu name from the text value. This can be changed.
+                MenuNameEntered = self.form.CommandTable_RD.item(row, 0).text()
 
-                self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar]["order"] = Order
-                self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar]["commands"][
-                    CommandName
-                ] = {
-                    "size": Size,
-                    "text": MenuNameEntered,
-                    "icon": IconName,
-                }
+                self.CommandTableRows.updateCommand(row - 1, MenuNameEntered, Size)
             except Exception as e:
                 if Parameters_Ribbon.DEBUG_MODE is True:
-                    StandardFunctions.Print(f"{CommandName}, {WorkBenchName} {e}", "Warning")
+                    StandardFunctions.Print(f"{CommandName}, row {row}: {e}", "Warning")
                 continue
         return
 
-
     def ReadJson(self, Section="All", JsonFile=""):
-        # Open the JsonFile and load the data
+        # Wait until saved changes are written
+        JsonStore_Ribbon.FlushJson()
+        # Open the JsonFile and load the data.
+        # Without a file, read the ribbon structure. With a base layout, the user changes are merged into it
+        data = None
         try:
             if JsonFile != "":
-                JsonFile = open(JsonFile)
-            else:
-                JsonFile = open(Parameters_Ribbon.RIBBON_STRUCTURE_JSON)
+                with open(JsonFile) as infile:
+                    data = json.load(infile)
         except Exception:
-            JsonFile = open(Parameters_Ribbon.RIBBON_STRUCTURE_JSON)
-        data = json.load(JsonFile)
+            pass
+        if data is None:
+            data = LayeredConfig_Ribbon.ReadStructure()
 
         # Get all the ignored toolbars
         if Section == "ignoredToolbars" or Section == "All":
@@ -3558,10 +3445,15 @@ class LoadDialog(Design_ui.Ui_Form):
             except Exception:
                 pass
 
-        JsonFile.close()
-        return
+        return data
 
-    def WriteJson(self):
+    def ReturnJsonSections(self) -> dict:
+        """_summary_
+        Returns the top-level sections of the ribbon structure as they are set in the dialog.
+
+        Returns:
+            dict: The sections for the Json file.
+        """
         # get the system language
         # Get the current stylesheet for FreeCAD
         FreeCAD_preferences = App.ParamGet("User parameter:BaseApp/Preferences/General")
@@ -3585,11 +3477,8 @@ class LoadDialog(Design_ui.Ui_Form):
             if IconOnly_Toolbar not in List_IconOnly_Toolbars:
                 List_IconOnly_Toolbars.append(IconOnly_Toolbar)
 
-        # QuickAccessCommands
-        SelectedCommands = self.ListWidgetItems(self.form.CommandsSelected_QC)
-        for i2 in range(len(SelectedCommands)):
-            ListWidgetItem: QListWidgetItem = SelectedCommands[i2]
-            QuickAccessCommand = ListWidgetItem.data(Qt.ItemDataRole.UserRole)
+        # QuickAccessCommands, in the order of the list
+        for QuickAccessCommand in self.CommandProxy_QC_Selected.commandNames():
             List_QuickAccessCommands.append(QuickAccessCommand)
 
         # IgnoredWorkbences
@@ -3614,24 +3503,42 @@ class LoadDialog(Design_ui.Ui_Form):
         # RibbonTabs
         # Get the Ribbon dictionary
         resultingDict.update(self.Dict_RibbonCommandPanel)
+        return resultingDict
+
+    def WriteJson(self):
+        # Get the sections and update the hashes of all sections
+        resultingDict = self.ReturnJsonSections()
+        for Section, Value in resultingDict.items():
+            self.ChangeTracker.update(Section, Value)
+
+        # If nothing is changed, there is nothing to write
+        List_ChangedSections = self.ChangeTracker.changedSections()
+        if len(List_ChangedSections) == 0:
+            return
 
         # get the path for the Json file
         JsonFile = Parameters_Ribbon.RIBBON_STRUCTURE_JSON
 
-        # create a copy and rename it as a backup if enabled
-        if Parameters_Ribbon.ENABLE_BACKUP is True:
-            Suffix = datetime.now().strftime("%Y%m%d_%H%M%S")
-            BackupName = f"RibbonStructure_{Suffix}.json"
-            if os.path.exists(pathBackup) is False:
-                os.makedirs(pathBackup)
-            BackupFile = os.path.join(pathBackup, BackupName)
-            shutil.copy(JsonFile, BackupFile)
+        # Read the saved structure. Only the changed sections are replaced.
+        # With a base layout, this is the merged structure
+        data = LayeredConfig_Ribbon.ReadStructure()
+        for Section in List_ChangedSections:
+            if Section in resultingDict:
+                data[Section] = resultingDict[Section]
 
-        # Writing to sample.json
-        with open(JsonFile, "w") as outfile:
-            json.dump(resultingDict, outfile, indent=4)
+        # create a compressed backup if enabled. Unchanged content is not stored again
+        if Parameters_Ribbon.ENABLE_BACKUP is True and os.path.exists(JsonFile) is True:
+            try:
+                BackupStore_Ribbon.BackupStore(pathBackup).createBackup(JsonFile)
+            except Exception as e:
+                StandardFunctions.Print(f"{e}", "Warning")
 
-        outfile.close()
+        # Write the file on a worker thread. The file is replaced in one step, so it is never half written.
+        # With a base layout, only the differences from the base layout are written
+        LayeredConfig_Ribbon.WriteStructure(data)
+
+        # The written sections are now the saved sections
+        self.ChangeTracker.setSaved(resultingDict, List_ChangedSections)
         return
 
     def ListWidgetItems(self, ListWidget: QListWidget) -> list:
@@ -3641,55 +3548,92 @@ class LoadDialog(Design_ui.Ui_Form):
 
         return items
 
+    def ReturnCommandNames(self, ListWidget: QListView, Selected: bool = False) -> list:
+        """_summary_
+        Returns the command names in a command list, in the order of the list.
+        The list is a list widget, or a list view on the command model.
+
+        Args:
+            ListWidget (QListView): The list.
+            Selected (bool, optional): Return only the selected commands. Defaults to False.
+
+        Returns:
+            list: The command names.
+        """
+        if isinstance(ListWidget, QListWidget):
+            if Selected is True:
+                Items = ListWidget.selectedItems()
+            else:
+                Items = self.ListWidgetItems(ListWidget)
+            return [Item.data(Qt.ItemDataRole.UserRole) for Item in Items]
+
+        Proxy: CommandModel_Ribbon.CommandFilterProxyModel = ListWidget.model()
+        if Selected is False:
+            return Proxy.commandNames()
+        Rows = sorted(Index.row() for Index in ListWidget.selectionModel().selectedIndexes())
+        return [Proxy.commandName(row) for row in Rows]
+
     def AddItem(
         self,
-        SourceWidget: QListWidget,
-        DestinationWidget: QListWidget,
+        SourceWidget: QListView,
+        DestinationWidget: QListView,
         ExcludedItems=[],
         CheckIfInList=True,
     ):
-        """Move a list item widgtet from one list to another
+        """Move the selected commands from one list to another.
+        The lists are list widgets, or list views on the command model.
 
         Args:
-            SourceWidget (QListWidget): _description_
-            DestinationWidget (QListWidget): _description_
+            SourceWidget (QListView): _description_
+            DestinationWidget (QListView): _description_
         """
-        Values = SourceWidget.selectedItems()
-
-        # Go through the items
-        for Value in Values:
-            # Get the item text
-            DestinationItem = QListWidgetItem(Value)
-
-            IsInList = False
-            if CheckIfInList is True:
-                for i in range(DestinationWidget.count()):
-                    item = DestinationWidget.item(i)
-                    if item.data(Qt.ItemDataRole.UserRole) == DestinationItem.data(Qt.ItemDataRole.UserRole):
-                        IsInList = True
-
-            IsExcluded = False
-            for ExcludedItem in ExcludedItems:
-                if ExcludedItem == DestinationItem.data(Qt.ItemDataRole.UserRole):
-                    IsExcluded = True
-
-            # Add the item to the list with current items
+        # Get the selected commands and the commands that are already in the destination
+        Values = self.ReturnCommandNames(SourceWidget, Selected=True)
+        DestinationCommands = []
+        if CheckIfInList is True:
+            DestinationCommands = self.ReturnCommandNames(DestinationWidget)
+
+        # Go through the commands
+        List_Moved = []
+        for CommandName in Values:
+            IsInList = CommandName in DestinationCommands or CommandName in List_Moved
+            IsExcluded = CommandName in ExcludedItems
             if IsInList is False and IsExcluded is False:
-                DestinationWidget.addItem(DestinationItem)
-
-                # Go through the items on the list with items to add.
-                for i in range(SourceWidget.count()):
-                    # Get the item
-                    SourceItem = SourceWidget.item(i)
-                    # If the item is not none and the item text is equal to itemText,
-                    # remove it from the columns to add list.
-                    if SourceItem is not None:
-                        if SourceItem.data(Qt.ItemDataRole.UserRole) == DestinationItem.data(Qt.ItemDataRole.UserRole):
-                            SourceWidget.takeItem(i)
+                List_Moved.append(CommandName)
+
+        # Add the commands to the list with current items
+        if isinstance(DestinationWidget, QListWidget):
+            for CommandName in List_Moved:
+                row = self.CommandModel.row(CommandName)
+                if row >= 0:
+                    DestinationWidget.addItem(CommandModel_Ribbon.ReturnListWidgetItem(self.CommandModel, row))
+        else:
+            DestinationWidget.model().addCommands(List_Moved)
+
+        # Remove the commands from the list with items to add.
+        if isinstance(SourceWidget, QListWidget):
+            for i in reversed(range(SourceWidget.count())):
+                SourceItem = SourceWidget.item(i)
+                if SourceItem is not None and SourceItem.data(Qt.ItemDataRole.UserRole) in List_Moved:
+                    SourceWidget.takeItem(i)
+        else:
+            SourceWidget.clearSelection()
+            SourceWidget.model().removeCommands(List_Moved)
 
         return
 
-    def MoveItem(self, ListWidget: QListWidget, Up: bool = True):
+    def MoveItem(self, ListWidget: QListView, Up: bool = True):
+        # A list view on the command model: move the command in the order of the list
+        if isinstance(ListWidget, QListWidget) is False:
+            Proxy: CommandModel_Ribbon.CommandFilterProxyModel = ListWidget.model()
+            if ListWidget.currentIndex().isValid() is False:
+                return
+            CommandName = Proxy.commandName(ListWidget.currentIndex().row())
+            if Proxy.moveCommand(CommandName, Up) is True:
+                # Set the moved row, to the current row
+                ListWidget.setCurrentIndex(Proxy.index(Proxy.row(CommandName), 0))
+            return
+
         # Get the current row
         Row = ListWidget.currentRow()
         # remove the current row
@@ -3709,53 +3653,36 @@ class LoadDialog(Design_ui.Ui_Form):
     def MoveItem_CommandTable(self, CommandTable: QTableWidget, Up: bool = True):
         row = CommandTable.currentRow()
         column = CommandTable.currentColumn()
-        if Up is False:
-            if row < CommandTable.rowCount() - 1:
-                CommandTable.insertRow(row + 2)
-                for i in range(CommandTable.columnCount()):
-                    item = CommandTable.takeItem(row, i)
-                    CommandTable.setItem(row + 2, i, item)
-                    CommandTable.setCurrentCell(row + 2, column)
-                CommandTable.removeRow(row)
+        # The first row ("All") stays on top
+        if row < 1:
+            return
+        # Move the row. This updates the order in place
+        if self.CommandTableRows.moveRow(row - 1, Up) is False:
+            return
 
-        if Up is True:
-            if row > 0:
-                CommandTable.insertRow(row - 1)
-                for i in range(CommandTable.columnCount()):
-                    item = CommandTable.takeItem(row + 1, i)
-                    CommandTable.setItem(row - 1, i, item)
-                    CommandTable.setCurrentCell(row - 1, column)
-                CommandTable.removeRow(row + 1)
-
-        self.UpdateData()
+        # Swap the items of the two rows
+        Target = row - 1 if Up is True else row + 1
+        CommandTable.blockSignals(True)
+        for i in range(CommandTable.columnCount()):
+            item = CommandTable.takeItem(row, i)
+            TargetItem = CommandTable.takeItem(Target, i)
+            CommandTable.setItem(Target, i, item)
+            CommandTable.setItem(row, i, TargetItem)
+        CommandTable.blockSignals(False)
+        CommandTable.setCurrentCell(Target, column)
         return
 
     def Remove_TableItem(self, CommandTable: QTableWidget, filter: str = ""):
         row = CommandTable.currentRow()
-        if filter != "":
-            if CommandTable.item(row, 0).text().lower() == "separator":
-                CommandTable.removeRow(row)
-        else:
-            CommandTable.removeRow(row)
-
-        # Get the correct workbench name
-        WorkBenchName = self.form.WorkbenchList_RD.currentData(Qt.ItemDataRole.UserRole)[0]
-
-        # Get the toolbar name
-        Toolbar = self.form.PanelList_RD.currentData(Qt.ItemDataRole.UserRole)
-
-        # Define the order based on the order in this table widget
-        Order = []
-        for i in range(CommandTable.rowCount()):
-            Order.append(QTableWidgetItem(CommandTable.item(i, 0)).data(Qt.ItemDataRole.UserRole))
-
-        # Add or update the dict for the Ribbon command panel
-        StandardFunctions.add_keys_nested_dict(
-            self.Dict_RibbonCommandPanel,
-            ["workbenches", WorkBenchName, "toolbars", Toolbar, "order"],
-        )
-        self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][Toolbar]["order"] = Order
+        # The first row ("All") cannot be removed
+        if row < 1:
+            return
+        if filter != "" and CommandTable.item(row, 0).text().lower() != "separator":
+            return
 
+        CommandTable.removeRow(row)
+        # Remove the row. This removes it from the order
+        self.CommandTableRows.removeRow(row - 1)
         return
 
     def List_ReturnCustomToolbars(self):
@@ -3944,13 +3871,11 @@ class LoadDialog(Design_ui.Ui_Form):
                                 WorkbenchTitle = "Global"
 
                             for key, value in list(Commands.items()):
-                                for i in range(len(self.List_Commands)):
-                                    if self.List_Commands[i][2] == key and self.List_Commands[i][3] == WorkBenchName:
-                                        Command = self.List_Commands[i][0]
-                                        ListCommands.append(Command)
-                                    if self.List_Commands[i][2] == key and self.List_Commands[i][3] == "Global":
-                                        Command = self.List_Commands[i][0]
-                                        ListCommands.append(Command)
+                                for CommandItem in self.Dict_MenuTextRecords.get(key, []):
+                                    if CommandItem.WorkBenchName == WorkBenchName:
+                                        ListCommands.append(CommandItem.CommandName)
+                                    if CommandItem.WorkBenchName == "Global":
+                                        ListCommands.append(CommandItem.CommandName)
 
                                 if value not in self.List_IgnoredToolbars_internal:
                                     self.List_IgnoredToolbars_internal.append(f"{value}")
@@ -3977,14 +3902,12 @@ class LoadDialog(Design_ui.Ui_Form):
                 Commands = DictPanels[PanelDict][WorkBenchName][CustomToolbar]["commands"]
 
                 for key, value in list(Commands.items()):
-                    for i in range(len(self.List_Commands)):
-                        if self.List_Commands[i][2] == key:
-                            if self.List_Commands[i][3] == WorkBenchName or self.List_Commands[i][3] == "Global":
-                                Command = self.List_Commands[i][0]
-                                ListCommands.append(Command)
+                    for CommandItem in self.Dict_MenuTextRecords.get(key, []):
+                        if CommandItem.WorkBenchName == WorkBenchName or CommandItem.WorkBenchName == "Global":
+                            ListCommands.append(CommandItem.CommandName)
 
-                        if value not in self.List_IgnoredToolbars_internal:
-                            self.List_IgnoredToolbars_internal.append(f"{value}")
+                    if value not in self.List_IgnoredToolbars_internal:
+                        self.List_IgnoredToolbars_internal.append(f"{value}")
 
                     Toolbars[CustomToolbar] = ListCommands
         except Exception:
@@ -4033,39 +3956,31 @@ class LoadDialog(Design_ui.Ui_Form):
                     pass
         return Toolbars
 
-    def CheckChanges(self):
-        # Open the JsonFile and load the data
-        JsonFile = open(os.path.join(os.path.dirname(__file__), "RibbonStructure.json"))
-        data = json.load(JsonFile)
-
-        IsChanged = False
-        if "ignoredToolbars" in data:
-            if data["ignoredToolbars"].sort() != self.List_IgnoredToolbars.sort():
-                IsChanged = True
-        if "iconOnlyToolbars" in data:
-            if data["iconOnlyToolbars"].sort() != self.List_IconOnly_Toolbars.sort():
-                IsChanged = True
-        if "quickAccessCommands" in data:
-            if data["quickAccessCommands"].sort() != self.List_QuickAccessCommands.sort():
-                IsChanged = True
-        if "ignoredWorkbenches" in data:
-            if data["ignoredWorkbenches"].sort() != self.List_IgnoredWorkbenches.sort():
-                IsChanged = True
-        if "customToolbars" in data:
-            if data["customToolbars"] != self.Dict_CustomToolbars:
-                IsChanged = True
-        if "dropdownButtons" in data:
-            if data["dropdownButtons"] != self.Dict_DropDownButtons:
-                IsChanged = True
-        if "newPanels" in data:
-            if data["newPanels"] != self.Dict_DropDownButtons:
-                IsChanged = True
-        if "workbenches" in data:
-            if data["workbenches"] != self.Dict_RibbonCommandPanel:
-                IsChanged = True
+    def CheckChanges(self, Sections: list = None, WorkBenchName: str = None):
+        """_summary_
+        Rehashes the edited sections and checks if any section differs from the saved Json file.
 
-        JsonFile.close()
-        return IsChanged
+        Args:
+            Sections (list, optional): The edited sections. Defaults to None (all sections).
+            WorkBenchName (str, optional): The edited workbench in the workbenches section.
+                Only this workbench is rehashed. Defaults to None (all workbenches).
+
+        Returns:
+            bool: True if there are changes.
+        """
+        Dict_Sections = self.ReturnJsonSections()
+        if Sections is None:
+            Sections = list(Dict_Sections)
+
+        for Section in Sections:
+            if Section not in Dict_Sections:
+                continue
+            Keys = None
+            if Section == "workbenches" and WorkBenchName is not None:
+                Keys = [WorkBenchName]
+            self.ChangeTracker.update(Section, Dict_Sections[Section], Keys)
+
+        return self.ChangeTracker.isChanged()
 
     def SortedPanelList(self, PanelList_RD: list, WorkBenchName):
         JsonOrderList = []
@@ -4074,15 +3989,19 @@ class LoadDialog(Design_ui.Ui_Form):
                 JsonOrderList = self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"]["order"]
         except Exception:
             JsonOrderList = PanelList_RD
+        # Get the position of each toolbar once
+        Dict_Positions = {}
+        for i in range(len(JsonOrderList)):
+            Dict_Positions.setdefault(JsonOrderList[i], i)
 
         def SortList(toolbar):
             if toolbar == "":
                 return -1
 
             position = None
-            try:
-                position = JsonOrderList.index(toolbar) + 1
-            except ValueError:
+            if toolbar in Dict_Positions:
+                position = Dict_Positions[toolbar] + 1
+            else:
                 position = 999999
                 if toolbar.endswith("_custom") or toolbar.endswith("_newPanel"):
                     if Parameters_Ribbon.DEFAULT_PANEL_POSITION_CUSTOM == "Right":
@@ -4100,9 +4019,6 @@ class LoadDialog(Design_ui.Ui_Form):
         self.form.WorkbenchList_IS.clear()
         self.form.Panels_IS.clear()
         #
-        self.form.CommandsAvailable_QC.clear()
-        self.form.CommandsSelected_QC.clear()
-        #
         self.form.PanelsToExclude_EP.clear()
         self.form.PanelsExcluded_EP.clear()
         #
@@ -4113,16 +4029,17 @@ class LoadDialog(Design_ui.Ui_Form):
         self.form.PanelSelected_CP.clear()
         #
         self.form.WorkbenchList_NP.clear()
-        self.form.CommandsAvailable_NP.clear()
         self.form.NewPanel_NP.clear()
         #
-        self.form.CommandsAvailable_DDB.clear()
         self.form.NewControl_DDB.clear()
         self.form.ListCategory_DDB.clear()
         #
         self.form.PanelOrder_RD.clear()
         self.form.WorkbenchList_RD.clear()
 
+        # Create the indexes for the commands. Used by the command table and the command lists
+        self.CreateCommandIndex()
+
         # -- Ribbon design tab --
         # Add all workbenches to the ListItem Widget. In this case a dropdown list.
         self.addWorkbenches()
@@ -4149,9 +4066,8 @@ class LoadDialog(Design_ui.Ui_Form):
     def returnWorkBenchToolbars(self, WorkBenchName):
         wbToolbars = []
         try:
-            for ToolbarItem in self.StringList_Toolbars:
-                if ToolbarItem[2] == WorkBenchName:
-                    wbToolbars.append(ToolbarItem[0])
+            for ToolbarItem in self.Dict_WorkbenchToolbars.get(WorkBenchName, []):
+                wbToolbars.append(ToolbarItem.Toolbar)
         except Exception:
             Gui.activateWorkbench(WorkBenchName)
             wbToolbars: list = Gui.getWorkbench(WorkBenchName).listToolbars()
@@ -4159,9 +4075,9 @@ class LoadDialog(Design_ui.Ui_Form):
 
     def returnToolbarCommands(self, WorkBenchName):
         try:
-            for item in self.List_Workbenches:
-                if item[0] == WorkBenchName:
-                    return item[3]
+            WorkBenchItem = self.Dict_WorkbenchRecords.get(WorkBenchName)
+            if WorkBenchItem is not None:
+                return WorkBenchItem.ToolbarItems
         except Exception:
             Gui.activateWorkbench(WorkBenchName)
             Toolbars = Gui.getWorkbench(WorkBenchName).getToolbarItems()
@@ -4169,199 +4085,169 @@ class LoadDialog(Design_ui.Ui_Form):
 
     def FilterCommands_SearchBar(
         self,
-        ListWidget: QListWidget,
+        ListWidget: QListView,
         SearchBar: QLineEdit,
-        DestinationWidget: QListWidget,
+        DestinationWidget: QListView,
     ):
-        # Create a list from the current commands
-        CurrentCommands = []
-        for i in range(ListWidget.count()):
-            CommandItem = ListWidget.item(i)
-            CurrentCommands.append(CommandItem.data(Qt.ItemDataRole.UserRole))
-
-        # Define a list for the current ListWidget items
-        ListWidgetItem_List = []
-        for i in range(ListWidget.count()):
-            ListWidgetItem_List.append(ListWidget.item(i).clone())
-
-        # Clear the listwidget
-        ListWidget.clear()
-
-        ShadowList = []  # List to add the commands and prevent duplicates
-        for ToolbarCommand in self.List_Commands:
-            CommandName = ToolbarCommand[0]
-            MenuNameTranslated = ToolbarCommand[4]
-            if CommandName.endswith("_ddb"):
-                MenuNameTranslated = CommandName.replace("_ddb", "")
-
-            if f"{CommandName}" not in ShadowList:
-                if (
-                    SearchBar.text() != "" and MenuNameTranslated.lower().startswith(SearchBar.text().lower())
-                ) or SearchBar.text() == "":
-                    IsInlist = False
-                    for i in range(ListWidget.count()):
-                        CommandItem = ListWidget.item(i)
-                        if CommandItem.data(Qt.ItemDataRole.UserRole) == CommandName:
-                            IsInlist = True
-
-                    if IsInlist is False:
-                        # Get an icon
-                        # Define a commandname for the icon
-                        CommandName_Icon = CommandName
-                        # If the command is a dropdown button, get the icon from the first command in the dropdown list
-                        if str(CommandName).endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
-                            for DropDownCommand, Commands in self.Dict_DropDownButtons["dropdownButtons"].items():
-                                if DropDownCommand == CommandName:
-                                    CommandName_Icon = Commands[0][0]
-                        # Get the icon name
-                        IconName = StandardFunctions.CommandInfoCorrections(CommandName_Icon)["pixmap"]
-                        # get the icon for this command if there isn't one, leave it None
-                        Icon = StandardFunctions.returnQiCons_Commands(CommandName_Icon, IconName)
-                        # If the icon is still None, get the icon from the iconlist
-                        if Icon is None or (Icon is not None and Icon.isNull()):
-                            for item in self.List_CommandIcons:
-                                if item[0] == CommandName_Icon:
-                                    Icon = item[1]
-                                    break
-
-                        # Define a new ListWidgetItem.
-                        ListWidgetItem = QListWidgetItem()
-                        ListWidgetItem.setText(MenuNameTranslated)
-                        ListWidgetItem.setData(Qt.ItemDataRole.UserRole, CommandName)
-                        if Icon is not None:
-                            ListWidgetItem.setIcon(Icon)
-                            ListWidgetItem.setToolTip(CommandName)  # Use the tooltip to store the actual command.
-
-                            # Add the ListWidgetItem to the correct ListWidget
-                            IsInList = False
-                            for i in range(DestinationWidget.count()):
-                                item = DestinationWidget.item(i)
-                                if item.data(Qt.ItemDataRole.UserRole) == ListWidgetItem.data(Qt.ItemDataRole.UserRole):
-                                    IsInList = True
-                            if IsInList is False:
-                                ListWidget.addItem(ListWidgetItem)
-                        if Icon is None:
-                            if Parameters_Ribbon.DEBUG_MODE is True:
-                                StandardFunctions.Print(f"{CommandName} has no icon!", "Warning")
-            ShadowList.append(f"{CommandName}")
+        # Wait until the user stops typing. Each keystroke restarts the timer of this search bar
+        Timer = self.Dict_SearchTimers.get(SearchBar.objectName())
+        if Timer is None:
+            Timer = QTimer(self.form)
+            Timer.setSingleShot(True)
+            Timer.setInterval(150)
+            Timer.timeout.connect(
+                lambda ListWidget=ListWidget, SearchBar=SearchBar, DestinationWidget=DestinationWidget: (
+                    self.SearchCommands(ListWidget, SearchBar, DestinationWidget)
+                )
+            )
+            self.Dict_SearchTimers[SearchBar.objectName()] = Timer
+        Timer.start()
+        return
 
+    def SearchCommands(
+        self,
+        ListWidget: QListView,
+        SearchBar: QLineEdit,
+        DestinationWidget: QListView,
+    ):
+        Query = SearchBar.text()
+
+        # If the search text is extended, search only in the previous result
+        List_Rows = None
+        PreviousQuery, PreviousRows = self.Dict_SearchResults.get(SearchBar.objectName(), ("", None))
+        if PreviousRows is not None and PreviousQuery != "" and Query.startswith(PreviousQuery):
+            List_Rows = PreviousRows
+        List_Rows = self.CommandSearchIndex.search(Query, List_Rows, Fuzzy=Parameters_Ribbon.FUZZY_SEARCH)
+        self.Dict_SearchResults[SearchBar.objectName()] = (Query, List_Rows)
+
+        # Commands that are already in the destination are not available
+        Proxy: CommandModel_Ribbon.CommandFilterProxyModel = ListWidget.model()
+        Proxy.setExcluded(self.ReturnCommandNames(DestinationWidget))
+        # Show the found commands. Commands without an icon are hidden by the proxy
+        Proxy.setIncluded(self.CommandModel.commandName(row) for row in List_Rows)
         return
 
-    def FilterCommands_ListCategory(self, ListWidget_Commands: QListWidget, ListWidget_WorkBenches: QListWidget):
+    def FilterCommands_ListCategory(self, ListWidget_Commands: QListView, ListWidget_WorkBenches: QComboBox):
         if (
             ListWidget_WorkBenches.currentData(Qt.ItemDataRole.UserRole) is None
             and ListWidget_WorkBenches.currentText() != "All"
         ):
             return
 
-        ListWidget_Commands.clear()
+        # Show the commands of the selected workbench from the index
+        Proxy: CommandModel_Ribbon.CommandFilterProxyModel = ListWidget_Commands.model()
+        if ListWidget_WorkBenches.currentData(Qt.ItemDataRole.UserRole) == "All":
+            Proxy.setIncluded(None)
+        else:
+            WorkbenchTitle = ListWidget_WorkBenches.currentData(Qt.ItemDataRole.UserRole)[2]
+            Proxy.setIncluded(self.Dict_WorkbenchCommands.get(WorkbenchTitle, []))
+        return
 
-        ShadowList = []  # List to add the commands and prevent duplicates
-        for ToolbarCommand in self.List_Commands:
-            CommandName = ToolbarCommand[0]
-            MenuNameTranslated = ToolbarCommand[2]
-            if len(ToolbarCommand) == 5:
-                MenuNameTranslated = ToolbarCommand[4]
-            if CommandName.endswith("_ddb"):
-                MenuNameTranslated = CommandName.replace("_ddb", "")
-            workbenchName = ToolbarCommand[3]
-
-            if ListWidget_WorkBenches.currentData(Qt.ItemDataRole.UserRole) != "All":
-                if (
-                    f"{CommandName}, {workbenchName}" not in ShadowList
-                    and workbenchName != "Global"
-                    and workbenchName != "General"
-                ):
-                    try:
-                        WorkbenchTitle = Gui.getWorkbench(workbenchName).MenuText
-                    except Exception:
-                        return
-                    if WorkbenchTitle == ListWidget_WorkBenches.currentData(Qt.ItemDataRole.UserRole)[2]:
-                        IsInlist = False
-                        for i in range(ListWidget_Commands.count()):
-                            CommandItem = ListWidget_Commands.item(i)
-                            if CommandItem.data(Qt.ItemDataRole.UserRole) == CommandName:
-                                IsInlist = True
-
-                        if IsInlist is False:
-                            # Get an icon
-                            # Define a commandname for the icon
-                            CommandName_Icon = CommandName
-                            # If the command is a dropdown button, get the icon from the first command in the dropdown list
-                            if str(CommandName).endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
-                                for (
-                                    DropDownCommand,
-                                    Commands,
-                                ) in self.Dict_DropDownButtons["dropdownButtons"].items():
-                                    if DropDownCommand == CommandName:
-                                        CommandName_Icon = Commands[0][0]
-                            # Get the icon name
-                            IconName = StandardFunctions.CommandInfoCorrections(CommandName_Icon)["pixmap"]
-                            # get the icon for this command if there isn't one, leave it None
-                            Icon = StandardFunctions.returnQiCons_Commands(CommandName_Icon, IconName)
-                            # If the icon is still None, get the icon from the iconlist
-                            if Icon is None or (Icon is not None and Icon.isNull()):
-                                for item in self.List_CommandIcons:
-                                    if item[0] == CommandName_Icon:
-                                        Icon = item[1]
-                                        break
-
-                            Text = MenuNameTranslated
-                            ListWidgetItem = QListWidgetItem()
-                            ListWidgetItem.setText(Text)
-                            ListWidgetItem.setData(Qt.ItemDataRole.UserRole, CommandName)
-                            if Icon is not None:
-                                ListWidgetItem.setIcon(Icon)
-                            ListWidgetItem.setToolTip(CommandName)  # Use the tooltip to store the actual command.
+    def CreateCommandIndex(self):
+        """_summary_
+        Creates the indexes over the records of the workbenches, toolbars and commands.
+        Used instead of going through the lists for each lookup:
+            - the first record of each command, and of each command per workbench
+            - the command records per menu text
+            - the record of each workbench
+            - the first record of each toolbar, and of each toolbar per workbench
+            - the toolbar records per workbench
+        Creates an index with the commands per workbench title as well. Used to filter the commands per workbench.
+        """
+        self.Dict_CommandRecords = Records_Ribbon.ReturnIndex(self.List_Commands, "CommandName")
+        self.Dict_WorkbenchCommandRecords = Records_Ribbon.ReturnIndex(
+            self.List_Commands, "CommandName", "WorkBenchName"
+        )
+        self.Dict_MenuTextRecords = Records_Ribbon.ReturnGroupedIndex(self.List_Commands, "MenuText")
+        self.Dict_WorkbenchRecords = Records_Ribbon.ReturnIndex(self.List_Workbenches, "WorkBenchName")
+        self.Dict_ToolbarRecords = Records_Ribbon.ReturnIndex(self.StringList_Toolbars, "Toolbar")
+        self.Dict_WorkbenchToolbarRecords = Records_Ribbon.ReturnIndex(
+            self.StringList_Toolbars, "Toolbar", "WorkBenchName"
+        )
+        self.Dict_WorkbenchToolbars = Records_Ribbon.ReturnGroupedIndex(self.StringList_Toolbars, "WorkBenchName")
 
-                            # Add the ListWidgetItem to the correct ListWidget
-                            if Icon is not None:
-                                ListWidget_Commands.addItem(ListWidgetItem)
+        # Get the titles of the workbenches from the data
+        Dict_WorkbenchTitles = {}
+        for WorkBenchName, WorkBenchItem in self.Dict_WorkbenchRecords.items():
+            Dict_WorkbenchTitles[WorkBenchName] = WorkBenchItem.WorkbenchTitle
 
-                    ShadowList.append(f"{CommandName}, {workbenchName}")
-            if ListWidget_WorkBenches.currentData(Qt.ItemDataRole.UserRole) == "All":
-                IsInlist = False
-                for i in range(ListWidget_Commands.count()):
-                    CommandItem = ListWidget_Commands.item(i)
-                    if CommandItem.data(Qt.ItemDataRole.UserRole) == CommandName:
-                        IsInlist = True
+        self.Dict_WorkbenchCommands = {}
 
-                if IsInlist is False:
-                    # Define a new ListWidgetItem.
-                    Icon = None
-                    for item in self.List_CommandIcons:
-                        if item[0] == CommandName:
-                            Icon = item[1]
-                        if str(CommandName).endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
-                            for (
-                                DropDownCommand,
-                                Commands,
-                            ) in self.Dict_DropDownButtons["dropdownButtons"].items():
-                                if Commands[0][0] == item[0]:
-                                    Icon = item[1]
-                    if Icon is None:
-                        IconName = StandardFunctions.CommandInfoCorrections(CommandName)["pixmap"]
-                        if str(CommandName).endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
-                            for (
-                                DropDownCommand,
-                                Commands,
-                            ) in self.Dict_DropDownButtons["dropdownButtons"].items():
-                                if Commands[0][0] == CommandName:
-                                    IconName = ToolbarCommand[1]
-                        Icon = StandardFunctions.returnQiCons_Commands(CommandName, IconName)
+        Dict_Added = {}  # Set per workbench title to prevent duplicates
+        for CommandItem in self.List_Commands:
+            CommandName = CommandItem.CommandName
+            workbenchName = CommandItem.WorkBenchName
+            if workbenchName == "Global" or workbenchName == "General":
+                continue
 
-                    Text = MenuNameTranslated
-                    ListWidgetItem = QListWidgetItem()
-                    ListWidgetItem.setText(Text)
-                    ListWidgetItem.setData(Qt.ItemDataRole.UserRole, CommandName)
-                    if Icon is not None:
-                        ListWidgetItem.setIcon(Icon)
-                        ListWidgetItem.setToolTip(CommandName)  # Use the tooltip to store the actual command.
+            WorkbenchTitle = Dict_WorkbenchTitles.get(workbenchName)
+            if WorkbenchTitle is None:
+                try:
+                    WorkbenchTitle = Gui.getWorkbench(workbenchName).MenuText
+                except Exception:
+                    continue
+                Dict_WorkbenchTitles[workbenchName] = WorkbenchTitle
 
-                        # Add the ListWidgetItem to the correct ListWidget
-                        ListWidget_Commands.addItem(ListWidgetItem)
+            Set_Added = Dict_Added.setdefault(WorkbenchTitle, set())
+            if CommandName not in Set_Added:
+                Set_Added.add(CommandName)
+                self.Dict_WorkbenchCommands.setdefault(WorkbenchTitle, []).append(CommandName)
         return
 
+    def ReturnRibbonStructure(self) -> RibbonStructure_Ribbon.RibbonStructure:
+        """_summary_
+        Returns the indexed ribbon structure over the sections of the dialog.
+        The sections are shared, not copied. The indexes are kept until a section is replaced.
+
+        Returns:
+            RibbonStructure: The ribbon structure.
+        """
+        Dict_Sections = {
+            "ignoredToolbars": self.List_IgnoredToolbars,
+            "iconOnlyToolbars": self.List_IconOnly_Toolbars,
+            "quickAccessCommands": self.List_QuickAccessCommands,
+            "ignoredWorkbenches": self.List_IgnoredWorkbenches,
+            "customToolbars": self.Dict_CustomToolbars.get("customToolbars"),
+            "dropdownButtons": self.Dict_DropDownButtons.get("dropdownButtons"),
+            "newPanels": self.Dict_NewPanels.get("newPanels"),
+            "workbenches": self.Dict_RibbonCommandPanel.get("workbenches"),
+        }
+        for Section, Value in Dict_Sections.items():
+            if Value is None:
+                if Section in self.RibbonStructure:
+                    del self.RibbonStructure[Section]
+            elif self.RibbonStructure.get(Section) is not Value:
+                self.RibbonStructure[Section] = Value
+        return self.RibbonStructure
+
+    def ReturnCommandRecord(self, CommandName: str) -> Records_Ribbon.CommandRecord:
+        """_summary_
+        Returns the first record of a command in the list of commands.
+
+        Args:
+            CommandName (str): The name of the command.
+
+        Returns:
+            CommandRecord: [CommandName, IconName, MenuText, WorkBenchName, MenuTextTranslated] or None.
+        """
+        return self.Dict_CommandRecords.get(CommandName)
+
+    def ReturnDropDownFirstCommand(self, CommandName: str) -> str:
+        """_summary_
+        Returns the first command of a dropdown button.
+
+        Args:
+            CommandName (str): The name of the dropdown button.
+
+        Returns:
+            str: The name of the first command, or None if the command is not a dropdown button.
+        """
+        if str(CommandName).endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
+            Commands = self.Dict_DropDownButtons["dropdownButtons"].get(CommandName)
+            if isinstance(Commands, list) and len(Commands) > 0:
+                return Commands[0][0]
+        return None
+
     def CreateRibbonStructure_WB(self, WorkBenchName="All", Size="small"):
         # Define a list for the workbenchName
         ListWorkbenches = []
@@ -4423,10 +4309,10 @@ class LoadDialog(Design_ui.Ui_Form):
                     # Get the MenuName and IconName
                     MenuName = ""
                     IconName = ""
-                    for CommandItem in self.List_Commands:
-                        if CommandItem[0] == CommandName:
-                            IconName = CommandItem[1]
-                            MenuName = CommandItem[2]
+                    CommandItem = self.Dict_CommandRecords.get(CommandName)
+                    if CommandItem is not None:
+                        IconName = CommandItem.IconName
+                        MenuName = CommandItem.MenuText
 
                     # Write the values
                     self.Dict_RibbonCommandPanel["workbenches"][WorkBenchItem]["toolbars"][key]["commands"][
@@ -4479,23 +4365,13 @@ class LoadDialog(Design_ui.Ui_Form):
                                     ],
                                 )
 
-                                # Get the MenuName and IconName
+                                # Get the MenuName and IconName. Dropdown buttons are in the list of commands as well
                                 MenuName = ""
                                 IconName = ""
-                                if CommandName.endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
-                                    for (
-                                        DropDownCommand,
-                                        Commands,
-                                    ) in self.Dict_DropDownButtons["dropdownButtons"].items():
-                                        if DropDownCommand == CommandName:
-                                            for CommandItem in self.List_Commands:
-                                                if CommandItem[0] == CommandName:
-                                                    IconName = CommandItem[1]
-                                                    MenuName = CommandItem[2]
-                                for CommandItem in self.List_Commands:
-                                    if CommandItem[0] == CommandName:
-                                        IconName = CommandItem[1]
-                                        MenuName = CommandItem[2]
+                                CommandItem = self.Dict_CommandRecords.get(CommandName)
+                                if CommandItem is not None:
+                                    IconName = CommandItem.IconName
+                                    MenuName = CommandItem.MenuText
 
                                 # Write the values
                                 self.Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][key]["commands"][
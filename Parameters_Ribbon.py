@@ -98,12 +98,20 @@ class Settings:
 
     def WriteSettings():
         Settings.SetStringSetting("BackupFolder", BACKUP_LOCATION)
+        Settings.SetIntSetting("BackupCount", BACKUP_COUNT)
+        Settings.SetIntSetting("BackupDays", BACKUP_DAYS)
+        Settings.SetIntSetting("BackupWeeks", BACKUP_WEEKS)
         Settings.SetStringSetting("RibbonStructure", RIBBON_STRUCTURE_JSON)
+        Settings.SetStringSetting("RibbonStructureBase", RIBBON_STRUCTURE_BASE)
+        Settings.SetStringSetting("SharedDataLocation", SHARED_DATA_LOCATION)
         Settings.SetStringSetting("TabOrder", TAB_ORDER)
         Settings.SetIntSetting("TabBar_Style", TABBAR_STYLE)
         Settings.SetStringSetting("Stylesheet", STYLESHEET)
         Settings.SetBoolSetting("AutoHideRibbon", AUTOHIDE_RIBBON)
         Settings.SetIntSetting("MaxColumnsPerPanel", MAX_COLUMN_PANELS)
+        Settings.SetIntSetting("MaxLoadedCategories", MAX_LOADED_CATEGORIES)
+        Settings.SetIntSetting("CategoryMemoryBudget", CATEGORY_MEMORY_BUDGET)
+        Settings.SetIntSetting("MaxPooledButtons", MAX_POOLED_BUTTONS)
 
         Settings.SetIntSetting("IconSize_Small", ICON_SIZE_SMALL)
         Settings.SetIntSetting("IconSize_Medium", ICON_SIZE_MEDIUM)
@@ -124,12 +132,15 @@ class Settings:
         Settings.SetIntSetting("Ribbon_Scroll", RIBBON_SCROLLSPEED)
         Settings.SetIntSetting("TabBar_Click", TABBAR_CLICKSPEED)
         Settings.SetIntSetting("Ribbon_Click", RIBBON_CLICKSPEED)
+        Settings.SetBoolSetting("Ribbon_InstantScroll", RIBBON_INSTANTSCROLL)
+        Settings.SetBoolSetting("Ribbon_SnapToPanels", RIBBON_SNAPTOPANELS)
         Settings.SetStringSetting("Shortcut_Application", SHORTCUT_APPLICATION)
 
         Settings.SetIntSetting("Preferred_view", PREFERRED_VIEW)
         Settings.SetBoolSetting("UseToolsPanel", USE_TOOLSPANEL)
         Settings.SetBoolSetting("UseFCOverlay", USE_FC_OVERLAY)
         Settings.SetBoolSetting("UseButtonBackGround", BUTTON_BACKGROUND_ENABLED)
+        Settings.SetBoolSetting("FuzzySearch", FUZZY_SEARCH)
 
         Settings.SetBoolSetting("DebugMode", DEBUG_MODE)
 
@@ -170,6 +181,8 @@ DefaultSettings = {
     "ImportLocation": os.path.join(os.path.dirname(__file__), ""),
     "ExportLocation": os.path.join(os.path.dirname(__file__), ""),
     "RibbonStructure": os.path.join(os.path.dirname(__file__), "RibbonStructure.json"),
+    "RibbonStructureBase": "",
+    "SharedDataLocation": "",
     "TabBar_Style": int(0),
     "IconSize_Small": int(24),
     "IconSize_Medium": int(36),
@@ -180,6 +193,9 @@ DefaultSettings = {
     "RightToolbarButtonSize": int(24),
     "BackupEnabled": bool(True),
     "BackupFolder": os.path.join(os.path.dirname(__file__), "Backups"),
+    "BackupCount": int(10),
+    "BackupDays": int(7),
+    "BackupWeeks": int(4),
     "TabOrder": App.ParamGet(
         "User parameter:BaseApp/Preferences/Workbenches/"
     ).GetString("Ordered"),
@@ -189,18 +205,24 @@ DefaultSettings = {
     "ShowIconText_Medium": bool(False),
     "ShowIconText_Large": bool(True),
     "MaxColumnsPerPanel": int(6),
+    "MaxLoadedCategories": int(0),
+    "CategoryMemoryBudget": int(0),
+    "MaxPooledButtons": int(200),
     "DebugMode": bool(False),
     "ShowOnHover": bool(False),
     "TabBar_Scroll": int(1),
     "Ribbon_Scroll": int(1),
     "TabBar_Click": int(1),
     "Ribbon_Click": int(1),
+    "Ribbon_InstantScroll": bool(False),
+    "Ribbon_SnapToPanels": bool(False),
     "Preferred_view": int(2),
     "UseToolsPanel": bool(True),
     "WrapText_Medium": bool(True),
     "WrapText_Large": bool(True),
     "UseFCOverlay": bool(False),
     "UseButtonBackGround": bool(False),
+    "FuzzySearch": bool(False),
     "CustomColors": bool(False),
     "BorderTransparant": bool(True),
     "Color_Borders": "",
@@ -241,6 +263,20 @@ if Settings.GetStringSetting("RibbonStructure") != "":
 else:
     RIBBON_STRUCTURE_JSON = DefaultSettings["RibbonStructure"]
     Settings.SetStringSetting("RibbonStructure", RIBBON_STRUCTURE_JSON)
+
+# The shared base layout. When set, RIBBON_STRUCTURE_JSON contains only the differences from the base layout
+if Settings.GetStringSetting("RibbonStructureBase") != "":
+    RIBBON_STRUCTURE_BASE = Settings.GetStringSetting("RibbonStructureBase")
+else:
+    RIBBON_STRUCTURE_BASE = DefaultSettings["RibbonStructureBase"]
+# endregion ------------------------------------------------------------------------------------------------------------
+
+# region - Define the shared data location -----------------------------------------------------------------------------
+# A folder with prebuilt data and icon stores, shared by several seats. See SharedData_Ribbon
+if Settings.GetStringSetting("SharedDataLocation") != "":
+    SHARED_DATA_LOCATION = Settings.GetStringSetting("SharedDataLocation")
+else:
+    SHARED_DATA_LOCATION = DefaultSettings["SharedDataLocation"]
 # endregion ------------------------------------------------------------------------------------------------------------
 
 # region - Define the default position for global panels ---------------------------------------------------------------
@@ -329,6 +365,32 @@ BACKUP_LOCATION = Settings.GetStringSetting("BackupFolder")
 if Settings.GetStringSetting("BackupFolder") == "":
     BACKUP_LOCATION = DefaultSettings["BackupFolder"]
     Settings.SetStringSetting("BackupFolder", BACKUP_LOCATION)
+
+# The number of latest backups to keep
+BACKUP_COUNT = Settings.GetIntSetting("BackupCount")
+if (
+    Settings.GetIntSetting("BackupCount") is None
+    or Settings.GetIntSetting("BackupCount") == 0
+):
+    BACKUP_COUNT = DefaultSettings["BackupCount"]
+    Settings.SetIntSetting("BackupCount", BACKUP_COUNT)
+
+# The number of days and weeks for which the last backup of the day or week is kept
+BACKUP_DAYS = Settings.GetIntSetting("BackupDays")
+if (
+    Settings.GetIntSetting("BackupDays") is None
+    or Settings.GetIntSetting("BackupDays") == 0
+):
+    BACKUP_DAYS = DefaultSettings["BackupDays"]
+    Settings.SetIntSetting("BackupDays", BACKUP_DAYS)
+
+BACKUP_WEEKS = Settings.GetIntSetting("BackupWeeks")
+if (
+    Settings.GetIntSetting("BackupWeeks") is None
+    or Settings.GetIntSetting("BackupWeeks") == 0
+):
+    BACKUP_WEEKS = DefaultSettings["BackupWeeks"]
+    Settings.SetIntSetting("BackupWeeks", BACKUP_WEEKS)
 # endregion ------------------------------------------------------------------------------------------------------------
 
 # region - Ribbon settings ---------------------------------------------------------------------------------------------
@@ -365,6 +427,25 @@ if Settings.GetIntSetting("MaxColumnsPerPanel") is None:
     MAX_COLUMN_PANELS = DefaultSettings["MaxColumnsPerPanel"]
     Settings.SetIntSetting("MaxColumnsPerPanel", MAX_COLUMN_PANELS)
 
+# The maximum number of workbench tabs that are kept in memory. 0 is unlimited
+MAX_LOADED_CATEGORIES = Settings.GetIntSetting("MaxLoadedCategories")
+if Settings.GetIntSetting("MaxLoadedCategories") is None:
+    MAX_LOADED_CATEGORIES = DefaultSettings["MaxLoadedCategories"]
+    Settings.SetIntSetting("MaxLoadedCategories", MAX_LOADED_CATEGORIES)
+
+# The estimated memory (MB) for icons of workbench tabs that are kept in memory. 0 is unlimited
+CATEGORY_MEMORY_BUDGET = Settings.GetIntSetting("CategoryMemoryBudget")
+if Settings.GetIntSetting("CategoryMemoryBudget") is None:
+    CATEGORY_MEMORY_BUDGET = DefaultSettings["CategoryMemoryBudget"]
+    Settings.SetIntSetting("CategoryMemoryBudget", CATEGORY_MEMORY_BUDGET)
+
+# The maximum number of buttons from unloaded workbench tabs that are kept for reuse. 0 disables the pool
+MAX_POOLED_BUTTONS = Settings.GetIntSetting("MaxPooledButtons")
+# Only an unset value is replaced by the default. GetInt returns 0 for an unset value as well
+if MAX_POOLED_BUTTONS is None or "MaxPooledButtons" not in preferences.GetInts():
+    MAX_POOLED_BUTTONS = DefaultSettings["MaxPooledButtons"]
+    Settings.SetIntSetting("MaxPooledButtons", MAX_POOLED_BUTTONS)
+
 WRAPTEXT_MEDIUM = Settings.GetBoolSetting("WrapText_Medium")
 if Settings.GetBoolSetting("WrapText_Medium") == "":
     WRAPTEXT_MEDIUM = DefaultSettings["WrapText_Medium"]
@@ -421,6 +502,16 @@ if (
     RIBBON_CLICKSPEED = DefaultSettings["Ribbon_Click"]
     Settings.SetIntSetting("Ribbon_Click", RIBBON_CLICKSPEED)
 
+RIBBON_INSTANTSCROLL = Settings.GetBoolSetting("Ribbon_InstantScroll")
+if Settings.GetBoolSetting("Ribbon_InstantScroll") is None:
+    RIBBON_INSTANTSCROLL = DefaultSettings["Ribbon_InstantScroll"]
+    Settings.SetBoolSetting("Ribbon_InstantScroll", RIBBON_INSTANTSCROLL)
+
+RIBBON_SNAPTOPANELS = Settings.GetBoolSetting("Ribbon_SnapToPanels")
+if Settings.GetBoolSetting("Ribbon_SnapToPanels") is None:
+    RIBBON_SNAPTOPANELS = DefaultSettings["Ribbon_SnapToPanels"]
+    Settings.SetBoolSetting("Ribbon_SnapToPanels", RIBBON_SNAPTOPANELS)
+
 SHORTCUT_APPLICATION = Settings.GetStringSetting("Shortcut_Application")
 if Settings.GetStringSetting("Shortcut_Application") == "":
     SHORTCUT_APPLICATION = DefaultSettings["Shortcut_Application"]
@@ -452,6 +543,11 @@ BUTTON_BACKGROUND_ENABLED = Settings.GetBoolSetting("UseButtonBackGround")
 if Settings.GetBoolSetting("UseButtonBackGround") is None:
     BUTTON_BACKGROUND_ENABLED = DefaultSettings["UseButtonBackGround"]
     Settings.SetBoolSetting("UseButtonBackGround", BUTTON_BACKGROUND_ENABLED)
+
+FUZZY_SEARCH = Settings.GetBoolSetting("FuzzySearch")
+if Settings.GetBoolSetting("FuzzySearch") is None:
+    FUZZY_SEARCH = DefaultSettings["FuzzySearch"]
+    Settings.SetBoolSetting("FuzzySearch", FUZZY_SEARCH)
 # endregion ------------------------------------------------------------------------------------------------------------
 
 # region - Color and icon settings -------------------------------------------------------------------------------------
@@ -0,0 +1,251 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+import sys
+from typing import NamedTuple
+
+# The records for the lists in the data file: List_Workbenches, StringList_Toolbars and List_Commands.
+# The records are tuples with named fields. They are stored in the data file as lists, in the same order,
+# so the fields can also be read by index. The strings are interned: names that are in many records
+# (workbench names, icon names, menu texts) are stored once.
+
+# The version of the records in the data file.
+# Version 1 had command records without the translated menu text and toolbar records without the workbench.
+RECORD_VERSION = 2
+
+
+class CommandRecord(NamedTuple):
+    """
+    An entry of List_Commands.
+    """
+
+    CommandName: str
+    IconName: str
+    MenuText: str
+    WorkBenchName: str
+    MenuTextTranslated: str
+
+
+class WorkbenchRecord(NamedTuple):
+    """
+    An entry of List_Workbenches.
+    """
+
+    WorkBenchName: str
+    IconName: str
+    WorkbenchTitle: str
+    ToolbarItems: dict
+    WorkbenchTitleTranslated: str
+
+
+class ToolbarListRecord(NamedTuple):
+    """
+    An entry of StringList_Toolbars. Custom toolbars have no workbench name.
+    """
+
+    Toolbar: str
+    WorkbenchTitle: str
+    WorkBenchName: str
+    ToolbarTranslated: str
+
+
+def Intern(Value):
+    """
+    Returns the interned string, or the value itself when it is not a string.
+    """
+    if isinstance(Value, str):
+        return sys.intern(Value)
+    return Value
+
+
+def ReturnToolbarItems(ToolbarItems: dict) -> dict:
+    """
+    Returns the toolbar items of a workbench with interned toolbar and command names.
+    """
+    if isinstance(ToolbarItems, dict) is False:
+        return {}
+    return {
+        Intern(Toolbar): [Intern(CommandName) for CommandName in Commands]
+        for Toolbar, Commands in ToolbarItems.items()
+    }
+
+
+def ReturnCommandRecord(Item, Upgrade=True) -> CommandRecord:
+    """
+    Returns the command record for an entry of List_Commands.
+
+    Args:
+        Item: The entry as stored in the data file, or a record.
+        Upgrade (bool, optional): Upgrade entries of an older version. Defaults to True.
+
+    Returns:
+        CommandRecord: The record.
+    """
+    if isinstance(Item, CommandRecord):
+        return Item
+    if Upgrade is False:
+        return CommandRecord._make(map(Intern, Item))
+
+    # Older entries have no translated menu text. Use the menu text instead
+    Item = list(Item)
+    CommandName = Item[0]
+    IconName = Item[1] if len(Item) > 1 else ""
+    MenuText = Item[2] if len(Item) > 2 else CommandName
+    WorkBenchName = Item[3] if len(Item) > 3 else ""
+    MenuTextTranslated = Item[4] if len(Item) > 4 else MenuText
+    return CommandRecord._make(
+        map(
+            Intern, (CommandName, IconName, MenuText, WorkBenchName, MenuTextTranslated)
+        )
+    )
+
+
+def ReturnWorkbenchRecord(Item, Upgrade=True) -> WorkbenchRecord:
+    """
+    Returns the workbench record for an entry of List_Workbenches.
+
+    Args:
+        Item: The entry as stored in the data file, or a record.
+        Upgrade (bool, optional): Upgrade entries of an older version. Defaults to True.
+
+    Returns:
+        WorkbenchRecord: The record.
+    """
+    if isinstance(Item, WorkbenchRecord):
+        return Item
+    if Upgrade is False:
+        (
+            WorkBenchName,
+            IconName,
+            WorkbenchTitle,
+            ToolbarItems,
+            WorkbenchTitleTranslated,
+        ) = Item
+    else:
+        Item = list(Item)
+        WorkBenchName = Item[0]
+        IconName = Item[1] if len(Item) > 1 else ""
+        WorkbenchTitle = Item[2] if len(Item) > 2 else WorkBenchName
+        ToolbarItems = Item[3] if len(Item) > 3 else {}
+        WorkbenchTitleTranslated = Item[4] if len(Item) > 4 else WorkbenchTitle
+    return WorkbenchRecord(
+        Intern(WorkBenchName),
+        Intern(IconName),
+        Intern(WorkbenchTitle),
+        ReturnToolbarItems(ToolbarItems),
+        Intern(WorkbenchTitleTranslated),
+    )
+
+
+def ReturnToolbarRecord(Item, Upgrade=True) -> ToolbarListRecord:
+    """
+    Returns the toolbar record for an entry of StringList_Toolbars.
+    Custom toolbars are returned by List_ReturnCustomToolbars with their commands in the place of
+    the workbench name. These commands are not stored in the record.
+
+    Args:
+        Item: The entry as stored in the data file, a custom toolbar or a record.
+        Upgrade (bool, optional): Upgrade entries of an older version. Defaults to True.
+
+    Returns:
+        ToolbarListRecord: The record.
+    """
+    if isinstance(Item, ToolbarListRecord):
+        return Item
+    if Upgrade is False:
+        return ToolbarListRecord._make(map(Intern, Item))
+
+    Item = list(Item)
+    Toolbar = Item[0]
+    WorkbenchTitle = Item[1] if len(Item) > 1 else ""
+    WorkBenchName = Item[2] if len(Item) > 2 and isinstance(Item[2], str) else ""
+    ToolbarTranslated = Item[3] if len(Item) > 3 else Toolbar
+    return ToolbarListRecord._make(
+        map(Intern, (Toolbar, WorkbenchTitle, WorkBenchName, ToolbarTranslated))
+    )
+
+
+def LoadRecords(Data: dict) -> dict:
+    """
+    Replaces the lists in the data by records. Entries of an older version are upgraded once, here.
+    The record version is stored in the data, so the upgrade is not done again when the data is written.
+
+    Args:
+        Data (dict): The data file. Changed in place.
+
+    Returns:
+        dict: The data.
+    """
+    Upgrade = Data.get("recordVersion", 1) != RECORD_VERSION
+    Data["List_Workbenches"] = [
+        ReturnWorkbenchRecord(Item, Upgrade)
+        for Item in Data.get("List_Workbenches", [])
+    ]
+    Data["StringList_Toolbars"] = [
+        ReturnToolbarRecord(Item, Upgrade)
+        for Item in Data.get("StringList_Toolbars", [])
+    ]
+    Data["List_Commands"] = [
+        ReturnCommandRecord(Item, Upgrade) for Item in Data.get("List_Commands", [])
+    ]
+    Data["recordVersion"] = RECORD_VERSION
+    return Data
+
+
+def ReturnIndex(List_Records: list, *Fields: str) -> dict:
+    """
+    Returns an index with the first record for each key.
+
+    Args:
+        List_Records (list): The records.
+        Fields (str): The fields of the key. With more than one field, the key is a tuple.
+
+    Returns:
+        dict: {key: record}
+    """
+    Dict_Index = {}
+    if len(Fields) == 1:
+        Field = Fields[0]
+        for Record in List_Records:
+            Dict_Index.setdefault(getattr(Record, Field), Record)
+    else:
+        for Record in List_Records:
+            Dict_Index.setdefault(
+                tuple(getattr(Record, Field) for Field in Fields), Record
+            )
+    return Dict_Index
+
+
+def ReturnGroupedIndex(List_Records: list, Field: str) -> dict:
+    """
+    Returns an index with all records for each key, in the order of the list.
+
+    Args:
+        List_Records (list): The records.
+        Field (str): The field of the key.
+
+    Returns:
+        dict: {key: [records]}
+    """
+    Dict_Index = {}
+    for Record in List_Records:
+        Dict_Index.setdefault(getattr(Record, Field), []).append(Record)
+    return Dict_Index
@@ -325,6 +325,16 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
         self.removeWidget(self._panels[title])
         self._panels.pop(title)
 
+    def clearPanels(self):
+        """Remove and delete all panels and separators from the category."""
+        while self._categoryLayout.count() > 0:
+            item = self._categoryLayout.takeAt(0)
+            widget = item.widget()
+            if widget is not None:
+                widget.hide()
+                widget.deleteLater()
+        self._panels.clear()
+
     def takePanel(self, title: str) -> RibbonPanel:
         """Remove and return a panel from the category.
 
@@ -476,24 +476,18 @@ class Ui_Form(object):
 
         self.gridLayout_2.addWidget(self.label_5, 3, 0, 1, 3)
 
-        self.CommandsSelected_QC = QListWidget(self.frame)
-        __qlistwidgetitem = QListWidgetItem(self.CommandsSelected_QC)
-        __qlistwidgetitem.setCheckState(Qt.Checked)
+        self.CommandsSelected_QC = QListView(self.frame)
         self.CommandsSelected_QC.setObjectName("CommandsSelected_QC")
         self.CommandsSelected_QC.setDefaultDropAction(Qt.DropAction.MoveAction)
         self.CommandsSelected_QC.setMovement(QListView.Movement.Free)
-        self.CommandsSelected_QC.setSortingEnabled(False)
 
         self.gridLayout_2.addWidget(self.CommandsSelected_QC, 4, 2, 1, 1)
 
-        self.CommandsAvailable_QC = QListWidget(self.frame)
-        __qlistwidgetitem1 = QListWidgetItem(self.CommandsAvailable_QC)
-        __qlistwidgetitem1.setCheckState(Qt.Checked)
+        self.CommandsAvailable_QC = QListView(self.frame)
         self.CommandsAvailable_QC.setObjectName("CommandsAvailable_QC")
         self.CommandsAvailable_QC.setSelectionMode(
             QAbstractItemView.SelectionMode.MultiSelection
         )
-        self.CommandsAvailable_QC.setSortingEnabled(True)
 
         self.gridLayout_2.addWidget(self.CommandsAvailable_QC, 4, 0, 1, 1)
 
@@ -860,14 +854,11 @@ class Ui_Form(object):
 
         self.gridLayout_40.addWidget(self.SearchBar_DDB, 0, 0, 1, 1)
 
-        self.CommandsAvailable_DDB = QListWidget(self.tab)
-        __qlistwidgetitem8 = QListWidgetItem(self.CommandsAvailable_DDB)
-        __qlistwidgetitem8.setCheckState(Qt.Checked)
+        self.CommandsAvailable_DDB = QListView(self.tab)
         self.CommandsAvailable_DDB.setObjectName("CommandsAvailable_DDB")
         self.CommandsAvailable_DDB.setSelectionMode(
             QAbstractItemView.SelectionMode.MultiSelection
         )
-        self.CommandsAvailable_DDB.setSortingEnabled(True)
 
         self.gridLayout_40.addWidget(self.CommandsAvailable_DDB, 2, 0, 1, 1)
 
@@ -1082,14 +1073,11 @@ class Ui_Form(object):
 
         self.gridLayout_38.addWidget(self.SearchBar_NP, 0, 0, 1, 1)
 
-        self.CommandsAvailable_NP = QListWidget(self.groupBox)
-        __qlistwidgetitem10 = QListWidgetItem(self.CommandsAvailable_NP)
-        __qlistwidgetitem10.setCheckState(Qt.Checked)
+        self.CommandsAvailable_NP = QListView(self.groupBox)
         self.CommandsAvailable_NP.setObjectName("CommandsAvailable_NP")
         self.CommandsAvailable_NP.setSelectionMode(
             QAbstractItemView.SelectionMode.MultiSelection
         )
-        self.CommandsAvailable_NP.setSortingEnabled(True)
 
         self.gridLayout_38.addWidget(self.CommandsAvailable_NP, 2, 0, 1, 1)
 
@@ -1621,22 +1609,6 @@ class Ui_Form(object):
             )
         )
 
-        __sortingEnabled1 = self.CommandsSelected_QC.isSortingEnabled()
-        self.CommandsSelected_QC.setSortingEnabled(False)
-        ___qlistwidgetitem1 = self.CommandsSelected_QC.item(0)
-        ___qlistwidgetitem1.setText(
-            QCoreApplication.translate("Form", "New Item", None)
-        )
-        self.CommandsSelected_QC.setSortingEnabled(__sortingEnabled1)
-
-        __sortingEnabled2 = self.CommandsAvailable_QC.isSortingEnabled()
-        self.CommandsAvailable_QC.setSortingEnabled(False)
-        ___qlistwidgetitem2 = self.CommandsAvailable_QC.item(0)
-        ___qlistwidgetitem2.setText(
-            QCoreApplication.translate("Form", "New Item", None)
-        )
-        self.CommandsAvailable_QC.setSortingEnabled(__sortingEnabled2)
-
         self.SearchBar_QC.setInputMask("")
         self.SearchBar_QC.setText("")
         self.SearchBar_QC.setPlaceholderText(
@@ -1808,14 +1780,6 @@ class Ui_Form(object):
             QCoreApplication.translate("Form", "Type to search...", None)
         )
 
-        __sortingEnabled9 = self.CommandsAvailable_DDB.isSortingEnabled()
-        self.CommandsAvailable_DDB.setSortingEnabled(False)
-        ___qlistwidgetitem9 = self.CommandsAvailable_DDB.item(0)
-        ___qlistwidgetitem9.setText(
-            QCoreApplication.translate("Form", "New Item", None)
-        )
-        self.CommandsAvailable_DDB.setSortingEnabled(__sortingEnabled9)
-
         self.label_22.setText(QCoreApplication.translate("Form", "Category:", None))
         # if QT_CONFIG(tooltip)
         self.MoveUpCommand_DDB.setToolTip(
@@ -1890,14 +1854,6 @@ class Ui_Form(object):
             QCoreApplication.translate("Form", "Type to search...", None)
         )
 
-        __sortingEnabled11 = self.CommandsAvailable_NP.isSortingEnabled()
-        self.CommandsAvailable_NP.setSortingEnabled(False)
-        ___qlistwidgetitem11 = self.CommandsAvailable_NP.item(0)
-        ___qlistwidgetitem11.setText(
-            QCoreApplication.translate("Form", "New Item", None)
-        )
-        self.CommandsAvailable_NP.setSortingEnabled(__sortingEnabled11)
-
         self.label_21.setText(QCoreApplication.translate("Form", "Category:", None))
 
         __sortingEnabled12 = self.NewPanel_NP.isSortingEnabled()
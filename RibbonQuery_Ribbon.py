@@ -0,0 +1,382 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+
+# Query and transform the ribbon structure in bulk.
+#
+# A selector selects workbenches, toolbars or commands, depending on the number of parts:
+#   "PartDesign*"                 : workbenches
+#   "Draft*/*"                    : toolbars of workbenches
+#   "*/*/Part_*"                  : commands in toolbars of workbenches
+#   "Draft*/*/#0"                 : the first command in every toolbar of the Draft workbenches
+# Each part is a pattern as in fnmatch. Alternatives are separated with "|", for example "View|Structure".
+# "#n" selects the command at position n in the toolbar (negative counts from the end).
+# A selector can also be a tuple of parts, for names that contain "/" or "|".
+#
+# Transforms are queued and applied in one pass over the structure. The changes can be previewed
+# as a diff before they are written, with a single atomic write.
+import copy
+import json
+import fnmatch
+import Parameters_Ribbon
+import JsonStore_Ribbon
+import LayeredConfig_Ribbon
+import RibbonStructure_Ribbon
+
+# The levels of a selector
+WORKBENCH = 1
+TOOLBAR = 2
+COMMAND = 3
+
+
+def ParseSelector(Selector) -> tuple:
+    """
+    Returns the parts of a selector. Each part is a tuple of alternatives.
+    """
+    if isinstance(Selector, str):
+        Parts = Selector.split("/")
+    else:
+        Parts = list(Selector)
+    if len(Parts) < WORKBENCH or len(Parts) > COMMAND:
+        raise ValueError(f"Selector {Selector} must have one to three parts")
+
+    Result = []
+    for Part in Parts:
+        if isinstance(Selector, str):
+            Result.append(tuple(Part.split("|")))
+        else:
+            Result.append((Part,))
+    return tuple(Result)
+
+
+def MatchPart(Name: str, Part: tuple) -> bool:
+    for Pattern in Part:
+        if Pattern == Name or fnmatch.fnmatchcase(Name, Pattern):
+            return True
+    return False
+
+
+def MatchPosition(Position: int, Count: int, Part: tuple) -> bool:
+    """
+    Matches the "#n" patterns of a command part. Returns None when the part has no position patterns.
+    """
+    Result = None
+    for Pattern in Part:
+        if Pattern.startswith("#") is False:
+            continue
+        Index = int(Pattern[1:])
+        if Index < 0:
+            Index = Count + Index
+        if Index == Position:
+            return True
+        Result = False
+    return Result
+
+
+class Match:
+    """
+    A selected workbench, toolbar or command. Data is the dict in the structure, changes are made in place.
+    """
+
+    def __init__(
+        self, Level, WorkBenchName, Data, Toolbar=None, CommandName=None, Position=None
+    ):
+        self.Level = Level
+        self.WorkBenchName = WorkBenchName
+        self.Toolbar = Toolbar
+        self.CommandName = CommandName
+        # The position of the command in the toolbar
+        self.Position = Position
+        self.Data = Data
+
+    def __repr__(self):
+        Path = [
+            Name
+            for Name in [self.WorkBenchName, self.Toolbar, self.CommandName]
+            if Name is not None
+        ]
+        return "/".join(Path)
+
+
+def ReturnDiff(Before, After, Path: str = "") -> list:
+    """
+    Returns the differences between two versions of json data, one line per changed value.
+    """
+    List_Diff = []
+    if isinstance(Before, dict) and isinstance(After, dict):
+        for Key in Before:
+            KeyPath = f"{Path}/{Key}" if Path != "" else str(Key)
+            if Key not in After:
+                List_Diff.append(f"- {KeyPath}: {json.dumps(Before[Key])}")
+            else:
+                List_Diff.extend(ReturnDiff(Before[Key], After[Key], KeyPath))
+        for Key in After:
+            if Key not in Before:
+                KeyPath = f"{Path}/{Key}" if Path != "" else str(Key)
+                List_Diff.append(f"+ {KeyPath}: {json.dumps(After[Key])}")
+    elif Before != After:
+        List_Diff.append(f"~ {Path}: {json.dumps(Before)} -> {json.dumps(After)}")
+    return List_Diff
+
+
+class RibbonQuery:
+    """
+    Queries and transforms a ribbon structure.
+    """
+
+    def __init__(self, Data: dict, FileName: str = None):
+        """
+        Args:
+            Data (dict): The ribbon structure. It is changed when the transforms are applied.
+            FileName (str, optional): The file to write to. None for the active ribbon structure. Defaults to None.
+        """
+        if isinstance(Data, RibbonStructure_Ribbon.RibbonStructure) is False:
+            Data = RibbonStructure_Ribbon.RibbonStructure(Data)
+        self.Structure = Data
+        self.FileName = FileName
+        # The structure as loaded or last written. Used for the diff
+        self.Original = copy.deepcopy(dict(Data))
+        # The queued transforms: [(Parts, Function)]
+        self.List_Transforms = []
+        return
+
+    @classmethod
+    def load(cls, FileName: str = None):
+        """
+        Reads a ribbon structure. Without a file name, or with the file name of the active ribbon structure,
+        the active ribbon structure is read (merged with the base layout, if there is one).
+        """
+        if FileName is None or FileName == Parameters_Ribbon.RIBBON_STRUCTURE_JSON:
+            return cls(LayeredConfig_Ribbon.ReadStructure())
+        return cls(RibbonStructure_Ribbon.RibbonStructure.load(FileName), FileName)
+
+    # region - Queries
+    def walk(self, List_Parts: list):
+        """
+        Goes once through the structure and yields the matches for each selector.
+
+        Args:
+            List_Parts (list): Parsed selectors.
+
+        Yields:
+            tuple: (index of the selector, Match)
+        """
+        Workbenches = self.Structure.get("workbenches", {})
+        for WorkBenchName, WorkBenchData in list(Workbenches.items()):
+            List_Active = [
+                i
+                for i in range(len(List_Parts))
+                if MatchPart(WorkBenchName, List_Parts[i][0])
+            ]
+            if len(List_Active) == 0 or isinstance(WorkBenchData, dict) is False:
+                continue
+            for i in List_Active:
+                if len(List_Parts[i]) == WORKBENCH:
+                    yield i, Match(WORKBENCH, WorkBenchName, WorkBenchData)
+
+            List_Active = [i for i in List_Active if len(List_Parts[i]) > WORKBENCH]
+            if len(List_Active) == 0:
+                continue
+            Toolbars = WorkBenchData.get("toolbars", {})
+            if isinstance(Toolbars, dict) is False:
+                continue
+            for Toolbar, ToolbarData in list(Toolbars.items()):
+                # The order of the toolbars is not a toolbar
+                if Toolbar == "order" or isinstance(ToolbarData, dict) is False:
+                    continue
+                List_ToolbarActive = [
+                    i for i in List_Active if MatchPart(Toolbar, List_Parts[i][1])
+                ]
+                for i in List_ToolbarActive:
+                    if len(List_Parts[i]) == TOOLBAR:
+                        yield i, Match(TOOLBAR, WorkBenchName, ToolbarData, Toolbar)
+
+                List_ToolbarActive = [
+                    i for i in List_ToolbarActive if len(List_Parts[i]) == COMMAND
+                ]
+                if len(List_ToolbarActive) == 0:
+                    continue
+                Commands = ToolbarData.get("commands", {})
+                List_Commands = self.orderedCommands(WorkBenchName, Toolbar)
+                for Position in range(len(List_Commands)):
+                    CommandName = List_Commands[Position]
+                    CommandData = Commands[CommandName]
+                    for i in List_ToolbarActive:
+                        Part = List_Parts[i][2]
+                        IsMatch = MatchPosition(Position, len(List_Commands), Part)
+                        if IsMatch is None or IsMatch is False:
+                            IsMatch = MatchPart(CommandName, Part)
+                        if IsMatch is True:
+                            yield i, Match(
+                                COMMAND,
+                                WorkBenchName,
+                                CommandData,
+                                Toolbar,
+                                CommandName,
+                                Position,
+                            )
+        return
+
+    def orderedCommands(self, WorkBenchName: str, Toolbar: str) -> list:
+        """
+        Returns the names of the commands of a toolbar, sorted by the order of the toolbar.
+        The order contains the texts of the commands. Commands that are not in the order are added at the end.
+        """
+        Record = self.Structure.toolbar(WorkBenchName, Toolbar)
+        if Record is None:
+            return []
+        Dict_Positions = Record.positions()
+        Commands = Record.commands()
+
+        def Position(CommandName):
+            Text = ""
+            if isinstance(Commands[CommandName], dict):
+                Text = str(Commands[CommandName].get("text", ""))
+            return Dict_Positions.get(
+                Text, Dict_Positions.get(Text.replace("...", ""), Record.NotInOrder)
+            )
+
+        return sorted(Commands.keys(), key=Position)
+
+    def select(self, Selector) -> list:
+        """
+        Returns the matches of a selector.
+        """
+        return [Item for Index, Item in self.walk([ParseSelector(Selector)])]
+
+    def workbenches(self, Pattern="*") -> list:
+        """
+        Returns the names of the workbenches in the structure that match a pattern.
+        """
+        return [Item.WorkBenchName for Item in self.select(Pattern)]
+
+    # endregion
+
+    # region - Transforms
+    def transform(self, Selector, Function):
+        """
+        Queues a transform. Function(Match) is called for every match when the transforms are applied.
+
+        Returns:
+            RibbonQuery: The query, so that transforms can be chained.
+        """
+        self.List_Transforms.append((ParseSelector(Selector), Function))
+        return self
+
+    def set(self, Selector, **Values):
+        """
+        Queues a transform that sets values in the dict of every match. For example set("*/*/#0", size="large").
+        """
+
+        def SetValues(Item: Match):
+            Item.Data.update(Values)
+
+        return self.transform(Selector, SetValues)
+
+    def insertToolbars(self, Selector, Dict_Toolbars: dict):
+        """
+        Queues a transform that adds toolbars to the toolbar order of workbenches, when they are not present.
+
+        Args:
+            Selector: The workbenches.
+            Dict_Toolbars (dict): The position per toolbar.
+        """
+
+        def InsertToolbars(Item: Match):
+            Order = Item.Data.setdefault("toolbars", {}).setdefault("order", [])
+            for Toolbar, Position in Dict_Toolbars.items():
+                if Toolbar not in Order:
+                    Order.insert(Position, Toolbar)
+
+        return self.transform(Selector, InsertToolbars)
+
+    def addCommand(
+        self, WorkBenchName: str, Toolbar: str, CommandName: str, Values: dict
+    ):
+        """
+        Queues a transform that adds or replaces the entry of a command. The toolbar is created when needed.
+        """
+
+        def AddCommand(Item: Match):
+            ToolbarData = Item.Data.setdefault("toolbars", {}).setdefault(Toolbar, {})
+            ToolbarData.setdefault("order", [])
+            ToolbarData.setdefault("commands", {})[CommandName] = dict(Values)
+
+        return self.transform((WorkBenchName,), AddCommand)
+
+    def apply(self) -> int:
+        """
+        Applies the queued transforms in one pass over the structure.
+
+        Returns:
+            int: The number of matches that were transformed.
+        """
+        List_Transforms = self.List_Transforms
+        self.List_Transforms = []
+        if len(List_Transforms) == 0:
+            return 0
+
+        # Walk the structure first. Transforms that add toolbars or commands do not change the walk
+        List_Matches = list(self.walk([Parts for Parts, Function in List_Transforms]))
+        # Apply the transforms in the order in which they are queued
+        List_Matches.sort(key=lambda Item: Item[0])
+        for Index, Item in List_Matches:
+            List_Transforms[Index][1](Item)
+        self.Structure.invalidate()
+        return len(List_Matches)
+
+    # endregion
+
+    # region - Preview and commit
+    def diff(self) -> list:
+        """
+        Applies the queued transforms and returns the changes since loading or the last commit.
+        """
+        self.apply()
+        return ReturnDiff(self.Original, dict(self.Structure))
+
+    def preview(self) -> str:
+        List_Diff = self.diff()
+        if len(List_Diff) == 0:
+            return "No changes"
+        return "\n".join(List_Diff)
+
+    def commit(self) -> bool:
+        """
+        Applies the queued transforms and writes the structure in one atomic write, if anything is changed.
+
+        Returns:
+            bool: True if the structure is written.
+        """
+        if len(self.diff()) == 0:
+            return False
+        Data = dict(self.Structure)
+        if self.FileName is None:
+            LayeredConfig_Ribbon.WriteStructure(Data)
+            JsonStore_Ribbon.FlushJson()
+        else:
+            JsonStore_Ribbon.WriteFileAtomic(
+                self.FileName, json.dumps(Data, indent=4).encode("utf-8")
+            )
+        self.Original = copy.deepcopy(Data)
+        return True
+
+    # endregion
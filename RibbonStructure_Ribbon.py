@@ -0,0 +1,254 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+import json
+
+
+class ToolbarRecord:
+    """
+    The settings of one toolbar (panel) of a workbench in the ribbon structure.
+    The positions in the order and the separators are computed once.
+    They are computed again only when the order is changed.
+    """
+
+    # The position of names that are not in the order
+    NotInOrder = 999999
+
+    def __init__(self, Data: dict):
+        """
+        Args:
+            Data (dict): The dict of the toolbar: {"order": [...], "commands": {...}}.
+                The dict is not copied, changes are visible in the json data.
+        """
+        self.Data = Data
+        # A copy of the order for which the positions are computed
+        self.List_Order = None
+        # The position per name in the order. The first position is used for duplicates
+        self.Dict_Positions = {}
+        # The separators in the order: [(position, name)]
+        self.List_Separators = []
+        return
+
+    def order(self) -> list:
+        Order = self.Data.get("order", [])
+        if isinstance(Order, list) is False:
+            return []
+        return Order
+
+    def hasOrder(self) -> bool:
+        return isinstance(self.Data.get("order"), list)
+
+    def refresh(self):
+        """
+        Computes the positions and separators again, if the order is changed.
+        """
+        Order = self.order()
+        if Order == self.List_Order:
+            return
+        self.List_Order = list(Order)
+        self.Dict_Positions = {}
+        self.List_Separators = []
+        for Position in range(len(Order)):
+            Name = Order[Position]
+            self.Dict_Positions.setdefault(Name, Position)
+            if isinstance(Name, str) and "separator" in Name.lower():
+                self.List_Separators.append((Position, Name))
+        return
+
+    def positions(self) -> dict:
+        """
+        Returns the position per name in the order (menu text or separator).
+        Names that are not in the order are not in the dict, use NotInOrder for them.
+        """
+        self.refresh()
+        return self.Dict_Positions
+
+    def separators(self) -> list:
+        """
+        Returns the separators with their position in the order: [(position, name)]
+        """
+        self.refresh()
+        return self.List_Separators
+
+    def commands(self) -> dict:
+        Commands = self.Data.get("commands", {})
+        if isinstance(Commands, dict) is False:
+            return {}
+        return Commands
+
+    def command(self, CommandName: str) -> dict:
+        """
+        Returns the settings of a command: {"size": ..., "text": ..., "icon": ...}, or an empty dict.
+        """
+        Command = self.commands().get(CommandName, {})
+        if isinstance(Command, dict) is False:
+            return {}
+        return Command
+
+    def commandValue(self, CommandName: str, Key: str, Default=None):
+        return self.command(CommandName).get(Key, Default)
+
+
+class RibbonStructure(dict):
+    """
+    The ribbon structure from RibbonStructure.json.
+    It is the json dict itself, so it writes back to the same json without changes.
+    On top of that it has indexes: sets for the ignored and icon only toolbars and ignored workbenches,
+    and a ToolbarRecord per toolbar with the positions of the order.
+    """
+
+    # The sections that are used as sets
+    List_SetSections = [
+        "ignoredToolbars",
+        "iconOnlyToolbars",
+        "ignoredWorkbenches",
+        "quickAccessCommands",
+    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The sets per section: {Section: (list, copy of the list, set)}
+        self.Dict_Sets = {}
+        # The records per toolbar: {(WorkBenchName, Toolbar): ToolbarRecord}
+        self.Dict_Toolbars = {}
+        return
+
+    @classmethod
+    def load(cls, FileName: str):
+        """
+        Reads the ribbon structure from a json file.
+        """
+        with open(FileName, "r") as JsonFile:
+            return cls(json.load(JsonFile))
+
+    def toDict(self) -> dict:
+        """
+        Returns the json data. The sections are the same objects as in the structure.
+        """
+        return dict(self)
+
+    def __setitem__(self, Key, Value):
+        super().__setitem__(Key, Value)
+        self.invalidate(Key)
+        return
+
+    def __delitem__(self, Key):
+        super().__delitem__(Key)
+        self.invalidate(Key)
+        return
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.invalidate()
+        return
+
+    def invalidate(self, Section: str = None):
+        """
+        Clears the indexes of a section, or of all sections. Called when a section is replaced.
+        Changes inside a list section or a toolbar order are detected without it:
+        the sets and the positions are compared with a copy of the list they were made from.
+        """
+        if Section is None:
+            self.Dict_Sets = {}
+            self.Dict_Toolbars = {}
+            return
+        self.Dict_Sets.pop(Section, None)
+        if Section == "workbenches":
+            self.Dict_Toolbars = {}
+        return
+
+    def memberSet(self, Section: str) -> set:
+        """
+        Returns a list section as a set. The set is created again when the list is changed.
+        """
+        Items = self.get(Section, [])
+        if isinstance(Items, list) is False:
+            return set()
+        Cached = self.Dict_Sets.get(Section)
+        # Comparing with the copy is cheaper than creating the set again
+        if Cached is None or Cached[0] is not Items or Cached[1] != Items:
+            Cached = (Items, list(Items), set(Items))
+            self.Dict_Sets[Section] = Cached
+        return Cached[2]
+
+    def isIgnoredToolbar(self, Toolbar: str) -> bool:
+        return Toolbar in self.memberSet("ignoredToolbars")
+
+    def isIconOnlyToolbar(self, Toolbar: str) -> bool:
+        return Toolbar in self.memberSet("iconOnlyToolbars")
+
+    def isIgnoredWorkbench(self, WorkBenchName: str) -> bool:
+        return WorkBenchName in self.memberSet("ignoredWorkbenches")
+
+    def isQuickAccessCommand(self, CommandName: str) -> bool:
+        return CommandName in self.memberSet("quickAccessCommands")
+
+    def workbench(self, WorkBenchName: str) -> dict:
+        """
+        Returns the dict of a workbench, or an empty dict.
+        """
+        WorkBench = self.get("workbenches", {}).get(WorkBenchName, {})
+        if isinstance(WorkBench, dict) is False:
+            return {}
+        return WorkBench
+
+    def toolbar(self, WorkBenchName: str, Toolbar: str) -> ToolbarRecord:
+        """
+        Returns the record of a toolbar of a workbench, or None when the toolbar is not in the structure.
+        """
+        Data = self.workbench(WorkBenchName).get("toolbars", {}).get(Toolbar)
+        if isinstance(Data, dict) is False:
+            return None
+        Record = self.Dict_Toolbars.get((WorkBenchName, Toolbar))
+        if Record is None or Record.Data is not Data:
+            Record = ToolbarRecord(Data)
+            self.Dict_Toolbars[(WorkBenchName, Toolbar)] = Record
+        return Record
+
+    def panelOrder(self, WorkBenchName: str) -> list:
+        """
+        Returns the order of the toolbars (panels) of a workbench.
+        """
+        Order = self.workbench(WorkBenchName).get("toolbars", {}).get("order", [])
+        if isinstance(Order, list) is False:
+            return []
+        return Order
+
+    def dropdownButtons(self) -> dict:
+        return self.get("dropdownButtons", {})
+
+    def newPanels(self, WorkBenchName: str = None) -> dict:
+        """
+        Returns the new panels of a workbench, or of all workbenches.
+        """
+        NewPanels = self.get("newPanels", {})
+        if WorkBenchName is None:
+            return NewPanels
+        return NewPanels.get(WorkBenchName, {})
+
+    def customToolbars(self, WorkBenchName: str = None) -> dict:
+        """
+        Returns the custom toolbars of a workbench, or of all workbenches.
+        """
+        CustomToolbars = self.get("customToolbars", {})
+        if WorkBenchName is None:
+            return CustomToolbars
+        return CustomToolbars.get(WorkBenchName, {})
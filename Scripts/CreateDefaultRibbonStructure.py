@@ -25,16 +25,33 @@
 # For workbenches and toolbars that don't have a customization, for each toolbar, the first command is set to large.
 # The goal of this script is to provide a starting point for your own ribbon customization.
 # The file "RibbonStructure_default.json" is used by the reset button to replace RibbonStructure.json with "RibbonStructure_default.json".
+#
+# The script can also run from the command line, to generate structures for several size presets and languages:
+#   FreeCAD CreateDefaultRibbonStructure.py --pass --output <folder> --presets default,all-small --languages English,German --quit
+# See SIZE_PRESETS for the available presets.
+#
+# With --publish, the data file and icon store of this installation are copied to a shared folder,
+# for the seats that use the same FreeCAD version and language (see SharedData_Ribbon):
+#   FreeCAD CreateDefaultRibbonStructure.py --pass --publish <shared folder> --quit
 
 import FreeCAD as App
 import FreeCADGui as Gui
 import os
-
+import sys
+import copy
 import json
+import argparse
 
 from PySide.QtWidgets import QToolBar, QToolButton
+from PySide.QtCore import QTimer
 
 ParentPath = os.path.dirname(os.path.dirname(__file__))
+# Make the modules of the ribbon available
+if ParentPath not in sys.path:
+    sys.path.append(ParentPath)
+
+import IconStore_Ribbon
+import SharedData_Ribbon
 
 # Set the path where you want to save this new Json file
 # JsonPath = os.path.dirname(__file__)
@@ -2820,248 +2837,215 @@ CustomJson_Workbenches = {
 # a list to store replaced toolbars
 List_IgnoredToolbars_internal = []
 
-
-def main():
-    CreateLists()
-    CreateJson()
-    WriteJson()
-
-
-def CreateJson():
-    # Add your custom workbenches
-    if (
-        CustomJson_Workbenches != ""
-        and CustomJson_Workbenches is not None
-        and IncludeCustomJson is True
-    ):
-        for Workbench in CustomJson_Workbenches["workbenches"]:
-            skipWorkbenchList.append(Workbench)
-        Dict_RibbonCommandPanel.update(CustomJson_Workbenches)
-
-    # Go through the workbenches
-    for WorkbenchItem in List_Workbenches:
-        WorkBenchName = WorkbenchItem[0]
-
-        # Exclude the workbenches that you want to exclude
-        WorkbenchToBeSkipped = False
-        for WorkbenchToSkip in skipWorkbenchList:
-            if WorkbenchToSkip == WorkBenchName:
-                WorkbenchToBeSkipped = True
-        # Exclude the workbenches that will be ignored in the RibbonBar
-        for WorkbenchToSkip in List_IgnoredWorkbenches:
-            if WorkbenchToSkip == WorkBenchName:
-                WorkbenchToBeSkipped = True
-
-        if WorkbenchToBeSkipped is False:
-            # Activate the workbench. Otherwise, .listToolbars() returns empty
+# The size presets for the command line: (size of the first icon, size of the other icons)
+SIZE_PRESETS = {
+    "default": (FirstIconSize, OtherIconSize),
+    "first-large": ("large", "small"),
+    "first-medium": ("medium", "small"),
+    "all-small": ("small", "small"),
+    "all-medium": ("medium", "medium"),
+    "all-large": ("large", "large"),
+}
+# The size that the ribbon uses for commands without an entry in the json file
+DEFAULT_ICON_SIZE = "small"
+
+
+class DefaultStructureGenerator:
+    """
+    Generates default ribbon structures.
+    Harvest activates each workbench once and stores its toolbars and the info of its commands.
+    Build creates a structure from the stored data, so several size presets need no extra calls to FreeCAD.
+    """
+
+    def __init__(self):
+        # The toolbars per workbench: {WorkBenchName: {Toolbar: [CommandName, ...]}}
+        self.Dict_WorkbenchToolbars = {}
+        # Cache for Command.getInfo(). None for commands that do not exist
+        self.Dict_CommandInfo = {}
+        # [CommandName, IconName, MenuName, WorkBenchName]
+        self.List_Commands = []
+        # The command names per menu name. Used for the custom panels
+        self.Dict_MenuNames = {}
+        # The order per list of commands
+        self.Dict_Orders = {}
+
+    def CommandInfo(self, CommandName):
+        if CommandName not in self.Dict_CommandInfo:
+            Info = None
+            Command = Gui.Command.get(CommandName)
+            if Command is not None:
+                Info = Command.getInfo()
+            self.Dict_CommandInfo[CommandName] = Info
+        return self.Dict_CommandInfo[CommandName]
+
+    def Harvest(self):
+        # Clear the stored data. The texts of the commands depend on the language
+        self.Dict_WorkbenchToolbars.clear()
+        self.Dict_CommandInfo.clear()
+        self.List_Commands.clear()
+        self.Dict_MenuNames.clear()
+        self.Dict_Orders.clear()
+
+        # Store the current active workbench
+        ActiveWB = Gui.activeWorkbench().name()
+        CommandNames = []
+        Set_CommandNames = set()
+        for WorkBenchName in Gui.listWorkbenches():
+            if str(WorkBenchName) == "" or str(WorkBenchName) == "NoneWorkbench":
+                continue
+            # Activate the workbench. Otherwise, the toolbars are empty
             Gui.activateWorkbench(WorkBenchName)
-            # Get the toolbars of this workbench
             wbToolbars = Gui.getWorkbench(WorkBenchName).getToolbarItems()
-            CustomCommands = Dict_ReturnCustomToolbars(WorkBenchName)
-            wbToolbars.update(CustomCommands)
-            CustomPanelCommands = Dict_AddCustomToolbarsToWorkbench(WorkBenchName)
-            wbToolbars.update(CustomPanelCommands)
+            # Custom toolbars of the user are only available in the active workbench
+            wbToolbars.update(Dict_ReturnCustomToolbars(WorkBenchName))
+            self.Dict_WorkbenchToolbars[WorkBenchName] = wbToolbars
 
-            # Set the standard toolbar order
-            ToolbarOrder = []
-            ToolbarOrder.append("Individual views")
-            ToolbarOrder.append("Structure")
             for key, value in list(wbToolbars.items()):
-                IsInList = False
-                for item in ToolbarOrder:
-                    if item == key:
-                        IsInList = True
+                for CommandName in value:
+                    if CommandName not in Set_CommandNames:
+                        Set_CommandNames.add(CommandName)
+                        CommandNames.append([CommandName, WorkBenchName])
+        # re-activate the workbench that was stored.
+        Gui.activateWorkbench(ActiveWB)
+
+        # Create a list of all commands
+        for CommandName, WorkBenchName in CommandNames:
+            Info = self.CommandInfo(CommandName)
+            if Info is not None:
+                MenuName = Info["menuText"].replace("&", "")
+                self.List_Commands.append(
+                    [CommandName, Info["pixmap"], MenuName, WorkBenchName]
+                )
+                self.Dict_MenuNames.setdefault(MenuName, []).append(CommandName)
+        return
+
+    def ToolbarOrder(self, Commands: list) -> list:
+        """
+        Returns the order for a toolbar: the menu names of its commands. Computed once per toolbar.
+        """
+        Key = tuple(Commands)
+        if Key not in self.Dict_Orders:
+            Order = []
+            for CommandName in Commands:
+                Info = self.CommandInfo(CommandName)
+                if Info is not None:
+                    Order.append(Info["menuText"].replace("&", "").replace("...", ""))
+            self.Dict_Orders[Key] = Order
+        return self.Dict_Orders[Key]
+
+    def CustomPanels(self, WorkBenchName) -> dict:
+        """
+        Returns the custom panels from Dict_CustomPanels for a workbench, with the names of their commands.
+        """
+        Toolbars = {}
+        try:
+            for CustomToolbar in Dict_CustomPanels["customToolbars"][WorkBenchName]:
+                ListCommands = []
+                Commands = Dict_CustomPanels["customToolbars"][WorkBenchName][
+                    CustomToolbar
+                ]["commands"]
+
+                for key, value in list(Commands.items()):
+                    ListCommands.extend(self.Dict_MenuNames.get(key, []))
+
+                    if List_IgnoredToolbars_internal.__contains__(value) is False:
+                        List_IgnoredToolbars_internal.append(value)
+
+                Toolbars[CustomToolbar] = ListCommands
+        except Exception:
+            pass
+        return Toolbars
+
+    def Build(self, FirstSize: str, OtherSize: str) -> dict:
+        """
+        Creates the workbenches section from the harvested data.
+
+        Args:
+            FirstSize (str): The size of the first icon in every panel.
+            OtherSize (str): The size of the other icons.
+
+        Returns:
+            dict: {"workbenches": {...}}
+        """
+        Dict_RibbonCommandPanel = {}
+        List_SkipWorkbenches = list(skipWorkbenchList)
+
+        # Add your custom workbenches
+        if (
+            CustomJson_Workbenches != ""
+            and CustomJson_Workbenches is not None
+            and IncludeCustomJson is True
+        ):
+            List_SkipWorkbenches.extend(CustomJson_Workbenches["workbenches"])
+            # Copy, so that every preset starts from the same custom workbenches
+            Dict_RibbonCommandPanel.update(copy.deepcopy(CustomJson_Workbenches))
+
+        # Go through the workbenches
+        for WorkBenchName, ToolbarItems in self.Dict_WorkbenchToolbars.items():
+            # Exclude the workbenches that you want to exclude and that will be ignored in the RibbonBar
+            if (
+                WorkBenchName in List_SkipWorkbenches
+                or WorkBenchName in List_IgnoredWorkbenches
+            ):
+                continue
+
+            wbToolbars = dict(ToolbarItems)
+            wbToolbars.update(self.CustomPanels(WorkBenchName))
 
-                if IsInList is False:
+            # Set the standard toolbar order
+            ToolbarOrder = ["Individual views", "Structure"]
+            for key in wbToolbars:
+                if key not in ToolbarOrder:
                     ToolbarOrder.append(key)
             add_keys_nested_dict(
                 Dict_RibbonCommandPanel,
-                [
-                    "workbenches",
-                    WorkBenchName,
-                    "toolbars",
-                    "order",
-                ],
+                ["workbenches", WorkBenchName, "toolbars", "order"],
             )
             Dict_RibbonCommandPanel["workbenches"][WorkBenchName]["toolbars"][
                 "order"
             ] = ToolbarOrder
 
             # Go through the toolbars
-            for key, value in list(wbToolbars.items()):
-                Toolbar = key
-
-                # Exclude the toolbars that will be ignored in the RibbonBar
-                ToolbarToBeSkipped = False
-                for ignoredToolbar in List_IgnoredToolbars:
-                    if ignoredToolbar == key:
-                        ToolbarToBeSkipped = True
-                # Exclude the toolbars that must have only small icons
-                for ToolbarToSkip in smallOnlyToolbars:
-                    if ToolbarToSkip == key:
-                        ToolbarToBeSkipped = True
-
-                if ToolbarToBeSkipped is False:
-                    # create a empty size string
-                    Size = OtherIconSize
-                    # Define empty strings for the command name and icon name
-                    CommandName = ""
-                    IconName = ""
-
-                    for i2 in range(len(value)):
-                        CommandName = value[i2]
-                        Command = Gui.Command.get(CommandName)
-                        if Command is not None:
-                            IconName = Command.getInfo()["pixmap"]
-                            MenuName = Command.getInfo()["menuText"].replace("&", "")
-
-                            # Create an empty list for orders
-                            Order = []
-                            for i3 in range(len(value)):
-                                CommandOrder = Gui.Command.get(value[i3])
-                                if CommandOrder is not None:
-                                    MenuNameOrder = (
-                                        CommandOrder.getInfo()["menuText"]
-                                        .replace("&", "")
-                                        .replace("...", "")
-                                    )
-                                    Order.append(MenuNameOrder)
-
-                            # Set the first command to large
-                            if i2 == 0:
-                                Size = FirstIconSize
-
-                                add_keys_nested_dict(
-                                    Dict_RibbonCommandPanel,
-                                    [
-                                        "workbenches",
-                                        WorkBenchName,
-                                        "toolbars",
-                                        Toolbar,
-                                        "order",
-                                    ],
-                                )
-                                add_keys_nested_dict(
-                                    Dict_RibbonCommandPanel,
-                                    [
-                                        "workbenches",
-                                        WorkBenchName,
-                                        "toolbars",
-                                        Toolbar,
-                                        "commands",
-                                        CommandName,
-                                    ],
-                                )
-
-                                Dict_RibbonCommandPanel["workbenches"][WorkBenchName][
-                                    "toolbars"
-                                ][Toolbar]["order"] = Order
-                                Dict_RibbonCommandPanel["workbenches"][WorkBenchName][
-                                    "toolbars"
-                                ][Toolbar]["commands"][CommandName] = {
-                                    "size": Size,
-                                    "text": MenuName,
-                                    "icon": IconName,
-                                }
-                            if i2 > 0:
-                                Size = "small"
-
-                            i2 = i2 + 1
-    return
-
-
-def CreateLists():
-    # Create a list of all workbenches with their icon
-    List_Workbenches.clear()
-    Workbenches = Gui.listWorkbenches()
-    for WorkBenchName in Workbenches:
-        if str(WorkBenchName) != "":
-            if str(WorkBenchName) != "NoneWorkbench" or WorkBenchName is not None:
-                Icon = None
-                IconName = str(Gui.getWorkbench(WorkBenchName).Icon)
-                if IconName != "":
-                    Icon = Gui.getIcon(IconName)
-                WorkbenchTitle = Gui.getWorkbench(WorkBenchName).MenuText
-                List_Workbenches.append([str(WorkBenchName), Icon, WorkbenchTitle])
-
-    # Create a list of all toolbars
-    StringList_Toolbars.clear()
-    # Store the current active workbench
-    ActiveWB = Gui.activeWorkbench().name()
-    # Go through the list of workbenches
-    for workbench in List_Workbenches:
-        # Activate the workbench. Otherwise, .listToolbars() returns empty
-        Gui.activateWorkbench(workbench[0])
-        # Get the toolbars of this workbench
-        wbToolbars = Gui.getWorkbench(workbench[0]).listToolbars()
-        # Go through the toolbars
-        for Toolbar in wbToolbars:
-            # Go through the list of toolbars. If already present, skip it.
-            # Otherwise add it the the list.
-            IsInList = False
-            for i in range(len(StringList_Toolbars)):
-                if Toolbar == StringList_Toolbars[i][0]:
-                    IsInList = True
-
-            if IsInList is False:
-                StringList_Toolbars.append([Toolbar, workbench[2]])
-    CustomToolbars = List_ReturnCustomToolbars()
-    for Customtoolbar in CustomToolbars:
-        StringList_Toolbars.append(Customtoolbar)
-    # re-activate the workbench that was stored.
-    Gui.activateWorkbench(ActiveWB)
-
-    # Create a list of all commands with their icon
-    List_Commands.clear()
-    # Create a list of command names
-    CommandNames = []
-    for i in range(len(List_Workbenches)):
-        WorkBench = Gui.getWorkbench(List_Workbenches[i][0])
-        ToolbarItems = WorkBench.getToolbarItems()
-        for key, value in list(ToolbarItems.items()):
-            for j in range(len(value)):
-                Item = [value[j], List_Workbenches[i][0]]
-                IsInList = False
-                for k in range(len(CommandNames)):
-                    if CommandNames[k][0] == value[j]:
-                        IsInList = True
-                if IsInList is False:
-                    CommandNames.append(Item)
-
-    # Go through the list
-    for CommandName in CommandNames:
-        # get the command with this name
-        command = Gui.Command.get(CommandName[0])
-        WorkBenchName = CommandName[1]
-        if command is not None:
-            # get the icon for this command
-            if command.getInfo()["pixmap"] != "":
-                Icon = Gui.getIcon(command.getInfo()["pixmap"])
-            else:
-                Icon = None
-            MenuName = command.getInfo()["menuText"].replace("&", "")
-            List_Commands.append([CommandName[0], Icon, MenuName, WorkBenchName])
-    # add also custom commands
-    Toolbars = List_ReturnCustomToolbars()
-    for Toolbar in Toolbars:
-        WorkbenchTitle = Toolbar[1]
-        for WorkBench in List_Workbenches:
-            if WorkbenchTitle == WorkBench[2]:
-                WorkBenchName = WorkBench[0]
-                for CustomCommand in Toolbar[2]:
-                    command = Gui.Command.get(CustomCommand)
-                    if command.getInfo()["pixmap"] != "":
-                        Icon = Gui.getIcon(command.getInfo()["pixmap"])
+            for Toolbar, value in list(wbToolbars.items()):
+                # Exclude the toolbars that will be ignored and the toolbars that must have only small icons
+                if Toolbar in List_IgnoredToolbars or Toolbar in smallOnlyToolbars:
+                    continue
+
+                for i2 in range(len(value)):
+                    CommandName = value[i2]
+                    Info = self.CommandInfo(CommandName)
+                    if Info is None:
+                        continue
+
+                    # The first command gets the first size.
+                    # The other commands are only stored when their size differs from the default
+                    if i2 == 0:
+                        Size = FirstSize
+                    elif OtherSize != DEFAULT_ICON_SIZE:
+                        Size = OtherSize
                     else:
-                        Icon = None
-                    MenuName = command.getInfo()["menuText"].replace("&", "")
-                    List_Commands.append([CustomCommand, Icon, MenuName, WorkBenchName])
-    # endregion ----------------------------------------------------------------------
-
-    return
+                        continue
 
-
-def WriteJson():
+                    ToolbarPath = ["workbenches", WorkBenchName, "toolbars", Toolbar]
+                    add_keys_nested_dict(
+                        Dict_RibbonCommandPanel, ToolbarPath + ["order"]
+                    )
+                    add_keys_nested_dict(
+                        Dict_RibbonCommandPanel, ToolbarPath + ["commands", CommandName]
+                    )
+                    Dict_Toolbar = Dict_RibbonCommandPanel["workbenches"][
+                        WorkBenchName
+                    ]["toolbars"][Toolbar]
+                    Dict_Toolbar["order"] = self.ToolbarOrder(value)
+                    Dict_Toolbar["commands"][CommandName] = {
+                        "size": Size,
+                        "text": Info["menuText"].replace("&", ""),
+                        "icon": Info["pixmap"],
+                    }
+        return Dict_RibbonCommandPanel
+
+
+def WriteJson(Dict_RibbonCommandPanel, JsonFile):
     # Create a resulting dict
     resultingDict = {}
     # add the various lists to the resulting dict.
@@ -3075,9 +3059,6 @@ def WriteJson():
     # Get the Ribbon dictionary
     resultingDict.update(Dict_RibbonCommandPanel)
 
-    # get the path for the Json file
-    JsonFile = os.path.join(JsonPath, JsonName)
-
     # Writing to sample.json
     with open(JsonFile, "w") as outfile:
         json.dump(resultingDict, outfile, indent=4)
@@ -3086,6 +3067,148 @@ def WriteJson():
     return
 
 
+def Generate(OutputFolder, Presets, Languages=None):
+    """
+    Generates a ribbon structure for each size preset and language.
+    The files are written to <OutputFolder>/<language>/RibbonStructure_<preset>.json.
+    Without languages, the current language is used and the files are written to OutputFolder.
+
+    Returns:
+        list: The written files.
+    """
+    if Languages is None or len(Languages) == 0:
+        Languages = [""]
+    CurrentLocale = ""
+    if Languages != [""]:
+        CurrentLocale = Gui.getLocale()
+
+    Generator = DefaultStructureGenerator()
+    List_Written = []
+    for Language in Languages:
+        Folder = OutputFolder
+        if Language != "":
+            try:
+                Gui.setLocale(Language)
+            except Exception as e:
+                App.Console.PrintWarning(f"Language {Language} is skipped: {e}\n")
+                continue
+            Folder = os.path.join(OutputFolder, Language)
+        os.makedirs(Folder, exist_ok=True)
+
+        # Activate the workbenches once per language
+        Generator.Harvest()
+        for Preset in Presets:
+            FirstSize, OtherSize = SIZE_PRESETS[Preset]
+            JsonFile = os.path.join(Folder, f"RibbonStructure_{Preset}.json")
+            WriteJson(Generator.Build(FirstSize, OtherSize), JsonFile)
+            List_Written.append(JsonFile)
+            App.Console.PrintMessage(f"Written {JsonFile}\n")
+
+    if CurrentLocale != "":
+        Gui.setLocale(CurrentLocale)
+    return List_Written
+
+
+def Publish(Location, DataFile=None, StoreFile=None):
+    """
+    Publishes the data file and icon store of this installation to a shared location.
+    Open the design dialog of the ribbon once before, so that the data file and icon store are complete.
+
+    Returns:
+        str: The folder the files are published to.
+    """
+    if DataFile is None:
+        DataFile = IconStore_Ribbon.DATA_FILE
+    if StoreFile is None:
+        StoreFile = IconStore_Ribbon.STORE_FILE
+    for FileName in [DataFile, StoreFile]:
+        if os.path.exists(FileName) is False:
+            raise FileNotFoundError(
+                f"{FileName} does not exist. Open the design dialog of the ribbon first."
+            )
+
+    DataVersion = SharedData_Ribbon.ReadDataFile(DataFile).get("dataVersion", "")
+    Folder = SharedData_Ribbon.PublishSharedStore(
+        DataFile, StoreFile, DataVersion, Location
+    )
+    App.Console.PrintMessage(f"Published {DataFile} and {StoreFile} to {Folder}\n")
+    return Folder
+
+
+def ReturnArguments():
+    # FreeCAD passes the arguments after "--pass" to python
+    if "--pass" in sys.argv:
+        return sys.argv[sys.argv.index("--pass") + 1 :]
+    return []
+
+
+def main(Arguments=None):
+    if Arguments is None:
+        Arguments = ReturnArguments()
+
+    # Run as a macro: create the file for the reset button
+    if len(Arguments) == 0:
+        Generator = DefaultStructureGenerator()
+        Generator.Harvest()
+        WriteJson(
+            Generator.Build(FirstIconSize, OtherIconSize),
+            os.path.join(JsonPath, JsonName),
+        )
+        return
+
+    Parser = argparse.ArgumentParser(
+        prog="CreateDefaultRibbonStructure",
+        description="Generates default ribbon structures for several size presets and languages.",
+    )
+    Parser.add_argument("--output", help="The folder for the generated files.")
+    Parser.add_argument(
+        "--presets",
+        default="default",
+        help="Comma separated size presets: "
+        + ", ".join(SIZE_PRESETS.keys())
+        + ". Defaults to default.",
+    )
+    Parser.add_argument(
+        "--languages",
+        default="",
+        help="Comma separated languages, for example English,German. Defaults to the current language.",
+    )
+    Parser.add_argument(
+        "--publish",
+        metavar="FOLDER",
+        help="Publish the data file and icon store of this installation to a shared folder.",
+    )
+    Parser.add_argument("--quit", action="store_true", help="Close FreeCAD when done.")
+    Options = Parser.parse_args(Arguments)
+    if Options.output is None and Options.publish is None:
+        Parser.error("--output or --publish is required")
+
+    Presets = [
+        Preset.strip() for Preset in Options.presets.split(",") if Preset.strip() != ""
+    ]
+    for Preset in Presets:
+        if Preset not in SIZE_PRESETS:
+            Parser.error(f"unknown preset: {Preset}")
+    Languages = [
+        Language.strip()
+        for Language in Options.languages.split(",")
+        if Language.strip() != ""
+    ]
+
+    if Options.output is not None:
+        Generate(Options.output, Presets, Languages)
+    if Options.publish is not None:
+        try:
+            Publish(Options.publish)
+        except Exception as e:
+            App.Console.PrintError(f"Publishing failed: {e}\n")
+
+    if Options.quit is True:
+        # Close FreeCAD after the script has finished
+        QTimer.singleShot(0, Gui.getMainWindow().close)
+    return
+
+
 def add_keys_nested_dict(dict, keys):
     for key in keys:
         if key not in dict:
@@ -3098,47 +3221,6 @@ def add_keys_nested_dict(dict, keys):
     return
 
 
-def List_ReturnCustomToolbars():
-    # Get the main window of FreeCAD
-    mw = Gui.getMainWindow()
-    Toolbars = []
-
-    List_Workbenches = Gui.listWorkbenches().copy()
-    for WorkBenchName in List_Workbenches:
-        WorkbenchTitle = Gui.getWorkbench(WorkBenchName).MenuText
-        if str(WorkBenchName) != "" or WorkBenchName is not None:
-            if str(WorkBenchName) != "NoneWorkbench":
-                CustomToolbars: list = App.ParamGet(
-                    "User parameter:BaseApp/Workbench/" + WorkBenchName + "/Toolbar"
-                ).GetGroups()
-
-                for Group in CustomToolbars:
-                    Parameter = App.ParamGet(
-                        "User parameter:BaseApp/Workbench/"
-                        + WorkBenchName
-                        + "/Toolbar/"
-                        + Group
-                    )
-                    Name = Parameter.GetString("Name")
-
-                    ListCommands = []
-                    # get list of all buttons in toolbar
-                    TB = mw.findChildren(QToolBar, Name)
-                    allButtons: list = TB[0].findChildren(QToolButton)
-                    for button in allButtons:
-                        if button.text() == "":
-                            continue
-
-                        action = button.defaultAction()
-                        if action is not None:
-                            Command = action.objectName()
-                            ListCommands.append(Command)
-
-                    Toolbars.append([Name, WorkbenchTitle, ListCommands])
-
-    return Toolbars
-
-
 def Dict_ReturnCustomToolbars(WorkBenchName):
     # Get the main window of FreeCAD
     mw = Gui.getMainWindow()
@@ -3176,30 +3258,4 @@ def Dict_ReturnCustomToolbars(WorkBenchName):
     return Toolbars
 
 
-def Dict_AddCustomToolbarsToWorkbench(WorkBenchName):
-    Toolbars = {}
-
-    try:
-        for CustomToolbar in Dict_CustomPanels["customToolbars"][WorkBenchName]:
-            ListCommands = []
-            Commands = Dict_CustomPanels["customToolbars"][WorkBenchName][
-                CustomToolbar
-            ]["commands"]
-
-            for key, value in list(Commands.items()):
-                for i in range(len(List_Commands)):
-                    if List_Commands[i][2] == key:
-                        Command = List_Commands[i][0]
-                        ListCommands.append(Command)
-
-                if List_IgnoredToolbars_internal.__contains__(value) is False:
-                    List_IgnoredToolbars_internal.append(value)
-
-            Toolbars[CustomToolbar] = ListCommands
-    except Exception:
-        pass
-
-    return Toolbars
-
-
 main()
@@ -31,12 +31,14 @@
 import FreeCAD as App
 import FreeCADGui as Gui
 import os
-
-import json
-
-from PySide.QtWidgets import QToolBar, QToolButton
+import sys
 
 ParentPath = os.path.dirname(os.path.dirname(__file__))
+# Make the modules of the ribbon available
+if ParentPath not in sys.path:
+    sys.path.append(ParentPath)
+
+import RibbonQuery_Ribbon
 
 # Set the path where you want to save this new Json file
 # JsonPath = os.path.dirname(__file__)
@@ -49,50 +51,21 @@ JsonName = "RibbonStructure.json"
 # define panels/toolbars to sort. key=toolbarname, value is position S
 ToolbarsToAdd = {"View": 0, "Views - Ribbon": 1, "Individual views": 2}
 
+# Set to True to print the changes without writing them
+PreviewOnly = False
+
 # get the path for the Json file
 JsonFile = os.path.join(JsonPath, JsonName)
 
-ribbonStructure = {}
-# read ribbon structure from JSON file
-with open(JsonFile, "r") as file:
-    ribbonStructure.update(json.load(file))
-file.close()
-
 
 def main():
-    UpdateOrder()
-    WriteJson()
-
-
-def UpdateOrder():
-
-    # update the order for each workbench toolbar
-    for WorkBench in ribbonStructure["workbenches"]:
-        orderList: list = ribbonStructure["workbenches"][WorkBench]["toolbars"]["order"]
-        for key, value in ToolbarsToAdd.items():
-            if key not in orderList:
-                orderList.insert(value, key)
-
-        ribbonStructure["workbenches"][WorkBench]["toolbars"]["order"] = orderList
-    return
-
-
-def WriteJson():
-    # Create a resulting dict
-    resultingDict = {}
-
-    # RibbonTabs
-    # Get the Ribbon dictionary
-    resultingDict.update(ribbonStructure)
-
-    # get the path for the Json file
-    JsonFile = os.path.join(JsonPath, JsonName)
-
-    # Writing to sample.json
-    with open(JsonFile, "w") as outfile:
-        json.dump(resultingDict, outfile, indent=4)
+    Query = RibbonQuery_Ribbon.RibbonQuery.load(JsonFile)
+    # update the order for each workbench
+    Query.insertToolbars("*", ToolbarsToAdd)
 
-    outfile.close()
+    print(Query.preview())
+    if PreviewOnly is False:
+        Query.commit()
     return
 
 
@@ -31,12 +31,14 @@
 import FreeCAD as App
 import FreeCADGui as Gui
 import os
-
-import json
-
-from PySide.QtWidgets import QToolBar, QToolButton
+import sys
 
 ParentPath = os.path.dirname(os.path.dirname(__file__))
+# Make the modules of the ribbon available
+if ParentPath not in sys.path:
+    sys.path.append(ParentPath)
+
+import RibbonQuery_Ribbon
 
 # Set the path where you want to save this new Json file
 # JsonPath = os.path.dirname(__file__)
@@ -52,128 +54,60 @@ ToolbarToUpdate = ["Structure"]  # ToolbarToUpdate = ["Structure", "Individual v
 # Set the size for the first icon in every toolbar/panel
 IconSize = "medium"  # set to "small" or medium as per preference
 
+# Set to True to print the changes without writing them
+PreviewOnly = False
+
 # get the path for the Json file
 JsonFile = os.path.join(JsonPath, JsonName)
 
-ribbonStructure = {}
-# read ribbon structure from JSON file
-with open(JsonFile, "r") as file:
-    ribbonStructure.update(json.load(file))
-file.close()
-
 
 def main():
-    UpdateJson()
-    WriteJson()
-
+    Query = RibbonQuery_Ribbon.RibbonQuery.load(JsonFile)
+    UpdateJson(Query)
 
-def UpdateJson():
-    # update the order for each workbench toolbar
-    #
-    # Go through each workbench in the Json file
-    for WorkBench in ribbonStructure["workbenches"]:
-        # Go through the list with toolbars to update
-        for Item in ToolbarToUpdate:
-            # Go through the toolbars of the workbench. If the toolbar is the same as in the list if toolbars to update, continue
-            for ToolBar in ribbonStructure["workbenches"][WorkBench]["toolbars"]:
-                if ToolBar == Item:
-                    # Go through all commands for this toolbar and set the size
-                    for Command in ribbonStructure["workbenches"][WorkBench][
-                        "toolbars"
-                    ][ToolBar]["commands"]:
-                        ribbonStructure["workbenches"][WorkBench]["toolbars"][ToolBar][
-                            "commands"
-                        ][Command]["size"] = IconSize
-    # Go through the workbenches again. now add the toolbars when they are not present.
-    for WorkBench in ribbonStructure["workbenches"]:
-        # Go through the list with toolbars to update
-        for Item in ToolbarToUpdate:
-            if Item not in ribbonStructure["workbenches"][WorkBench]["toolbars"]:
-                try:
-                    # Activate the workbench. Otherwise, .listToolbars() returns empty
-                    Gui.activateWorkbench(WorkBench)
-                    wbToolbars = Gui.getWorkbench(WorkBench).getToolbarItems()
-                    for key, value in list(wbToolbars.items()):
-                        if key == Item:
-                            for i in range(len(value)):
-                                CommandName = value[i]
-                                Command = Gui.Command.get(CommandName)
-                                if Command is not None:
-                                    IconName = Command.getInfo()["pixmap"]
-                                    MenuName = Command.getInfo()["menuText"].replace(
-                                        "&", ""
-                                    )
-
-                                    # Create an empty list for orders
-                                    Order = []
-
-                                    Size = IconSize
-
-                                    add_keys_nested_dict(
-                                        ribbonStructure,
-                                        [
-                                            "workbenches",
-                                            WorkBench,
-                                            "toolbars",
-                                            key,
-                                            "order",
-                                        ],
-                                    )
-                                    add_keys_nested_dict(
-                                        ribbonStructure,
-                                        [
-                                            "workbenches",
-                                            WorkBench,
-                                            "toolbars",
-                                            key,
-                                            "commands",
-                                            CommandName,
-                                        ],
-                                    )
-
-                                    ribbonStructure["workbenches"][WorkBench][
-                                        "toolbars"
-                                    ][key]["order"] = Order
-                                    ribbonStructure["workbenches"][WorkBench][
-                                        "toolbars"
-                                    ][key]["commands"][CommandName] = {
-                                        "size": Size,
-                                        "text": MenuName,
-                                        "icon": IconName,
-                                    }
-                except Exception:
-                    pass
+    print(Query.preview())
+    if PreviewOnly is False:
+        Query.commit()
     return
 
 
-def WriteJson():
-    # Create a resulting dict
-    resultingDict = {}
+def UpdateJson(Query: RibbonQuery_Ribbon.RibbonQuery):
+    # Set the size of all commands in the toolbars to update, in every workbench
+    for Item in ToolbarToUpdate:
+        Query.set(("*", Item, "*"), size=IconSize)
 
-    # RibbonTabs
-    # Get the Ribbon dictionary
-    resultingDict.update(ribbonStructure)
-
-    # get the path for the Json file
-    JsonFile = os.path.join(JsonPath, JsonName)
-
-    # Writing to sample.json
-    with open(JsonFile, "w") as outfile:
-        json.dump(resultingDict, outfile, indent=4)
-
-    outfile.close()
-    return
-
-
-def add_keys_nested_dict(dict, keys):
-    for key in keys:
-        if key not in dict:
-            dict[key] = {}
-        dict = dict[key]
-    try:
-        dict.setdefault(keys[-1], 1)
-    except Exception:
-        pass
+    # Add the toolbars to the workbenches where they are not present.
+    for WorkBench in Query.workbenches():
+        # Get the toolbars to update that are missing in this workbench
+        List_Missing = []
+        for Item in ToolbarToUpdate:
+            if len(Query.select((WorkBench, Item))) == 0:
+                List_Missing.append(Item)
+        if len(List_Missing) == 0:
+            continue
+
+        try:
+            # Activate the workbench. Otherwise, .listToolbars() returns empty
+            Gui.activateWorkbench(WorkBench)
+            wbToolbars = Gui.getWorkbench(WorkBench).getToolbarItems()
+            for key, value in list(wbToolbars.items()):
+                if key in List_Missing:
+                    for CommandName in value:
+                        Command = Gui.Command.get(CommandName)
+                        if Command is not None:
+                            Info = Command.getInfo()
+                            Query.addCommand(
+                                WorkBench,
+                                key,
+                                CommandName,
+                                {
+                                    "size": IconSize,
+                                    "text": Info["menuText"].replace("&", ""),
+                                    "icon": Info["pixmap"],
+                                },
+                            )
+        except Exception:
+            pass
     return
 
 
@@ -21,17 +21,23 @@
 # *************************************************************************
 
 # This script can be used to update "RibbonStructure.json" with modified command text from CommandList.json.
-# An backup will be created in the folder ../Backupss
+# A backup will be created in the backup folder of the ribbon.
 
 
 import FreeCAD as App
 import FreeCADGui as Gui
 import os
-import json
-from datetime import datetime
-import shutil
+import sys
 
 ParentPath = os.path.dirname(os.path.dirname(__file__))
+# Make the modules of the ribbon available
+if ParentPath not in sys.path:
+    sys.path.append(ParentPath)
+
+import json
+import Parameters_Ribbon
+import BackupStore_Ribbon
+import RibbonQuery_Ribbon
 
 # Set the path where you want to save this new Json file
 # JsonPath = os.path.dirname(__file__)
@@ -41,43 +47,26 @@ JsonPath = ParentPath
 # This is the file used to reset the ribbon.
 JsonName = "RibbonStructure.json"
 
-# Define list of the workbenches, toolbars and commands on class level
-List_Workbenches = []
+# Set to True to print the changes without writing them
+PreviewOnly = False
+
+# Define the dict with the commands from CommandList.json
 Dict_Commands = {}
-Dict_RibbonCommandPanel = {}
 
 
 def main():
-    ReadJson()
+    JsonFile = os.path.join(JsonPath, JsonName)
+    Query = RibbonQuery_Ribbon.RibbonQuery.load(JsonFile)
     ReadCommands()
-    UpdateCommands()
-    WriteJson()
-
-
-def ReadJson():
-    """Read the Json file and fill the lists and set settings"""
-    # Open the JsonFile and load the data
-    JsonFile = open(os.path.join(JsonPath, "RibbonStructure.json"))
-    data = json.load(JsonFile)
-
-    # Create a backup file
-    OriginalPath = os.path.join(JsonPath, "RibbonStructure.json")
-    Suffix = datetime.now().strftime("%Y%m%d_%H%M%S")
-    BackupName = f"RibbonStructure_{Suffix}.json"
-    pathBackup = os.path.dirname(__file__) + "/Backups"
-    if os.path.exists(pathBackup) is False:
-        os.makedirs(pathBackup)
-    BackupFile = os.path.join(pathBackup, BackupName)
-    shutil.copy(OriginalPath, BackupFile)
-
-    # Get the dict with the customized date for the buttons
-    try:
-        Dict_RibbonCommandPanel["workbenches"] = data["workbenches"]
-    except Exception as e:
-        print(e)
-        pass
-
-    JsonFile.close()
+    UpdateCommands(Query)
+
+    print(Query.preview())
+    if PreviewOnly is False:
+        # Create a backup file
+        BackupStore_Ribbon.BackupStore(Parameters_Ribbon.BACKUP_LOCATION).createBackup(
+            JsonFile
+        )
+        Query.commit()
     return
 
 
@@ -98,58 +87,16 @@ def ReadCommands():
     return
 
 
-def add_keys_nested_dict(dict, keys):
-    for key in keys:
-        if key not in dict:
-            dict[key] = {}
-        dict = dict[key]
-    try:
-        dict.setdefault(keys[-1], 1)
-    except Exception:
-        pass
-    return
-
-
-def UpdateCommands():
-    # Go through the workbenches in the dict
-    for WorkBench in Dict_RibbonCommandPanel["workbenches"]:
-        # Go through the toolbars of the workbench
-        for ToolBar in Dict_RibbonCommandPanel["workbenches"][WorkBench]["toolbars"]:
-            # Continue if the "Toolbar" is not named order. This is the orderlist for the toolbars
-            if ToolBar != "order":
-                # Go through the commands in the toolbar
-                for Command in Dict_RibbonCommandPanel["workbenches"][WorkBench][
-                    "toolbars"
-                ][ToolBar]["commands"]:
-                    # Get the command (key) and its custom name (value) from the commandlist
-                    # And compare them with the command in the Dict_RibbonCommandPanel
-                    for key, value in list(Dict_Commands.items()):
-                        # If the command and key are equal and value is not empty or three dots,
-                        # Get the custom name and change the text in the Dict_RibbonCommandPanel
-                        if Command == key:
-                            if value[2] != "" and value[2] != "...":
-                                Dict_RibbonCommandPanel["workbenches"][WorkBench][
-                                    "toolbars"
-                                ][ToolBar]["commands"][Command]["text"] = value[2]
-
-
-def WriteJson():
-    # Open the JsonFile and load the data
-    JsonFile = open(os.path.join(JsonPath, "RibbonStructure.json"))
-    data = json.load(JsonFile)
-
-    # RibbonTabs
-    # Get the Ribbon dictionary
-    data.update(Dict_RibbonCommandPanel)
-
-    # get the path for the Json file
-    JsonFile = os.path.join(JsonPath, JsonName)
-
-    # Writing to sample.json
-    with open(JsonFile, "w") as outfile:
-        json.dump(data, outfile, indent=4)
+def UpdateCommands(Query: RibbonQuery_Ribbon.RibbonQuery):
+    def UpdateText(Item: RibbonQuery_Ribbon.Match):
+        # Get the custom name of the command from the commandlist.
+        # If the value is not empty or three dots, change the text of the command
+        value = Dict_Commands.get(Item.CommandName)
+        if value is not None and value[2] != "" and value[2] != "...":
+            Item.Data["text"] = value[2]
 
-    outfile.close()
+    # Go through all commands in all toolbars of all workbenches
+    Query.transform("*/*/*", UpdateText)
     return
 
 
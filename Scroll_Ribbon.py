@@ -0,0 +1,248 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+from PySide.QtWidgets import QScrollBar
+from PySide.QtCore import QObject, QPropertyAnimation, QEasingCurve
+
+# One notch of a standard mouse wheel, as reported by QWheelEvent.angleDelta()
+WHEEL_NOTCH = 120
+
+
+def ReturnWheelDelta(event):
+    """
+    Returns the dominant scroll delta of a wheel event.
+
+    Args:
+        event (QWheelEvent): The wheel event.
+
+    Returns:
+        tuple: (delta, isPixelDelta). delta is positive when scrolling back (left/up).
+    """
+    # High resolution devices (touchpads) report a pixel delta. Use that when available
+    PixelDelta = event.pixelDelta()
+    if PixelDelta.isNull() is False:
+        if abs(PixelDelta.x()) > abs(PixelDelta.y()):
+            return PixelDelta.x(), True
+        return PixelDelta.y(), True
+
+    # Otherwise use the angle delta. Horizontal scrolling (tilt wheels) is supported as well
+    AngleDelta = event.angleDelta()
+    if abs(AngleDelta.x()) > abs(AngleDelta.y()):
+        return AngleDelta.x(), False
+    return AngleDelta.y(), False
+
+
+class ScrollController(QObject):
+    """
+    Scrolls a QScrollBar to a target value in one step, instead of emulating several button clicks.
+    Wheel deltas are accumulated, so that high resolution wheels and touchpads scroll smoothly.
+    """
+
+    # The number of pixels for one scroll step (equal to the previous/next buttons of the category)
+    StepSize = 50
+    # The duration of the scroll animation in ms. 0 disables the animation
+    Duration = 120
+    # Snap to the positions returned by SnapPositions
+    SnapEnabled = False
+    # Function that returns a list with the positions to snap to (e.g. the left side of the panels)
+    SnapPositions = None
+    # Function that is called when the scrollbar has reached its target
+    onFinished = None
+
+    def __init__(
+        self,
+        ScrollBar: QScrollBar,
+        StepSize=50,
+        Duration=120,
+        SnapEnabled=False,
+        parent=None,
+    ):
+        if parent is None:
+            parent = ScrollBar
+        super().__init__(parent)
+
+        self.ScrollBar = ScrollBar
+        self.StepSize = StepSize
+        self.Duration = Duration
+        self.SnapEnabled = SnapEnabled
+
+        # The value the scrollbar is scrolling to. Used to add new deltas while the animation is running
+        self.Target = float(ScrollBar.value())
+
+        self.Animation = QPropertyAnimation(ScrollBar, b"value", self)
+        self.Animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.Animation.finished.connect(self.on_Animation_finished)
+        return
+
+    def wheelEvent(self, event, StepsPerNotch=1):
+        """
+        Scrolls the scrollbar based on a wheel event.
+
+        Args:
+            event (QWheelEvent): The wheel event.
+            StepsPerNotch (int, optional): The number of steps for one wheel notch. Defaults to 1.
+        """
+        Delta, isPixelDelta = ReturnWheelDelta(event)
+        if Delta == 0:
+            return
+
+        # Touchpads are already smooth. Follow the fingers without animation
+        if isPixelDelta is True:
+            self.scrollBy(-Delta, Animate=False, Snap=False)
+            return
+
+        # Convert the angle delta to pixels. Partial notches (high resolution wheels) give a partial step.
+        # Only snap on full notches, otherwise every partial notch would jump to the next panel
+        Pixels = -Delta * StepsPerNotch * self.StepSize / WHEEL_NOTCH
+        self.scrollBy(Pixels, Snap=abs(Delta) >= WHEEL_NOTCH)
+        return
+
+    def scrollSteps(self, Steps: int):
+        """
+        Scrolls a number of steps. A negative value scrolls back.
+
+        Args:
+            Steps (int): The number of steps.
+        """
+        self.scrollBy(Steps * self.StepSize)
+        return
+
+    def scrollBy(self, Pixels: float, Animate=True, Snap=True):
+        """
+        Scrolls the scrollbar with a number of pixels, relative to the current target.
+
+        Args:
+            Pixels (float): The number of pixels. A negative value scrolls back.
+            Animate (bool, optional): Use an animation. Defaults to True.
+            Snap (bool, optional): Snap to the snap positions, when enabled. Defaults to True.
+        """
+        # Continue from the current target when the animation is still running.
+        # Otherwise continue from the actual value, which may be changed elsewhere
+        if self.Animation.state() != QPropertyAnimation.State.Running:
+            self.Target = float(self.ScrollBar.value())
+
+        Target = self.Target + Pixels
+        if Snap is True and self.SnapEnabled is True and self.SnapPositions is not None:
+            Target = self.returnSnapPosition(Target, Pixels)
+        self.scrollTo(Target, Animate=Animate)
+        return
+
+    def scrollTo(self, Value: float, Animate=True):
+        """
+        Scrolls the scrollbar to a value in one step.
+
+        Args:
+            Value (float): The new value.
+            Animate (bool, optional): Use an animation. Defaults to True.
+        """
+        # Keep the target within the range of the scrollbar
+        Value = max(self.ScrollBar.minimum(), min(self.ScrollBar.maximum(), Value))
+        self.Target = Value
+
+        if Animate is False or self.Duration <= 0:
+            self.Animation.stop()
+            self.ScrollBar.setValue(round(Value))
+            self.on_Animation_finished()
+            return
+
+        # Restart the animation from the current position to the new target.
+        self.Animation.stop()
+        self.Animation.setDuration(self.Duration)
+        self.Animation.setStartValue(self.ScrollBar.value())
+        self.Animation.setEndValue(round(Value))
+        self.Animation.start()
+        return
+
+    def returnSnapPosition(self, Value: float, Direction: float):
+        """
+        Returns the first snap position in the scroll direction.
+
+        Args:
+            Value (float): The unsnapped value.
+            Direction (float): The scroll direction. Negative is back.
+
+        Returns:
+            float: The snapped value.
+        """
+        try:
+            Positions = sorted(self.SnapPositions())
+        except Exception:
+            return Value
+        if len(Positions) == 0:
+            return Value
+
+        Current = self.Target
+        if Direction > 0:
+            for Position in Positions:
+                if Position > Current and Position >= Value:
+                    return Position
+            return self.ScrollBar.maximum()
+        if Direction < 0:
+            for Position in reversed(Positions):
+                if Position < Current and Position <= Value:
+                    return Position
+            return self.ScrollBar.minimum()
+        return Value
+
+    def on_Animation_finished(self):
+        if self.onFinished is not None:
+            try:
+                self.onFinished()
+            except Exception:
+                pass
+        return
+
+
+class StepAccumulator:
+    """
+    Converts wheel deltas into whole steps. Used for widgets that can only scroll in steps, like a tab bar.
+    """
+
+    def __init__(self, PixelsPerStep=50):
+        self.PixelsPerStep = PixelsPerStep
+        self.AngleRemainder = 0
+        self.PixelRemainder = 0
+        return
+
+    def wheelEvent(self, event):
+        """
+        Returns the number of steps for a wheel event. Positive is back (left).
+
+        Args:
+            event (QWheelEvent): The wheel event.
+
+        Returns:
+            int: The number of steps.
+        """
+        Delta, isPixelDelta = ReturnWheelDelta(event)
+        if isPixelDelta is True:
+            self.PixelRemainder += Delta
+            Steps = int(self.PixelRemainder / self.PixelsPerStep)
+            self.PixelRemainder -= Steps * self.PixelsPerStep
+            return Steps
+
+        # Reset the remainder when the scroll direction changes
+        if (Delta > 0) != (self.AngleRemainder > 0):
+            self.AngleRemainder = 0
+        self.AngleRemainder += Delta
+        Steps = int(self.AngleRemainder / WHEEL_NOTCH)
+        self.AngleRemainder -= Steps * WHEEL_NOTCH
+        return Steps
@@ -22,7 +22,7 @@
 
 # This code is based on the serialize function of the SearBar Addon.
 # Original developer for the SearchBar addon is Suzanne Soy.
-from PySide.QtGui import QIcon, QPixmap
+from PySide.QtGui import QIcon, QPixmap, QImage
 from PySide.QtCore import (
     Qt,
     QSize,
@@ -65,6 +65,28 @@ def iconToBase64(
     return base64_data
 
 
+def imageToBytes(image: QImage):
+    """
+    Converts a QImage to PNG data.
+
+    Args:
+        image (QImage): The image to encode.
+
+    Returns:
+        bytes: The PNG data of the image.
+    """
+    buf = QBuffer()
+    buf.open(QIODevice.OpenModeFlag.WriteOnly)
+    try:
+        image.save(buf, "PNG")
+    except Exception as e:
+        print(e)
+
+    png_data = bytes(buf.data().data())
+    buf.close()
+    return png_data
+
+
 def serializeIcon(icon):
     iconPixmaps = {}
     for sz in icon.availableSizes():
@@ -0,0 +1,372 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+
+# Shared read-only data and icon store for installations with many seats.
+#
+# Layout of the shared location (Parameters_Ribbon.SHARED_DATA_LOCATION):
+#   <location>/FreeCAD-<version>/<language>/RibbonShared.json   : manifest, see ReturnStoreKey
+#   <location>/FreeCAD-<version>/<language>/RibbonDataFile.dat  : lists of workbenches, toolbars and commands
+#   <location>/FreeCAD-<version>/<language>/RibbonIcons.dat     : icon store, see IconStore_Ribbon
+#
+# The shared files are only read, with mmap. A seat uses the shared store when the manifest matches its
+# FreeCAD build, language and ribbon addon version. Workbenches that are not in the shared store, or have a
+# different fingerprint, are stored in the local data file and icon store next to the addon (the delta).
+import os
+import json
+import mmap
+import shutil
+import FreeCAD as App
+import FreeCADGui as Gui
+import Parameters_Ribbon
+import Standard_Functions_RIbbon as StandardFunctions
+import IconStore_Ribbon
+import DataHarvest_Ribbon
+import Records_Ribbon
+
+MANIFEST_FILE = "RibbonShared.json"
+DATA_FILE = "RibbonDataFile.dat"
+STORE_FILE = "RibbonIcons.dat"
+STORE_VERSION = 1
+
+
+def ReturnLanguage() -> str:
+    return App.ParamGet("User parameter:BaseApp/Preferences/General").GetString(
+        "Language"
+    )
+
+
+def ReturnStoreKey() -> dict:
+    """
+    Returns the values that a shared store must match to be used on this seat.
+    """
+    AddonVersion = ""
+    try:
+        AddonVersion = StandardFunctions.ReturnXML_Value(
+            os.path.join(os.path.dirname(__file__), "package.xml"), "version"
+        )
+    except Exception:
+        pass
+    return {
+        "storeVersion": STORE_VERSION,
+        "FreeCAD": " ".join(str(Item) for Item in App.Version()[0:4]),
+        "Language": ReturnLanguage(),
+        "Addon": AddonVersion,
+    }
+
+
+def ReturnSharedFolder(Location: str = None) -> str:
+    """
+    Returns the folder in the shared location for the FreeCAD version and language of this seat.
+    Returns an empty string when no shared location is set.
+    """
+    if Location is None:
+        Location = Parameters_Ribbon.SHARED_DATA_LOCATION
+    if Location == "":
+        return ""
+    Version = ".".join(str(Item) for Item in App.Version()[0:3])
+    Language = ReturnLanguage()
+    if Language == "":
+        Language = "default"
+    return os.path.join(Location, f"FreeCAD-{Version}", Language)
+
+
+def ReadDataFile(FileName: str) -> dict:
+    """
+    Reads a data file with mmap. The file is not locked and is only read.
+    """
+    with open(FileName, "rb") as file:
+        # mmap cannot map an empty file
+        if os.fstat(file.fileno()).st_size == 0:
+            return {}
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as Map:
+            return json.loads(Map[:].decode("utf-8"))
+
+
+class SharedStore:
+    """
+    The shared data and icon store in a folder. Only read.
+    """
+
+    def __init__(self, Folder: str):
+        self.Folder = Folder
+        self.Manifest = {}
+        self.Data = None
+        self.Store = None
+        try:
+            with open(os.path.join(Folder, MANIFEST_FILE), "r") as file:
+                self.Manifest = json.load(file)
+        except Exception:
+            pass
+        return
+
+    def isValid(self, DataVersion: str = None) -> bool:
+        """
+        Returns True when the store matches this seat.
+
+        Args:
+            DataVersion (str, optional): The required version of the data file. Defaults to None (any version).
+        """
+        if (
+            len(self.Manifest) == 0
+            or os.path.exists(os.path.join(self.Folder, DATA_FILE)) is False
+        ):
+            return False
+        for Key, Value in ReturnStoreKey().items():
+            if self.Manifest.get(Key) != Value:
+                if Parameters_Ribbon.DEBUG_MODE is True:
+                    StandardFunctions.Print(
+                        f"Shared data in {self.Folder} is not used: {Key} is {self.Manifest.get(Key)}, not {Value}",
+                        "Warning",
+                    )
+                return False
+        if DataVersion is not None and self.Manifest.get("dataVersion") != DataVersion:
+            return False
+        return True
+
+    def data(self) -> dict:
+        """
+        Returns the content of the shared data file, with the lists as records. The file is read once.
+        """
+        if self.Data is None:
+            self.Data = Records_Ribbon.LoadRecords(
+                ReadDataFile(os.path.join(self.Folder, DATA_FILE))
+            )
+        return self.Data
+
+    def iconStore(self):
+        """
+        Returns the shared icon store, or None when there is no icon store.
+        """
+        if self.Store is None:
+            try:
+                self.Store = IconStore_Ribbon.IconStore(
+                    os.path.join(self.Folder, STORE_FILE)
+                )
+            except Exception:
+                return None
+        return self.Store
+
+    def changedWorkbenches(self) -> list:
+        """
+        Returns the installed workbenches that are not in the shared store or have a different fingerprint.
+        These workbenches are stored in the local data file.
+        """
+        Data = self.data()
+        New, Changed, Removed = DataHarvest_Ribbon.ReturnChangedWorkbenches(
+            Data.get("Workbench_Fingerprints", {}),
+            [WorkBench[0] for WorkBench in Data.get("List_Workbenches", [])],
+        )
+        return New + Changed
+
+    def close(self):
+        if self.Store is not None:
+            self.Store.close()
+            self.Store = None
+        self.Data = None
+        return
+
+
+# The shared store of this seat
+_SharedStore = None
+
+
+def ReturnSharedStore(DataVersion: str = None):
+    """
+    Returns the shared store for this seat.
+
+    Args:
+        DataVersion (str, optional): The required version of the data file. Defaults to None (any version).
+
+    Returns:
+        SharedStore: The store, or None when no valid shared store is available.
+    """
+    global _SharedStore
+
+    Folder = ReturnSharedFolder()
+    if Folder == "":
+        return None
+    if _SharedStore is None or _SharedStore.Folder != Folder:
+        if _SharedStore is not None:
+            _SharedStore.close()
+        _SharedStore = SharedStore(Folder)
+    if _SharedStore.isValid(DataVersion) is False:
+        return None
+    return _SharedStore
+
+
+def MergeData(SharedData: dict, LocalData: dict) -> dict:
+    """
+    Merges the local delta into the shared data. The lists of both must be records, see Records_Ribbon.LoadRecords.
+    The data of a workbench in the local data replaces the shared data of that workbench.
+    Shared workbenches that are not installed on this seat are left out.
+
+    Args:
+        SharedData (dict): The shared data file.
+        LocalData (dict): The local data file.
+
+    Returns:
+        dict: The merged data.
+    """
+    List_Installed = [str(WorkBenchName) for WorkBenchName in Gui.listWorkbenches()]
+    Set_Local = set(WorkBench[0] for WorkBench in LocalData.get("List_Workbenches", []))
+    Set_Shared = set(
+        WorkBench[0] for WorkBench in SharedData.get("List_Workbenches", [])
+    )
+    # Shared entries of these workbenches are not used
+    Set_Skipped = Set_Local | set(
+        Name for Name in Set_Shared if Name not in List_Installed
+    )
+
+    def MergeList(Key: str, WorkBenchIndex: int) -> list:
+        List_Merged = []
+        Set_Seen = set()
+        for Item in SharedData.get(Key, []):
+            if Item[WorkBenchIndex] in Set_Skipped:
+                continue
+            List_Merged.append(Item)
+            Set_Seen.add(json.dumps(Item))
+        for Item in LocalData.get(Key, []):
+            # Entries that do not belong to a workbench, like custom toolbars, can be in both files
+            if json.dumps(Item) not in Set_Seen:
+                List_Merged.append(Item)
+        return List_Merged
+
+    Merged = dict(SharedData)
+    Merged.update(LocalData)
+    Merged["List_Workbenches"] = MergeList("List_Workbenches", 0)
+    Merged["StringList_Toolbars"] = MergeList("StringList_Toolbars", 2)
+    Merged["List_Commands"] = MergeList("List_Commands", 3)
+    Dict_Fingerprints = {}
+    for WorkBenchName, Fingerprint in SharedData.get(
+        "Workbench_Fingerprints", {}
+    ).items():
+        if WorkBenchName not in Set_Skipped:
+            Dict_Fingerprints[WorkBenchName] = Fingerprint
+    Dict_Fingerprints.update(LocalData.get("Workbench_Fingerprints", {}))
+    Merged["Workbench_Fingerprints"] = Dict_Fingerprints
+    return Merged
+
+
+def ReadData(LocalDataFile: str, DataVersion: str = None) -> dict:
+    """
+    Returns the data for this seat: the shared data merged with the local delta,
+    or only the local data file when there is no valid shared store.
+
+    Args:
+        LocalDataFile (str): The local data file.
+        DataVersion (str, optional): The required version of the shared data file. Defaults to None.
+
+    Returns:
+        dict: The data, with the lists as records. Empty when there is no data at all.
+    """
+    LocalData = {}
+    if os.path.exists(LocalDataFile) is True:
+        LocalData = Records_Ribbon.LoadRecords(ReadDataFile(LocalDataFile))
+
+    Store = ReturnSharedStore(DataVersion)
+    if Store is None:
+        return LocalData
+    return MergeData(Store.data(), LocalData)
+
+
+def ReturnStoredIcon(Name: str, Kind: str = IconStore_Ribbon.COMMANDS):
+    """
+    Returns an icon from the local icon store, or from the shared icon store.
+
+    Args:
+        Name (str): The name of the workbench or command.
+        Kind (str, optional): IconStore_Ribbon.WORKBENCHES or COMMANDS. Defaults to COMMANDS.
+
+    Returns:
+        QIcon: The icon, or None when the icon is in neither store.
+    """
+    Store = IconStore_Ribbon.ReturnIconStore()
+    if Store is not None and Store.hasIcon(Name, Kind) is True:
+        return Store.icon(Name, Kind)
+
+    Shared = ReturnSharedStore()
+    if Shared is not None:
+        Store = Shared.iconStore()
+        if Store is not None:
+            return Store.icon(Name, Kind)
+    return None
+
+
+def HasStoredIcon(Name: str, Kind: str = IconStore_Ribbon.COMMANDS) -> bool:
+    """
+    Returns True when an icon is in the local icon store or in the shared icon store.
+    Only the indexes of the stores are checked, no icon is decoded.
+
+    Args:
+        Name (str): The name of the workbench or command.
+        Kind (str, optional): IconStore_Ribbon.WORKBENCHES or COMMANDS. Defaults to COMMANDS.
+
+    Returns:
+        bool: True when the icon is stored.
+    """
+    Store = IconStore_Ribbon.ReturnIconStore()
+    if Store is not None and Store.hasIcon(Name, Kind) is True:
+        return True
+
+    Shared = ReturnSharedStore()
+    if Shared is not None:
+        Store = Shared.iconStore()
+        if Store is not None:
+            return Store.hasIcon(Name, Kind)
+    return False
+
+
+def PublishSharedStore(
+    DataFile: str, StoreFile: str, DataVersion: str, Location: str = None
+) -> str:
+    """
+    Copies a complete data file and icon store to the shared location, for the FreeCAD version and
+    language of this seat. The manifest is written last, so seats do not use a store that is half copied.
+
+    Args:
+        DataFile (str): The data file to publish.
+        StoreFile (str): The icon store to publish.
+        DataVersion (str): The version of the data file.
+        Location (str, optional): The shared location. Defaults to Parameters_Ribbon.SHARED_DATA_LOCATION.
+
+    Returns:
+        str: The folder the store is published to.
+    """
+    Folder = ReturnSharedFolder(Location)
+    if Folder == "":
+        raise ValueError("No shared data location is set")
+    os.makedirs(Folder, exist_ok=True)
+
+    # Remove the manifest first. Seats that start while copying use their local data
+    ManifestFile = os.path.join(Folder, MANIFEST_FILE)
+    if os.path.exists(ManifestFile) is True:
+        os.remove(ManifestFile)
+    for Source, Name in [(DataFile, DATA_FILE), (StoreFile, STORE_FILE)]:
+        shutil.copyfile(Source, os.path.join(Folder, Name + ".tmp"))
+        os.replace(os.path.join(Folder, Name + ".tmp"), os.path.join(Folder, Name))
+
+    Manifest = ReturnStoreKey()
+    Manifest["dataVersion"] = DataVersion
+    with open(ManifestFile + ".tmp", "w") as outfile:
+        json.dump(Manifest, outfile, indent=4)
+    os.replace(ManifestFile + ".tmp", ManifestFile)
+    return Folder
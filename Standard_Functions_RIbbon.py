@@ -458,52 +458,64 @@ def ReturnXML_Value(
     return result
 
 
+# The workbenches that need more than one translation context
+ListSpecialWB = [
+    "Assembly4Workbench",
+    "A2plusWorkbench",
+]
+# The translation context per workbench
+contextDict_Standard = {
+    "WorkFeatureWorkbench": "Workbench",
+    "SketcherWorkbench": "Workbench",
+    "PartDesignWorkbench": "Workbench",
+    "PartWorkbench": "Workbench",
+    "SMWorkbench": "Workbench",
+    "FrameWorkbench": "Workbench",
+    "SurfaceWorkbench": "Workbench",
+    "TechDrawWorkbench": "Workbench",
+    "FemWorkbench": "Workbench",
+    "GearWorkbench": "Workbench",
+    "FastenersWorkbench": "Workbench",
+    "SpreadsheetWorkbench": "Workbench",
+    "InspectionWorkbench": "Workbench",
+    "RenderWorkbench": "Workbench",
+    "RobotWorkbench": "Workbench",
+    "CfdOFWorkbench": "Workbench",
+    "PlotWorkbench": "Workbench",
+    "BillOfMaterialsWB": "Workbench",
+    "DynamicDataWorkbench": "Workbench",
+    "AssistantWorkbench": "Workbench",
+    "TestWorkbench": "Workbench",
+    "ThreadProfileWorkbench": "Workbench",
+    "AssemblyWorkbench": "Workbench",
+    "BIMWorkbench": "Workbench",
+    "CAMWorkbench": "Workbench",
+    "MaterialWorkbench": "Workbench",
+    "Assembly3Workbench": "asm3",
+}
+
+# The shared translation cache. Created on the first translation
+_TranslationCache = None
+
+
 def TranslationsMapping(WorkBenchName: str, string: str):
+    """
+    Returns the translation of a workbench, toolbar or command name.
+    The translations are cached per language and stored, see TranslationCache_Ribbon.
+    """
+    global _TranslationCache
+    if _TranslationCache is None:
+        import TranslationCache_Ribbon
+
+        _TranslationCache = TranslationCache_Ribbon.ReturnTranslationCache()
+    return _TranslationCache.translate(WorkBenchName, string, ReturnTranslation)
+
+
+def ReturnTranslation(WorkBenchName: str, string: str):
     result = string
 
-    ListSpecialWB = [
-        "Assembly4Workbench",
-        "A2plusWorkbench",
-    ]
-    isSpecialWB = False
-    for wb in ListSpecialWB:
-        if wb == WorkBenchName:
-            isSpecialWB = True
-
-    if isSpecialWB is False:
-        contextDict_Standard = {
-            "WorkFeatureWorkbench": "Workbench",
-            "SketcherWorkbench": "Workbench",
-            "PartDesignWorkbench": "Workbench",
-            "PartWorkbench": "Workbench",
-            "SMWorkbench": "Workbench",
-            "FrameWorkbench": "Workbench",
-            "SurfaceWorkbench": "Workbench",
-            "TechDrawWorkbench": "Workbench",
-            "FemWorkbench": "Workbench",
-            "GearWorkbench": "Workbench",
-            "FastenersWorkbench": "Workbench",
-            "SpreadsheetWorkbench": "Workbench",
-            "InspectionWorkbench": "Workbench",
-            "RenderWorkbench": "Workbench",
-            "RobotWorkbench": "Workbench",
-            "CfdOFWorkbench": "Workbench",
-            "PlotWorkbench": "Workbench",
-            "BillOfMaterialsWB": "Workbench",
-            "DynamicDataWorkbench": "Workbench",
-            "AssistantWorkbench": "Workbench",
-            "TestWorkbench": "Workbench",
-            "ThreadProfileWorkbench": "Workbench",
-            "AssemblyWorkbench": "Workbench",
-            "BIMWorkbench": "Workbench",
-            "CAMWorkbench": "Workbench",
-            "MaterialWorkbench": "Workbench",
-            "Assembly3Workbench": "asm3",
-        }
-        try:
-            context = contextDict_Standard[WorkBenchName]
-        except Exception:
-            context = "Workbench"
+    if WorkBenchName not in ListSpecialWB:
+        context = contextDict_Standard.get(WorkBenchName, "Workbench")
         result = translate(context, string)
 
     if WorkBenchName == "Assembly4Workbench":
@@ -0,0 +1,77 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+# Tests for the change tracking of the design dialog. Run with: python -m pytest Tests
+import os
+import sys
+import unittest
+
+ParentPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ParentPath not in sys.path:
+    sys.path.append(ParentPath)
+
+from ChangeTracker_Ribbon import ChangeTracker
+
+
+class TestChangeTracker(unittest.TestCase):
+    def setUp(self):
+        self.Tracker = ChangeTracker()
+        self.Tracker.setSaved(
+            {
+                "quickAccessCommands": ["Std_New", "Std_Open"],
+                "ignoredToolbars": ["File", "Edit"],
+                "workbenches": {"PartWorkbench": {"order": ["A", "B"]}},
+            }
+        )
+        return
+
+    def test_QuickAccessReordered(self):
+        # The quick access toolbar is built in the order of the list
+        self.Tracker.update("quickAccessCommands", ["Std_Open", "Std_New"])
+        self.assertTrue(self.Tracker.isChanged())
+
+        self.Tracker.update("quickAccessCommands", ["Std_New", "Std_Open"])
+        self.assertFalse(self.Tracker.isChanged())
+        return
+
+    def test_UnorderedSectionReordered(self):
+        self.Tracker.update("ignoredToolbars", ["Edit", "File"])
+        self.assertFalse(self.Tracker.isChanged())
+
+        self.Tracker.update("ignoredToolbars", ["Edit", "File", "View"])
+        self.assertTrue(self.Tracker.isChanged())
+        return
+
+    def test_WorkbenchEdited(self):
+        self.Tracker.update(
+            "workbenches", {"PartWorkbench": {"order": ["B", "A"]}}, ["PartWorkbench"]
+        )
+        self.assertTrue(self.Tracker.isChanged())
+
+        self.Tracker.setSaved(
+            {"workbenches": {"PartWorkbench": {"order": ["B", "A"]}}}, ["workbenches"]
+        )
+        self.assertFalse(self.Tracker.isChanged())
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
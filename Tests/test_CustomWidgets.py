@@ -0,0 +1,125 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+# Tests for the ribbon buttons. Run from the Python console of FreeCAD, with the ribbon loaded:
+#   import unittest; unittest.main(module="test_CustomWidgets", argv=[""], exit=False)
+import os
+import sys
+import unittest
+
+try:
+    import FreeCAD as App
+    import FreeCADGui as Gui
+except ImportError:
+    raise unittest.SkipTest("FreeCAD is not available")
+
+ParentPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ParentPath not in sys.path:
+    sys.path.append(ParentPath)
+
+from PySide.QtGui import QAction, QIcon
+from PySide.QtWidgets import QApplication, QDockWidget, QMenu, QToolButton
+from PySide.QtCore import Qt, QSize
+from CustomWidgets import CustomControls
+
+# The menus of the ribbon that are created once: overlay, ribbon preferences, help and about
+FIXED_MENUS = 4
+
+
+@unittest.skipUnless(App.GuiUp, "The FreeCAD GUI is not running")
+class TestButtonMenus(unittest.TestCase):
+    """
+    Plain buttons must not create a menu or an arrow button. Only dropdown commands have a menu.
+    """
+
+    def setUp(self):
+        self.Action = QAction("Test")
+        self.Icon = QIcon()
+        return
+
+    def ReturnMenu(self, NumberOfActions: int) -> QMenu:
+        Menu = QMenu()
+        for i in range(NumberOfActions):
+            Menu.addAction(QAction(f"Test {i}", Menu))
+        return Menu
+
+    def test_PlainButtonsHaveNoArrow(self):
+        for Button in (
+            CustomControls.CustomToolButton(
+                Text="Test",
+                Action=self.Action,
+                Icon=self.Icon,
+                IconSize=QSize(16, 16),
+                ButtonSize=QSize(24, 24),
+            ),
+            CustomControls.LargeCustomToolButton(
+                Text="Test",
+                Action=self.Action,
+                Icon=self.Icon,
+                IconSize=QSize(32, 32),
+                ButtonSize=QSize(40, 40),
+            ),
+        ):
+            # Only the command button
+            self.assertEqual(len(Button.findChildren(QToolButton)), 1)
+            self.assertEqual(len(Button.findChildren(QMenu)), 0)
+        return
+
+    def test_DropDownButtonsHaveArrow(self):
+        Menu = self.ReturnMenu(3)
+        Button = CustomControls.CustomToolButton(
+            Text="Test",
+            Action=self.Action,
+            Icon=self.Icon,
+            IconSize=QSize(16, 16),
+            ButtonSize=QSize(24, 24),
+            Menu=Menu,
+        )
+        ArrowButtons = [
+            Child for Child in Button.findChildren(QToolButton) if Child.menu() is Menu
+        ]
+        self.assertEqual(len(ArrowButtons), 1)
+        return
+
+    def test_RibbonMenuCount(self):
+        """
+        The number of menus of the ribbon is bounded by the number of dropdown commands.
+        """
+        RibbonDock = Gui.getMainWindow().findChild(QDockWidget, "Ribbon")
+        if RibbonDock is None:
+            self.skipTest("The ribbon is not loaded")
+        Ribbon = RibbonDock.widget()
+        QApplication.processEvents()
+
+        List_Menus = Ribbon.findChildren(
+            QMenu, options=Qt.FindChildOption.FindDirectChildrenOnly
+        )
+        List_DropDownButtons = [
+            Button
+            for Button in Ribbon.findChildren(QToolButton)
+            if Button.menu() is not None and len(Button.menu().actions()) > 1
+        ]
+        self.assertLessEqual(len(List_Menus), len(List_DropDownButtons) + FIXED_MENUS)
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+# Tests for the atomic json writes. Run from the Python console of FreeCAD:
+#   import unittest; unittest.main(module="test_JsonStore", argv=[""], exit=False)
+import os
+import sys
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    import FreeCAD as App
+except ImportError:
+    raise unittest.SkipTest("FreeCAD is not available")
+
+ParentPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ParentPath not in sys.path:
+    sys.path.append(ParentPath)
+
+import JsonStore_Ribbon
+
+
+class TestWriteFileAtomic(unittest.TestCase):
+    """
+    A write that fails halfway must leave the old file intact and must not leave a temporary file behind.
+    """
+
+    def setUp(self):
+        self.Folder = tempfile.TemporaryDirectory()
+        self.FileName = os.path.join(self.Folder.name, "RibbonStructure.json")
+        with open(self.FileName, "wb") as File:
+            File.write(b'{"old": true}')
+        return
+
+    def tearDown(self):
+        self.Folder.cleanup()
+        return
+
+    def ReadFile(self) -> bytes:
+        with open(self.FileName, "rb") as File:
+            return File.read()
+
+    def assertOldFileIntact(self):
+        self.assertEqual(self.ReadFile(), b'{"old": true}')
+        self.assertEqual(os.listdir(self.Folder.name), ["RibbonStructure.json"])
+        return
+
+    def test_Write(self):
+        JsonStore_Ribbon.WriteFileAtomic(self.FileName, b'{"new": true}')
+        self.assertEqual(self.ReadFile(), b'{"new": true}')
+        self.assertEqual(os.listdir(self.Folder.name), ["RibbonStructure.json"])
+        return
+
+    def test_ReplaceFails(self):
+        with mock.patch("os.replace", side_effect=OSError("replace failed")):
+            with self.assertRaises(OSError):
+                JsonStore_Ribbon.WriteFileAtomic(self.FileName, b'{"new": true}')
+        self.assertOldFileIntact()
+        return
+
+    def test_FsyncFails(self):
+        with mock.patch("os.fsync", side_effect=OSError("fsync failed")):
+            with self.assertRaises(OSError):
+                JsonStore_Ribbon.WriteFileAtomic(self.FileName, b'{"new": true}')
+        self.assertOldFileIntact()
+        return
+
+    def test_WriterKeepsOldFile(self):
+        Writer = JsonStore_Ribbon.JsonWriter()
+        with mock.patch("os.replace", side_effect=OSError("replace failed")):
+            with mock.patch.object(
+                JsonStore_Ribbon.StandardFunctions, "Print"
+            ) as Print:
+                Writer.save(self.FileName, {"new": True})
+                self.assertTrue(Writer.flush())
+        # The failed write is reported, not raised on the worker thread
+        self.assertEqual(Print.call_args[0][1], "Error")
+        self.assertOldFileIntact()
+
+        # The next save writes the file
+        Writer.save(self.FileName, {"new": True})
+        self.assertTrue(Writer.flush())
+        self.assertEqual(json.loads(self.ReadFile()), {"new": True})
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
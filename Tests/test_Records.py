@@ -0,0 +1,92 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+# Tests for the records of the data file. Run with: python -m pytest Tests
+import os
+import sys
+import unittest
+
+ParentPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ParentPath not in sys.path:
+    sys.path.append(ParentPath)
+
+import Records_Ribbon
+
+
+class TestLoadRecords(unittest.TestCase):
+    def test_UpgradeCommands(self):
+        # Version 1 had command records without the translated menu text
+        Data = Records_Ribbon.LoadRecords(
+            {"List_Commands": [["Part_Box", "Part_Box.svg", "Cube", "PartWorkbench"]]}
+        )
+        Record = Data["List_Commands"][0]
+        self.assertIsInstance(Record, Records_Ribbon.CommandRecord)
+        self.assertEqual(Record.CommandName, "Part_Box")
+        self.assertEqual(Record.WorkBenchName, "PartWorkbench")
+        self.assertEqual(Record.MenuTextTranslated, "Cube")
+        self.assertEqual(Data["recordVersion"], Records_Ribbon.RECORD_VERSION)
+        return
+
+    def test_UpgradeWorkbenches(self):
+        Data = Records_Ribbon.LoadRecords(
+            {
+                "List_Workbenches": [
+                    ["PartWorkbench", "Part.svg", "Part", {"Solids": ["Part_Box"]}]
+                ]
+            }
+        )
+        Record = Data["List_Workbenches"][0]
+        self.assertEqual(Record.WorkbenchTitleTranslated, "Part")
+        self.assertEqual(Record.ToolbarItems, {"Solids": ["Part_Box"]})
+        return
+
+    def test_CurrentVersion(self):
+        Item = ["Part_Box", "Part_Box.svg", "Cube", "PartWorkbench", "Würfel"]
+        Data = Records_Ribbon.LoadRecords(
+            {
+                "recordVersion": Records_Ribbon.RECORD_VERSION,
+                "List_Commands": [Item],
+            }
+        )
+        self.assertEqual(list(Data["List_Commands"][0]), Item)
+        self.assertEqual(Data["List_Commands"][0].MenuTextTranslated, "Würfel")
+        return
+
+    def test_Index(self):
+        List_Records = [
+            Records_Ribbon.ReturnCommandRecord(Item)
+            for Item in [
+                ["Std_Open", "Open.svg", "Open", "PartWorkbench", "Open"],
+                ["Std_Open", "Open.svg", "Open", "SketcherWorkbench", "Open"],
+            ]
+        ]
+        Dict_Index = Records_Ribbon.ReturnIndex(List_Records, "CommandName")
+        self.assertEqual(Dict_Index["Std_Open"].WorkBenchName, "PartWorkbench")
+
+        Dict_Index = Records_Ribbon.ReturnIndex(
+            List_Records, "CommandName", "WorkBenchName"
+        )
+        self.assertIs(Dict_Index[("Std_Open", "SketcherWorkbench")], List_Records[1])
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+# Tests for the indexes of the ribbon structure. Run with: python -m pytest Tests
+import os
+import sys
+import unittest
+
+ParentPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ParentPath not in sys.path:
+    sys.path.append(ParentPath)
+
+from RibbonStructure_Ribbon import RibbonStructure
+
+
+class TestMemberSets(unittest.TestCase):
+    """
+    The sets of the list sections must follow every change of the lists, also changes in place.
+    """
+
+    def setUp(self):
+        self.Structure = RibbonStructure(
+            {"ignoredToolbars": ["A"], "quickAccessCommands": ["Std_New"]}
+        )
+        return
+
+    def test_ItemReplaced(self):
+        self.assertTrue(self.Structure.isIgnoredToolbar("A"))
+        self.Structure["ignoredToolbars"][0] = "B"
+        self.assertFalse(self.Structure.isIgnoredToolbar("A"))
+        self.assertTrue(self.Structure.isIgnoredToolbar("B"))
+        return
+
+    def test_ItemsAddedAndRemoved(self):
+        self.assertTrue(self.Structure.isQuickAccessCommand("Std_New"))
+        self.Structure["quickAccessCommands"].append("Std_Open")
+        self.assertTrue(self.Structure.isQuickAccessCommand("Std_Open"))
+        self.Structure["quickAccessCommands"].remove("Std_New")
+        self.assertFalse(self.Structure.isQuickAccessCommand("Std_New"))
+        return
+
+    def test_SectionReplaced(self):
+        self.assertTrue(self.Structure.isIgnoredToolbar("A"))
+        self.Structure["ignoredToolbars"] = ["C"]
+        self.assertFalse(self.Structure.isIgnoredToolbar("A"))
+        self.assertTrue(self.Structure.isIgnoredToolbar("C"))
+        return
+
+
+class TestToolbarRecord(unittest.TestCase):
+    def test_OrderChanged(self):
+        Structure = RibbonStructure(
+            {
+                "workbenches": {
+                    "PartWorkbench": {
+                        "toolbars": {
+                            "Part": {"order": ["Box", "separator_1", "Cylinder"]}
+                        }
+                    }
+                }
+            }
+        )
+        Record = Structure.toolbar("PartWorkbench", "Part")
+        self.assertEqual(Record.positions()["Cylinder"], 2)
+        self.assertEqual(Record.separators(), [(1, "separator_1")])
+
+        Record.order().reverse()
+        self.assertEqual(Record.positions()["Cylinder"], 0)
+        self.assertEqual(Record.separators(), [(1, "separator_1")])
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
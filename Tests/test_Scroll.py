@@ -0,0 +1,102 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+# Tests for the wheel steps of the tab bar. Run with: python -m pytest Tests
+# Runs with the PySide of FreeCAD. The wheel events are replaced by simple objects.
+import os
+import sys
+import unittest
+
+try:
+    import PySide
+except ImportError:
+    raise unittest.SkipTest("PySide is not available")
+
+ParentPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ParentPath not in sys.path:
+    sys.path.append(ParentPath)
+
+from Scroll_Ribbon import StepAccumulator, WHEEL_NOTCH
+
+
+class Delta:
+    def __init__(self, x=0, y=0):
+        self.X = x
+        self.Y = y
+
+    def x(self):
+        return self.X
+
+    def y(self):
+        return self.Y
+
+    def isNull(self):
+        return self.X == 0 and self.Y == 0
+
+
+class WheelEvent:
+    def __init__(self, AngleDelta=0, PixelDelta=0):
+        self.AngleDelta = Delta(y=AngleDelta)
+        self.PixelDelta = Delta(y=PixelDelta)
+
+    def angleDelta(self):
+        return self.AngleDelta
+
+    def pixelDelta(self):
+        return self.PixelDelta
+
+
+class TestStepAccumulator(unittest.TestCase):
+    def setUp(self):
+        self.Accumulator = StepAccumulator(PixelsPerStep=50)
+        return
+
+    def test_Notches(self):
+        self.assertEqual(self.Accumulator.wheelEvent(WheelEvent(WHEEL_NOTCH)), 1)
+        self.assertEqual(self.Accumulator.wheelEvent(WheelEvent(-2 * WHEEL_NOTCH)), -2)
+        return
+
+    def test_HighResolutionWheel(self):
+        # Parts of a notch are added up to whole steps
+        Steps = [
+            self.Accumulator.wheelEvent(WheelEvent(WHEEL_NOTCH // 4)) for i in range(8)
+        ]
+        self.assertEqual(Steps, [0, 0, 0, 1, 0, 0, 0, 1])
+        return
+
+    def test_DirectionChange(self):
+        # The remainder of one direction is not used for the other direction
+        self.assertEqual(self.Accumulator.wheelEvent(WheelEvent(WHEEL_NOTCH // 2)), 0)
+        self.assertEqual(self.Accumulator.wheelEvent(WheelEvent(-WHEEL_NOTCH // 2)), 0)
+        self.assertEqual(self.Accumulator.wheelEvent(WheelEvent(-WHEEL_NOTCH // 2)), -1)
+        return
+
+    def test_PixelDelta(self):
+        # Touchpads report pixels. These are used instead of the angle
+        Steps = [
+            self.Accumulator.wheelEvent(WheelEvent(WHEEL_NOTCH, 20)) for i in range(5)
+        ]
+        self.assertEqual(Steps, [0, 0, 1, 0, 1])
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
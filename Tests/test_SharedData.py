@@ -0,0 +1,135 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+# Tests for publishing the shared data. Run from the Python console of FreeCAD:
+#   import unittest; unittest.main(module="test_SharedData", argv=[""], exit=False)
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+try:
+    import FreeCAD as App
+    import FreeCADGui as Gui
+except ImportError:
+    raise unittest.SkipTest("FreeCAD is not available")
+
+ParentPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ParentPath not in sys.path:
+    sys.path.append(ParentPath)
+
+import SharedData_Ribbon
+
+
+class TestPublishSharedStore(unittest.TestCase):
+    """
+    A published store must be complete and usable by a seat with the same FreeCAD version and language.
+    """
+
+    def setUp(self):
+        self.Source = tempfile.TemporaryDirectory()
+        self.Location = tempfile.TemporaryDirectory()
+        self.DataFile = os.path.join(self.Source.name, "RibbonDataFile.dat")
+        self.StoreFile = os.path.join(self.Source.name, "RibbonIcons.dat")
+        self.WriteSource({"dataVersion": "1.0", "List_Commands": []}, b"icons")
+        return
+
+    def tearDown(self):
+        self.Source.cleanup()
+        self.Location.cleanup()
+        return
+
+    def WriteSource(self, Data: dict, Icons: bytes):
+        with open(self.DataFile, "w") as File:
+            json.dump(Data, File)
+        with open(self.StoreFile, "wb") as File:
+            File.write(Icons)
+        return
+
+    def ReadFile(self, FileName: str) -> bytes:
+        with open(FileName, "rb") as File:
+            return File.read()
+
+    def test_Publish(self):
+        Folder = SharedData_Ribbon.PublishSharedStore(
+            self.DataFile, self.StoreFile, "1.0", self.Location.name
+        )
+        self.assertEqual(
+            Folder, SharedData_Ribbon.ReturnSharedFolder(self.Location.name)
+        )
+        self.assertEqual(
+            sorted(os.listdir(Folder)),
+            sorted(
+                [
+                    SharedData_Ribbon.MANIFEST_FILE,
+                    SharedData_Ribbon.DATA_FILE,
+                    SharedData_Ribbon.STORE_FILE,
+                ]
+            ),
+        )
+        self.assertEqual(
+            self.ReadFile(os.path.join(Folder, SharedData_Ribbon.DATA_FILE)),
+            self.ReadFile(self.DataFile),
+        )
+        self.assertEqual(
+            self.ReadFile(os.path.join(Folder, SharedData_Ribbon.STORE_FILE)),
+            b"icons",
+        )
+
+        # The store is read back for the data version it is published with
+        Store = SharedData_Ribbon.SharedStore(Folder)
+        self.assertTrue(Store.isValid("1.0"))
+        self.assertFalse(Store.isValid("2.0"))
+        self.assertEqual(
+            SharedData_Ribbon.ReadDataFile(
+                os.path.join(Folder, SharedData_Ribbon.DATA_FILE)
+            )["dataVersion"],
+            "1.0",
+        )
+        Store.close()
+        return
+
+    def test_PublishAgain(self):
+        SharedData_Ribbon.PublishSharedStore(
+            self.DataFile, self.StoreFile, "1.0", self.Location.name
+        )
+        self.WriteSource({"dataVersion": "2.0", "List_Commands": []}, b"new icons")
+        Folder = SharedData_Ribbon.PublishSharedStore(
+            self.DataFile, self.StoreFile, "2.0", self.Location.name
+        )
+        self.assertEqual(
+            self.ReadFile(os.path.join(Folder, SharedData_Ribbon.STORE_FILE)),
+            b"new icons",
+        )
+        self.assertTrue(SharedData_Ribbon.SharedStore(Folder).isValid("2.0"))
+        return
+
+    def test_NoLocation(self):
+        with self.assertRaises(ValueError):
+            SharedData_Ribbon.PublishSharedStore(
+                self.DataFile, self.StoreFile, "1.0", ""
+            )
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+# Tests for the pool with buttons of unloaded ribbon categories. Run with: python -m pytest Tests
+# Runs with the PySide of FreeCAD. The buttons are replaced by simple objects.
+import os
+import sys
+import unittest
+
+try:
+    import PySide
+except ImportError:
+    raise unittest.SkipTest("PySide is not available")
+
+ParentPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ParentPath not in sys.path:
+    sys.path.append(ParentPath)
+
+from WidgetPool_Ribbon import WidgetPool
+
+
+class Widget:
+    def __init__(self):
+        self.Visible = True
+        self.Parent = "Panel"
+        self.Deleted = False
+
+    def hide(self):
+        self.Visible = False
+
+    def setParent(self, Parent):
+        self.Parent = Parent
+
+    def deleteLater(self):
+        self.Deleted = True
+
+
+class TestWidgetPool(unittest.TestCase):
+    def setUp(self):
+        self.Pool = WidgetPool(MaxSize=2)
+        return
+
+    def test_TakeReleased(self):
+        Button = Widget()
+        self.assertTrue(self.Pool.release(("small", "Std_New"), Button))
+        self.assertFalse(Button.Visible)
+        self.assertIsNone(Button.Parent)
+
+        self.assertIsNone(self.Pool.take(("large", "Std_New")))
+        self.assertIs(self.Pool.take(("small", "Std_New")), Button)
+        self.assertIsNone(self.Pool.take(("small", "Std_New")))
+        self.assertEqual(self.Pool.Count, 0)
+        self.assertEqual(self.Pool.Dict_Pool, {})
+        return
+
+    def test_Full(self):
+        Buttons = [Widget() for i in range(3)]
+        for Button in Buttons:
+            self.Pool.release(("small", "Std_New"), Button)
+        # The widget that does not fit is deleted
+        self.assertTrue(Buttons[2].Deleted)
+        self.assertEqual(self.Pool.Count, 2)
+        return
+
+    def test_Disabled(self):
+        Pool = WidgetPool(MaxSize=0)
+        Button = Widget()
+        self.assertFalse(Pool.release(("small", "Std_New"), Button))
+        self.assertTrue(Button.Deleted)
+        return
+
+    def test_Clear(self):
+        Button = Widget()
+        self.Pool.release(("small", "Std_New"), Button)
+        self.Pool.clear()
+        self.assertTrue(Button.Deleted)
+        self.assertEqual(self.Pool.Count, 0)
+        self.assertIsNone(self.Pool.take(("small", "Std_New")))
+        return
+
+    def test_Statistics(self):
+        self.Pool.release(("small", "Std_New"), Widget())
+        self.Pool.take(("small", "Std_New"))
+        self.Pool.take(("small", "Std_New"))
+        Statistics = self.Pool.statistics()
+        self.assertEqual(Statistics["Hits"], 1)
+        self.assertEqual(Statistics["Misses"], 1)
+        self.assertEqual(Statistics["HitRate"], 0.5)
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,226 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+
+# Persistent cache for the translations of workbench, toolbar and command names.
+# The translations are stored per language, next to the data file. The cache is emptied when the
+# FreeCAD version or the .qm files of FreeCAD and the addons change.
+import os
+import json
+import atexit
+import hashlib
+import FreeCAD as App
+
+CACHE_FILE = os.path.join(os.path.dirname(__file__), "RibbonTranslations.dat")
+CACHE_VERSION = 1
+
+# The folders, relative to a workbench folder, where the .qm files are searched
+List_TranslationFolders = [
+    "translations",
+    os.path.join("Resources", "translations"),
+    os.path.join("resources", "translations"),
+    os.path.join("Gui", "Resources", "translations"),
+]
+
+
+def ReturnTranslationFiles() -> list:
+    """
+    Returns the .qm files of FreeCAD and the installed workbenches.
+    """
+    List_Folders = [os.path.join(App.getResourceDir(), "translations")]
+    for ModFolder in [
+        os.path.join(App.getUserAppDataDir(), "Mod"),
+        os.path.join(App.getHomePath(), "Mod"),
+    ]:
+        if os.path.isdir(ModFolder) is False:
+            continue
+        for Entry in os.scandir(ModFolder):
+            if Entry.is_dir() is False:
+                continue
+            for TranslationFolder in List_TranslationFolders:
+                List_Folders.append(os.path.join(Entry.path, TranslationFolder))
+            # Workbenches with the code in a subfolder, like <addon>/<package>/Resources/translations
+            try:
+                for SubEntry in os.scandir(Entry.path):
+                    if (
+                        SubEntry.is_dir() is True
+                        and SubEntry.name.startswith(".") is False
+                    ):
+                        List_Folders.append(
+                            os.path.join(SubEntry.path, "Resources", "translations")
+                        )
+            except OSError:
+                pass
+
+    List_Files = []
+    for Folder in List_Folders:
+        if os.path.isdir(Folder) is False:
+            continue
+        for Entry in os.scandir(Folder):
+            if Entry.name.endswith(".qm"):
+                List_Files.append(Entry.path)
+    return sorted(List_Files)
+
+
+def ReturnTranslationFingerprint() -> str:
+    """
+    Returns a fingerprint of the FreeCAD version and the size and modification time of all .qm files.
+    """
+    Hash = hashlib.sha1(
+        " ".join(str(Item) for Item in App.Version()[0:4]).encode("utf-8")
+    )
+    for FileName in ReturnTranslationFiles():
+        try:
+            Stat = os.stat(FileName)
+            Hash.update(f"{FileName}|{Stat.st_size}|{Stat.st_mtime_ns}".encode("utf-8"))
+        except OSError:
+            pass
+    return Hash.hexdigest()
+
+
+class TranslationCache:
+    """
+    Memoizes translations by (language, workbench, text). Missing translations are computed once and stored.
+    Texts without a translation are kept in memory only. They are translated again in the next session,
+    so translations that become available are not hidden by the cache.
+    """
+
+    def __init__(self, FileName: str = CACHE_FILE):
+        self.FileName = FileName
+        self.Preferences = App.ParamGet("User parameter:BaseApp/Preferences/General")
+        self.Fingerprint = ReturnTranslationFingerprint()
+        # The translations: {(language, workbench, text): translation}
+        self.Dict_Translations = {}
+        # True when there are translations that are not saved
+        self.Changed = False
+        self.load()
+        return
+
+    def load(self):
+        """
+        Reads the stored translations. Nothing is read when the .qm files have changed since they were stored.
+        """
+        try:
+            with open(self.FileName, "r") as file:
+                Data = json.load(file)
+        except Exception:
+            return
+        if (
+            Data.get("version") != CACHE_VERSION
+            or Data.get("fingerprint") != self.Fingerprint
+        ):
+            # Remove the outdated translations from the file on the next save
+            self.Changed = True
+            return
+        for Language, Dict_Workbenches in Data.get("translations", {}).items():
+            for WorkBenchName, Dict_Texts in Dict_Workbenches.items():
+                for Text, Translation in Dict_Texts.items():
+                    self.Dict_Translations[(Language, WorkBenchName, Text)] = (
+                        Translation
+                    )
+        return
+
+    def translate(self, WorkBenchName: str, Text: str, Function) -> str:
+        """
+        Returns the translation of a text.
+
+        Args:
+            WorkBenchName (str): The workbench of the text.
+            Text (str): The text.
+            Function: Function(WorkBenchName, Text) that translates the text when it is not in the cache.
+
+        Returns:
+            str: The translation.
+        """
+        Key = (self.Preferences.GetString("Language"), WorkBenchName, Text)
+        try:
+            return self.Dict_Translations[Key]
+        except KeyError:
+            pass
+        Translation = Function(WorkBenchName, Text)
+        self.Dict_Translations[Key] = Translation
+        if Translation != Text:
+            self.Changed = True
+        return Translation
+
+    def clear(self):
+        self.Dict_Translations.clear()
+        self.Changed = True
+        return
+
+    def save(self, Wait: bool = False):
+        """
+        Writes the translations when they are changed.
+
+        Args:
+            Wait (bool, optional): Wait until the file is written. Defaults to False.
+        """
+        if self.Changed is False:
+            return
+        # Imported here, JsonStore_Ribbon imports Standard_Functions_RIbbon which uses this module
+        import JsonStore_Ribbon
+
+        Dict_Languages = {}
+        for (
+            Language,
+            WorkBenchName,
+            Text,
+        ), Translation in self.Dict_Translations.items():
+            # Texts without a translation are not stored
+            if Translation == Text:
+                continue
+            Dict_Languages.setdefault(Language, {}).setdefault(WorkBenchName, {})[
+                Text
+            ] = Translation
+        Data = {
+            "version": CACHE_VERSION,
+            "fingerprint": self.Fingerprint,
+            "translations": Dict_Languages,
+        }
+        JsonStore_Ribbon.SaveJson(self.FileName, Data, indent=None)
+        self.Changed = False
+        if Wait is True:
+            JsonStore_Ribbon.FlushJson()
+        return
+
+
+# The cache that is shared by the ribbon and the design dialog
+_TranslationCache = None
+
+
+def ReturnTranslationCache() -> TranslationCache:
+    """
+    Returns the shared translation cache. It is created on first use and saved when FreeCAD closes.
+    """
+    global _TranslationCache
+    if _TranslationCache is None:
+        _TranslationCache = TranslationCache()
+        atexit.register(SaveTranslationCache, True)
+    return _TranslationCache
+
+
+def SaveTranslationCache(Wait: bool = False):
+    """
+    Writes the new translations of the shared cache, if there are any.
+    """
+    if _TranslationCache is not None:
+        _TranslationCache.save(Wait)
+    return
@@ -0,0 +1,122 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+from PySide.QtWidgets import QWidget
+
+
+class WidgetPool:
+    """
+    Keeps widgets of unloaded ribbon categories, so they can be reused when the category is rebuilt.
+    Widgets are stored per key (e.g. size class and command). The number of stored widgets is limited.
+    """
+
+    def __init__(self, MaxSize: int = 200):
+        # The maximum number of widgets in the pool. 0 disables the pool
+        self.MaxSize = MaxSize
+        # The stored widgets per key
+        self.Dict_Pool = {}
+        # The number of stored widgets
+        self.Count = 0
+        # Counters for the hit rate
+        self.Hits = 0
+        self.Misses = 0
+        return
+
+    def take(self, Key):
+        """
+        Takes a widget from the pool.
+
+        Args:
+            Key (tuple): The key of the widget.
+
+        Returns:
+            QWidget: The widget, or None when there is no widget for this key.
+        """
+        List_Widgets = self.Dict_Pool.get(Key)
+        if List_Widgets is not None and len(List_Widgets) > 0:
+            Widget = List_Widgets.pop()
+            if len(List_Widgets) == 0:
+                del self.Dict_Pool[Key]
+            self.Count = self.Count - 1
+            self.Hits = self.Hits + 1
+            return Widget
+
+        self.Misses = self.Misses + 1
+        return None
+
+    def release(self, Key, Widget: QWidget) -> bool:
+        """
+        Returns a widget to the pool. When the pool is full, the widget is deleted.
+
+        Args:
+            Key (tuple): The key of the widget.
+            Widget (QWidget): The widget.
+
+        Returns:
+            bool: True if the widget is stored.
+        """
+        if self.Count >= self.MaxSize:
+            Widget.deleteLater()
+            return False
+
+        # Remove the widget from its panel. The pool keeps the reference
+        Widget.hide()
+        Widget.setParent(None)
+        self.Dict_Pool.setdefault(Key, []).append(Widget)
+        self.Count = self.Count + 1
+        return True
+
+    def clear(self):
+        """
+        Deletes all widgets in the pool.
+        """
+        for List_Widgets in self.Dict_Pool.values():
+            for Widget in List_Widgets:
+                Widget.deleteLater()
+        self.Dict_Pool.clear()
+        self.Count = 0
+        return
+
+    def hitRate(self) -> float:
+        """
+        Returns the fraction of requests that were served from the pool.
+
+        Returns:
+            float: The hit rate (0-1).
+        """
+        if self.Hits + self.Misses == 0:
+            return 0.0
+        return self.Hits / (self.Hits + self.Misses)
+
+    def statistics(self) -> dict:
+        """
+        Returns the statistics of the pool. Used for debugging.
+
+        Returns:
+            dict: {"Size", "MaxSize", "Hits", "Misses", "HitRate"}
+        """
+        return {
+            "Size": self.Count,
+            "MaxSize": self.MaxSize,
+            "Hits": self.Hits,
+            "Misses": self.Misses,
+            "HitRate": self.hitRate(),
+        }